@@ -1,5 +1,4 @@
 import contextlib
-import json
 import os
 from os import environ
 from sys import path as syspath
@@ -278,6 +277,11 @@ from dna_viewer import (
     get_skin_weights_from_scene,
     set_skin_weights_to_scene
 )
+from dna_viewer.dnalib.binding import (
+    SurfaceJointBinding,
+    bind_surface_joints,
+    create_rebind_command
+)
 from dnacalib import (
     CommandSequence,
     DNACalibDNAReader,
@@ -288,8 +292,6 @@ from dnacalib import (
     CalculateMeshLowerLODsCommand,
     VectorOperation_Add,
     VectorOperation_Interpolate,
-    SetNeutralJointTranslationsCommand,
-    SetNeutralJointRotationsCommand,
     SetLODsCommand,
     TranslateCommand,
     SetSkinWeightsCommand,
@@ -306,7 +308,11 @@ from dna import (
     FileStream,
     Status,
 )
-from vtx_color import MESH_SHADER_MAPPING, VTX_COLOR_MESHES, VTX_COLOR_VALUES
+from dna_viewer.builder.maya.vertex_color import set_all_vertex_colors_to_scene
+from dna_viewer.vertex_color import VertexColors
+from dna_viewer.dnalib.registry import shared_dna
+
+VERTEX_COLORS = VertexColors(f"{DATA_DIR}/vtx_color.bin")
 
 
 # Methods
@@ -355,7 +361,6 @@ def show_meshes(dna_path, add_skinning=False, add_blend_shapes=False):
 
 def assemble_scene(dna_path, analog_gui_path, gui_path,
                    additional_assemble_script):
-    dna = DNA(dna_path)
     config = RigConfig(
         gui_path=gui_path,
         analog_gui_path=analog_gui_path,
@@ -365,8 +370,9 @@ def assemble_scene(dna_path, analog_gui_path, gui_path,
         add_mesh_name_to_blend_shape_channel_name=True
     )
 
-    # Creates the rig
-    build_rig(dna=dna, config=config)
+    # Creates the rig, the parsed DNA stays cached in the registry for the export
+    with shared_dna(dna_path) as dna:
+        build_rig(dna=dna, config=config)
 
     translation = cmds.xform("neck_01", ws=True, query=True, translation=True)
     cmds.xform("CTRL_faceGUI", ws=True, t=[translation[0] + 20, translation[1] + 5, translation[2]])
@@ -393,36 +399,6 @@ def get_mesh_vertex_positions_from_scene(meshName):
         return None
 
 
-def run_joints_command(reader, calibrated):
-    # Making arrays for joints' transformations and their corresponding mapping arrays
-    joint_translations = []
-    joint_rotations = []
-
-    for i in range(reader.getJointCount()):
-        joint_name = reader.getJointName(i)
-
-        translation = cmds.xform(joint_name, query=True, translation=True)
-        joint_translations.append(translation)
-
-        rotation = cmds.joint(joint_name, query=True, orientation=True)
-        joint_rotations.append(rotation)
-
-    set_new_joints_translations = SetNeutralJointTranslationsCommand(joint_translations)
-    set_new_joints_rotations = SetNeutralJointRotationsCommand(joint_rotations)
-
-    # Abstraction to collect all commands into a sequence, and run them with only one invocation
-    commands = CommandSequence()
-
-    commands.add(set_new_joints_translations)
-    commands.add(set_new_joints_rotations)
-
-    commands.run(calibrated)
-    # verify that everything went fine
-    if not Status.isOk():
-        status = Status.get()
-        raise RuntimeError(f"Error do_joints_command: {status.message}")
-
-
 def run_vertices_command(
         calibrated, old_vertices_positions, new_vertices_positions, mesh_index
 ):
@@ -455,38 +431,16 @@ def run_vertices_command(
         raise RuntimeError(f"Error do_vertices_command: {status.message}")
 
 
-def transfer_joints_positions_distance(a, b):
-    return pow((a[0] - b[0]), 2) + pow((a[1] - b[1]), 2) + pow((a[2] - b[2]), 2)
-
-
-def find_and_save_joint_positions_in_file(reader, joints, file_path):
-    mesh = reader.getMeshName(0)
-    output = {}
-    for joint_name in joints:
-        cmds.select(joint_name)
-
-        joint_pos = cmds.xform(joint_name, q=True, ws=True, translation=True)
-        near_point = mel.eval(f"nearestPointOnMesh {mesh}")
-        cmds.setAttr(f"{near_point}.inPositionX", joint_pos[0])
-        cmds.setAttr(f"{near_point}.inPositionY", joint_pos[1])
-        cmds.setAttr(f"{near_point}.inPositionZ", joint_pos[2])
-        best_face = cmds.getAttr(f"{near_point}.nearestFaceIndex")
-
-        face_vtx_str = cmds.polyInfo(f"{mesh}.f[{best_face}]", fv=True)
-        buffer = face_vtx_str[0].split()
-        closest_vtx = 0
-        dist = 10000
-        for v in range(2, len(buffer)):
-            vtx = buffer[v]
-            vtx_pos = cmds.xform(f"{mesh}.vtx[{vtx}]", q=True, ws=True, translation=True)
-            new_dist = transfer_joints_positions_distance(joint_pos, vtx_pos)
-            if new_dist < dist:
-                dist = new_dist
-                closest_vtx = vtx
-        output[joint_name] = closest_vtx
+def run_rebind_command(calibrated, binding):
+    # Puts surface joints back onto their vertices, computed from the calibrated geometry in one step
+    commands = CommandSequence()
+    commands.add(create_rebind_command(calibrated, binding))
+    commands.run(calibrated)
 
-    with open(file_path, 'w') as out_file:
-        json.dump(output, out_file, indent=4)
+    # verify that everything went fine
+    if not Status.isOk():
+        status = Status.get()
+        raise RuntimeError(f"Error do_rebind_command: {status.message}")
 
 
 def prepare_rotated_dna(dna_path, rotated_dna_path):
@@ -503,10 +457,14 @@ def prepare_rotated_dna(dna_path, rotated_dna_path):
     return DNA(rotated_dna_path)
 
 
+@contextlib.contextmanager
 def get_dna(dna_path, rotated_dna_path):
     if up_axis == "z":
-        return prepare_rotated_dna(dna_path, rotated_dna_path)
-    return DNA(dna_path)
+        yield prepare_rotated_dna(dna_path, rotated_dna_path)
+        return
+    # Released to the registry when the export is done
+    with shared_dna(dna_path) as dna:
+        yield dna
 
 
 def build_meshes_for_lod(dna, lod):
@@ -607,7 +565,7 @@ def create_shader(name):
 
 
 def add_shader(lod):
-    for shader_name, meshes in MESH_SHADER_MAPPING.items():
+    for shader_name, meshes in VERTEX_COLORS.shader_mapping.items():
         shading_group = create_shader(shader_name)
         for mesh in meshes:
             if f"lod{lod}" in mesh:
@@ -619,15 +577,7 @@ def add_shader(lod):
 
 
 def set_vertex_color(lod):
-    for m, mesh_name in enumerate(VTX_COLOR_MESHES):
-        try:
-            if f"lod{lod}" in mesh_name:
-                cmds.select(mesh_name)
-                for v, rgb in enumerate(VTX_COLOR_VALUES[m]):
-                    cmds.polyColorPerVertex(f"{mesh_name}.vtx[{v}]", g=rgb[1], b=rgb[2])
-        except Exception as e:
-            print(f"Skipped adding vtx color for mesh {mesh_name}. Reason {e}")
-            continue
+    set_all_vertex_colors_to_scene(VERTEX_COLORS, lod)
 
 
 def export_fbx(lod_num, meshes, root_jnt, chr_name, fbx_dir):
@@ -670,7 +620,7 @@ character_dna = f"{WORK_DIR}/dna/Lena.dna"
 model = f"{WORK_DIR}/model/Lena_remodel.obj"
 
 # Surface joints
-joint_position_file = f"{temp_dir}/joint_position.json"
+joint_binding_file = f"{temp_dir}/joint_binding.npz"
 
 # In-between DNA paths
 mesh_dna = f"{WORK_DIR}/dna/Lena_mesh.dna"
@@ -703,7 +653,6 @@ character_name = "Lena"
 
 #############################################
 # Init work
-cmds.loadPlugin("nearestPointOnMesh.mll")
 
 # Create folders
 if not os.path.exists(output_dir):
@@ -718,8 +667,8 @@ show_meshes(character_dna)
 reader = read_dna(character_dna)
 calibrated = DNACalibDNAReader(reader)
 
-# Save surface joints positions
-find_and_save_joint_positions_in_file(reader, surface_joints, joint_position_file)
+# Bind surface joints to their nearest vertices of the base neutral mesh
+bind_surface_joints(DNA(character_dna), 0, surface_joints, barycentric=False).save(joint_binding_file)
 
 # Step 2: Update neutral mesh LOD0 based on provided model
 
@@ -734,20 +683,10 @@ run_vertices_command(
 # Save DNA
 save_dna(calibrated, mesh_dna)
 
-# Step 3: Update joints - snap to vertices
-show_meshes(mesh_dna)
-
-jnt_data = {}
-with open(joint_position_file) as jnt_file:
-    jnt_data = json.load(jnt_file)
-
-for jnt_name, vertex_id in jnt_data.items():
-    vtx_position = cmds.xform(f"{head_mesh}.vtx[{vertex_id}]", q=True, worldSpace=True, t=True)
-    cmds.xform(jnt_name, ws=True, translation=vtx_position)
-
+# Step 3: Update joints - snap to vertices using the cached binding, without rebuilding the scene
 reader = read_dna(mesh_dna)
 calibrated = DNACalibDNAReader(reader)
-run_joints_command(reader, calibrated)
+run_rebind_command(calibrated, SurfaceJointBinding.load(joint_binding_file))
 
 # Save DNA
 save_dna(calibrated, jnt_dna)
@@ -803,11 +742,11 @@ mel.eval(f'setProject "{output_dir}";')
 # Export FBX for each lod
 cmds.upAxis(ax=up_axis)
 
-dna_for_export = get_dna(final_dna, rotated_dna)
-for lod_index in range(dna_for_export.get_lod_count()):
-    export_fbx_for_lod(dna_for_export, lod_index, add_vtx_color,
-                       character_name, body_file, output_dir, neck_joints,
-                       root_joint, fbx_root, facial_root_joints, up_axis)
+with get_dna(final_dna, rotated_dna) as dna_for_export:
+    for lod_index in range(dna_for_export.get_lod_count()):
+        export_fbx_for_lod(dna_for_export, lod_index, add_vtx_color,
+                           character_name, body_file, output_dir, neck_joints,
+                           root_joint, fbx_root, facial_root_joints, up_axis)
 
 with contextlib.suppress(FileNotFoundError):
     os.remove(rotated_dna)
@@ -168,7 +168,11 @@ from dna import (
     FileStream,
     Status,
 )
-from vtx_color import MESH_SHADER_MAPPING, VTX_COLOR_MESHES, VTX_COLOR_VALUES
+from dna_viewer.builder.maya.vertex_color import set_all_vertex_colors_to_scene
+from dna_viewer.vertex_color import VertexColors
+from dna_viewer.dnalib.registry import shared_dna
+
+VERTEX_COLORS = VertexColors(f"{DATA_DIR}/vtx_color.bin")
 
 
 # Methods
@@ -197,7 +201,6 @@ def save_dna(reader, path):
 
 def assemble_scene(dna_path, analog_gui_path, gui_path,
                    additional_assemble_script):
-    dna = DNA(dna_path)
     config = RigConfig(
         gui_path=gui_path,
         analog_gui_path=analog_gui_path,
@@ -207,8 +210,9 @@ def assemble_scene(dna_path, analog_gui_path, gui_path,
         add_mesh_name_to_blend_shape_channel_name=True
     )
 
-    # Creates the rig
-    build_rig(dna=dna, config=config)
+    # Creates the rig, the parsed DNA stays cached in the registry for the export
+    with shared_dna(dna_path) as dna:
+        build_rig(dna=dna, config=config)
 
     translation = cmds.xform("neck_01", ws=True, query=True, translation=True)
     cmds.xform("CTRL_faceGUI", ws=True, t=[translation[0] + 20, translation[1] + 5, translation[2]])
@@ -228,10 +232,14 @@ def prepare_rotated_dna(dna_path, rotated_dna_path):
     return DNA(rotated_dna_path)
 
 
+@contextlib.contextmanager
 def get_dna(dna_path, rotated_dna_path):
     if up_axis == "z":
-        return prepare_rotated_dna(dna_path, rotated_dna_path)
-    return DNA(dna_path)
+        yield prepare_rotated_dna(dna_path, rotated_dna_path)
+        return
+    # Released to the registry when the export is done
+    with shared_dna(dna_path) as dna:
+        yield dna
 
 
 def build_meshes_for_lod(dna, lod):
@@ -332,7 +340,7 @@ def create_shader(name):
 
 
 def add_shader(lod):
-    for shader_name, meshes in MESH_SHADER_MAPPING.items():
+    for shader_name, meshes in VERTEX_COLORS.shader_mapping.items():
         shading_group = create_shader(shader_name)
         for mesh in meshes:
             if f"lod{lod}" in mesh:
@@ -344,15 +352,7 @@ def add_shader(lod):
 
 
 def set_vertex_color(lod):
-    for m, mesh_name in enumerate(VTX_COLOR_MESHES):
-        try:
-            if f"lod{lod}" in mesh_name:
-                cmds.select(mesh_name)
-                for v, rgb in enumerate(VTX_COLOR_VALUES[m]):
-                    cmds.polyColorPerVertex(f"{mesh_name}.vtx[{v}]", g=rgb[1], b=rgb[2])
-        except Exception as e:
-            print(f"Skipped adding vtx color for mesh {mesh_name}. Reason {e}")
-            continue
+    set_all_vertex_colors_to_scene(VERTEX_COLORS, lod)
 
 
 def export_fbx(lod_num, meshes, root_jnt, chr_name, fbx_dir):
@@ -455,11 +455,11 @@ mel.eval(f'setProject "{output_dir}";')
 # Export FBX for each lod
 cmds.upAxis(ax=up_axis)
 
-dna_for_export = get_dna(final_dna, rotated_dna)
-for lod_index in range(dna_for_export.get_lod_count()):
-    export_fbx_for_lod(dna_for_export, lod_index, add_vtx_color,
-                       character_name, scaled_skeleton_file, output_dir, neck_joints, root_joint, fbx_root,
-                       facial_root_joints, up_axis)
+with get_dna(final_dna, rotated_dna) as dna_for_export:
+    for lod_index in range(dna_for_export.get_lod_count()):
+        export_fbx_for_lod(dna_for_export, lod_index, add_vtx_color,
+                           character_name, scaled_skeleton_file, output_dir, neck_joints, root_joint, fbx_root,
+                           facial_root_joints, up_axis)
 
 with contextlib.suppress(FileNotFoundError):
     os.remove(rotated_dna)
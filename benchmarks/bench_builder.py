@@ -0,0 +1,35 @@
+from typing import List
+
+from dna_viewer.builder.config import Config
+from dna_viewer.builder.maya.mesh import MayaMesh
+
+from .bench_dnalib import load_all
+from .harness import benchmark
+from .synthetic import SyntheticDNA
+
+
+def create_maya_meshes(dna: SyntheticDNA) -> List[MayaMesh]:
+    config = Config()
+    return [
+        MayaMesh(
+            mesh_index=mesh_index,
+            dna=dna,
+            blend_shape_group_prefix=config.blend_shape_group_prefix,
+            blend_shape_name_postfix=config.blend_shape_name_postfix,
+            skin_cluster_suffix=config.skin_cluster_suffix,
+        )
+        for mesh_index in range(dna.get_mesh_count())
+    ]
+
+
+@benchmark("builder.create_neutral_mesh", setup=load_all)
+def create_neutral_mesh(dna: SyntheticDNA) -> None:
+    for mesh in create_maya_meshes(dna):
+        mesh.create_neutral_mesh()
+
+
+@benchmark("builder.set_skin_weights", setup=load_all)
+def set_skin_weights(dna: SyntheticDNA) -> None:
+    joint_ids = list(range(dna.get_joint_count()))
+    for mesh in create_maya_meshes(dna):
+        mesh.set_skin_weights(dna.get_mesh_name(mesh.mesh_index), joint_ids)
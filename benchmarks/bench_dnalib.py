@@ -0,0 +1,39 @@
+from dna_viewer.dnalib.layer import Layer
+
+from .harness import benchmark
+from .synthetic import SyntheticDNA, SyntheticReader
+
+
+def load_definition(reader: SyntheticReader) -> SyntheticDNA:
+    return SyntheticDNA(reader, [Layer.definition])
+
+
+def load_all(reader: SyntheticReader) -> SyntheticDNA:
+    return SyntheticDNA(reader)
+
+
+@benchmark("dnalib.read_definition")
+def read_definition(reader: SyntheticReader) -> None:
+    SyntheticDNA(reader, [Layer.definition])
+
+
+@benchmark("dnalib.read_all")
+def read_all(reader: SyntheticReader) -> None:
+    SyntheticDNA(reader)
+
+
+@benchmark("dnalib.geometry_read", setup=load_definition, fresh=True)
+def geometry_read(dna: SyntheticDNA) -> None:
+    dna.read_layers([Layer.geometry])
+
+
+@benchmark("dnalib.get_skin_weight_matrix_for_mesh", setup=load_all)
+def get_skin_weight_matrix_for_mesh(dna: SyntheticDNA) -> None:
+    for mesh_index in range(dna.get_mesh_count()):
+        dna.get_skin_weight_matrix_for_mesh(mesh_index)
+
+
+@benchmark("dnalib.get_polygon_faces_and_connects", setup=load_all)
+def get_polygon_faces_and_connects(dna: SyntheticDNA) -> None:
+    for mesh_index in range(dna.get_mesh_count()):
+        dna.get_polygon_faces_and_connects(mesh_index)
@@ -0,0 +1,38 @@
+import json
+import os
+import subprocess
+import sys
+
+from .harness import benchmark
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Modules that headless use of dna_viewer must not load
+HEAVY_MODULES = ["maya", "PySide2"]
+IMPORT_SCRIPT = f"""
+import json, sys, time
+start = time.perf_counter()
+from dna_viewer import DNA, Layer
+duration = time.perf_counter() - start
+print(json.dumps({{"duration": duration, "modules": [name for name in {HEAVY_MODULES!r} if name in sys.modules]}}))
+"""
+
+
+@benchmark(
+    "import.dna_viewer", setup=lambda reader: None, scaled=False, timed_by_run=True
+)
+def import_dna_viewer(_: None) -> float:
+    """Imports the headless part of dna_viewer in a new interpreter, timing only the import"""
+
+    process = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        text=True,
+        cwd=ROOT_DIR,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    if process.returncode:
+        raise RuntimeError(f"Importing dna_viewer failed: {process.stderr}")
+    result = json.loads(process.stdout.splitlines()[-1])
+    if result["modules"]:
+        raise RuntimeError(f"Importing DNA loaded {', '.join(result['modules'])}")
+    return float(result["duration"])
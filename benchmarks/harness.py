@@ -0,0 +1,307 @@
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from . import stubs
+from .synthetic import Scale, SyntheticReader
+
+RESULTS_VERSION = 1
+# The scale reported for benchmarks that don't use a synthetic DNA
+NO_SCALE = "none"
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.1
+
+
+@dataclass
+class Benchmark:
+    """
+    A model class for holding a registered benchmark
+
+    Attributes
+    ----------
+    @type name: str
+    @param name: The name of the benchmark, prefixed with the area it times
+
+    @type run: Callable[[Any], Any]
+    @param run: The timed function, called with the value returned by setup
+
+    @type setup: Callable[[SyntheticReader], Any]
+    @param setup: The function preparing the input of run, it is not timed
+
+    @type fresh: bool
+    @param fresh: Calls setup before every repeat, used when run changes its input
+
+    @type scaled: bool
+    @param scaled: Runs the benchmark at every scale, otherwise it is run once without a reader
+
+    @type timed_by_run: bool
+    @param timed_by_run: Run measures and returns its own duration in seconds, used when only a part of it is timed
+    """
+
+    name: str
+    run: Callable[[Any], Any]
+    setup: Callable[[SyntheticReader], Any]
+    fresh: bool = field(default=False)
+    scaled: bool = field(default=True)
+    timed_by_run: bool = field(default=False)
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    A model class for holding the timings of a benchmark at a scale
+
+    Attributes
+    ----------
+    @type name: str
+    @param name: The name of the benchmark
+
+    @type scale: str
+    @param scale: The name of the scale
+
+    @type times: List[float]
+    @param times: The duration of every repeat in seconds
+
+    @type maya_calls: Dict[str, int]
+    @param maya_calls: The number of calls per stubbed Maya function in a single repeat
+    """
+
+    name: str
+    scale: str
+    times: List[float] = field(default_factory=list)
+    maya_calls: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def best(self) -> float:
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = asdict(self)
+        result["best"] = self.best
+        result["median"] = self.median
+        return result
+
+
+BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(
+    name: str,
+    setup: Callable[[SyntheticReader], Any] = lambda reader: reader,
+    fresh: bool = False,
+    scaled: bool = True,
+    timed_by_run: bool = False,
+) -> Callable[[Callable[[Any], Any]], Callable[[Any], Any]]:
+    """
+    Registers the decorated function as a benchmark.
+
+    @type name: str
+    @param name: The name of the benchmark
+
+    @type setup: Callable[[SyntheticReader], Any]
+    @param setup: The function preparing the input of the benchmark, the reader is passed as is by default
+
+    @type fresh: bool
+    @param fresh: Calls setup before every repeat
+
+    @type scaled: bool
+    @param scaled: Runs the benchmark at every scale, otherwise it is run once and setup gets None
+
+    @type timed_by_run: bool
+    @param timed_by_run: The benchmark returns its own duration in seconds
+    """
+
+    def register(run: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        BENCHMARKS.append(
+            Benchmark(
+                name=name,
+                run=run,
+                setup=setup,
+                fresh=fresh,
+                scaled=scaled,
+                timed_by_run=timed_by_run,
+            )
+        )
+        return run
+
+    return register
+
+
+def run_benchmark(
+    bench: Benchmark,
+    reader: Optional[SyntheticReader],
+    repeat: int = DEFAULT_REPEAT,
+) -> BenchmarkResult:
+    """
+    Times the benchmark, garbage collection is disabled while timing like in timeit.
+
+    @type bench: Benchmark
+    @param bench: The benchmark
+
+    @type reader: Optional[SyntheticReader]
+    @param reader: The reader of the DNA the benchmark is run on, None for benchmarks that are not scaled
+
+    @type repeat: int
+    @param repeat: The number of times the benchmark is run
+
+    @rtype: BenchmarkResult
+    @returns: The timings of the benchmark
+    """
+
+    result = BenchmarkResult(
+        name=bench.name, scale=reader.scale.name if reader else NO_SCALE
+    )
+    state = None if bench.fresh else bench.setup(reader)
+    stubs.reset_calls()
+    for _ in range(repeat):
+        if bench.fresh:
+            state = bench.setup(reader)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            duration = bench.run(state)
+            if not bench.timed_by_run:
+                duration = time.perf_counter() - start
+            result.times.append(duration)
+        finally:
+            gc.enable()
+    result.maya_calls = {
+        name: count // repeat for name, count in stubs.get_calls().items()
+    }
+    return result
+
+
+def run_benchmarks(
+    scales: List[Scale],
+    pattern: Optional[str] = None,
+    repeat: int = DEFAULT_REPEAT,
+    log: Callable[[str], None] = print,
+) -> List[BenchmarkResult]:
+    """
+    Runs the registered benchmarks at every scale, the benchmarks that are not scaled run once before them.
+
+    @type scales: List[Scale]
+    @param scales: The scales of the generated DNAs
+
+    @type pattern: Optional[str]
+    @param pattern: Runs only the benchmarks containing it in the name
+
+    @type repeat: int
+    @param repeat: The number of times every benchmark is run
+
+    @rtype: List[BenchmarkResult]
+    @returns: The timings of every benchmark
+    """
+
+    benchmarks = [bench for bench in BENCHMARKS if not pattern or pattern in bench.name]
+    unscaled = [bench for bench in benchmarks if not bench.scaled]
+    scaled = [bench for bench in benchmarks if bench.scaled]
+
+    results = []
+    for scale in [None] + (scales if scaled else []):
+        reader = SyntheticReader(scale) if scale else None
+        for bench in scaled if scale else unscaled:
+            result = run_benchmark(bench, reader, repeat)
+            log(
+                f"{result.name:<40} {result.scale:<8} best {result.best * 1000:10.2f}ms"
+                f" median {result.median * 1000:10.2f}ms"
+            )
+            results.append(result)
+    return results
+
+
+def get_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_results(results: List[BenchmarkResult], path: str, maya_stubbed: bool) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                "version": RESULTS_VERSION,
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "commit": get_commit(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "maya_stubbed": maya_stubbed,
+                "results": [result.to_dict() for result in results],
+            },
+            file,
+            indent=2,
+        )
+
+
+def load_results(path: str) -> Dict[str, Dict[str, Any]]:
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    return {
+        f"{result['name']}[{result['scale']}]": result for result in data["results"]
+    }
+
+
+def compare_results(
+    results: List[BenchmarkResult],
+    baseline_path: str,
+    threshold: float = DEFAULT_THRESHOLD,
+    log: Callable[[str], None] = print,
+) -> List[str]:
+    """
+    Compares the best timings with the results saved by an earlier run.
+
+    @type results: List[BenchmarkResult]
+    @param results: The timings of the current run
+
+    @type baseline_path: str
+    @param baseline_path: The path of the results of the earlier run
+
+    @type threshold: float
+    @param threshold: The relative slowdown above which a benchmark is reported as a regression
+
+    @rtype: List[str]
+    @returns: The benchmarks that got slower than the threshold allows
+    """
+
+    baseline = load_results(baseline_path)
+    regressions = []
+    for result in results:
+        key = f"{result.name}[{result.scale}]"
+        if key not in baseline:
+            log(f"{key:<50} new")
+            continue
+        ratio = result.best / baseline[key]["best"]
+        status = ""
+        if ratio > 1 + threshold:
+            status = "REGRESSION"
+            regressions.append(key)
+        elif ratio < 1 - threshold:
+            status = "improved"
+        log(
+            f"{key:<50} {baseline[key]['best'] * 1000:10.2f}ms -> {result.best * 1000:10.2f}ms"
+            f" {ratio:6.2f}x {status}"
+        )
+        if result.maya_calls != baseline[key].get("maya_calls", result.maya_calls):
+            log(
+                f"{'':<50} Maya calls changed: {baseline[key]['maya_calls']} -> {result.maya_calls}"
+            )
+    return regressions
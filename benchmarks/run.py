@@ -0,0 +1,76 @@
+"""
+Times the dnalib load paths and the builder hot paths on synthetic DNAs of several scales, and the import of
+dna_viewer outside of Maya.
+
+- usage in command line, from the root of the repository:
+    python -m benchmarks.run --scales small medium --output base.json
+    python -m benchmarks.run --scales small medium --output head.json --compare base.json
+
+The builder benchmarks run against stubbed Maya modules when Maya can't be imported, so they time the Python work of
+the builder and count the Maya calls it makes. Results are written as JSON, comparing them with the results of another
+commit reports every benchmark whose best time got slower by more than the threshold.
+"""
+
+import argparse
+import logging
+from typing import List, Optional
+
+from .stubs import install_stubs
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    maya_stubbed = install_stubs()
+
+    # benchmarks are registered on import, dna_viewer can only be imported once the stubs are in place
+    from . import bench_builder, bench_dnalib, bench_import  # noqa: F401
+    from .harness import (
+        DEFAULT_REPEAT,
+        DEFAULT_THRESHOLD,
+        compare_results,
+        run_benchmarks,
+        save_results,
+    )
+    from .synthetic import SCALES
+
+    parser = argparse.ArgumentParser(
+        description="Times dnalib and the builder on synthetic DNAs."
+    )
+    parser.add_argument(
+        "--scales",
+        nargs="+",
+        choices=list(SCALES),
+        default=["small", "medium"],
+        help="sizes of the generated DNAs",
+    )
+    parser.add_argument(
+        "--filter", help="runs only the benchmarks containing this in the name"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=DEFAULT_REPEAT, help="runs of every benchmark"
+    )
+    parser.add_argument("--output", help="path of the JSON results")
+    parser.add_argument("--compare", help="path of the JSON results to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="relative slowdown reported as a regression",
+    )
+    args = parser.parse_args(arguments)
+
+    logging.disable(logging.INFO)
+    results = run_benchmarks(
+        [SCALES[name] for name in args.scales], args.filter, max(args.repeat, 1)
+    )
+    if args.output:
+        save_results(results, args.output, maya_stubbed)
+    if args.compare:
+        regressions = compare_results(results, args.compare, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} benchmarks got slower: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,119 @@
+"""
+Stand-ins for the Maya and Qt modules, so the builder stages can be timed outside of Maya. Every call of a stubbed
+`maya.cmds` or `maya.mel` function is counted and does nothing else, so the timings of these stages are the time spent
+in dna_viewer. The modules are only stubbed if Maya can't be imported; within mayapy the real modules are used.
+"""
+
+import importlib.util
+import sys
+import types
+from collections import Counter
+from typing import Any, Dict
+
+# Modules imported by dna_viewer that are only available within Maya
+STUBBED_MODULES = [
+    "maya",
+    "maya.api",
+    "maya.api.OpenMaya",
+    "maya.api.OpenMayaAnim",
+    "maya.cmds",
+    "maya.mel",
+    "PySide2",
+    "PySide2.QtCore",
+    "PySide2.QtWidgets",
+]
+# Modules whose functions are counted when called
+COUNTED_MODULES = ["maya.cmds", "maya.mel"]
+
+CALLS: Counter = Counter()
+
+
+class StubType(type):
+    def __getattr__(cls, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return Stub()
+
+
+class Stub(metaclass=StubType):
+    """An object that accepts any call, attribute or item and returns another stub"""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return Stub()
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return Stub()
+
+    def __getitem__(self, key: Any) -> Any:
+        return Stub()
+
+    def __iter__(self) -> Any:
+        return iter(())
+
+    def __len__(self) -> int:
+        return 0
+
+
+class StubModule(types.ModuleType):
+    """A module creating a stub class for every name imported from it"""
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = type(name, (Stub,), {})
+        setattr(self, name, value)
+        return value
+
+
+class CountedModule(types.ModuleType):
+    """A module creating a counted no-op function for every name imported from it"""
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        key = f"{self.__name__}.{name}"
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            CALLS[key] += 1
+            return Stub()
+
+        setattr(self, name, call)
+        return call
+
+
+def is_maya_available() -> bool:
+    return "maya" in sys.modules or importlib.util.find_spec("maya") is not None
+
+
+def install_stubs() -> bool:
+    """
+    Puts the stub modules into sys.modules if Maya can't be imported.
+
+    @rtype: bool
+    @returns: True if the stubs are installed, False if the real modules are used
+    """
+
+    if is_maya_available():
+        return False
+    for name in STUBBED_MODULES:
+        module_type = CountedModule if name in COUNTED_MODULES else StubModule
+        module = module_type(name)
+        module.__path__ = []
+        sys.modules[name] = module
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(sys.modules[parent], child, module)
+    return True
+
+
+def reset_calls() -> None:
+    CALLS.clear()
+
+
+def get_calls() -> Dict[str, int]:
+    return dict(sorted(CALLS.items()))
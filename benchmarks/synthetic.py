@@ -0,0 +1,498 @@
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from dna_viewer.dnalib.dnalib import DNA
+from dna_viewer.dnalib.layer import Layer
+
+# Share of the vertices of a mesh moved by a blend shape target
+DELTA_VERTEX_RATIO = 0.05
+
+
+@dataclass
+class Scale:
+    """
+    A model class for holding the size of a synthetic DNA
+
+    Attributes
+    ----------
+    @type name: str
+    @param name: The name of the scale
+
+    @type vertex_count: int
+    @param vertex_count: The number of vertices of the LOD 0 mesh, every following LOD has half of the vertices
+
+    @type lod_count: int
+    @param lod_count: The number of LODs, every LOD has a single mesh
+
+    @type blend_shape_target_count: int
+    @param blend_shape_target_count: The number of blend shape targets of the LOD 0 mesh
+
+    @type joint_count: int
+    @param joint_count: The number of joints
+
+    @type influence_count: int
+    @param influence_count: The number of joints influencing every vertex
+    """
+
+    name: str
+    vertex_count: int
+    lod_count: int
+    blend_shape_target_count: int
+    joint_count: int
+    influence_count: int = 4
+
+
+SCALES: Dict[str, Scale] = {
+    scale.name: scale
+    for scale in (
+        Scale(
+            name="small",
+            vertex_count=1000,
+            lod_count=2,
+            blend_shape_target_count=20,
+            joint_count=50,
+        ),
+        Scale(
+            name="medium",
+            vertex_count=10000,
+            lod_count=4,
+            blend_shape_target_count=100,
+            joint_count=250,
+        ),
+        Scale(
+            name="large",
+            vertex_count=50000,
+            lod_count=8,
+            blend_shape_target_count=250,
+            joint_count=800,
+        ),
+    )
+}
+
+
+@dataclass
+class SyntheticMesh:
+    positions: np.ndarray
+    texture_coordinates: np.ndarray
+    faces: List[List[int]]
+    skin_weight_joint_indices: List[List[int]]
+    skin_weight_values: List[List[float]]
+    targets: List[Tuple[np.ndarray, np.ndarray]]
+
+
+class SyntheticReader:
+    """
+    A stand-in for the DNA stream reader serving a generated DNA of the given scale. It implements the getters that are
+    used by dnalib, and like the real reader it returns new lists on every call, so the benchmarks time the same Python
+    work as with a loaded DNA file. The generated data is the same for the same scale and seed.
+
+    @type scale: Scale
+    @param scale: The size of the generated DNA
+
+    @type seed: int
+    @param seed: The seed of the random generator
+    """
+
+    def __init__(self, scale: Scale, seed: int = 0) -> None:
+        self.scale = scale
+        self.rng = np.random.default_rng(seed)
+        self.joint_names = [f"joint_{index:04d}" for index in range(scale.joint_count)]
+        self.joint_parents = [0] + [
+            int(self.rng.integers(0, index)) for index in range(1, scale.joint_count)
+        ]
+        self.joint_translations = self.rng.normal(size=(scale.joint_count, 3))
+        self.joint_rotations = self.rng.uniform(-90.0, 90.0, (scale.joint_count, 3))
+        self.channel_names = [
+            f"channel_{index:04d}" for index in range(scale.blend_shape_target_count)
+        ]
+        self.control_names = [f"CTRL_expressions.{name}" for name in self.channel_names]
+        self.meshes = [
+            self.create_mesh(
+                max(scale.vertex_count >> lod, 4),
+                scale.blend_shape_target_count if lod == 0 else 0,
+            )
+            for lod in range(scale.lod_count)
+        ]
+
+    def create_mesh(self, vertex_count: int, target_count: int) -> SyntheticMesh:
+        """Creates a grid of quads, with random skin weights and sparse blend shape targets"""
+
+        side = max(int(np.sqrt(vertex_count)), 2)
+        vertex_count = side * side
+        grid = np.stack(
+            np.meshgrid(np.arange(side), np.arange(side), indexing="ij"), -1
+        ).reshape(-1, 2) / (side - 1)
+        positions = np.column_stack(
+            (grid, self.rng.normal(scale=0.01, size=vertex_count))
+        )
+
+        corners = (np.arange(side - 1)[:, None] * side + np.arange(side - 1)).ravel()
+        faces = np.column_stack(
+            (corners, corners + 1, corners + side + 1, corners + side)
+        )
+
+        influence_count = min(self.scale.influence_count, self.scale.joint_count)
+        first_joints = self.rng.integers(0, self.scale.joint_count, vertex_count)
+        joint_indices = (
+            first_joints[:, None] + np.arange(influence_count)
+        ) % self.scale.joint_count
+        weights = self.rng.random((vertex_count, influence_count)) + 0.01
+        weights /= weights.sum(axis=1, keepdims=True)
+
+        delta_count = max(int(vertex_count * DELTA_VERTEX_RATIO), 1)
+        targets = []
+        for _ in range(target_count):
+            vertex_indices = np.sort(
+                self.rng.choice(vertex_count, delta_count, replace=False)
+            )
+            targets.append(
+                (vertex_indices, self.rng.normal(scale=0.1, size=(delta_count, 3)))
+            )
+
+        return SyntheticMesh(
+            positions=positions,
+            texture_coordinates=grid,
+            faces=faces.tolist(),
+            skin_weight_joint_indices=np.sort(joint_indices, axis=1).tolist(),
+            skin_weight_values=weights.tolist(),
+            targets=targets,
+        )
+
+    # descriptor
+
+    def getName(self) -> str:
+        return f"synthetic_{self.scale.name}"
+
+    def getArchetype(self) -> int:
+        return 0
+
+    def getGender(self) -> int:
+        return 0
+
+    def getAge(self) -> int:
+        return 0
+
+    def getMetaDataCount(self) -> int:
+        return 0
+
+    def getMetaDataKey(self, index: int) -> str:
+        return ""
+
+    def getMetaDataValue(self, key: str) -> str:
+        return ""
+
+    def getTranslationUnit(self) -> int:
+        return 0
+
+    def getRotationUnit(self) -> int:
+        return 0
+
+    def getCoordinateSystem(self) -> SimpleNamespace:
+        return SimpleNamespace(xAxis=0, yAxis=2, zAxis=4)
+
+    def getLODCount(self) -> int:
+        return self.scale.lod_count
+
+    def getDBMaxLOD(self) -> int:
+        return self.scale.lod_count
+
+    def getDBComplexity(self) -> str:
+        return ""
+
+    def getDBName(self) -> str:
+        return ""
+
+    # definition
+
+    def getGUIControlCount(self) -> int:
+        return len(self.control_names)
+
+    def getGUIControlName(self, index: int) -> str:
+        return self.control_names[index]
+
+    def getRawControlCount(self) -> int:
+        return len(self.control_names)
+
+    def getRawControlName(self, index: int) -> str:
+        return self.control_names[index]
+
+    def getJointCount(self) -> int:
+        return self.scale.joint_count
+
+    def getJointName(self, index: int) -> str:
+        return self.joint_names[index]
+
+    def getJointParentIndex(self, index: int) -> int:
+        return self.joint_parents[index]
+
+    def getJointIndicesForLOD(self, lod: int) -> List[int]:
+        return list(range(max(self.scale.joint_count >> lod, 1)))
+
+    def getNeutralJointTranslation(self, index: int) -> List[float]:
+        return self.joint_translations[index].tolist()
+
+    def getNeutralJointTranslationXs(self) -> List[float]:
+        return self.joint_translations[:, 0].tolist()
+
+    def getNeutralJointTranslationYs(self) -> List[float]:
+        return self.joint_translations[:, 1].tolist()
+
+    def getNeutralJointTranslationZs(self) -> List[float]:
+        return self.joint_translations[:, 2].tolist()
+
+    def getNeutralJointRotation(self, index: int) -> List[float]:
+        return self.joint_rotations[index].tolist()
+
+    def getNeutralJointRotationXs(self) -> List[float]:
+        return self.joint_rotations[:, 0].tolist()
+
+    def getNeutralJointRotationYs(self) -> List[float]:
+        return self.joint_rotations[:, 1].tolist()
+
+    def getNeutralJointRotationZs(self) -> List[float]:
+        return self.joint_rotations[:, 2].tolist()
+
+    def getBlendShapeChannelCount(self) -> int:
+        return len(self.channel_names)
+
+    def getBlendShapeChannelName(self, index: int) -> str:
+        return self.channel_names[index]
+
+    def getBlendShapeChannelIndicesForLOD(self, lod: int) -> List[int]:
+        return list(range(len(self.channel_names)))
+
+    def getAnimatedMapCount(self) -> int:
+        return 0
+
+    def getAnimatedMapName(self, index: int) -> str:
+        return ""
+
+    def getAnimatedMapIndicesForLOD(self, lod: int) -> List[int]:
+        return []
+
+    def getMeshCount(self) -> int:
+        return len(self.meshes)
+
+    def getMeshName(self, index: int) -> str:
+        return f"head_lod{index}_mesh"
+
+    def getMeshIndicesForLOD(self, lod: int) -> List[int]:
+        return [lod]
+
+    def getMeshBlendShapeChannelMappingCount(self) -> int:
+        return len(self.meshes[0].targets)
+
+    def getMeshBlendShapeChannelMapping(self, index: int) -> SimpleNamespace:
+        return SimpleNamespace(meshIndex=0, blendShapeChannelIndex=index)
+
+    def getMeshBlendShapeChannelMappingIndicesForLOD(self, lod: int) -> List[int]:
+        return list(range(len(self.meshes[0].targets))) if lod == 0 else []
+
+    # behavior
+
+    def getGUIToRawInputIndices(self) -> List[int]:
+        return list(range(len(self.control_names)))
+
+    def getGUIToRawOutputIndices(self) -> List[int]:
+        return list(range(len(self.control_names)))
+
+    def getGUIToRawFromValues(self) -> List[float]:
+        return [0.0] * len(self.control_names)
+
+    def getGUIToRawToValues(self) -> List[float]:
+        return [1.0] * len(self.control_names)
+
+    def getGUIToRawSlopeValues(self) -> List[float]:
+        return [1.0] * len(self.control_names)
+
+    def getGUIToRawCutValues(self) -> List[float]:
+        return [0.0] * len(self.control_names)
+
+    def getPSDCount(self) -> int:
+        return 0
+
+    def getPSDRowIndices(self) -> List[int]:
+        return []
+
+    def getPSDColumnIndices(self) -> List[int]:
+        return []
+
+    def getPSDValues(self) -> List[float]:
+        return []
+
+    def getJointRowCount(self) -> int:
+        return self.scale.joint_count * 9
+
+    def getJointColumnCount(self) -> int:
+        return len(self.control_names)
+
+    def getJointVariableAttributeIndices(self, lod: int) -> List[int]:
+        return []
+
+    def getJointGroupCount(self) -> int:
+        return 0
+
+    def getBlendShapeChannelLODs(self) -> List[int]:
+        return [len(self.channel_names)] * self.scale.lod_count
+
+    def getBlendShapeChannelInputIndices(self) -> List[int]:
+        return list(range(len(self.channel_names)))
+
+    def getBlendShapeChannelOutputIndices(self) -> List[int]:
+        return list(range(len(self.channel_names)))
+
+    def getAnimatedMapLODs(self) -> List[int]:
+        return [0] * self.scale.lod_count
+
+    def getAnimatedMapFromValues(self) -> List[float]:
+        return []
+
+    def getAnimatedMapToValues(self) -> List[float]:
+        return []
+
+    def getAnimatedMapSlopeValues(self) -> List[float]:
+        return []
+
+    def getAnimatedMapCutValues(self) -> List[float]:
+        return []
+
+    def getAnimatedMapInputIndices(self) -> List[int]:
+        return []
+
+    def getAnimatedMapOutputIndices(self) -> List[int]:
+        return []
+
+    # geometry
+
+    def getVertexPositionCount(self, meshIndex: int) -> int:
+        return len(self.meshes[meshIndex].positions)
+
+    def getVertexPosition(self, meshIndex: int, vertexIndex: int) -> List[float]:
+        return self.meshes[meshIndex].positions[vertexIndex].tolist()
+
+    def getVertexPositionXs(self, meshIndex: int) -> List[float]:
+        return self.meshes[meshIndex].positions[:, 0].tolist()
+
+    def getVertexPositionYs(self, meshIndex: int) -> List[float]:
+        return self.meshes[meshIndex].positions[:, 1].tolist()
+
+    def getVertexPositionZs(self, meshIndex: int) -> List[float]:
+        return self.meshes[meshIndex].positions[:, 2].tolist()
+
+    def getVertexTextureCoordinateCount(self, meshIndex: int) -> int:
+        return len(self.meshes[meshIndex].texture_coordinates)
+
+    def getVertexTextureCoordinate(
+        self, meshIndex: int, textureCoordinateIndex: int
+    ) -> List[float]:
+        return (
+            self.meshes[meshIndex].texture_coordinates[textureCoordinateIndex].tolist()
+        )
+
+    def getVertexTextureCoordinateUs(self, meshIndex: int) -> List[float]:
+        return self.meshes[meshIndex].texture_coordinates[:, 0].tolist()
+
+    def getVertexTextureCoordinateVs(self, meshIndex: int) -> List[float]:
+        return self.meshes[meshIndex].texture_coordinates[:, 1].tolist()
+
+    def getVertexLayoutCount(self, meshIndex: int) -> int:
+        return len(self.meshes[meshIndex].positions)
+
+    def getVertexLayout(self, meshIndex: int, layoutIndex: int) -> List[int]:
+        return [layoutIndex, layoutIndex, layoutIndex]
+
+    def getVertexLayoutPositionIndices(self, meshIndex: int) -> List[int]:
+        return list(range(len(self.meshes[meshIndex].positions)))
+
+    def getVertexLayoutTextureCoordinateIndices(self, meshIndex: int) -> List[int]:
+        return list(range(len(self.meshes[meshIndex].positions)))
+
+    def getVertexLayoutNormalIndices(self, meshIndex: int) -> List[int]:
+        return list(range(len(self.meshes[meshIndex].positions)))
+
+    def getVertexNormalCount(self, meshIndex: int) -> int:
+        return 0
+
+    def getFaceCount(self, meshIndex: int) -> int:
+        return len(self.meshes[meshIndex].faces)
+
+    def getFaceVertexLayoutIndices(self, meshIndex: int, faceIndex: int) -> List[int]:
+        return list(self.meshes[meshIndex].faces[faceIndex])
+
+    def getMaximumInfluencePerVertex(self, meshIndex: int) -> int:
+        return min(self.scale.influence_count, self.scale.joint_count)
+
+    def getSkinWeightsCount(self, meshIndex: int) -> int:
+        return len(self.meshes[meshIndex].skin_weight_values)
+
+    def getSkinWeightsValues(self, meshIndex: int, vertexIndex: int) -> List[float]:
+        return list(self.meshes[meshIndex].skin_weight_values[vertexIndex])
+
+    def getSkinWeightsJointIndices(self, meshIndex: int, vertexIndex: int) -> List[int]:
+        return list(self.meshes[meshIndex].skin_weight_joint_indices[vertexIndex])
+
+    def getBlendShapeTargetCount(self, meshIndex: int) -> int:
+        return len(self.meshes[meshIndex].targets)
+
+    def getBlendShapeChannelIndex(
+        self, meshIndex: int, blendShapeTargetIndex: int
+    ) -> int:
+        return blendShapeTargetIndex
+
+    def getBlendShapeTargetDeltaCount(
+        self, meshIndex: int, blendShapeTargetIndex: int
+    ) -> int:
+        return len(self.meshes[meshIndex].targets[blendShapeTargetIndex][0])
+
+    def getBlendShapeTargetDelta(
+        self, meshIndex: int, blendShapeTargetIndex: int, deltaIndex: int
+    ) -> List[float]:
+        return (
+            self.meshes[meshIndex]
+            .targets[blendShapeTargetIndex][1][deltaIndex]
+            .tolist()
+        )
+
+    def getBlendShapeTargetDeltaXs(
+        self, meshIndex: int, blendShapeTargetIndex: int
+    ) -> List[float]:
+        return self.meshes[meshIndex].targets[blendShapeTargetIndex][1][:, 0].tolist()
+
+    def getBlendShapeTargetDeltaYs(
+        self, meshIndex: int, blendShapeTargetIndex: int
+    ) -> List[float]:
+        return self.meshes[meshIndex].targets[blendShapeTargetIndex][1][:, 1].tolist()
+
+    def getBlendShapeTargetDeltaZs(
+        self, meshIndex: int, blendShapeTargetIndex: int
+    ) -> List[float]:
+        return self.meshes[meshIndex].targets[blendShapeTargetIndex][1][:, 2].tolist()
+
+    def getBlendShapeTargetVertexIndices(
+        self, meshIndex: int, blendShapeTargetIndex: int
+    ) -> List[int]:
+        return self.meshes[meshIndex].targets[blendShapeTargetIndex][0].tolist()
+
+
+class SyntheticDNA(DNA):
+    """
+    A DNA read from a synthetic reader instead of a file.
+
+    @type reader: SyntheticReader
+    @param reader: The reader of the generated DNA
+
+    @type layers: Optional[List[Layer]]
+    @param layers: List of parts of DNA to be loaded. If noting is passed, whole DNA is going to be loaded.
+    """
+
+    def __init__(
+        self, reader: SyntheticReader, layers: Optional[List[Layer]] = None
+    ) -> None:
+        self.synthetic_reader = reader
+        super().__init__(f"{reader.getName()}.dna", layers)
+
+    def create_reader(self, dna_path: str, data_layer: int = 0) -> SyntheticReader:
+        return self.synthetic_reader
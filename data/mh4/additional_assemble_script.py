@@ -1,6 +1,7 @@
 from sys import stderr
 
 from maya import cmds, mel
+from maya.api import OpenMaya, OpenMayaAnim
 
 
 def both_guis_loaded():
@@ -91,574 +92,540 @@ def adjust_aim_control():
 
 
 # ****************************************************************************************************
-def connect_expression(driverCtrl, driverAttr, minVal, maxVal, driverKey1, driverKey2, expCtrl, expAttr, expKey1,
-                       expKey2):
-    """
-    Connects one GUI control with raw control.
-    """
-
-    # create driver attribute if dont exists
-    if not cmds_exists(f"{driverCtrl}.{driverAttr}"):
-        cmds_set_attr(driverCtrl, longName=driverAttr, keyable=True, attributeType="float", minValue=minVal,
-                      maxValue=maxVal, dv=0.0)
-
-    # connect CTRL driver with driven expression
-    cmds_set_driven_keyframe(f"{expCtrl}.{expAttr}", itt="linear", ott="linear",
-                             currentDriver=f"{driverCtrl}.{driverAttr}", driverValue=driverKey1, value=expKey1)
-    cmds_set_driven_keyframe(f"{expCtrl}.{expAttr}", itt="linear", ott="linear",
-                             currentDriver=f"{driverCtrl}.{driverAttr}", driverValue=driverKey2, value=expKey2)
-
-
-# ****************************************************************************************************
-def connect_expressions():
-    """
-    This method would connect GUI with raw controls. Raw controls are driven by rig logic while the user
-    manipulates GUI controls.
-    """
-
+# GUI control, GUI attribute, attribute min, attribute max, driver key 1, driver key 2, expression control,
+# expression attribute, expression key 1, expression key 2
+EXPRESSION_CONNECTIONS = (
     # brows down
-    connect_expression("CTRL_L_brow_down", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "browDownL", 0.0, 1.0)
-    connect_expression("CTRL_R_brow_down", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "browDownR", 0.0, 1.0)
+    ("CTRL_L_brow_down", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "browDownL", 0.0, 1.0),
+    ("CTRL_R_brow_down", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "browDownR", 0.0, 1.0),
     # brows lateral
-    connect_expression("CTRL_L_brow_lateral", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "browLateralL", 0.0, 1.0)
-    connect_expression("CTRL_R_brow_lateral", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "browLateralR", 0.0, 1.0)
+    ("CTRL_L_brow_lateral", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "browLateralL", 0.0, 1.0),
+    ("CTRL_R_brow_lateral", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "browLateralR", 0.0, 1.0),
     # brows raise
-    connect_expression("CTRL_L_brow_raiseIn", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "browRaiseInL", 0.0, 1.0)
-    connect_expression("CTRL_R_brow_raiseIn", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "browRaiseInR", 0.0, 1.0)
-    connect_expression("CTRL_L_brow_raiseOut", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "browRaiseOuterL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_brow_raiseOut", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "browRaiseOuterR", 0.0,
-                       1.0)
+    ("CTRL_L_brow_raiseIn", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "browRaiseInL", 0.0, 1.0),
+    ("CTRL_R_brow_raiseIn", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "browRaiseInR", 0.0, 1.0),
+    ("CTRL_L_brow_raiseOut", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "browRaiseOuterL", 0.0, 1.0),
+    ("CTRL_R_brow_raiseOut", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "browRaiseOuterR", 0.0, 1.0),
     # ears up
-    connect_expression("CTRL_L_ear_up", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "earUpL", 0.0, 1.0)
-    connect_expression("CTRL_R_ear_up", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "earUpR", 0.0, 1.0)
+    ("CTRL_L_ear_up", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "earUpL", 0.0, 1.0),
+    ("CTRL_R_ear_up", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "earUpR", 0.0, 1.0),
     # eyes widen/blink
-    connect_expression("CTRL_L_eye_blink", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeBlinkL", 0.0, 1.0)
-    connect_expression("CTRL_R_eye_blink", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeBlinkR", 0.0, 1.0)
-    connect_expression("CTRL_L_eye_blink", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyeWidenL", 0.0, 1.0)
-    connect_expression("CTRL_R_eye_blink", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyeWidenR", 0.0, 1.0)
+    ("CTRL_L_eye_blink", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeBlinkL", 0.0, 1.0),
+    ("CTRL_R_eye_blink", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeBlinkR", 0.0, 1.0),
+    ("CTRL_L_eye_blink", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyeWidenL", 0.0, 1.0),
+    ("CTRL_R_eye_blink", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyeWidenR", 0.0, 1.0),
     # lid press
-    connect_expression("CTRL_L_eye_lidPress", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeLidPressL", 0.0, 1.0)
-    connect_expression("CTRL_R_eye_lidPress", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeLidPressR", 0.0, 1.0)
+    ("CTRL_L_eye_lidPress", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeLidPressL", 0.0, 1.0),
+    ("CTRL_R_eye_lidPress", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeLidPressR", 0.0, 1.0),
     # eyes squint inner
-    connect_expression("CTRL_L_eye_squintInner", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeSquintInnerL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_eye_squintInner", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeSquintInnerR", 0.0,
-                       1.0)
+    ("CTRL_L_eye_squintInner", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeSquintInnerL", 0.0, 1.0),
+    ("CTRL_R_eye_squintInner", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeSquintInnerR", 0.0, 1.0),
     # eyes cheek raise
-    connect_expression("CTRL_L_eye_cheekRaise", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeCheekRaiseL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_eye_cheekRaise", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeCheekRaiseR", 0.0,
-                       1.0)
+    ("CTRL_L_eye_cheekRaise", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeCheekRaiseL", 0.0, 1.0),
+    ("CTRL_R_eye_cheekRaise", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeCheekRaiseR", 0.0, 1.0),
     # face scrunch
-    connect_expression("CTRL_L_eye_faceScrunch", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeFaceScrunchL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_eye_faceScrunch", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeFaceScrunchR", 0.0,
-                       1.0)
+    ("CTRL_L_eye_faceScrunch", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeFaceScrunchL", 0.0, 1.0),
+    ("CTRL_R_eye_faceScrunch", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeFaceScrunchR", 0.0, 1.0),
     # eyelids up/down (and eyes relax)
-    connect_expression("CTRL_L_eye_eyelidU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyeUpperLidUpL", 0.0, 1.0)
-    connect_expression("CTRL_R_eye_eyelidU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyeUpperLidUpR", 0.0, 1.0)
-    connect_expression("CTRL_L_eye_eyelidU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeRelaxL", 0.0, 1.0)
-    connect_expression("CTRL_R_eye_eyelidU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeRelaxR", 0.0, 1.0)
-    connect_expression("CTRL_L_eye_eyelidD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyeLowerLidDownL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_eye_eyelidD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyeLowerLidDownR", 0.0,
-                       1.0)
-    connect_expression("CTRL_L_eye_eyelidD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeLowerLidUpL", 0.0, 1.0)
-    connect_expression("CTRL_R_eye_eyelidD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeLowerLidUpR", 0.0, 1.0)
-
-    if analog_gui_loaded():
-        # eyes look up/down/left/right
-        connect_expression("LOC_L_eyeDriver", "rx", -30.0, 40.0, 0.0, -30.0, "CTRL_expressions", "eyeLookUpL", 0.0, 1.0)
-        connect_expression("LOC_R_eyeDriver", "rx", -30.0, 40.0, 0.0, -30.0, "CTRL_expressions", "eyeLookUpR", 0.0, 1.0)
-        connect_expression("LOC_L_eyeDriver", "rx", -30.0, 40.0, 0.0, 40.0, "CTRL_expressions", "eyeLookDownL", 0.0, 1.0)
-        connect_expression("LOC_R_eyeDriver", "rx", -30.0, 40.0, 0.0, 40.0, "CTRL_expressions", "eyeLookDownR", 0.0, 1.0)
-        connect_expression("LOC_L_eyeDriver", "ry", -40.0, 40.0, 0.0, 40.0, "CTRL_expressions", "eyeLookLeftL", 0.0, 1.0)
-        connect_expression("LOC_R_eyeDriver", "ry", -40.0, 40.0, 0.0, 40.0, "CTRL_expressions", "eyeLookLeftR", 0.0, 1.0)
-        connect_expression("LOC_L_eyeDriver", "ry", -40.0, 40.0, 0.0, -40.0, "CTRL_expressions", "eyeLookRightL", 0.0, 1.0)
-        connect_expression("LOC_R_eyeDriver", "ry", -40.0, 40.0, 0.0, -40.0, "CTRL_expressions", "eyeLookRightR", 0.0, 1.0)
+    ("CTRL_L_eye_eyelidU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyeUpperLidUpL", 0.0, 1.0),
+    ("CTRL_R_eye_eyelidU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyeUpperLidUpR", 0.0, 1.0),
+    ("CTRL_L_eye_eyelidU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeRelaxL", 0.0, 1.0),
+    ("CTRL_R_eye_eyelidU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeRelaxR", 0.0, 1.0),
+    ("CTRL_L_eye_eyelidD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyeLowerLidDownL", 0.0, 1.0),
+    ("CTRL_R_eye_eyelidD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyeLowerLidDownR", 0.0, 1.0),
+    ("CTRL_L_eye_eyelidD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeLowerLidUpL", 0.0, 1.0),
+    ("CTRL_R_eye_eyelidD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeLowerLidUpR", 0.0, 1.0),
     # pupils wide/narrow
-    connect_expression("CTRL_L_eye_pupil", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyePupilWideL", 0.0, 1.0)
-    connect_expression("CTRL_R_eye_pupil", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyePupilWideR", 0.0, 1.0)
-    connect_expression("CTRL_L_eye_pupil", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyePupilNarrowL", 0.0, 1.0)
-    connect_expression("CTRL_R_eye_pupil", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyePupilNarrowR", 0.0, 1.0)
+    ("CTRL_L_eye_pupil", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyePupilWideL", 0.0, 1.0),
+    ("CTRL_R_eye_pupil", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyePupilWideR", 0.0, 1.0),
+    ("CTRL_L_eye_pupil", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyePupilNarrowL", 0.0, 1.0),
+    ("CTRL_R_eye_pupil", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyePupilNarrowR", 0.0, 1.0),
     # eyes parallel
-    connect_expression("CTRL_C_eye_parallelLook", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "eyeParallelLookDirection", 0.0, 1.0)
+    ("CTRL_C_eye_parallelLook", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyeParallelLookDirection", 0.0, 1.0),
     # eyelashes tweakers
-    connect_expression("CTRL_L_eyelashes_tweakerIn", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyelashesDownINL",
-                       0.0, 1.0)
-    connect_expression("CTRL_R_eyelashes_tweakerIn", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyelashesDownINR",
-                       0.0, 1.0)
-    connect_expression("CTRL_L_eyelashes_tweakerOut", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "eyelashesDownOUTL",
-                       0.0, 1.0)
-    connect_expression("CTRL_R_eyelashes_tweakerOut", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "eyelashesDownOUTR",
-                       0.0, 1.0)
-    connect_expression("CTRL_L_eyelashes_tweakerIn", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyelashesUpINL",
-                       0.0, 1.0)
-    connect_expression("CTRL_R_eyelashes_tweakerIn", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyelashesUpINR",
-                       0.0, 1.0)
-    connect_expression("CTRL_L_eyelashes_tweakerOut", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyelashesUpOUTL",
-                       0.0, 1.0)
-    connect_expression("CTRL_R_eyelashes_tweakerOut", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyelashesUpOUTR",
-                       0.0, 1.0)
+    ("CTRL_L_eyelashes_tweakerIn", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyelashesDownINL", 0.0, 1.0),
+    ("CTRL_R_eyelashes_tweakerIn", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyelashesDownINR", 0.0, 1.0),
+    ("CTRL_L_eyelashes_tweakerOut", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyelashesDownOUTL", 0.0, 1.0),
+    ("CTRL_R_eyelashes_tweakerOut", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "eyelashesDownOUTR", 0.0, 1.0),
+    ("CTRL_L_eyelashes_tweakerIn", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyelashesUpINL", 0.0, 1.0),
+    ("CTRL_R_eyelashes_tweakerIn", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyelashesUpINR", 0.0, 1.0),
+    ("CTRL_L_eyelashes_tweakerOut", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyelashesUpOUTL", 0.0, 1.0),
+    ("CTRL_R_eyelashes_tweakerOut", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "eyelashesUpOUTR", 0.0, 1.0),
     # nose wrinkle/depress/dilate/compress
-    connect_expression("CTRL_L_nose", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "noseWrinkleL", 0.0, 1.0)
-    connect_expression("CTRL_R_nose", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "noseWrinkleR", 0.0, 1.0)
-    connect_expression("CTRL_L_nose", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "noseNostrilDepressL", 0.0, 1.0)
-    connect_expression("CTRL_R_nose", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "noseNostrilDepressR", 0.0, 1.0)
-    connect_expression("CTRL_L_nose", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "noseNostrilDilateL", 0.0, 1.0)
-    connect_expression("CTRL_R_nose", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "noseNostrilDilateR", 0.0, 1.0)
-    connect_expression("CTRL_L_nose", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "noseNostrilCompressL", 0.0, 1.0)
-    connect_expression("CTRL_R_nose", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "noseNostrilCompressR", 0.0, 1.0)
+    ("CTRL_L_nose", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "noseWrinkleL", 0.0, 1.0),
+    ("CTRL_R_nose", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "noseWrinkleR", 0.0, 1.0),
+    ("CTRL_L_nose", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "noseNostrilDepressL", 0.0, 1.0),
+    ("CTRL_R_nose", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "noseNostrilDepressR", 0.0, 1.0),
+    ("CTRL_L_nose", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "noseNostrilDilateL", 0.0, 1.0),
+    ("CTRL_R_nose", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "noseNostrilDilateR", 0.0, 1.0),
+    ("CTRL_L_nose", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "noseNostrilCompressL", 0.0, 1.0),
+    ("CTRL_R_nose", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "noseNostrilCompressR", 0.0, 1.0),
     # nose wrinkle upper
-    connect_expression("CTRL_L_nose_wrinkleUpper", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "noseWrinkleUpperL",
-                       0.0, 1.0)
-    connect_expression("CTRL_R_nose_wrinkleUpper", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "noseWrinkleUpperR",
-                       0.0, 1.0)
+    ("CTRL_L_nose_wrinkleUpper", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "noseWrinkleUpperL", 0.0, 1.0),
+    ("CTRL_R_nose_wrinkleUpper", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "noseWrinkleUpperR", 0.0, 1.0),
     # nasolabial deepener
-    connect_expression("CTRL_L_nose_nasolabialDeepen", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "noseNasolabialDeepenL", 0.0, 1.0)
-    connect_expression("CTRL_R_nose_nasolabialDeepen", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "noseNasolabialDeepenR", 0.0, 1.0)
+    ("CTRL_L_nose_nasolabialDeepen", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "noseNasolabialDeepenL", 0.0, 1.0),
+    ("CTRL_R_nose_nasolabialDeepen", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "noseNasolabialDeepenR", 0.0, 1.0),
     # cheek suck/blow
-    connect_expression("CTRL_L_mouth_suckBlow", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCheekBlowL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_suckBlow", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCheekBlowR", 0.0,
-                       1.0)
-    connect_expression("CTRL_L_mouth_suckBlow", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthCheekSuckL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_suckBlow", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthCheekSuckR", 0.0,
-                       1.0)
+    ("CTRL_L_mouth_suckBlow", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCheekBlowL", 0.0, 1.0),
+    ("CTRL_R_mouth_suckBlow", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCheekBlowR", 0.0, 1.0),
+    ("CTRL_L_mouth_suckBlow", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthCheekSuckL", 0.0, 1.0),
+    ("CTRL_R_mouth_suckBlow", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthCheekSuckR", 0.0, 1.0),
     # lips blow
-    connect_expression("CTRL_L_mouth_lipsBlow", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsBlowL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_lipsBlow", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsBlowR", 0.0,
-                       1.0)
+    ("CTRL_L_mouth_lipsBlow", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsBlowL", 0.0, 1.0),
+    ("CTRL_R_mouth_lipsBlow", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsBlowR", 0.0, 1.0),
     # mouth up/down/left/right
-    connect_expression("CTRL_C_mouth", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthUp", 0.0, 1.0)
-    connect_expression("CTRL_C_mouth", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthDown", 0.0, 1.0)
-    connect_expression("CTRL_C_mouth", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLeft", 0.0, 1.0)
-    connect_expression("CTRL_C_mouth", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthRight", 0.0, 1.0)
+    ("CTRL_C_mouth", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthUp", 0.0, 1.0),
+    ("CTRL_C_mouth", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthDown", 0.0, 1.0),
+    ("CTRL_C_mouth", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLeft", 0.0, 1.0),
+    ("CTRL_C_mouth", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthRight", 0.0, 1.0),
     # upper lip raise
-    connect_expression("CTRL_L_mouth_upperLipRaise", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthUpperLipRaiseL",
-                       0.0, 1.0)
-    connect_expression("CTRL_R_mouth_upperLipRaise", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthUpperLipRaiseR",
-                       0.0, 1.0)
+    ("CTRL_L_mouth_upperLipRaise", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthUpperLipRaiseL", 0.0, 1.0),
+    ("CTRL_R_mouth_upperLipRaise", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthUpperLipRaiseR", 0.0, 1.0),
     # lower lip depress
-    connect_expression("CTRL_L_mouth_lowerLipDepress", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthLowerLipDepressL", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_lowerLipDepress", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthLowerLipDepressR", 0.0, 1.0)
+    ("CTRL_L_mouth_lowerLipDepress", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLowerLipDepressL", 0.0, 1.0),
+    ("CTRL_R_mouth_lowerLipDepress", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLowerLipDepressR", 0.0, 1.0),
     # corner pull
-    connect_expression("CTRL_L_mouth_cornerPull", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCornerPullL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_cornerPull", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCornerPullR", 0.0,
-                       1.0)
+    ("CTRL_L_mouth_cornerPull", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCornerPullL", 0.0, 1.0),
+    ("CTRL_R_mouth_cornerPull", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCornerPullR", 0.0, 1.0),
     # mouth stretch
-    connect_expression("CTRL_L_mouth_stretch", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStretchL", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_stretch", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStretchR", 0.0, 1.0)
+    ("CTRL_L_mouth_stretch", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStretchL", 0.0, 1.0),
+    ("CTRL_R_mouth_stretch", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStretchR", 0.0, 1.0),
     # mouth stretch lips close
-    connect_expression("CTRL_L_mouth_stretchLipsClose", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthStretchLipsCloseL", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_stretchLipsClose", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthStretchLipsCloseR", 0.0, 1.0)
+    ("CTRL_L_mouth_stretchLipsClose", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStretchLipsCloseL", 0.0, 1.0),
+    ("CTRL_R_mouth_stretchLipsClose", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStretchLipsCloseR", 0.0, 1.0),
     # dimpler
-    connect_expression("CTRL_L_mouth_dimple", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthDimpleL", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_dimple", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthDimpleR", 0.0, 1.0)
+    ("CTRL_L_mouth_dimple", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthDimpleL", 0.0, 1.0),
+    ("CTRL_R_mouth_dimple", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthDimpleR", 0.0, 1.0),
     # corner depress
-    connect_expression("CTRL_L_mouth_cornerDepress", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthCornerDepressL",
-                       0.0, 1.0)
-    connect_expression("CTRL_R_mouth_cornerDepress", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthCornerDepressR",
-                       0.0, 1.0)
+    ("CTRL_L_mouth_cornerDepress", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCornerDepressL", 0.0, 1.0),
+    ("CTRL_R_mouth_cornerDepress", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCornerDepressR", 0.0, 1.0),
     # mouth press
-    connect_expression("CTRL_L_mouth_pressU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthPressUL", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_pressU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthPressUR", 0.0, 1.0)
-    connect_expression("CTRL_L_mouth_pressD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthPressDL", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_pressD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthPressDR", 0.0, 1.0)
+    ("CTRL_L_mouth_pressU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthPressUL", 0.0, 1.0),
+    ("CTRL_R_mouth_pressU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthPressUR", 0.0, 1.0),
+    ("CTRL_L_mouth_pressD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthPressDL", 0.0, 1.0),
+    ("CTRL_R_mouth_pressD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthPressDR", 0.0, 1.0),
     # purse
-    connect_expression("CTRL_L_mouth_purseU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPurseUL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_purseU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPurseUR", 0.0,
-                       1.0)
-    connect_expression("CTRL_L_mouth_purseD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPurseDL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_purseD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPurseDR", 0.0,
-                       1.0)
+    ("CTRL_L_mouth_purseU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPurseUL", 0.0, 1.0),
+    ("CTRL_R_mouth_purseU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPurseUR", 0.0, 1.0),
+    ("CTRL_L_mouth_purseD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPurseDL", 0.0, 1.0),
+    ("CTRL_R_mouth_purseD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPurseDR", 0.0, 1.0),
     # lips towards
-    connect_expression("CTRL_L_mouth_towardsU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTowardsUL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_towardsU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTowardsUR", 0.0,
-                       1.0)
-    connect_expression("CTRL_L_mouth_towardsD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTowardsDL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_towardsD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTowardsDR", 0.0,
-                       1.0)
+    ("CTRL_L_mouth_towardsU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTowardsUL", 0.0, 1.0),
+    ("CTRL_R_mouth_towardsU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTowardsUR", 0.0, 1.0),
+    ("CTRL_L_mouth_towardsD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTowardsDL", 0.0, 1.0),
+    ("CTRL_R_mouth_towardsD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTowardsDR", 0.0, 1.0),
     # funnel
-    connect_expression("CTRL_L_mouth_funnelU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthFunnelUL", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_funnelU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthFunnelUR", 0.0, 1.0)
-    connect_expression("CTRL_L_mouth_funnelD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthFunnelDL", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_funnelD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthFunnelDR", 0.0, 1.0)
+    ("CTRL_L_mouth_funnelU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthFunnelUL", 0.0, 1.0),
+    ("CTRL_R_mouth_funnelU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthFunnelUR", 0.0, 1.0),
+    ("CTRL_L_mouth_funnelD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthFunnelDL", 0.0, 1.0),
+    ("CTRL_R_mouth_funnelD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthFunnelDR", 0.0, 1.0),
     # lips together
-    connect_expression("CTRL_L_mouth_lipsTogetherU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthLipsTogetherUL",
-                       0.0, 1.0)
-    connect_expression("CTRL_R_mouth_lipsTogetherU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthLipsTogetherUR",
-                       0.0, 1.0)
-    connect_expression("CTRL_L_mouth_lipsTogetherD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthLipsTogetherDL",
-                       0.0, 1.0)
-    connect_expression("CTRL_R_mouth_lipsTogetherD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthLipsTogetherDR",
-                       0.0, 1.0)
+    ("CTRL_L_mouth_lipsTogetherU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTogetherUL", 0.0, 1.0),
+    ("CTRL_R_mouth_lipsTogetherU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTogetherUR", 0.0, 1.0),
+    ("CTRL_L_mouth_lipsTogetherD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTogetherDL", 0.0, 1.0),
+    ("CTRL_R_mouth_lipsTogetherD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTogetherDR", 0.0, 1.0),
     # upper lip bite
-    connect_expression("CTRL_L_mouth_lipBiteU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthUpperLipBiteL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_lipBiteU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthUpperLipBiteR", 0.0,
-                       1.0)
+    ("CTRL_L_mouth_lipBiteU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthUpperLipBiteL", 0.0, 1.0),
+    ("CTRL_R_mouth_lipBiteU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthUpperLipBiteR", 0.0, 1.0),
     # lower lip bite
-    connect_expression("CTRL_L_mouth_lipBiteD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLowerLipBiteL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_lipBiteD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLowerLipBiteR", 0.0,
-                       1.0)
+    ("CTRL_L_mouth_lipBiteD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLowerLipBiteL", 0.0, 1.0),
+    ("CTRL_R_mouth_lipBiteD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLowerLipBiteR", 0.0, 1.0),
     # lips tighten
-    connect_expression("CTRL_L_mouth_tightenU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTightenUL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_tightenU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTightenUR", 0.0,
-                       1.0)
-    connect_expression("CTRL_L_mouth_tightenD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTightenDL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_tightenD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTightenDR", 0.0,
-                       1.0)
+    ("CTRL_L_mouth_tightenU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTightenUL", 0.0, 1.0),
+    ("CTRL_R_mouth_tightenU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTightenUR", 0.0, 1.0),
+    ("CTRL_L_mouth_tightenD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTightenDL", 0.0, 1.0),
+    ("CTRL_R_mouth_tightenD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsTightenDR", 0.0, 1.0),
     # lips press
-    connect_expression("CTRL_L_mouth_lipsPressU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPressL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_lipsPressU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPressR", 0.0,
-                       1.0)
+    ("CTRL_L_mouth_lipsPressU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPressL", 0.0, 1.0),
+    ("CTRL_R_mouth_lipsPressU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPressR", 0.0, 1.0),
     # sharp corner pull
-    connect_expression("CTRL_L_mouth_sharpCornerPull", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthSharpCornerPullL", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_sharpCornerPull", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthSharpCornerPullR", 0.0, 1.0)
+    ("CTRL_L_mouth_sharpCornerPull", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthSharpCornerPullL", 0.0, 1.0),
+    ("CTRL_R_mouth_sharpCornerPull", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthSharpCornerPullR", 0.0, 1.0),
     # mouth sticky
-    connect_expression("CTRL_C_mouth_stickyU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyUC", 0.0, 1.0)
-    connect_expression("CTRL_L_mouth_stickyInnerU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyUINL",
-                       0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_stickyInnerU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyUINR",
-                       0.0,
-                       1.0)
-    connect_expression("CTRL_L_mouth_stickyOuterU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyUOUTL",
-                       0.0, 1.0)
-    connect_expression("CTRL_R_mouth_stickyOuterU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyUOUTR",
-                       0.0, 1.0)
-    connect_expression("CTRL_C_mouth_stickyD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyDC", 0.0, 1.0)
-    connect_expression("CTRL_L_mouth_stickyInnerD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyDINL",
-                       0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_stickyInnerD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyDINR",
-                       0.0,
-                       1.0)
-    connect_expression("CTRL_L_mouth_stickyOuterD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyDOUTL",
-                       0.0, 1.0)
-    connect_expression("CTRL_R_mouth_stickyOuterD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyDOUTR",
-                       0.0, 1.0)
-    # sticky lips
-    cmds_set_driven_keyframe("CTRL_expressions.mouthLipsStickyLPh1", itt="linear", ott="linear",
-                             currentDriver="CTRL_L_mouth_lipSticky.ty", driverValue=0, value=0)
-    cmds_set_driven_keyframe("CTRL_expressions.mouthLipsStickyLPh1", itt="linear", ott="linear",
-                             currentDriver="CTRL_L_mouth_lipSticky.ty", driverValue=0.33, value=1)
-    cmds_set_driven_keyframe("CTRL_expressions.mouthLipsStickyLPh1", itt="linear", ott="linear",
-                             currentDriver="CTRL_L_mouth_lipSticky.ty", driverValue=0.66, value=0)
-    cmds_set_driven_keyframe("CTRL_expressions.mouthLipsStickyLPh2", itt="linear", ott="linear",
-                             currentDriver="CTRL_L_mouth_lipSticky.ty", driverValue=0.33, value=0)
-    cmds_set_driven_keyframe("CTRL_expressions.mouthLipsStickyLPh2", itt="linear", ott="linear",
-                             currentDriver="CTRL_L_mouth_lipSticky.ty", driverValue=0.66, value=1)
-    cmds_set_driven_keyframe("CTRL_expressions.mouthLipsStickyLPh2", itt="linear", ott="linear",
-                             currentDriver="CTRL_L_mouth_lipSticky.ty", driverValue=1, value=0)
-    cmds_set_driven_keyframe("CTRL_expressions.mouthLipsStickyLPh3", itt="linear", ott="linear",
-                             currentDriver="CTRL_L_mouth_lipSticky.ty", driverValue=0.66, value=0)
-    cmds_set_driven_keyframe("CTRL_expressions.mouthLipsStickyLPh3", itt="linear", ott="linear",
-                             currentDriver="CTRL_L_mouth_lipSticky.ty", driverValue=1, value=1)
-    cmds_set_driven_keyframe("CTRL_expressions.mouthLipsStickyRPh1", itt="linear", ott="linear",
-                             currentDriver="CTRL_R_mouth_lipSticky.ty", driverValue=0, value=0)
-    cmds_set_driven_keyframe("CTRL_expressions.mouthLipsStickyRPh1", itt="linear", ott="linear",
-                             currentDriver="CTRL_R_mouth_lipSticky.ty", driverValue=0.33, value=1)
-    cmds_set_driven_keyframe("CTRL_expressions.mouthLipsStickyRPh1", itt="linear", ott="linear",
-                             currentDriver="CTRL_R_mouth_lipSticky.ty", driverValue=0.66, value=0)
-    cmds_set_driven_keyframe("CTRL_expressions.mouthLipsStickyRPh2", itt="linear", ott="linear",
-                             currentDriver="CTRL_R_mouth_lipSticky.ty", driverValue=0.33, value=0)
-    cmds_set_driven_keyframe("CTRL_expressions.mouthLipsStickyRPh2", itt="linear", ott="linear",
-                             currentDriver="CTRL_R_mouth_lipSticky.ty", driverValue=0.66, value=1)
-    cmds_set_driven_keyframe("CTRL_expressions.mouthLipsStickyRPh2", itt="linear", ott="linear",
-                             currentDriver="CTRL_R_mouth_lipSticky.ty", driverValue=1, value=0)
-    cmds_set_driven_keyframe("CTRL_expressions.mouthLipsStickyRPh3", itt="linear", ott="linear",
-                             currentDriver="CTRL_R_mouth_lipSticky.ty", driverValue=0.66, value=0)
-    cmds_set_driven_keyframe("CTRL_expressions.mouthLipsStickyRPh3", itt="linear", ott="linear",
-                             currentDriver="CTRL_R_mouth_lipSticky.ty", driverValue=1, value=1)
+    ("CTRL_C_mouth_stickyU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyUC", 0.0, 1.0),
+    ("CTRL_L_mouth_stickyInnerU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyUINL", 0.0, 1.0),
+    ("CTRL_R_mouth_stickyInnerU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyUINR", 0.0, 1.0),
+    ("CTRL_L_mouth_stickyOuterU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyUOUTL", 0.0, 1.0),
+    ("CTRL_R_mouth_stickyOuterU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyUOUTR", 0.0, 1.0),
+    ("CTRL_C_mouth_stickyD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyDC", 0.0, 1.0),
+    ("CTRL_L_mouth_stickyInnerD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyDINL", 0.0, 1.0),
+    ("CTRL_R_mouth_stickyInnerD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyDINR", 0.0, 1.0),
+    ("CTRL_L_mouth_stickyOuterD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyDOUTL", 0.0, 1.0),
+    ("CTRL_R_mouth_stickyOuterD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthStickyDOUTR", 0.0, 1.0),
     # lips push/pull
-    connect_expression("CTRL_L_mouth_pushPullU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPushUL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_pushPullU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPushUR", 0.0,
-                       1.0)
-    connect_expression("CTRL_L_mouth_pushPullD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPushDL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_pushPullD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPushDR", 0.0,
-                       1.0)
-    connect_expression("CTRL_L_mouth_pushPullU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsPullUL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_pushPullU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsPullUR", 0.0,
-                       1.0)
-    connect_expression("CTRL_L_mouth_pushPullD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsPullDL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_pushPullD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsPullDR", 0.0,
-                       1.0)
+    ("CTRL_L_mouth_pushPullU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPushUL", 0.0, 1.0),
+    ("CTRL_R_mouth_pushPullU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPushUR", 0.0, 1.0),
+    ("CTRL_L_mouth_pushPullD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPushDL", 0.0, 1.0),
+    ("CTRL_R_mouth_pushPullD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsPushDR", 0.0, 1.0),
+    ("CTRL_L_mouth_pushPullU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsPullUL", 0.0, 1.0),
+    ("CTRL_R_mouth_pushPullU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsPullUR", 0.0, 1.0),
+    ("CTRL_L_mouth_pushPullD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsPullDL", 0.0, 1.0),
+    ("CTRL_R_mouth_pushPullD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsPullDR", 0.0, 1.0),
     # lips thin/thick
-    connect_expression("CTRL_L_mouth_thicknessU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsThinUL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_thicknessU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsThinUR", 0.0,
-                       1.0)
-    connect_expression("CTRL_L_mouth_thicknessD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsThinDL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_mouth_thicknessD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsThinDR", 0.0,
-                       1.0)
-    connect_expression("CTRL_L_mouth_thicknessU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsThickUL",
-                       0.0, 1.0)
-    connect_expression("CTRL_R_mouth_thicknessU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsThickUR",
-                       0.0, 1.0)
-    connect_expression("CTRL_L_mouth_thicknessD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsThickDL",
-                       0.0, 1.0)
-    connect_expression("CTRL_R_mouth_thicknessD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsThickDR",
-                       0.0, 1.0)
+    ("CTRL_L_mouth_thicknessU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsThinUL", 0.0, 1.0),
+    ("CTRL_R_mouth_thicknessU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsThinUR", 0.0, 1.0),
+    ("CTRL_L_mouth_thicknessD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsThinDL", 0.0, 1.0),
+    ("CTRL_R_mouth_thicknessD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsThinDR", 0.0, 1.0),
+    ("CTRL_L_mouth_thicknessU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsThickUL", 0.0, 1.0),
+    ("CTRL_R_mouth_thicknessU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsThickUR", 0.0, 1.0),
+    ("CTRL_L_mouth_thicknessD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsThickDL", 0.0, 1.0),
+    ("CTRL_R_mouth_thicknessD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsThickDR", 0.0, 1.0),
     # lips thin/thick inward
-    connect_expression("CTRL_L_mouth_thicknessInwardU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                      "mouthLipsThinInwardUL", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_thicknessInwardU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                      "mouthLipsThinInwardUR", 0.0, 1.0)
-    connect_expression("CTRL_L_mouth_thicknessInwardD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                      "mouthLipsThinInwardDL", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_thicknessInwardD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                      "mouthLipsThinInwardDR", 0.0, 1.0)
-    connect_expression("CTRL_L_mouth_thicknessInwardU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions",
-                      "mouthLipsThickInwardUL", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_thicknessInwardU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions",
-                      "mouthLipsThickInwardUR", 0.0, 1.0)
-    connect_expression("CTRL_L_mouth_thicknessInwardD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions",
-                      "mouthLipsThickInwardDL", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_thicknessInwardD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions",
-                      "mouthLipsThickInwardDR", 0.0, 1.0)
+    ("CTRL_L_mouth_thicknessInwardU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsThinInwardUL", 0.0, 1.0),
+    ("CTRL_R_mouth_thicknessInwardU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsThinInwardUR", 0.0, 1.0),
+    ("CTRL_L_mouth_thicknessInwardD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsThinInwardDL", 0.0, 1.0),
+    ("CTRL_R_mouth_thicknessInwardD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLipsThinInwardDR", 0.0, 1.0),
+    ("CTRL_L_mouth_thicknessInwardU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsThickInwardUL", 0.0,
+     1.0),
+    ("CTRL_R_mouth_thicknessInwardU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsThickInwardUR", 0.0,
+     1.0),
+    ("CTRL_L_mouth_thicknessInwardD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsThickInwardDL", 0.0,
+     1.0),
+    ("CTRL_R_mouth_thicknessInwardD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLipsThickInwardDR", 0.0,
+     1.0),
     # corner sharpen
-    connect_expression("CTRL_L_mouth_cornerSharpnessU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthCornerSharpenUL", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_cornerSharpnessU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthCornerSharpenUR", 0.0, 1.0)
-    connect_expression("CTRL_L_mouth_cornerSharpnessD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthCornerSharpenDL", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_cornerSharpnessD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthCornerSharpenDR", 0.0, 1.0)
-    connect_expression("CTRL_L_mouth_cornerSharpnessU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions",
-                       "mouthCornerRounderUL", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_cornerSharpnessU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions",
-                       "mouthCornerRounderUR", 0.0, 1.0)
-    connect_expression("CTRL_L_mouth_cornerSharpnessD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions",
-                       "mouthCornerRounderDL", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_cornerSharpnessD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions",
-                       "mouthCornerRounderDR", 0.0, 1.0)
+    ("CTRL_L_mouth_cornerSharpnessU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCornerSharpenUL", 0.0, 1.0),
+    ("CTRL_R_mouth_cornerSharpnessU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCornerSharpenUR", 0.0, 1.0),
+    ("CTRL_L_mouth_cornerSharpnessD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCornerSharpenDL", 0.0, 1.0),
+    ("CTRL_R_mouth_cornerSharpnessD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCornerSharpenDR", 0.0, 1.0),
+    ("CTRL_L_mouth_cornerSharpnessU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthCornerRounderUL", 0.0, 1.0),
+    ("CTRL_R_mouth_cornerSharpnessU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthCornerRounderUR", 0.0, 1.0),
+    ("CTRL_L_mouth_cornerSharpnessD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthCornerRounderDL", 0.0, 1.0),
+    ("CTRL_R_mouth_cornerSharpnessD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthCornerRounderDR", 0.0, 1.0),
     # lips towards
-    connect_expression("CTRL_L_mouth_lipsTowardsTeethU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthUpperLipTowardsTeethL", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_lipsTowardsTeethU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthUpperLipTowardsTeethR", 0.0, 1.0)
-    connect_expression("CTRL_L_mouth_lipsTowardsTeethD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthLowerLipTowardsTeethL", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_lipsTowardsTeethD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthLowerLipTowardsTeethR", 0.0, 1.0)
+    ("CTRL_L_mouth_lipsTowardsTeethU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthUpperLipTowardsTeethL", 0.0,
+     1.0),
+    ("CTRL_R_mouth_lipsTowardsTeethU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthUpperLipTowardsTeethR", 0.0,
+     1.0),
+    ("CTRL_L_mouth_lipsTowardsTeethD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLowerLipTowardsTeethL", 0.0,
+     1.0),
+    ("CTRL_R_mouth_lipsTowardsTeethD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLowerLipTowardsTeethR", 0.0,
+     1.0),
     # lips shift
-    connect_expression("CTRL_C_mouth_lipShiftU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthUpperLipShiftLeft",
-                       0.0, 1.0)
-    connect_expression("CTRL_C_mouth_lipShiftU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions",
-                       "mouthUpperLipShiftRight", 0.0, 1.0)
-    connect_expression("CTRL_C_mouth_lipShiftD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "mouthLowerLipShiftLeft",
-                       0.0, 1.0)
-    connect_expression("CTRL_C_mouth_lipShiftD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions",
-                       "mouthLowerLipShiftRight", 0.0, 1.0)
+    ("CTRL_C_mouth_lipShiftU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthUpperLipShiftLeft", 0.0, 1.0),
+    ("CTRL_C_mouth_lipShiftU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthUpperLipShiftRight", 0.0, 1.0),
+    ("CTRL_C_mouth_lipShiftD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLowerLipShiftLeft", 0.0, 1.0),
+    ("CTRL_C_mouth_lipShiftD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLowerLipShiftRight", 0.0, 1.0),
     # lips roll
-    connect_expression("CTRL_L_mouth_lipsRollU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthUpperLipRollInL",
-                       0.0, 1.0)
-    connect_expression("CTRL_R_mouth_lipsRollU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthUpperLipRollInR",
-                       0.0, 1.0)
-    connect_expression("CTRL_L_mouth_lipsRollD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLowerLipRollInL",
-                       0.0, 1.0)
-    connect_expression("CTRL_R_mouth_lipsRollD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLowerLipRollInR",
-                       0.0, 1.0)
-    connect_expression("CTRL_L_mouth_lipsRollU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions",
-                       "mouthUpperLipRollOutL",
-                       0.0, 1.0)
-    connect_expression("CTRL_R_mouth_lipsRollU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions",
-                       "mouthUpperLipRollOutR",
-                       0.0, 1.0)
-    connect_expression("CTRL_L_mouth_lipsRollD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions",
-                       "mouthLowerLipRollOutL",
-                       0.0, 1.0)
-    connect_expression("CTRL_R_mouth_lipsRollD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions",
-                       "mouthLowerLipRollOutR",
-                       0.0, 1.0)
+    ("CTRL_L_mouth_lipsRollU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthUpperLipRollInL", 0.0, 1.0),
+    ("CTRL_R_mouth_lipsRollU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthUpperLipRollInR", 0.0, 1.0),
+    ("CTRL_L_mouth_lipsRollD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLowerLipRollInL", 0.0, 1.0),
+    ("CTRL_R_mouth_lipsRollD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthLowerLipRollInR", 0.0, 1.0),
+    ("CTRL_L_mouth_lipsRollU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthUpperLipRollOutL", 0.0, 1.0),
+    ("CTRL_R_mouth_lipsRollU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthUpperLipRollOutR", 0.0, 1.0),
+    ("CTRL_L_mouth_lipsRollD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLowerLipRollOutL", 0.0, 1.0),
+    ("CTRL_R_mouth_lipsRollD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthLowerLipRollOutR", 0.0, 1.0),
     # corners
-    connect_expression("CTRL_L_mouth_corner", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCornerUpL", 0.0, 1.0)
-    connect_expression("CTRL_L_mouth_corner", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthCornerDownL", 0.0,
-                      1.0)
-    connect_expression("CTRL_L_mouth_corner", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCornerWideL", 0.0,
-                      1.0)
-    connect_expression("CTRL_L_mouth_corner", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthCornerNarrowL", 0.0,
-                      1.0)
-    connect_expression("CTRL_R_mouth_corner", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCornerUpR", 0.0, 1.0)
-    connect_expression("CTRL_R_mouth_corner", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthCornerDownR", 0.0,
-                      1.0)
-    connect_expression("CTRL_R_mouth_corner", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCornerWideR", 0.0,
-                      1.0)
-    connect_expression("CTRL_R_mouth_corner", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthCornerNarrowR", 0.0,
-                      1.0)
-
+    ("CTRL_L_mouth_corner", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCornerUpL", 0.0, 1.0),
+    ("CTRL_L_mouth_corner", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthCornerDownL", 0.0, 1.0),
+    ("CTRL_L_mouth_corner", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCornerWideL", 0.0, 1.0),
+    ("CTRL_L_mouth_corner", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthCornerNarrowL", 0.0, 1.0),
+    ("CTRL_R_mouth_corner", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCornerUpR", 0.0, 1.0),
+    ("CTRL_R_mouth_corner", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthCornerDownR", 0.0, 1.0),
+    ("CTRL_R_mouth_corner", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "mouthCornerWideR", 0.0, 1.0),
+    ("CTRL_R_mouth_corner", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "mouthCornerNarrowR", 0.0, 1.0),
     # tongue move up/down/left/right
-    connect_expression("CTRL_C_tongue_move", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueUp", 0.0, 1.0)
-    connect_expression("CTRL_C_tongue_move", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "tongueDown", 0.0, 1.0)
-    connect_expression("CTRL_C_tongue_move", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueLeft", 0.0, 1.0)
-    connect_expression("CTRL_C_tongue_move", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "tongueRight", 0.0, 1.0)
+    ("CTRL_C_tongue_move", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueUp", 0.0, 1.0),
+    ("CTRL_C_tongue_move", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "tongueDown", 0.0, 1.0),
+    ("CTRL_C_tongue_move", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueLeft", 0.0, 1.0),
+    ("CTRL_C_tongue_move", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "tongueRight", 0.0, 1.0),
     # tongue in/out
-    connect_expression("CTRL_C_tongue_inOut", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueIn", 0.0, 1.0)
-    connect_expression("CTRL_C_tongue_inOut", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "tongueOut", 0.0, 1.0)
+    ("CTRL_C_tongue_inOut", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueIn", 0.0, 1.0),
+    ("CTRL_C_tongue_inOut", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "tongueOut", 0.0, 1.0),
     # tongue bend up/down and twist left/right
-    connect_expression("CTRL_C_tongue_bendTwist", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueBendUp", 0.0,
-                      1.0)
-    connect_expression("CTRL_C_tongue_bendTwist", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "tongueBendDown", 0.0,
-                      1.0)
-    connect_expression("CTRL_C_tongue_bendTwist", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueTwistLeft", 0.0,
-                      1.0)
-    connect_expression("CTRL_C_tongue_bendTwist", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "tongueTwistRight",
-                      0.0, 1.0)
+    ("CTRL_C_tongue_bendTwist", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueBendUp", 0.0, 1.0),
+    ("CTRL_C_tongue_bendTwist", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "tongueBendDown", 0.0, 1.0),
+    ("CTRL_C_tongue_bendTwist", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueTwistLeft", 0.0, 1.0),
+    ("CTRL_C_tongue_bendTwist", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "tongueTwistRight", 0.0, 1.0),
     # tongue tip move up/down/left/right
-    connect_expression("CTRL_C_tongue_tipMove", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueTipUp", 0.0, 1.0)
-    connect_expression("CTRL_C_tongue_tipMove", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "tongueTipDown", 0.0,
-                      1.0)
-    connect_expression("CTRL_C_tongue_tipMove", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueTipLeft", 0.0, 1.0)
-    connect_expression("CTRL_C_tongue_tipMove", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "tongueTipRight", 0.0,
-                      1.0)
+    ("CTRL_C_tongue_tipMove", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueTipUp", 0.0, 1.0),
+    ("CTRL_C_tongue_tipMove", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "tongueTipDown", 0.0, 1.0),
+    ("CTRL_C_tongue_tipMove", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueTipLeft", 0.0, 1.0),
+    ("CTRL_C_tongue_tipMove", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "tongueTipRight", 0.0, 1.0),
     # tongue wide/narrow
-    connect_expression("CTRL_C_tongue_wideNarrow", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueWide", 0.0, 1.0)
-    connect_expression("CTRL_C_tongue_wideNarrow", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "tongueNarrow", 0.0,
-                      1.0)
+    ("CTRL_C_tongue_wideNarrow", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueWide", 0.0, 1.0),
+    ("CTRL_C_tongue_wideNarrow", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "tongueNarrow", 0.0, 1.0),
     # tongue press
-    connect_expression("CTRL_C_tongue_press", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tonguePress", 0.0, 1.0)
+    ("CTRL_C_tongue_press", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tonguePress", 0.0, 1.0),
     # tongue roll
-    connect_expression("CTRL_C_tongue_roll", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueRoll", 0.0, 1.0)
+    ("CTRL_C_tongue_roll", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueRoll", 0.0, 1.0),
     # tongue thick/thin
-    connect_expression("CTRL_C_tongue_thickThin", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueThick", 0.0, 1.0)
-    connect_expression("CTRL_C_tongue_thickThin", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "tongueThin", 0.0, 1.0)
+    ("CTRL_C_tongue_thickThin", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "tongueThick", 0.0, 1.0),
+    ("CTRL_C_tongue_thickThin", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "tongueThin", 0.0, 1.0),
     # jaw open
-    connect_expression("CTRL_C_jaw", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawOpen", 0.0, 1.0)
+    ("CTRL_C_jaw", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawOpen", 0.0, 1.0),
     # jaw left/right
-    connect_expression("CTRL_C_jaw", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "jawLeft", 0.0, 1.0)
-    connect_expression("CTRL_C_jaw", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawRight", 0.0, 1.0)
+    ("CTRL_C_jaw", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "jawLeft", 0.0, 1.0),
+    ("CTRL_C_jaw", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawRight", 0.0, 1.0),
     # jaw back/fwd
-    connect_expression("CTRL_C_jaw_fwdBack", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "jawFwd", 0.0, 1.0)
-    connect_expression("CTRL_C_jaw_fwdBack", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawBack", 0.0, 1.0)
+    ("CTRL_C_jaw_fwdBack", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "jawFwd", 0.0, 1.0),
+    ("CTRL_C_jaw_fwdBack", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawBack", 0.0, 1.0),
     # jaw clench
-    connect_expression("CTRL_L_jaw_clench", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawClenchL", 0.0, 1.0)
-    connect_expression("CTRL_R_jaw_clench", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawClenchR", 0.0, 1.0)
+    ("CTRL_L_jaw_clench", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawClenchL", 0.0, 1.0),
+    ("CTRL_R_jaw_clench", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawClenchR", 0.0, 1.0),
     # chin raise
-    connect_expression("CTRL_L_jaw_ChinRaiseU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawChinRaiseUL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_jaw_ChinRaiseU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawChinRaiseUR", 0.0,
-                       1.0)
-    connect_expression("CTRL_L_jaw_ChinRaiseD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawChinRaiseDL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_jaw_ChinRaiseD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawChinRaiseDR", 0.0,
-                       1.0)
+    ("CTRL_L_jaw_ChinRaiseU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawChinRaiseUL", 0.0, 1.0),
+    ("CTRL_R_jaw_ChinRaiseU", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawChinRaiseUR", 0.0, 1.0),
+    ("CTRL_L_jaw_ChinRaiseD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawChinRaiseDL", 0.0, 1.0),
+    ("CTRL_R_jaw_ChinRaiseD", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawChinRaiseDR", 0.0, 1.0),
     # chin compress
-    connect_expression("CTRL_L_jaw_chinCompress", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawChinCompressL", 0.0,
-                       1.0)
-    connect_expression("CTRL_R_jaw_chinCompress", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawChinCompressR", 0.0,
-                       1.0)
+    ("CTRL_L_jaw_chinCompress", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawChinCompressL", 0.0, 1.0),
+    ("CTRL_R_jaw_chinCompress", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawChinCompressR", 0.0, 1.0),
     # jaw open extreme
-    connect_expression("CTRL_C_jaw_openExtreme", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawOpenExtreme", 0.0,
-                       1.0)
+    ("CTRL_C_jaw_openExtreme", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "jawOpenExtreme", 0.0, 1.0),
     # neck stretch
-    connect_expression("CTRL_L_neck_stretch", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "neckStretchL", 0.0, 1.0)
-    connect_expression("CTRL_R_neck_stretch", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "neckStretchR", 0.0, 1.0)
-    # swallow
-    cmds_set_driven_keyframe("CTRL_expressions.neckSwallowPh1", itt="linear", ott="linear",
-                             currentDriver="CTRL_C_neck_swallow.ty", driverValue=0, value=0)
-    cmds_set_driven_keyframe("CTRL_expressions.neckSwallowPh1", itt="linear", ott="linear",
-                             currentDriver="CTRL_C_neck_swallow.ty", driverValue=0.2, value=1)
-    cmds_set_driven_keyframe("CTRL_expressions.neckSwallowPh1", itt="linear", ott="linear",
-                             currentDriver="CTRL_C_neck_swallow.ty", driverValue=0.4, value=0)
-    cmds_set_driven_keyframe("CTRL_expressions.neckSwallowPh2", itt="linear", ott="linear",
-                             currentDriver="CTRL_C_neck_swallow.ty", driverValue=0.2, value=0)
-    cmds_set_driven_keyframe("CTRL_expressions.neckSwallowPh2", itt="linear", ott="linear",
-                             currentDriver="CTRL_C_neck_swallow.ty", driverValue=0.4, value=1)
-    cmds_set_driven_keyframe("CTRL_expressions.neckSwallowPh2", itt="linear", ott="linear",
-                             currentDriver="CTRL_C_neck_swallow.ty", driverValue=0.6, value=0)
-    cmds_set_driven_keyframe("CTRL_expressions.neckSwallowPh3", itt="linear", ott="linear",
-                             currentDriver="CTRL_C_neck_swallow.ty", driverValue=0.4, value=0)
-    cmds_set_driven_keyframe("CTRL_expressions.neckSwallowPh3", itt="linear", ott="linear",
-                             currentDriver="CTRL_C_neck_swallow.ty", driverValue=0.6, value=1)
-    cmds_set_driven_keyframe("CTRL_expressions.neckSwallowPh3", itt="linear", ott="linear",
-                             currentDriver="CTRL_C_neck_swallow.ty", driverValue=0.8, value=0)
-    cmds_set_driven_keyframe("CTRL_expressions.neckSwallowPh4", itt="linear", ott="linear",
-                             currentDriver="CTRL_C_neck_swallow.ty", driverValue=0.6, value=0)
-    cmds_set_driven_keyframe("CTRL_expressions.neckSwallowPh4", itt="linear", ott="linear",
-                             currentDriver="CTRL_C_neck_swallow.ty", driverValue=0.8, value=1)
-    cmds_set_driven_keyframe("CTRL_expressions.neckSwallowPh4", itt="linear", ott="linear",
-                             currentDriver="CTRL_C_neck_swallow.ty", driverValue=1, value=0)
+    ("CTRL_L_neck_stretch", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "neckStretchL", 0.0, 1.0),
+    ("CTRL_R_neck_stretch", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "neckStretchR", 0.0, 1.0),
     # mastoid contract
-    connect_expression("CTRL_L_neck_mastoidContract", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "neckMastoidContractL", 0.0, 1.0)
-    connect_expression("CTRL_R_neck_mastoidContract", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "neckMastoidContractR", 0.0, 1.0)
+    ("CTRL_L_neck_mastoidContract", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "neckMastoidContractL", 0.0, 1.0),
+    ("CTRL_R_neck_mastoidContract", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "neckMastoidContractR", 0.0, 1.0),
     # throat down/up
-    connect_expression("CTRL_neck_throatUpDown", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "neckThroatDown", 0.0,
-                       1.0)
-    connect_expression("CTRL_neck_throatUpDown", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "neckThroatUp", 0.0,
-                       1.0)
+    ("CTRL_neck_throatUpDown", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "neckThroatDown", 0.0, 1.0),
+    ("CTRL_neck_throatUpDown", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "neckThroatUp", 0.0, 1.0),
     # digastric down/up
-    connect_expression("CTRL_neck_digastricUpDown", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "neckDigastricDown",
-                       0.0, 1.0)
-    connect_expression("CTRL_neck_digastricUpDown", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "neckDigastricUp",
-                       0.0, 1.0)
+    ("CTRL_neck_digastricUpDown", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "neckDigastricDown", 0.0, 1.0),
+    ("CTRL_neck_digastricUpDown", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "neckDigastricUp", 0.0, 1.0),
     # exhale/inhale
-    connect_expression("CTRL_neck_throatExhaleInhale", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions",
-                       "neckThroatExhale", 0.0, 1.0)
-    connect_expression("CTRL_neck_throatExhaleInhale", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions",
-                       "neckThroatInhale",
-                       0.0, 1.0)
+    ("CTRL_neck_throatExhaleInhale", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "neckThroatExhale", 0.0, 1.0),
+    ("CTRL_neck_throatExhaleInhale", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "neckThroatInhale", 0.0, 1.0),
     # upper teeth
-    connect_expression("CTRL_C_teethU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "teethUpU", 0.0, 1.0)
-    connect_expression("CTRL_C_teethU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "teethDownU", 0.0, 1.0)
-    connect_expression("CTRL_C_teethU", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "teethLeftU", 0.0, 1.0)
-    connect_expression("CTRL_C_teethU", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "teethRightU", 0.0, 1.0)
-    connect_expression("CTRL_C_teeth_fwdBackU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "teethBackU", 0.0, 1.0)
-    connect_expression("CTRL_C_teeth_fwdBackU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "teethFwdU", 0.0, 1.0)
+    ("CTRL_C_teethU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "teethUpU", 0.0, 1.0),
+    ("CTRL_C_teethU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "teethDownU", 0.0, 1.0),
+    ("CTRL_C_teethU", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "teethLeftU", 0.0, 1.0),
+    ("CTRL_C_teethU", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "teethRightU", 0.0, 1.0),
+    ("CTRL_C_teeth_fwdBackU", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "teethBackU", 0.0, 1.0),
+    ("CTRL_C_teeth_fwdBackU", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "teethFwdU", 0.0, 1.0),
     # lower teeth
-    connect_expression("CTRL_C_teethD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "teethUpD", 0.0, 1.0)
-    connect_expression("CTRL_C_teethD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "teethDownD", 0.0, 1.0)
-    connect_expression("CTRL_C_teethD", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "teethLeftD", 0.0, 1.0)
-    connect_expression("CTRL_C_teethD", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "teethRightD", 0.0, 1.0)
-    connect_expression("CTRL_C_teeth_fwdBackD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "teethBackD", 0.0, 1.0)
-    connect_expression("CTRL_C_teeth_fwdBackD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "teethFwdD", 0.0, 1.0)
+    ("CTRL_C_teethD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "teethUpD", 0.0, 1.0),
+    ("CTRL_C_teethD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "teethDownD", 0.0, 1.0),
+    ("CTRL_C_teethD", "tx", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "teethLeftD", 0.0, 1.0),
+    ("CTRL_C_teethD", "tx", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "teethRightD", 0.0, 1.0),
+    ("CTRL_C_teeth_fwdBackD", "ty", -1.0, 1.0, 0.0, 1.0, "CTRL_expressions", "teethBackD", 0.0, 1.0),
+    ("CTRL_C_teeth_fwdBackD", "ty", -1.0, 1.0, 0.0, -1.0, "CTRL_expressions", "teethFwdD", 0.0, 1.0),
+    # look at switch
+    ("CTRL_lookAtSwitch", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "lookAtSwitch", 0.0, 1.0),
+)
+
+# Same as EXPRESSION_CONNECTIONS, connected only when the analog GUI is loaded
+ANALOG_EXPRESSION_CONNECTIONS = (
+    # eyes look up/down/left/right
+    ("LOC_L_eyeDriver", "rx", -30.0, 40.0, 0.0, -30.0, "CTRL_expressions", "eyeLookUpL", 0.0, 1.0),
+    ("LOC_R_eyeDriver", "rx", -30.0, 40.0, 0.0, -30.0, "CTRL_expressions", "eyeLookUpR", 0.0, 1.0),
+    ("LOC_L_eyeDriver", "rx", -30.0, 40.0, 0.0, 40.0, "CTRL_expressions", "eyeLookDownL", 0.0, 1.0),
+    ("LOC_R_eyeDriver", "rx", -30.0, 40.0, 0.0, 40.0, "CTRL_expressions", "eyeLookDownR", 0.0, 1.0),
+    ("LOC_L_eyeDriver", "ry", -40.0, 40.0, 0.0, 40.0, "CTRL_expressions", "eyeLookLeftL", 0.0, 1.0),
+    ("LOC_R_eyeDriver", "ry", -40.0, 40.0, 0.0, 40.0, "CTRL_expressions", "eyeLookLeftR", 0.0, 1.0),
+    ("LOC_L_eyeDriver", "ry", -40.0, 40.0, 0.0, -40.0, "CTRL_expressions", "eyeLookRightL", 0.0, 1.0),
+    ("LOC_R_eyeDriver", "ry", -40.0, 40.0, 0.0, -40.0, "CTRL_expressions", "eyeLookRightR", 0.0, 1.0),
+)
+
+# Expressions driven by more than two keys: driven attribute, driver attribute, driver value, value
+EXPRESSION_DRIVEN_KEYS = (
+    # sticky lips
+    ("CTRL_expressions.mouthLipsStickyLPh1", "CTRL_L_mouth_lipSticky.ty", 0.0, 0.0),
+    ("CTRL_expressions.mouthLipsStickyLPh1", "CTRL_L_mouth_lipSticky.ty", 0.33, 1.0),
+    ("CTRL_expressions.mouthLipsStickyLPh1", "CTRL_L_mouth_lipSticky.ty", 0.66, 0.0),
+    ("CTRL_expressions.mouthLipsStickyLPh2", "CTRL_L_mouth_lipSticky.ty", 0.33, 0.0),
+    ("CTRL_expressions.mouthLipsStickyLPh2", "CTRL_L_mouth_lipSticky.ty", 0.66, 1.0),
+    ("CTRL_expressions.mouthLipsStickyLPh2", "CTRL_L_mouth_lipSticky.ty", 1.0, 0.0),
+    ("CTRL_expressions.mouthLipsStickyLPh3", "CTRL_L_mouth_lipSticky.ty", 0.66, 0.0),
+    ("CTRL_expressions.mouthLipsStickyLPh3", "CTRL_L_mouth_lipSticky.ty", 1.0, 1.0),
+    ("CTRL_expressions.mouthLipsStickyRPh1", "CTRL_R_mouth_lipSticky.ty", 0.0, 0.0),
+    ("CTRL_expressions.mouthLipsStickyRPh1", "CTRL_R_mouth_lipSticky.ty", 0.33, 1.0),
+    ("CTRL_expressions.mouthLipsStickyRPh1", "CTRL_R_mouth_lipSticky.ty", 0.66, 0.0),
+    ("CTRL_expressions.mouthLipsStickyRPh2", "CTRL_R_mouth_lipSticky.ty", 0.33, 0.0),
+    ("CTRL_expressions.mouthLipsStickyRPh2", "CTRL_R_mouth_lipSticky.ty", 0.66, 1.0),
+    ("CTRL_expressions.mouthLipsStickyRPh2", "CTRL_R_mouth_lipSticky.ty", 1.0, 0.0),
+    ("CTRL_expressions.mouthLipsStickyRPh3", "CTRL_R_mouth_lipSticky.ty", 0.66, 0.0),
+    ("CTRL_expressions.mouthLipsStickyRPh3", "CTRL_R_mouth_lipSticky.ty", 1.0, 1.0),
+    # swallow
+    ("CTRL_expressions.neckSwallowPh1", "CTRL_C_neck_swallow.ty", 0.0, 0.0),
+    ("CTRL_expressions.neckSwallowPh1", "CTRL_C_neck_swallow.ty", 0.2, 1.0),
+    ("CTRL_expressions.neckSwallowPh1", "CTRL_C_neck_swallow.ty", 0.4, 0.0),
+    ("CTRL_expressions.neckSwallowPh2", "CTRL_C_neck_swallow.ty", 0.2, 0.0),
+    ("CTRL_expressions.neckSwallowPh2", "CTRL_C_neck_swallow.ty", 0.4, 1.0),
+    ("CTRL_expressions.neckSwallowPh2", "CTRL_C_neck_swallow.ty", 0.6, 0.0),
+    ("CTRL_expressions.neckSwallowPh3", "CTRL_C_neck_swallow.ty", 0.4, 0.0),
+    ("CTRL_expressions.neckSwallowPh3", "CTRL_C_neck_swallow.ty", 0.6, 1.0),
+    ("CTRL_expressions.neckSwallowPh3", "CTRL_C_neck_swallow.ty", 0.8, 0.0),
+    ("CTRL_expressions.neckSwallowPh4", "CTRL_C_neck_swallow.ty", 0.6, 0.0),
+    ("CTRL_expressions.neckSwallowPh4", "CTRL_C_neck_swallow.ty", 0.8, 1.0),
+    ("CTRL_expressions.neckSwallowPh4", "CTRL_C_neck_swallow.ty", 1.0, 0.0),
+)
+
+
+# ****************************************************************************************************
+def connect_expressions():
+    """
+    This method would connect GUI with raw controls. Raw controls are driven by rig logic while the user
+    manipulates GUI controls.
+    """
 
     # look at switch
     cmds_add_attr("CTRL_expressions", longName="lookAtSwitch", attributeType="float", defaultValue=0.0, minValue=0.0,
                   maxValue=1.0, keyable=1)
-    connect_expression("CTRL_lookAtSwitch", "ty", 0.0, 1.0, 0.0, 1.0, "CTRL_expressions", "lookAtSwitch", 0.0, 1.0)
+
+    connections = list(EXPRESSION_CONNECTIONS)
+    if analog_gui_loaded():
+        connections.extend(ANALOG_EXPRESSION_CONNECTIONS)
+
+    # create all driver attributes before connecting any of them
+    add_driver_attributes(connections)
+
+    driven_keys = list(EXPRESSION_DRIVEN_KEYS)
+    for driverCtrl, driverAttr, _, _, driverKey1, driverKey2, expCtrl, expAttr, expKey1, expKey2 in connections:
+        driven_keys.append((f"{expCtrl}.{expAttr}", f"{driverCtrl}.{driverAttr}", driverKey1, expKey1))
+        driven_keys.append((f"{expCtrl}.{expAttr}", f"{driverCtrl}.{driverAttr}", driverKey2, expKey2))
+    set_driven_keys(driven_keys)
+
+
+# ****************************************************************************************************
+def add_driver_attributes(connections):
+    """
+    Creates driver attributes that don't exist yet, each one only once.
+    """
+
+    checked = set()
+    for driverCtrl, driverAttr, minVal, maxVal, *_ in connections:
+        driver = f"{driverCtrl}.{driverAttr}"
+        if driver in checked:
+            continue
+        checked.add(driver)
+        if not cmds_exists(driver):
+            cmds_add_attr(driverCtrl, longName=driverAttr, keyable=True, attributeType="float", minValue=minVal,
+                          maxValue=maxVal, dv=0.0)
+
+
+def set_driven_keys(driven_keys):
+    """
+    Creates the same network setDrivenKeyframe would, for all given keys in one pass. Keys with the same driver and
+    driven attribute share one curve, attributes with multiple drivers get a blendWeighted node. Driven key curves have
+    a unitless input, angle and distance drivers go through a unitConversion node, so the driver values are keyed in UI
+    units like setDrivenKeyframe keys them. Attributes that are already driven fall back to setDrivenKeyframe, which
+    extends the existing network. A driven attribute that fails is reported and skipped.
+    """
+
+    curve_keys = {}
+    for driven, driver, driver_value, value in driven_keys:
+        curve_keys.setdefault((driven, driver), []).append((driver_value, value))
+    drivers = {}
+    for driven, driver in curve_keys:
+        drivers.setdefault(driven, []).append(driver)
+
+    modifier = OpenMaya.MDGModifier()
+    networks = []
+    for driven, driven_by in drivers.items():
+        driven_plug = get_plug(driven)
+        driver_plugs = [get_plug(driver) for driver in driven_by]
+        if driven_plug is None or None in driver_plugs:
+            continue
+        if driven_plug.isDestination:
+            for driver in driven_by:
+                for driver_value, value in curve_keys[(driven, driver)]:
+                    cmds_set_driven_keyframe(driven, itt="linear", ott="linear", currentDriver=driver,
+                                             driverValue=driver_value, value=value)
+            continue
+
+        try:
+            curves = []
+            conversions = []
+            for driver_plug in driver_plugs:
+                curves.append(modifier.createNode(f"animCurveU{get_curve_unit(driven_plug)}"))
+                modifier.renameNode(curves[-1], driven.replace(".", "_"))
+                conversions.append(modifier.createNode("unitConversion")
+                                   if get_ui_unit_factor(driver_plug) is not None else None)
+            blend = modifier.createNode("blendWeighted") if len(curves) > 1 else None
+        except Exception as ex:
+            stderr.write(f"Creating driven keys of {driven} failed. Error: {ex} \n")
+            continue
+        networks.append((driven, driven_by, driven_plug, driver_plugs, curves, conversions, blend))
+    modifier.doIt()
+
+    for driven, driven_by, driven_plug, driver_plugs, curves, conversions, blend in networks:
+        try:
+            modifier = OpenMaya.MDGModifier()
+            for index, (driver, driver_plug, curve, conversion) in enumerate(
+                    zip(driven_by, driver_plugs, curves, conversions)):
+                fn_curve = OpenMayaAnim.MFnAnimCurve(curve)
+                for driver_value, value in curve_keys[(driven, driver)]:
+                    fn_curve.addKey(driver_value, to_internal_unit(driven_plug, value),
+                                    OpenMayaAnim.MFnAnimCurve.kTangentLinear, OpenMayaAnim.MFnAnimCurve.kTangentLinear)
+                fn_node = OpenMaya.MFnDependencyNode(curve)
+                if conversion is not None:
+                    fn_conversion = OpenMaya.MFnDependencyNode(conversion)
+                    fn_conversion.findPlug("conversionFactor", False).setDouble(get_ui_unit_factor(driver_plug))
+                    modifier.connect(driver_plug, fn_conversion.findPlug("input", False))
+                    modifier.connect(fn_conversion.findPlug("output", False), fn_node.findPlug("input", False))
+                else:
+                    modifier.connect(driver_plug, fn_node.findPlug("input", False))
+                output = fn_node.findPlug("output", False)
+                if blend is not None:
+                    modifier.connect(output, OpenMaya.MFnDependencyNode(blend).findPlug("input", False)
+                                     .elementByLogicalIndex(index))
+                else:
+                    modifier.connect(output, driven_plug)
+            if blend is not None:
+                modifier.connect(OpenMaya.MFnDependencyNode(blend).findPlug("output", False), driven_plug)
+            modifier.doIt()
+        except Exception as ex:
+            stderr.write(f"Connecting driven keys of {driven} failed. Error: {ex} \n")
+
+
+def get_plug(attr):
+    try:
+        selection_list = OpenMaya.MSelectionList()
+        selection_list.add(attr)
+        return selection_list.getPlug(0)
+    except Exception as ex:
+        stderr.write(f"Failed to find attribute {attr}. Error: {ex} \n")
+
+
+def get_unit_type(plug):
+    attribute = plug.attribute()
+    if attribute.hasFn(OpenMaya.MFn.kUnitAttribute):
+        return OpenMaya.MFnUnitAttribute(attribute).unitType()
+    return None
+
+
+def get_curve_unit(plug):
+    """
+    Gets the letter of the driven attribute in driven key curve types, e.g. animCurveUA for a driven rotation. The
+    input of driven key curves is always unitless.
+    """
+
+    unit_type = get_unit_type(plug)
+    if unit_type == OpenMaya.MFnUnitAttribute.kAngle:
+        return "A"
+    if unit_type == OpenMaya.MFnUnitAttribute.kDistance:
+        return "L"
+    return "U"
+
+
+def get_ui_unit_factor(plug):
+    """
+    Gets the factor converting the internal unit of the driver attribute to its UI unit, None for unitless drivers.
+    """
+
+    unit_type = get_unit_type(plug)
+    if unit_type == OpenMaya.MFnUnitAttribute.kAngle:
+        return OpenMaya.MAngle(1.0, OpenMaya.MAngle.kRadians).asUnits(OpenMaya.MAngle.uiUnit())
+    if unit_type == OpenMaya.MFnUnitAttribute.kDistance:
+        return OpenMaya.MDistance(1.0, OpenMaya.MDistance.kCentimeters).asUnits(OpenMaya.MDistance.uiUnit())
+    return None
+
+
+def to_internal_unit(plug, value):
+    """
+    Converts the value given in UI units, as setDrivenKeyframe expects them, to the internal unit of the attribute.
+    """
+
+    unit_type = get_unit_type(plug)
+    if unit_type == OpenMaya.MFnUnitAttribute.kAngle:
+        return OpenMaya.MAngle(value, OpenMaya.MAngle.uiUnit()).asRadians()
+    if unit_type == OpenMaya.MFnUnitAttribute.kDistance:
+        return OpenMaya.MDistance(value, OpenMaya.MDistance.uiUnit()).asCentimeters()
+    return value
 
 
 # ****************************************************************************************************
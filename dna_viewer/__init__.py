@@ -1,14 +1,36 @@
-from .api import build_meshes, build_rig
-from .builder.config import Config, RigConfig
-from .builder.maya.skin_weights import (
-    get_skin_weights_from_scene,
-    set_skin_weights_to_scene,
-)
-from .dnalib.dnalib import DNA
-from .dnalib.layer import Layer
-from .ui.app import show
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
 from .version import __version__
 
+if TYPE_CHECKING:
+    from .api import build_meshes, build_rig
+    from .builder.config import Config, RigConfig
+    from .builder.maya.joint import get_joint_transforms_from_scene
+    from .builder.maya.skin_weights import (
+        get_skin_weights_from_scene,
+        set_skin_weights_to_scene,
+    )
+    from .dnalib.dnalib import DNA
+    from .dnalib.layer import Layer
+    from .dnalib.registry import shared_dna
+    from .ui.app import show
+
+# The modules of the exported names are imported on first use, so using DNA does not load Maya or Qt
+_LAZY_ATTRIBUTES = {
+    "DNA": ".dnalib.dnalib",
+    "Layer": ".dnalib.layer",
+    "shared_dna": ".dnalib.registry",
+    "Config": ".builder.config",
+    "RigConfig": ".builder.config",
+    "build_rig": ".api",
+    "build_meshes": ".api",
+    "show": ".ui.app",
+    "get_skin_weights_from_scene": ".builder.maya.skin_weights",
+    "set_skin_weights_to_scene": ".builder.maya.skin_weights",
+    "get_joint_transforms_from_scene": ".builder.maya.joint",
+}
+
 __all__ = [
     "DNA",
     "build_rig",
@@ -16,8 +38,22 @@ __all__ = [
     "show",
     "get_skin_weights_from_scene",
     "set_skin_weights_to_scene",
+    "get_joint_transforms_from_scene",
     "Config",
     "RigConfig",
     "Layer",
+    "shared_dna",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,211 @@
+import logging
+import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from sys import executable, platform
+from typing import List, Optional
+
+from .common import DNAViewerError
+
+MAYAPY_ENVIRONMENT_VARIABLE = "MAYAPY"
+
+
+@dataclass
+class LODExportResult:
+    """
+    A model class for holding the result of exporting a single LOD in a worker process
+
+    Attributes
+    ----------
+    @type lod: int
+    @param lod: The LOD that was exported
+
+    @type return_code: Optional[int]
+    @param return_code: The exit code of the worker process, None if it timed out or couldn't be started
+
+    @type duration: float
+    @param duration: The time spent in the worker process in seconds
+
+    @type output: str
+    @param output: The combined stdout and stderr of the worker process
+
+    @type error: Optional[str]
+    @param error: The reason of the failure, None if the LOD was exported
+    """
+
+    lod: int = field(default=0)
+    return_code: Optional[int] = field(default=None)
+    duration: float = field(default=0.0)
+    output: str = field(default="")
+    error: Optional[str] = field(default=None)
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class ExportReport:
+    """
+    A model class for holding the results of exporting all LODs
+
+    Attributes
+    ----------
+    @type results: List[LODExportResult]
+    @param results: The result of every LOD, ordered by LOD
+
+    @type duration: float
+    @param duration: The wall clock time of the whole export in seconds
+    """
+
+    results: List[LODExportResult] = field(default_factory=list)
+    duration: float = field(default=0.0)
+
+    def get_failed(self) -> List[LODExportResult]:
+        return [result for result in self.results if not result.succeeded]
+
+    def log(self) -> None:
+        """Logs the timing of every LOD and the reasons of failures"""
+
+        for result in self.results:
+            if result.succeeded:
+                logging.info(f"lod{result.lod} exported in {result.duration:.1f}s")
+            else:
+                logging.error(
+                    f"lod{result.lod} failed after {result.duration:.1f}s. Reason: {result.error}"
+                )
+        logging.info(
+            f"{len(self.results) - len(self.get_failed())}/{len(self.results)} LODs exported in {self.duration:.1f}s"
+        )
+
+
+def get_mayapy_path(mayapy: Optional[str] = None) -> str:
+    """
+    Gets the path of the mayapy interpreter used for the worker processes. The explicitly passed path is used
+    first, then the MAYAPY environment variable, then the mayapy next to the running interpreter.
+
+    @type mayapy: Optional[str]
+    @param mayapy: The explicitly passed path
+
+    @rtype: str
+    @returns: The path of mayapy
+    """
+
+    if mayapy:
+        return mayapy
+    if os.environ.get(MAYAPY_ENVIRONMENT_VARIABLE):
+        return os.environ[MAYAPY_ENVIRONMENT_VARIABLE]
+
+    name = "mayapy.exe" if platform == "win32" else "mayapy"
+    candidate = Path(executable).parent / name
+    if candidate.exists():
+        return str(candidate)
+    raise DNAViewerError(
+        f"Unable to find mayapy, pass its path or set the {MAYAPY_ENVIRONMENT_VARIABLE} environment variable"
+    )
+
+
+def run_lod_worker(
+    mayapy: str,
+    script_path: str,
+    lod: int,
+    arguments: List[str],
+    timeout: Optional[float],
+) -> LODExportResult:
+    """
+    Runs the script for a single LOD in a new mayapy process and waits for it to finish.
+
+    @type mayapy: str
+    @param mayapy: The path of mayapy
+
+    @type script_path: str
+    @param script_path: The path of the script, called with --lod <lod> followed by the arguments
+
+    @type lod: int
+    @param lod: The LOD to be exported
+
+    @type arguments: List[str]
+    @param arguments: Additional arguments passed to the script
+
+    @type timeout: Optional[float]
+    @param timeout: The time in seconds after which the worker is killed
+
+    @rtype: LODExportResult
+    @returns: The result of the worker
+    """
+
+    result = LODExportResult(lod=lod)
+    start = time.perf_counter()
+    try:
+        process = subprocess.run(
+            [mayapy, script_path, "--lod", str(lod), *arguments],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True,
+            timeout=timeout,
+            check=False,
+        )
+        result.return_code = process.returncode
+        result.output = process.stdout
+        if process.returncode:
+            result.error = f"worker exited with code {process.returncode}"
+    except subprocess.TimeoutExpired as e:
+        result.output = e.output or ""
+        result.error = f"worker timed out after {timeout}s"
+    except OSError as e:
+        result.error = f"worker couldn't be started: {e}"
+    result.duration = time.perf_counter() - start
+    return result
+
+
+def export_lods_in_parallel(
+    script_path: str,
+    lods: List[int],
+    arguments: Optional[List[str]] = None,
+    pool_size: Optional[int] = None,
+    mayapy: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> ExportReport:
+    """
+    Exports every LOD in its own mayapy batch process, running at most pool_size processes at once.
+
+    @type script_path: str
+    @param script_path: The path of the script exporting a single LOD when called with --lod <lod>
+
+    @type lods: List[int]
+    @param lods: The LODs to be exported
+
+    @type arguments: Optional[List[str]]
+    @param arguments: Additional arguments passed to every worker
+
+    @type pool_size: Optional[int]
+    @param pool_size: The maximum number of worker processes, defaults to the number of CPUs
+
+    @type mayapy: Optional[str]
+    @param mayapy: The path of mayapy, see get_mayapy_path
+
+    @type timeout: Optional[float]
+    @param timeout: The time in seconds after which a worker is killed
+
+    @rtype: ExportReport
+    @returns: The timings and failures of every LOD
+    """
+
+    mayapy = get_mayapy_path(mayapy)
+    arguments = arguments or []
+    pool_size = max(1, min(pool_size or os.cpu_count() or 1, len(lods) or 1))
+    logging.info(f"exporting {len(lods)} LODs with {pool_size} workers...")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=pool_size) as executor:
+        futures = [
+            executor.submit(
+                run_lod_worker, mayapy, script_path, lod, arguments, timeout
+            )
+            for lod in lods
+        ]
+        results = [future.result() for future in futures]
+    return ExportReport(results=results, duration=time.perf_counter() - start)
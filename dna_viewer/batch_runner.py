@@ -0,0 +1,117 @@
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+
+@dataclass
+class FileResult:
+    """
+    A model class for holding the result of running a job on a single DNA file
+
+    Attributes
+    ----------
+    @type input_path: str
+    @param input_path: The path of the DNA file
+
+    @type output_path: str
+    @param output_path: The path of the written file or directory
+
+    @type duration: float
+    @param duration: The time spent running the job in seconds
+
+    @type error: Optional[str]
+    @param error: The reason of the failure, None if the job succeeded
+    """
+
+    input_path: str = field(default=None)
+    output_path: str = field(default=None)
+    duration: float = field(default=0.0)
+    error: Optional[str] = field(default=None)
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+def get_worker_count(workers: Optional[int]) -> int:
+    return max(1, min(workers or 1, os.cpu_count() or 1))
+
+
+def run_job(
+    job: Callable[[str, str], object], input_path: str, output_path: str
+) -> FileResult:
+    result = FileResult(input_path=input_path, output_path=output_path)
+    start = time.perf_counter()
+    try:
+        job(input_path, output_path)
+    except Exception as e:
+        result.error = str(e)
+    result.duration = time.perf_counter() - start
+    return result
+
+
+def run_jobs(
+    job: Callable[[str, str], object],
+    input_paths: List[str],
+    output_paths: List[str],
+    workers: int = 1,
+) -> List[FileResult]:
+    """
+    Runs the job on every DNA file, a failing file doesn't stop the others.
+
+    @type job: Callable[[str, str], object]
+    @param job: Called with the input and the output path, it has to be picklable with more than one worker, e.g. a
+    module level function or a functools.partial of one
+
+    @type input_paths: List[str]
+    @param input_paths: The paths of the DNA files
+
+    @type output_paths: List[str]
+    @param output_paths: The output path of every DNA file, in the order of input paths
+
+    @type workers: int
+    @param workers: The number of worker processes, the jobs run in the calling process if it is 1
+
+    @rtype: List[FileResult]
+    @returns: The result of every file, in the order of input paths
+    """
+
+    jobs = [job] * len(input_paths)
+    if workers <= 1:
+        return list(map(run_job, jobs, input_paths, output_paths))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_job, jobs, input_paths, output_paths))
+
+
+def log_results(results: List[FileResult], description: str, duration: float) -> int:
+    """
+    Logs the result of every file and the number of succeeded ones.
+
+    @type results: List[FileResult]
+    @param results: The results of the files
+
+    @type description: str
+    @param description: What was done with the files, e.g. "DNAs converted"
+
+    @type duration: float
+    @param duration: The time spent on all files in seconds
+
+    @rtype: int
+    @returns: The exit code of the command line, 1 if any file failed
+    """
+
+    for result in results:
+        if result.succeeded:
+            logging.info(
+                f"{result.input_path} -> {result.output_path} in {result.duration:.1f}s"
+            )
+        else:
+            logging.error(f"{result.input_path} failed. Reason: {result.error}")
+    failed = len([result for result in results if not result.succeeded])
+    logging.info(
+        f"{len(results) - failed}/{len(results)} {description} in {duration:.1f}s"
+    )
+    return 1 if failed else 0
@@ -2,7 +2,7 @@ import logging
 import traceback
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Generator, Iterator, List, Optional
 
 from maya import cmds, mel
 
@@ -13,6 +13,20 @@ from ..model import Joint as JointModel
 from .config import AngleUnit, Config, LinearUnit
 from .joint import Joint as JointBuilder
 from .mesh import Mesh
+from .mesh_filter import get_filtered_meshes, get_mesh_indices_filter
+from .plan import (
+    STAGE_ATTRIBUTES,
+    STAGE_BLEND_SHAPES,
+    STAGE_JOINTS,
+    STAGE_NEUTRAL_MESHES,
+    STAGE_SKIN_CLUSTERS,
+    BuildPlan,
+    BuildTimings,
+    calibrate_stage_costs,
+    estimate_stage,
+    load_stage_costs,
+    save_stage_costs,
+)
 
 
 @dataclass
@@ -42,6 +56,20 @@ class BuildResult:
         return all_meshes
 
 
+@dataclass
+class BuildStep:
+    """
+    A class used for reporting a finished unit of work while building cooperatively
+
+    Attributes
+    ----------
+    @type description: str
+    @param description: The description of the finished work
+    """
+
+    description: str = field(default=None)
+
+
 class Builder:
     """
     A builder class used for building the character
@@ -57,6 +85,12 @@ class Builder:
     @type meshes: Dict[int, List[str]]
     @param meshes: A list of meshes created grouped by lod
 
+    @type timings: BuildTimings
+    @param timings: The duration of every stage of the last build
+
+    @type joint_builder: Optional[JointBuilder]
+    @param joint_builder: The builder that added the joints of the last build, the joints are removed through it when
+        the build fails or is canceled
     """
 
     def __init__(self, dna: DNA, config: Optional[Config] = None) -> None:
@@ -64,8 +98,10 @@ class Builder:
         self.dna = dna
         self.meshes: Dict[int, List[str]] = {}
         self.all_loaded_meshes: List[int] = []
+        self.timings = BuildTimings(Maya.get_used_memory)
+        self.joint_builder: Optional[JointBuilder] = None
 
-    def _build(self) -> bool:
+    def _build(self) -> Generator[BuildStep, None, bool]:
         self.new_scene()
         self.set_filtered_meshes()
         if not self.all_loaded_meshes:
@@ -75,34 +111,160 @@ class Builder:
         self.create_groups()
 
         self.set_units()
-        self.add_joints()
-        self.build_meshes()
-        self.add_ctrl_attributes_on_root_joint()
-        self.add_animated_map_attributes_on_root_joint()
+        with self.timings.measure(STAGE_JOINTS):
+            self.add_joints()
+        yield BuildStep(description="added joints")
+        yield from self.iter_build_meshes()
+        with self.timings.measure(STAGE_ATTRIBUTES):
+            self.add_ctrl_attributes_on_root_joint()
+            self.add_animated_map_attributes_on_root_joint()
         self.add_key_frames()
+        yield BuildStep(description="added attributes")
         return True
 
     def build(self) -> BuildResult:
         """Builds the character"""
+
+        for _ in self.build_steps():
+            pass
+        return BuildResult(meshes_per_lod=self.meshes)
+
+    def build_steps(self) -> Iterator[BuildStep]:
+        """
+        Builds the character cooperatively, the build pauses after every unit of work, e.g. after every mesh, so the
+        caller can report progress, keep the application responsive or stop the build with cancel.
+
+        @rtype: Iterator[BuildStep]
+        @returns: The finished units of work, there are get_step_count of them if the build succeeds
+        """
+
         self.meshes = {}
+        self.timings = BuildTimings(Maya.get_used_memory)
         try:
             filename = Path(self.dna.path).stem
             logging.info("******************************")
             logging.info(f"{filename} started building")
             logging.info("******************************")
 
-            self._build()
+            plan = self.plan()
+            yield from self._build()
+            self.calibrate(plan)
 
             logging.info(f"{filename} built successfully!")
 
         except DNAViewerError as e:
             traceback.print_exc()
+            self.remove_joints()
             raise e
         except Exception as e:
             traceback.print_exc()
             logging.error(f"Unhandled exception, {e}")
+            self.remove_joints()
             raise DNAViewerError(f"Scene creation failed! Reason: {e}") from e
-        return BuildResult(meshes_per_lod=self.meshes)
+
+    def get_step_count(self) -> int:
+        """
+        Gets the number of units of work yielded by build_steps.
+
+        @rtype: int
+        @returns: The number of units of work
+        """
+
+        self.set_filtered_meshes()
+        return len(self.all_loaded_meshes) + 2
+
+    def cancel(self) -> None:
+        """
+        Returns the scene to the state the build started from, used after stopping a build started with build_steps.
+        The build always starts from a new scene, so the partially built character is discarded with a new scene.
+        """
+
+        logging.info("build canceled, discarding the partially built character...")
+        self.remove_joints()
+        self.new_scene()
+        self.meshes = {}
+
+    def plan(self) -> BuildPlan:
+        """
+        Estimates the duration and memory of every build stage from the DNA, without touching the scene. Costs are
+        calibrated from recorded builds if the cost calibration path is set in the config.
+
+        @rtype: BuildPlan
+        @returns: The estimated cost of every stage that will run
+        """
+
+        self.set_filtered_meshes()
+        costs = load_stage_costs(self.config.cost_calibration_path)
+        return BuildPlan(
+            stages=[
+                estimate_stage(name, units, costs)
+                for name, units in self.get_stage_units().items()
+                if units
+            ]
+        )
+
+    def calibrate(self, plan: BuildPlan) -> None:
+        """
+        Updates the stage costs in the cost calibration file with the durations and memory of the finished build.
+
+        @type plan: BuildPlan
+        @param plan: The plan made before the build
+        """
+
+        path = self.config.cost_calibration_path
+        if path:
+            try:
+                costs = calibrate_stage_costs(
+                    plan, self.timings, load_stage_costs(path)
+                )
+                save_stage_costs(path, costs)
+            except OSError as e:
+                logging.warning(f"Couldn't save build cost calibration. Reason: {e}")
+
+    def get_stage_units(self) -> Dict[str, int]:
+        """
+        Gets the amount of work of every stage from the DNA metadata of the filtered meshes.
+
+        @rtype: Dict[str, int]
+        @returns: The amount of work per stage, in build order
+        """
+
+        units = {
+            STAGE_JOINTS: self.dna.get_joint_count() if self.config.add_joints else 0,
+            STAGE_NEUTRAL_MESHES: 0,
+            STAGE_BLEND_SHAPES: 0,
+            STAGE_SKIN_CLUSTERS: 0,
+            STAGE_ATTRIBUTES: 0,
+        }
+        for mesh_index in self.all_loaded_meshes:
+            vertex_count = self.dna.get_vertex_position_count(mesh_index)
+            units[STAGE_NEUTRAL_MESHES] += (
+                vertex_count
+                + self.dna.get_vertex_layout_count(mesh_index)
+                + self.dna.get_face_count(mesh_index)
+            )
+            if self.config.add_blend_shapes:
+                for target_index in range(
+                    self.dna.get_blend_shape_target_count(mesh_index)
+                ):
+                    # every target is created as a copy of the mesh, then its deltas are applied
+                    units[
+                        STAGE_BLEND_SHAPES
+                    ] += vertex_count + self.dna.get_blend_shape_target_delta_count(
+                        mesh_index, target_index
+                    )
+            if self.config.add_skin_cluster and self.config.add_joints:
+                units[
+                    STAGE_SKIN_CLUSTERS
+                ] += vertex_count * self.dna.get_maximum_influence_per_vertex(
+                    mesh_index
+                )
+        if self.config.add_joints:
+            if self.config.add_ctrl_attributes_on_root_joint:
+                units[STAGE_ATTRIBUTES] += self.dna.get_raw_control_count()
+            if self.config.add_animated_map_attributes_on_root_joint:
+                units[STAGE_ATTRIBUTES] += self.dna.get_animated_map_count()
+        return units
 
     def new_scene(self) -> None:
         cmds.file(new=True, force=True)
@@ -131,12 +293,22 @@ class Builder:
         """
 
         joints: List[JointModel] = self.dna.read_all_neutral_joints()
-        builder = JointBuilder(
+        self.joint_builder = JointBuilder(
             joints,
         )
-        builder.process()
+        self.joint_builder.process()
         return joints
 
+    def remove_joints(self) -> None:
+        """
+        Removes the joints added by the last build. The joints are created in a single batch that is not in Maya's undo
+        queue, so they are removed explicitly when a build fails or is canceled.
+        """
+
+        if self.joint_builder:
+            self.joint_builder.undo()
+            self.joint_builder = None
+
     def add_joints(self) -> None:
         """
         Starts adding the joints the character, if the character configuration options have add_joints set to False,
@@ -221,12 +393,10 @@ class Builder:
 
         if self.config.add_ctrl_attributes_on_root_joint and self.config.add_joints:
             gui_control_names = self.dna.get_raw_control_names()
-            for name in gui_control_names:
-                ctrl_and_attr_names = name.split(".")
-                self.add_attribute(
-                    control_name=self.config.facial_root_joint_name,
-                    long_name=ctrl_and_attr_names[1],
-                )
+            Maya.add_float_attributes(
+                self.config.facial_root_joint_name,
+                [name.split(".")[1] for name in gui_control_names],
+            )
 
     def add_animated_map_attributes_on_root_joint(self) -> None:
         """
@@ -238,24 +408,10 @@ class Builder:
             and self.config.add_joints
         ):
             names = self.dna.get_animated_map_names()
-            for name in names:
-                long_name = name.replace(".", "_")
-                self.add_attribute(
-                    control_name=self.config.facial_root_joint_name, long_name=long_name
-                )
-
-    def add_attribute(self, control_name: str, long_name: str) -> None:
-        """
-        Adds attributes wrapper for internal usage.
-        """
-        cmds.addAttr(
-            control_name,
-            longName=long_name,
-            keyable=True,
-            attributeType="float",
-            minValue=0.0,
-            maxValue=1.0,
-        )
+            Maya.add_float_attributes(
+                self.config.facial_root_joint_name,
+                [name.replace(".", "_") for name in names],
+            )
 
     def add_key_frames(self) -> None:
         """
@@ -274,35 +430,10 @@ class Builder:
         self.all_loaded_meshes = self.get_filtered_meshes()
 
     def get_mesh_indices_filter(self) -> List[int]:
-        indices = []
-        for index in range(self.dna.get_mesh_count()):
-            mesh_name = self.dna.get_mesh_name(index)
-            for cur_filter in self.config.mesh_filter:
-                if cur_filter in mesh_name:
-                    indices.append(index)
-        return indices
+        return get_mesh_indices_filter(self.dna, self.config.mesh_filter)
 
     def get_filtered_meshes(self) -> List[int]:
-        if not self.config.mesh_filter and not self.config.lod_filter:
-            if self.config.meshes:
-                return self.config.meshes
-            return list(range(self.dna.get_mesh_count()))
-
-        meshes: List[int] = []
-        meshes_by_lod = self.dna.get_all_meshes_grouped_by_lod()
-        all_meshes = [mesh_index for meshes in meshes_by_lod for mesh_index in meshes]
-        mesh_indices_filter = self.get_mesh_indices_filter()
-
-        if self.config.lod_filter:
-            for lod in self.config.lod_filter:
-                if 0 <= lod < len(meshes_by_lod):
-                    meshes.extend(meshes_by_lod[lod])
-            if mesh_indices_filter:
-                return list(set(meshes) & set(mesh_indices_filter))
-            return meshes
-        if self.config.mesh_filter:
-            return list(set(all_meshes) & set(mesh_indices_filter))
-        return all_meshes
+        return get_filtered_meshes(self.dna, self.config)
 
     def build_meshes(self) -> None:
         """
@@ -310,12 +441,23 @@ class Builder:
         character node transform, otherwise the meshes get put to the root level of the scene.
         """
 
+        for _ in self.iter_build_meshes():
+            pass
+
+    def iter_build_meshes(self) -> Iterator[BuildStep]:
+        """
+        Builds the meshes like build_meshes, one mesh per unit of work.
+
+        @rtype: Iterator[BuildStep]
+        @returns: A finished unit of work after every mesh
+        """
+
         logging.info("adding character meshes...")
         self.meshes = {}
         for lod, meshes_per_lod in enumerate(
             self.dna.get_meshes_by_lods(self.all_loaded_meshes)
         ):
-            self.meshes[lod] = self.build_meshes_by_lod(
+            yield from self.iter_build_meshes_by_lod(
                 lod=lod, meshes_per_lod=meshes_per_lod
             )
 
@@ -330,16 +472,39 @@ class Builder:
         @type meshes_per_lod: List[int]
         @param meshes_per_lod: List of mesh indices that are being built.
 
-        @rtype: List[MObject]
-        @returns: The list of maya objects that represent the meshes added to the scene.
+        @rtype: List[str]
+        @returns: The names of the meshes added to the scene.
+        """
+
+        for _ in self.iter_build_meshes_by_lod(lod=lod, meshes_per_lod=meshes_per_lod):
+            pass
+        return self.meshes[lod]
+
+    def iter_build_meshes_by_lod(
+        self, lod: int, meshes_per_lod: List[int]
+    ) -> Iterator[BuildStep]:
+        """
+        Builds the meshes of the lod like build_meshes_by_lod, one mesh per unit of work. The names of the built meshes
+        are set in meshes as they are added to the scene.
+
+        @type lod: int
+        @param lod: The lod number representing the display layer the meshes to the display layer.
+
+        @type meshes_per_lod: List[int]
+        @param meshes_per_lod: List of mesh indices that are being built.
+
+        @rtype: Iterator[BuildStep]
+        @returns: A finished unit of work after every mesh
         """
 
         meshes: List[str] = []
+        self.meshes[lod] = meshes
         for mesh_index in meshes_per_lod:
             builder = Mesh(
                 config=self.config,
                 dna=self.dna,
                 mesh_index=mesh_index,
+                timings=self.timings,
             )
             builder.build()
 
@@ -349,7 +514,7 @@ class Builder:
             self.add_mesh_to_display_layer(mesh_name, lod)
             self.attach_mesh_to_lod(mesh_name, lod)
             self.default_lambert_shader(mesh_name)
-        return meshes
+            yield BuildStep(description=f"added mesh {mesh_name}")
 
     def default_lambert_shader(self, mesh_name: str) -> None:
         try:
@@ -95,6 +95,9 @@ class Config:
 
     @type add_mesh_name_to_blend_shape_channel_name: bool
     @param add_mesh_name_to_blend_shape_channel_name: A flag representing whether mesh name of blend shape channel is added to name when creating it
+
+    @type cost_calibration_path: Optional[str]
+    @param cost_calibration_path: The file holding build stage costs calibrated from recorded builds, it is updated after every build if set
     """
 
     meshes: List[int] = field(default_factory=list)
@@ -123,6 +126,8 @@ class Config:
     add_key_frames: bool = field(default=True)
     add_mesh_name_to_blend_shape_channel_name: bool = field(default=True)
 
+    cost_calibration_path: Optional[str] = field(default=None)
+
     def get_top_level_group(self) -> str:
         return f"{self.top_level_group}_grp"
 
@@ -1,7 +1,16 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from maya import cmds
-
+from maya.api.OpenMaya import (
+    MAngle,
+    MDagModifier,
+    MDistance,
+    MFnDependencyNode,
+    MObject,
+)
+
+from ..builder.maya.util import Maya
+from ..common import DNAViewerError
 from ..model import Joint as JointModel
 
 
@@ -14,65 +23,112 @@ class Joint:
     @type joints: List[JointModel]
     @param joints: data representing the joints
 
-    @type joint_flags: Dict[str, bool]
-    @param joint_flags: A mapping used for setting flags that are used to avoid adding the same joint multiple times
+    @type joint_indices: Dict[str, int]
+    @param joint_indices: A mapping of joint names to their indices in joints
+
+    @type parent_indices: List[int]
+    @param parent_indices: The index of the parent of every joint, root joints are their own parents and joints whose
+    parent is not in joints have -1
+
+    @type modifier: Optional[MDagModifier]
+    @param modifier: The modifier that created the joints, used for undoing the creation
     """
 
     def __init__(self, joints: List[JointModel]) -> None:
         self.joints = joints
-        self.joint_flags: Dict[str, bool] = {}
-
-        for joint in self.joints:
-            self.joint_flags[joint.name] = False
+        self.joint_indices: Dict[str, int] = {
+            joint.name: index for index, joint in enumerate(joints)
+        }
+        self.parent_indices: List[int] = [
+            self.joint_indices.get(joint.parent_name, -1) for joint in joints
+        ]
+        self.modifier: Optional[MDagModifier] = None
+
+    def get_topological_order(self) -> List[int]:
+        """
+        Orders the joints so that every joint comes after its parent.
 
-    def add_joint_to_scene(self, joint: JointModel) -> None:
+        @rtype: List[int]
+        @returns: The joint indices in creation order
         """
-        Adds the given joint to the scene
 
-        @type joint: JointModel
-        @param joint: The joint to be added to the scene
+        children: List[List[int]] = [[] for _ in self.joints]
+        order: List[int] = []
+        for index, parent_index in enumerate(self.parent_indices):
+            if parent_index in (-1, index):
+                order.append(index)
+            else:
+                children[parent_index].append(index)
+
+        position = 0
+        while position < len(order):
+            order.extend(children[order[position]])
+            position += 1
+
+        if len(order) != len(self.joints):
+            raise DNAViewerError("Joint hierarchy contains a cycle!")
+        return order
+
+    def get_external_parent(self, joint: JointModel) -> MObject:
         """
+        Gets the scene node of a parent that is not one of the joints being added.
 
-        if self.joint_flags[joint.name]:
-            return
+        @type joint: JointModel
+        @param joint: The joint whose parent is being retrieved
 
-        in_parent_space = True
+        @rtype: MObject
+        @returns: The parent node
+        """
 
-        if cmds.objExists(joint.parent_name):
-            cmds.select(joint.parent_name)
-        else:
-            if joint.name != joint.parent_name:
-                parent_joint = next(
-                    j for j in self.joints if j.name == joint.parent_name
-                )
-                self.add_joint_to_scene(parent_joint)
-            else:
-                # this is the first node
-                cmds.select(d=True)
-                in_parent_space = False
-
-        position = (
-            joint.translation.x,
-            joint.translation.y,
-            joint.translation.z,
-        )
-        orientation = (
-            joint.orientation.x,
-            joint.orientation.y,
-            joint.orientation.z,
-        )
-        cmds.joint(
-            p=position,
-            o=orientation,
-            n=joint.name,
-            r=in_parent_space,
-            a=not in_parent_space,
-            scaleCompensate=False,
-        )
-        self.joint_flags[joint.name] = True
+        if not cmds.objExists(joint.parent_name):
+            raise DNAViewerError(
+                f"Parent {joint.parent_name} of joint {joint.name} not found!"
+            )
+        return Maya.get_element(joint.parent_name).node()
 
     def process(self) -> None:
-        """Starts adding all the provided joints to the scene"""
+        """
+        Starts adding all the provided joints to the scene, parents first, in a single batch. The batch is made with an
+        MDagModifier, which is not in Maya's undo queue, so undoing in Maya doesn't remove the joints, undo does.
+        """
 
-        for joint in self.joints:
-            self.add_joint_to_scene(joint)
+        modifier = MDagModifier()
+        nodes: List[Optional[MObject]] = [None] * len(self.joints)
+        for index in self.get_topological_order():
+            joint = self.joints[index]
+            parent_index = self.parent_indices[index]
+            if parent_index == index:
+                parent = MObject.kNullObj
+            elif parent_index == -1:
+                parent = self.get_external_parent(joint)
+            else:
+                parent = nodes[parent_index]
+            nodes[index] = modifier.createNode("joint", parent)
+            modifier.renameNode(nodes[index], joint.name)
+        modifier.doIt()
+
+        linear_unit = MDistance.uiUnit()
+        angular_unit = MAngle.uiUnit()
+        for joint, node in zip(self.joints, nodes):
+            fn_node = MFnDependencyNode(node)
+            for axis in ("X", "Y", "Z"):
+                modifier.newPlugValueMDistance(
+                    fn_node.findPlug(f"translate{axis}", False),
+                    MDistance(getattr(joint.translation, axis.lower()), linear_unit),
+                )
+                modifier.newPlugValueMAngle(
+                    fn_node.findPlug(f"jointOrient{axis}", False),
+                    MAngle(getattr(joint.orientation, axis.lower()), angular_unit),
+                )
+            modifier.newPlugValueBool(
+                fn_node.findPlug("segmentScaleCompensate", False), False
+            )
+        modifier.doIt()
+        self.modifier = modifier
+
+    def undo(self) -> None:
+        """Removes the joints added by process from the scene"""
+
+        if self.modifier:
+            self.modifier.undoIt()
+            self.modifier = None
@@ -0,0 +1,69 @@
+from typing import List, Tuple
+
+import numpy as np
+from maya.api.OpenMaya import MAngle, MDistance, MSelectionList, MSpace
+from maya.api.OpenMayaAnim import MFnIkJoint
+
+from ...common import DNAViewerError
+
+
+def get_selection_list(names: List[str]) -> MSelectionList:
+    """
+    Creates a selection list holding the elements with the given names, in the given order.
+
+    @type names: List[str]
+    @param names: The names of the elements
+
+    @rtype: MSelectionList
+    @returns: The selection list with one item per name
+    """
+
+    selection_list = MSelectionList()
+    for name in names:
+        try:
+            selection_list.add(name)
+        except Exception as exception:
+            raise DNAViewerError(f"Element with name:{name} not found!") from exception
+    return selection_list
+
+
+def get_joint_transforms_from_scene(
+    joint_names: List[str],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reads the translations and orientations of the given joints from the scene in a single pass.
+
+    The values match what cmds.xform(query=True, translation=True) and cmds.joint(query=True, orientation=True)
+    return, so they can be used for SetNeutralJointTranslationsCommand and SetNeutralJointRotationsCommand.
+
+    @type joint_names: List[str]
+    @param joint_names: The names of the joints, usually in DNA joint index order
+
+    @rtype: Tuple[np.ndarray, np.ndarray]
+    @returns: The (N, 3) array of translations in the current linear unit and the (N, 3) array of orientations in the
+        current angle unit
+    """
+
+    selection_list = get_selection_list(joint_names)
+    joint_count = len(joint_names)
+    translations = np.empty((joint_count, 3), dtype=np.float64)
+    orientations = np.empty((joint_count, 3), dtype=np.float64)
+
+    fn_joint = MFnIkJoint()
+    linear_unit = MDistance.uiUnit()
+    angle_unit = MAngle.uiUnit()
+    for index in range(joint_count):
+        fn_joint.setObject(selection_list.getDagPath(index))
+        translation = fn_joint.translation(MSpace.kTransform)
+        orientation = fn_joint.orientation().asEulerRotation()
+        translations[index] = (
+            MDistance(translation.x).asUnits(linear_unit),
+            MDistance(translation.y).asUnits(linear_unit),
+            MDistance(translation.z).asUnits(linear_unit),
+        )
+        orientations[index] = (
+            MAngle(orientation.x).asUnits(angle_unit),
+            MAngle(orientation.y).asUnits(angle_unit),
+            MAngle(orientation.z).asUnits(angle_unit),
+        )
+    return translations, orientations
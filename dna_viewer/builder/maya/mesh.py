@@ -399,6 +399,9 @@ class MayaMesh:
 
         logging.info("adding skin weights...")
         skin_weights = self.dna.get_skin_weight_matrix_for_mesh(self.mesh_index)
+        influence_indices = {
+            joint_id: index for index, joint_id in enumerate(joint_ids)
+        }
 
         # import skin weights
         temp_str = f"{mesh_name}_{self.skin_cluster_suffix}.wl["
@@ -414,7 +417,7 @@ class MayaMesh:
             # import skin weights
             for vertex_info in vertex_infos:
                 cmds.setAttr(
-                    f"{vertex_string}{str(joint_ids.index(vertex_info[0]))}]",
+                    f"{vertex_string}{str(influence_indices[vertex_info[0]])}]",
                     float(vertex_info[1]),
                 )
         if len(skin_weights) % SKIN_WEIGHT_PRINT_RANGE != 0:
@@ -1,8 +1,13 @@
-from typing import Union
+from typing import List, Union
 
+from maya import cmds
 from maya.api.OpenMaya import (
     MDagPath,
+    MDGModifier,
     MFnDagNode,
+    MFnDependencyNode,
+    MFnNumericAttribute,
+    MFnNumericData,
     MFnTransform,
     MGlobal,
     MSpace,
@@ -79,3 +84,58 @@ class Maya:
         """
         element_obj = Maya.get_transform(element)
         element_obj.setTranslation(translation, space)
+
+    @staticmethod
+    def get_used_memory() -> float:
+        """gets the heap memory currently used by maya
+
+        @rtype: float
+        @returns: The used heap memory in bytes
+        """
+        return cmds.memory(heapMemory=True, megaByte=True) * 1024 * 1024
+
+    @staticmethod
+    def add_float_attributes(
+        element: str,
+        long_names: List[str],
+        min_value: float = 0.0,
+        max_value: float = 1.0,
+    ) -> None:
+        """adds keyable float attributes to the element with the given name in a single modifier transaction,
+        attributes that already exist are skipped
+
+        @type element: str
+        @param element: The element name that the attributes are added to
+
+        @type long_names: List[str]
+        @param long_names: The long names of the attributes
+
+        @type min_value: float
+        @param min_value: The minimum value of the attributes
+
+        @type max_value: float
+        @param max_value: The maximum value of the attributes
+        """
+        try:
+            element_obj = MGlobal.getSelectionListByName(element).getDependNode(0)
+        except Exception as exception:
+            raise DNAViewerError(
+                f"Element with name:{element} not found!"
+            ) from exception
+
+        node = MFnDependencyNode(element_obj)
+        modifier = MDGModifier()
+        added = set()
+        for long_name in long_names:
+            if long_name in added or node.hasAttribute(long_name):
+                continue
+            attribute = MFnNumericAttribute()
+            attribute_obj = attribute.create(
+                long_name, long_name, MFnNumericData.kFloat, 0.0
+            )
+            attribute.setMin(min_value)
+            attribute.setMax(max_value)
+            attribute.keyable = True
+            modifier.addAttribute(element_obj, attribute_obj)
+            added.add(long_name)
+        modifier.doIt()
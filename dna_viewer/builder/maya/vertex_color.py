@@ -0,0 +1,56 @@
+import logging
+from typing import Optional
+
+import numpy as np
+from maya.api.OpenMaya import MColor, MColorArray, MFnMesh
+
+from ...builder.maya.util import Maya
+from ...common import DNAViewerError
+from ...vertex_color import VertexColors
+
+
+def set_vertex_colors_to_scene(mesh_name: str, colors: np.ndarray) -> None:
+    """
+    Sets the vertex colors of the mesh with a single call instead of one command per vertex.
+
+    @type mesh_name: str
+    @param mesh_name: The mesh name
+
+    @type colors: np.ndarray
+    @param colors: The (V, 4) array of RGBA colors indexed by vertex id
+    """
+
+    mesh = MFnMesh(Maya.get_element(mesh_name))
+    if mesh.numVertices != len(colors):
+        raise DNAViewerError(
+            f"Mesh {mesh_name} has {mesh.numVertices} vertices, but {len(colors)} vertex colors were given!"
+        )
+    color_array = MColorArray([MColor(color) for color in colors.tolist()])
+    mesh.setVertexColors(color_array, list(range(len(colors))))
+
+
+def set_all_vertex_colors_to_scene(
+    vertex_colors: VertexColors, lod: Optional[int] = None
+) -> None:
+    """
+    Sets the vertex colors of all meshes in the vertex color file, skipping the ones that are not in the scene.
+
+    @type vertex_colors: VertexColors
+    @param vertex_colors: The loaded vertex color file
+
+    @type lod: Optional[int]
+    @param lod: If set, only the meshes of this LOD are colored
+    """
+
+    mesh_names = (
+        vertex_colors.get_mesh_names()
+        if lod is None
+        else vertex_colors.get_mesh_names_for_lod(lod)
+    )
+    for mesh_name in mesh_names:
+        try:
+            set_vertex_colors_to_scene(mesh_name, vertex_colors.get_colors(mesh_name))
+        except DNAViewerError as e:
+            logging.warning(
+                f"Skipped adding vtx color for mesh {mesh_name}. Reason {e}"
+            )
@@ -1,9 +1,15 @@
 import logging
-from typing import List
+from typing import List, Optional
 
 from ..builder.maya.mesh import MayaMesh
 from ..dnalib.dnalib import DNA
 from .config import Config
+from .plan import (
+    STAGE_BLEND_SHAPES,
+    STAGE_NEUTRAL_MESHES,
+    STAGE_SKIN_CLUSTERS,
+    BuildTimings,
+)
 
 
 class Mesh:
@@ -33,6 +39,9 @@ class Mesh:
 
     @type dna: DNA
     @param dna: The DNA object that was loaded in
+
+    @type timings: BuildTimings
+    @param timings: The recorder of the duration of every build step
     """
 
     def __init__(
@@ -40,8 +49,10 @@ class Mesh:
         config: Config,
         dna: DNA,
         mesh_index: int,
+        timings: Optional[BuildTimings] = None,
     ) -> None:
         self.mesh_index: int = mesh_index
+        self.timings = timings or BuildTimings()
         self.joint_ids: List[int] = []
         self.joint_names: List[str] = []
         self.config = config
@@ -57,9 +68,12 @@ class Mesh:
     def build(self) -> None:
         """Starts the build process, creates the neutral mesh, then adds normals, blends shapes and skin if needed"""
 
-        self.create_neutral_mesh()
-        self.add_blend_shapes()
-        self.add_skin_cluster()
+        with self.timings.measure(STAGE_NEUTRAL_MESHES):
+            self.create_neutral_mesh()
+        with self.timings.measure(STAGE_BLEND_SHAPES):
+            self.add_blend_shapes()
+        with self.timings.measure(STAGE_SKIN_CLUSTERS):
+            self.add_skin_cluster()
 
     def create_neutral_mesh(self) -> None:
         """Creates the neutral mesh"""
@@ -90,25 +104,8 @@ class Mesh:
 
         self.prepare_joint_ids()
 
-        joints = self.dna.read_all_neutral_joints()
-        self.joint_names = []
-        for joint_id in self.joint_ids:
-            self.joint_names.append(joints[joint_id].name)
+        joint_names = self.dna.get_joint_names()
+        self.joint_names = [joint_names[joint_id] for joint_id in self.joint_ids]
 
     def prepare_joint_ids(self) -> None:
-        joints_temp: List[int] = []
-        joint_indices = self.dna.get_all_skin_weights_joint_indices_for_mesh(
-            self.mesh_index
-        )
-        self.joint_ids = []
-        if any(joint_indices):
-            for row in joint_indices:
-                for column in row:
-                    joints_temp.append(column)
-
-            self.joint_ids = list(set(joints_temp))
-            self.joint_ids.sort()
-        else:
-            lod = self.dna.get_lowest_lod_containing_meshes([self.mesh_index])
-            if lod:
-                self.joint_ids = self.dna.get_joint_indices_for_lod(lod)
+        self.joint_ids = self.dna.get_skin_joint_indices_for_mesh(self.mesh_index)
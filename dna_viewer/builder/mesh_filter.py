@@ -0,0 +1,61 @@
+from typing import List
+
+import numpy as np
+
+from ..dnalib.dnalib import DNA
+from .config import Config
+
+
+def get_mesh_indices_filter(dna: DNA, mesh_filter: List[str]) -> List[int]:
+    """
+    Gets the indices of the meshes whose names contain any of the filters.
+
+    @type dna: DNA
+    @param dna: Instance of DNA
+
+    @type mesh_filter: List[str]
+    @param mesh_filter: Substrings of mesh names
+
+    @rtype: List[int]
+    @returns: The mesh indices
+    """
+
+    dna.read_definition()
+    return [
+        index
+        for index, mesh_name in enumerate(dna.meshes.names)
+        if any(cur_filter in mesh_name for cur_filter in mesh_filter)
+    ]
+
+
+def get_filtered_meshes(dna: DNA, config: Config) -> List[int]:
+    """
+    Gets the indices of the meshes selected by the mesh, mesh filter and LOD filter options of the config.
+
+    @type dna: DNA
+    @param dna: Instance of DNA
+
+    @type config: Config
+    @param config: The configuration options used for building the character
+
+    @rtype: List[int]
+    @returns: The mesh indices
+    """
+
+    if not config.mesh_filter and not config.lod_filter:
+        if config.meshes:
+            return config.meshes
+        return list(range(dna.get_mesh_count()))
+
+    lod_masks = dna.get_mesh_lod_masks()
+    lods = [lod for lod in config.lod_filter if 0 <= lod < len(lod_masks)]
+    if config.lod_filter:
+        selected = lod_masks[lods].any(axis=0)
+    else:
+        selected = lod_masks.any(axis=0)
+    mesh_indices_filter = get_mesh_indices_filter(dna, config.mesh_filter)
+
+    # a mesh filter matching no meshes only empties the selection without a LOD filter
+    if mesh_indices_filter or not config.lod_filter:
+        selected &= dna.meshes.get_mask(mesh_indices_filter)
+    return np.flatnonzero(selected).tolist()
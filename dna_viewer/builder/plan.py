@@ -0,0 +1,280 @@
+import json
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+STAGE_JOINTS = "joints"
+STAGE_NEUTRAL_MESHES = "neutral meshes"
+STAGE_BLEND_SHAPES = "blend shapes"
+STAGE_SKIN_CLUSTERS = "skin clusters"
+STAGE_ATTRIBUTES = "attributes"
+STAGE_GUI = "gui"
+STAGE_ANALOG_GUI = "analog gui"
+STAGE_RIG_LOGIC = "rig logic"
+STAGE_ASSEMBLE_SCRIPT = "additional assemble script"
+
+# The weight of the latest measurement when updating calibrated costs
+CALIBRATION_WEIGHT = 0.5
+
+
+@dataclass
+class StageCost:
+    """
+    A model class for holding the cost of a single unit of work of a build stage
+
+    Attributes
+    ----------
+    @type seconds_per_unit: float
+    @param seconds_per_unit: The time needed for a single unit of work
+
+    @type bytes_per_unit: float
+    @param bytes_per_unit: The scene memory taken by a single unit of work
+    """
+
+    seconds_per_unit: float = field(default=0.0)
+    bytes_per_unit: float = field(default=0.0)
+
+
+# Rough defaults used until the costs are calibrated from recorded builds
+DEFAULT_STAGE_COSTS: Dict[str, StageCost] = {
+    STAGE_JOINTS: StageCost(seconds_per_unit=2e-4, bytes_per_unit=4096),
+    STAGE_NEUTRAL_MESHES: StageCost(seconds_per_unit=2e-6, bytes_per_unit=64),
+    STAGE_BLEND_SHAPES: StageCost(seconds_per_unit=5e-8, bytes_per_unit=16),
+    STAGE_SKIN_CLUSTERS: StageCost(seconds_per_unit=2e-5, bytes_per_unit=12),
+    STAGE_ATTRIBUTES: StageCost(seconds_per_unit=2e-4, bytes_per_unit=256),
+    STAGE_GUI: StageCost(seconds_per_unit=2.0, bytes_per_unit=32 * 1024 * 1024),
+    STAGE_ANALOG_GUI: StageCost(seconds_per_unit=1.0, bytes_per_unit=8 * 1024 * 1024),
+    STAGE_RIG_LOGIC: StageCost(seconds_per_unit=3.0, bytes_per_unit=64 * 1024 * 1024),
+    STAGE_ASSEMBLE_SCRIPT: StageCost(seconds_per_unit=5.0, bytes_per_unit=0),
+}
+
+
+@dataclass
+class StageEstimate:
+    """
+    A model class for holding the estimated cost of a single build stage
+
+    Attributes
+    ----------
+    @type name: str
+    @param name: The name of the stage
+
+    @type units: int
+    @param units: The amount of work in the stage, e.g. the number of joints or vertices
+
+    @type seconds: float
+    @param seconds: The estimated duration of the stage
+
+    @type memory: float
+    @param memory: The estimated scene memory in bytes taken by the stage
+    """
+
+    name: str = field(default=None)
+    units: int = field(default=0)
+    seconds: float = field(default=0.0)
+    memory: float = field(default=0.0)
+
+
+@dataclass
+class BuildPlan:
+    """
+    A model class for holding the estimated cost of a build, produced without touching the scene
+
+    Attributes
+    ----------
+    @type stages: List[StageEstimate]
+    @param stages: The estimates of the stages that will run, in build order
+    """
+
+    stages: List[StageEstimate] = field(default_factory=list)
+
+    def get_total_seconds(self) -> float:
+        return sum(stage.seconds for stage in self.stages)
+
+    def get_total_memory(self) -> float:
+        return sum(stage.memory for stage in self.stages)
+
+    def get_summary(self) -> str:
+        """
+        Formats the total cost for displaying it to the user.
+
+        @rtype: str
+        @returns: The total estimated duration and memory, e.g. "~42 s, ~1.2 GB"
+        """
+
+        return f"~{self.get_total_seconds():.0f} s, ~{format_bytes(self.get_total_memory())}"
+
+    def log(self) -> None:
+        """Logs the estimate of every stage"""
+
+        for stage in self.stages:
+            logging.info(
+                f"{stage.name}: {stage.units} units, ~{stage.seconds:.1f} s, ~{format_bytes(stage.memory)}"
+            )
+        logging.info(f"estimated build cost: {self.get_summary()}")
+
+
+class BuildTimings:
+    """
+    A class used for recording the duration and memory of build stages
+
+    Attributes
+    ----------
+    @type memory_probe: Optional[Callable[[], float]]
+    @param memory_probe: Returns the memory in bytes currently used by the scene, memory isn't recorded if not set
+
+    @type durations: Dict[str, float]
+    @param durations: The accumulated duration of every measured stage in seconds
+
+    @type memory: Dict[str, float]
+    @param memory: The accumulated memory growth of every measured stage in bytes
+    """
+
+    def __init__(self, memory_probe: Optional[Callable[[], float]] = None) -> None:
+        self.memory_probe = memory_probe
+        self.durations: Dict[str, float] = {}
+        self.memory: Dict[str, float] = {}
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """
+        Adds the duration and the memory growth of the wrapped block to the ones of the stage.
+
+        @type stage: str
+        @param stage: The name of the stage
+        """
+
+        used = self.memory_probe() if self.memory_probe else None
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[stage] = (
+                self.durations.get(stage, 0.0) + time.perf_counter() - start
+            )
+            if used is not None:
+                # memory freed by unrelated work during the stage can make the difference negative
+                growth = max(0.0, self.memory_probe() - used)
+                self.memory[stage] = self.memory.get(stage, 0.0) + growth
+
+
+def format_bytes(value: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+def estimate_stage(name: str, units: int, costs: Dict[str, StageCost]) -> StageEstimate:
+    """
+    Estimates the cost of a stage from the amount of its work.
+
+    @type name: str
+    @param name: The name of the stage
+
+    @type units: int
+    @param units: The amount of work in the stage
+
+    @type costs: Dict[str, StageCost]
+    @param costs: The cost of a unit of work per stage
+
+    @rtype: StageEstimate
+    @returns: The estimated cost of the stage
+    """
+
+    cost = costs.get(name) or DEFAULT_STAGE_COSTS.get(name) or StageCost()
+    return StageEstimate(
+        name=name,
+        units=units,
+        seconds=units * cost.seconds_per_unit,
+        memory=units * cost.bytes_per_unit,
+    )
+
+
+def calibrate_stage_costs(
+    plan: BuildPlan, timings: BuildTimings, costs: Dict[str, StageCost]
+) -> Dict[str, StageCost]:
+    """
+    Updates the time and memory cost of every stage with the durations and memory recorded during the build of the
+    plan. The memory cost of stages without recorded memory is kept.
+
+    @type plan: BuildPlan
+    @param plan: The plan of the recorded build
+
+    @type timings: BuildTimings
+    @param timings: The durations and memory recorded during the build
+
+    @type costs: Dict[str, StageCost]
+    @param costs: The current costs
+
+    @rtype: Dict[str, StageCost]
+    @returns: The updated costs
+    """
+
+    calibrated = dict(costs)
+    for stage in plan.stages:
+        duration = timings.durations.get(stage.name)
+        if duration is None or not stage.units:
+            continue
+        cost = calibrated.get(stage.name) or DEFAULT_STAGE_COSTS.get(stage.name)
+        measured = StageCost(
+            seconds_per_unit=duration / stage.units,
+            bytes_per_unit=timings.memory.get(stage.name, 0.0) / stage.units,
+        )
+        if cost is None:
+            calibrated[stage.name] = measured
+            continue
+        bytes_per_unit = cost.bytes_per_unit
+        if stage.name in timings.memory:
+            bytes_per_unit = (
+                CALIBRATION_WEIGHT * measured.bytes_per_unit
+                + (1 - CALIBRATION_WEIGHT) * cost.bytes_per_unit
+            )
+        calibrated[stage.name] = StageCost(
+            seconds_per_unit=CALIBRATION_WEIGHT * measured.seconds_per_unit
+            + (1 - CALIBRATION_WEIGHT) * cost.seconds_per_unit,
+            bytes_per_unit=bytes_per_unit,
+        )
+    return calibrated
+
+
+def load_stage_costs(path: Optional[str]) -> Dict[str, StageCost]:
+    """
+    Loads calibrated stage costs, missing or unreadable files give the default costs.
+
+    @type path: Optional[str]
+    @param path: The path of the calibration file
+
+    @rtype: Dict[str, StageCost]
+    @returns: The cost of a unit of work per stage
+    """
+
+    costs = dict(DEFAULT_STAGE_COSTS)
+    if path and Path(path).exists():
+        try:
+            with open(path, encoding="utf-8") as file:
+                for name, cost in json.load(file).items():
+                    costs[name] = StageCost(**cost)
+        except (OSError, ValueError, TypeError) as e:
+            logging.warning(f"Ignoring build cost calibration {path}. Reason: {e}")
+    return costs
+
+
+def save_stage_costs(path: str, costs: Dict[str, StageCost]) -> None:
+    """
+    Saves calibrated stage costs.
+
+    @type path: str
+    @param path: The path of the calibration file
+
+    @type costs: Dict[str, StageCost]
+    @param costs: The cost of a unit of work per stage
+    """
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({name: asdict(cost) for name, cost in costs.items()}, file, indent=4)
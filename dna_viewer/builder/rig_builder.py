@@ -3,7 +3,7 @@ from importlib.machinery import SourceFileLoader
 from importlib.util import module_from_spec, spec_from_loader
 from pathlib import Path
 from types import ModuleType
-from typing import Optional
+from typing import Dict, Generator, List, Optional
 
 from maya import cmds, mel
 from maya.api.OpenMaya import MSpace, MVector
@@ -11,8 +11,9 @@ from maya.api.OpenMaya import MSpace, MVector
 from ..builder.maya.util import Maya
 from ..common import ANALOG_GUI_HOLDER, GUI_HOLDER, RIG_LOGIC_PREFIX, DNAViewerError
 from ..dnalib.dnalib import DNA
-from .builder import Builder
+from .builder import Builder, BuildStep
 from .config import RigConfig
+from .plan import STAGE_ANALOG_GUI, STAGE_ASSEMBLE_SCRIPT, STAGE_GUI, STAGE_RIG_LOGIC
 
 
 class RigBuilder(Builder):
@@ -26,12 +27,60 @@ class RigBuilder(Builder):
         self.eye_l_pos: MVector
         self.eye_r_pos: MVector
 
-    def _build(self) -> None:
-        if super()._build():
+    def _build(self) -> Generator[BuildStep, None, bool]:
+        if not (yield from super()._build()):
+            return False
+
+        with self.timings.measure(STAGE_GUI):
             self.add_gui()
+        yield BuildStep(description="added gui")
+        with self.timings.measure(STAGE_ANALOG_GUI):
             self.add_analog_gui()
+        yield BuildStep(description="added analog gui")
+        with self.timings.measure(STAGE_RIG_LOGIC):
             self.add_rig_logic()
+        yield BuildStep(description="added rig logic")
+        with self.timings.measure(STAGE_ASSEMBLE_SCRIPT):
             self.run_additional_assemble_script()
+        yield BuildStep(description="ran additional assemble script")
+        return True
+
+    def get_step_count(self) -> int:
+        """
+        Gets the number of units of work yielded by build_steps, the rig stages are a single unit each.
+
+        @rtype: int
+        @returns: The number of units of work
+        """
+
+        return super().get_step_count() + 4
+
+    def get_stage_units(self) -> Dict[str, int]:
+        """
+        Gets the amount of work of every stage, the rig stages are counted as a single unit each.
+
+        @rtype: Dict[str, int]
+        @returns: The amount of work per stage, in build order
+        """
+
+        units = super().get_stage_units()
+        units[STAGE_GUI] = int(bool(self.config.gui_path))
+        units[STAGE_ANALOG_GUI] = int(
+            bool(self.config.analog_gui_path and self.config.add_joints)
+        )
+        units[STAGE_RIG_LOGIC] = int(
+            bool(
+                self.config.add_rig_logic
+                and self.config.add_joints
+                and self.config.add_skin_cluster
+                and self.config.add_blend_shapes
+                and self.config.aas_path
+                and self.config.analog_gui_path
+                and self.config.gui_path
+            )
+        )
+        units[STAGE_ASSEMBLE_SCRIPT] = int(bool(self.config.aas_path))
+        return units
 
     def run_additional_assemble_script(self) -> None:
         """
@@ -113,26 +162,26 @@ class RigBuilder(Builder):
         """
 
         gui_control_names = self.dna.get_raw_control_names()
+        attributes_per_control: Dict[str, List[str]] = {}
         for name in gui_control_names:
             ctrl_and_attr_names = name.split(".")
-            self.add_attribute(
-                control_name=ctrl_and_attr_names[0],
-                long_name=ctrl_and_attr_names[1],
+            attributes_per_control.setdefault(ctrl_and_attr_names[0], []).append(
+                ctrl_and_attr_names[1]
             )
+        for control_name, long_names in attributes_per_control.items():
+            Maya.add_float_attributes(control_name, long_names)
 
     def add_animated_map_attributes(self) -> None:
         """
         Adds and sets the animated map attributes.
         """
 
-        names = self.dna.get_animated_map_names()
-        for name in names:
-            long_name = name.replace(".", "_")
-            if self.config.gui_path:
-                self.add_attribute(
-                    control_name=self.config.animated_map_attribute_multipliers_name,
-                    long_name=long_name,
-                )
+        if self.config.gui_path:
+            names = self.dna.get_animated_map_names()
+            Maya.add_float_attributes(
+                self.config.animated_map_attribute_multipliers_name,
+                [name.replace(".", "_") for name in names],
+            )
 
     def position_gui(self, group_name: str) -> None:
         """Sets the gui position to align with the character eyes"""
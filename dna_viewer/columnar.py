@@ -0,0 +1,734 @@
+import struct
+import zipfile
+from itertools import chain
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from dna import DataLayer_All
+
+from .common import DNAViewerError
+from .dnalib.dnalib import DNA
+from .dnalib.transform import (
+    read_joint_parent_indices,
+    read_neutral_joint_rotations,
+    read_neutral_joint_translations,
+    read_vertex_positions,
+)
+
+FORMAT_NPZ = "npz"
+FORMAT_PARQUET = "parquet"
+
+SECTION_NAMES = "names"
+SECTION_LODS = "lods"
+SECTION_JOINTS = "joints"
+SECTION_MESHES = "meshes"
+SECTION_VERTEX_POSITIONS = "vertex_positions"
+SECTION_TEXTURE_COORDINATES = "texture_coordinates"
+SECTION_TOPOLOGY = "topology"
+SECTION_SKIN_WEIGHTS = "skin_weights"
+SECTION_BLEND_SHAPE_DELTAS = "blend_shape_deltas"
+SECTION_GUI_TO_RAW = "gui_to_raw"
+SECTION_PSD = "psd"
+SECTION_JOINT_GROUPS = "joint_groups"
+SECTION_BLEND_SHAPE_CHANNELS = "blend_shape_channels"
+SECTION_ANIMATED_MAPS = "animated_maps"
+
+NAME_KIND_GUI_CONTROL = "gui_control"
+NAME_KIND_RAW_CONTROL = "raw_control"
+NAME_KIND_JOINT = "joint"
+NAME_KIND_MESH = "mesh"
+NAME_KIND_BLEND_SHAPE_CHANNEL = "blend_shape_channel"
+NAME_KIND_ANIMATED_MAP = "animated_map"
+
+# The local file header of a zip member, followed by the member name and the extra field
+ZIP_LOCAL_HEADER = struct.Struct("<4s5H3I2H")
+ZIP_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+Columns = Dict[str, np.ndarray]
+
+
+def to_columns(rows: Dict[str, List[Any]], dtypes: Dict[str, Any]) -> Columns:
+    return {name: np.asarray(rows[name], dtype=dtypes[name]) for name in dtypes}
+
+
+def concatenate(parts: List[np.ndarray], dtype: Any) -> np.ndarray:
+    if not parts:
+        return np.empty(0, dtype=dtype)
+    return np.concatenate(parts).astype(dtype, copy=False)
+
+
+def read_names(dna: DNA) -> Columns:
+    """
+    Reads the names of the controls, joints, meshes, blend shape channels and animated maps.
+
+    @type dna: DNA
+    @param dna: The DNA
+
+    @rtype: Columns
+    @returns: The kind, index and name of every name
+    """
+
+    sources = [
+        (NAME_KIND_GUI_CONTROL, dna.get_gui_control_count(), dna.get_gui_control_name),
+        (NAME_KIND_RAW_CONTROL, dna.get_raw_control_count(), dna.get_raw_control_name),
+        (NAME_KIND_JOINT, dna.get_joint_count(), dna.get_joint_name),
+        (NAME_KIND_MESH, dna.get_mesh_count(), dna.get_mesh_name),
+        (
+            NAME_KIND_BLEND_SHAPE_CHANNEL,
+            dna.get_blend_shape_channel_count(),
+            dna.get_blend_shape_channel_name,
+        ),
+        (
+            NAME_KIND_ANIMATED_MAP,
+            dna.get_animated_map_count(),
+            dna.get_animated_map_name,
+        ),
+    ]
+    rows: Dict[str, List[Any]] = {"kind": [], "index": [], "name": []}
+    for kind, count, get_name in sources:
+        for index in range(count):
+            rows["kind"].append(kind)
+            rows["index"].append(index)
+            rows["name"].append(get_name(index))
+    return to_columns(rows, {"kind": str, "index": np.int32, "name": str})
+
+
+def read_lods(dna: DNA) -> Columns:
+    """
+    Reads the LOD membership of the joints, meshes, blend shape channels and animated maps.
+
+    @type dna: DNA
+    @param dna: The DNA
+
+    @rtype: Columns
+    @returns: The kind, LOD and index of every member of every LOD
+    """
+
+    sources = [
+        (NAME_KIND_JOINT, dna.get_joint_indices_for_lod),
+        (NAME_KIND_MESH, dna.get_mesh_indices_for_lod),
+        (NAME_KIND_BLEND_SHAPE_CHANNEL, dna.get_blend_shape_channel_indices_for_lod),
+        (NAME_KIND_ANIMATED_MAP, dna.get_animated_map_indices_for_lod),
+    ]
+    rows: Dict[str, List[Any]] = {"kind": [], "lod": [], "index": []}
+    for kind, get_indices in sources:
+        for lod in range(dna.get_lod_count()):
+            indices = list(get_indices(lod))
+            rows["kind"].extend([kind] * len(indices))
+            rows["lod"].extend([lod] * len(indices))
+            rows["index"].extend(indices)
+    return to_columns(rows, {"kind": str, "lod": np.int32, "index": np.int32})
+
+
+def read_joints(dna: DNA) -> Columns:
+    """
+    Reads the neutral joints, rotations are in radians regardless of the rotation unit of the DNA.
+
+    @type dna: DNA
+    @param dna: The DNA
+
+    @rtype: Columns
+    @returns: The name, parent index, translation and rotation of every joint
+    """
+
+    translations = read_neutral_joint_translations(dna.reader)
+    rotations = read_neutral_joint_rotations(dna.reader)
+    return {
+        "name": np.asarray(
+            [dna.get_joint_name(index) for index in range(dna.get_joint_count())],
+            dtype=str,
+        ),
+        "parent_index": read_joint_parent_indices(dna.reader).astype(np.int32),
+        "translation_x": translations[:, 0],
+        "translation_y": translations[:, 1],
+        "translation_z": translations[:, 2],
+        "rotation_x": rotations[:, 0],
+        "rotation_y": rotations[:, 1],
+        "rotation_z": rotations[:, 2],
+    }
+
+
+def read_meshes(dna: DNA) -> Columns:
+    """
+    Reads the sizes of every mesh.
+
+    @type dna: DNA
+    @param dna: The DNA
+
+    @rtype: Columns
+    @returns: The name and element counts of every mesh
+    """
+
+    reader = dna.reader
+    mesh_indices = range(dna.get_mesh_count())
+    return {
+        "name": np.asarray(
+            [dna.get_mesh_name(index) for index in mesh_indices], dtype=str
+        ),
+        "vertex_position_count": np.asarray(
+            [reader.getVertexPositionCount(index) for index in mesh_indices],
+            dtype=np.int32,
+        ),
+        "texture_coordinate_count": np.asarray(
+            [reader.getVertexTextureCoordinateCount(index) for index in mesh_indices],
+            dtype=np.int32,
+        ),
+        "vertex_layout_count": np.asarray(
+            [reader.getVertexLayoutCount(index) for index in mesh_indices],
+            dtype=np.int32,
+        ),
+        "face_count": np.asarray(
+            [reader.getFaceCount(index) for index in mesh_indices], dtype=np.int32
+        ),
+        "maximum_influence_per_vertex": np.asarray(
+            [reader.getMaximumInfluencePerVertex(index) for index in mesh_indices],
+            dtype=np.int32,
+        ),
+        "blend_shape_target_count": np.asarray(
+            [reader.getBlendShapeTargetCount(index) for index in mesh_indices],
+            dtype=np.int32,
+        ),
+    }
+
+
+def read_vertex_positions_section(dna: DNA) -> Columns:
+    """
+    Reads the vertex positions of all meshes, in mesh and vertex order.
+
+    @type dna: DNA
+    @param dna: The DNA
+
+    @rtype: Columns
+    @returns: The mesh index and position of every vertex
+    """
+
+    mesh_indices, positions = [], []
+    for mesh_index in range(dna.get_mesh_count()):
+        mesh_positions = read_vertex_positions(dna.reader, mesh_index)
+        mesh_indices.append(np.full(len(mesh_positions), mesh_index))
+        positions.append(mesh_positions)
+    positions_array = concatenate(positions, np.float32).reshape(-1, 3)
+    return {
+        "mesh_index": concatenate(mesh_indices, np.int32),
+        "x": positions_array[:, 0],
+        "y": positions_array[:, 1],
+        "z": positions_array[:, 2],
+    }
+
+
+def read_texture_coordinates(dna: DNA) -> Columns:
+    """
+    Reads the texture coordinates of all meshes, in mesh and texture coordinate order.
+
+    @type dna: DNA
+    @param dna: The DNA
+
+    @rtype: Columns
+    @returns: The mesh index and UV of every texture coordinate
+    """
+
+    mesh_indices, us, vs = [], [], []
+    for mesh_index in range(dna.get_mesh_count()):
+        mesh_us = dna.reader.getVertexTextureCoordinateUs(mesh_index)
+        mesh_indices.append(np.full(len(mesh_us), mesh_index))
+        us.append(np.asarray(mesh_us))
+        vs.append(np.asarray(dna.reader.getVertexTextureCoordinateVs(mesh_index)))
+    return {
+        "mesh_index": concatenate(mesh_indices, np.int32),
+        "u": concatenate(us, np.float32),
+        "v": concatenate(vs, np.float32),
+    }
+
+
+def read_topology(dna: DNA) -> Columns:
+    """
+    Reads the faces of all meshes, in mesh and face order. Every face vertex is a row, holding the position and texture
+    coordinate index of its vertex layout.
+
+    @type dna: DNA
+    @param dna: The DNA
+
+    @rtype: Columns
+    @returns: The mesh index, face index, position index and texture coordinate index of every face vertex
+    """
+
+    reader = dna.reader
+    columns: Dict[str, List[np.ndarray]] = {
+        "mesh_index": [],
+        "face_index": [],
+        "position_index": [],
+        "texture_coordinate_index": [],
+    }
+    for mesh_index in range(dna.get_mesh_count()):
+        faces = [
+            reader.getFaceVertexLayoutIndices(mesh_index, face_index)
+            for face_index in range(reader.getFaceCount(mesh_index))
+        ]
+        face_counts = np.fromiter(map(len, faces), dtype=np.int64, count=len(faces))
+        face_layouts = np.fromiter(
+            chain.from_iterable(faces), dtype=np.int64, count=int(face_counts.sum())
+        )
+        layout_positions = np.asarray(
+            reader.getVertexLayoutPositionIndices(mesh_index), dtype=np.int64
+        )
+        layout_texture_coordinates = np.asarray(
+            reader.getVertexLayoutTextureCoordinateIndices(mesh_index), dtype=np.int64
+        )
+        columns["mesh_index"].append(np.full(len(face_layouts), mesh_index))
+        columns["face_index"].append(np.repeat(np.arange(len(faces)), face_counts))
+        columns["position_index"].append(layout_positions[face_layouts])
+        columns["texture_coordinate_index"].append(
+            layout_texture_coordinates[face_layouts]
+        )
+    return {name: concatenate(parts, np.int32) for name, parts in columns.items()}
+
+
+def read_skin_weights(dna: DNA) -> Columns:
+    """
+    Reads the skin weights of all meshes. Rows are sorted by mesh and vertex, so the rows of a vertex are contiguous
+    and the columns can be used as a CSR matrix per mesh.
+
+    @type dna: DNA
+    @param dna: The DNA
+
+    @rtype: Columns
+    @returns: The mesh index, vertex index, joint index and weight of every influence
+    """
+
+    rows: Dict[str, List[Any]] = {
+        "mesh_index": [],
+        "vertex_index": [],
+        "joint_index": [],
+        "weight": [],
+    }
+    for mesh_index in range(dna.get_mesh_count()):
+        for vertex_index in range(dna.reader.getSkinWeightsCount(mesh_index)):
+            joint_indices = dna.reader.getSkinWeightsJointIndices(
+                mesh_index, vertex_index
+            )
+            rows["mesh_index"].extend([mesh_index] * len(joint_indices))
+            rows["vertex_index"].extend([vertex_index] * len(joint_indices))
+            rows["joint_index"].extend(joint_indices)
+            rows["weight"].extend(
+                dna.reader.getSkinWeightsValues(mesh_index, vertex_index)
+            )
+    return to_columns(
+        rows,
+        {
+            "mesh_index": np.int32,
+            "vertex_index": np.int32,
+            "joint_index": np.int32,
+            "weight": np.float32,
+        },
+    )
+
+
+def read_blend_shape_deltas(dna: DNA) -> Columns:
+    """
+    Reads the blend shape target deltas of all meshes, in mesh and target order.
+
+    @type dna: DNA
+    @param dna: The DNA
+
+    @rtype: Columns
+    @returns: The mesh index, target index, blend shape channel index, vertex index and delta of every delta
+    """
+
+    reader = dna.reader
+    columns: Dict[str, List[np.ndarray]] = {
+        "mesh_index": [],
+        "target_index": [],
+        "channel_index": [],
+        "vertex_index": [],
+        "x": [],
+        "y": [],
+        "z": [],
+    }
+    for mesh_index in range(dna.get_mesh_count()):
+        for target_index in range(reader.getBlendShapeTargetCount(mesh_index)):
+            vertex_indices = np.asarray(
+                reader.getBlendShapeTargetVertexIndices(mesh_index, target_index)
+            )
+            count = len(vertex_indices)
+            columns["mesh_index"].append(np.full(count, mesh_index))
+            columns["target_index"].append(np.full(count, target_index))
+            columns["channel_index"].append(
+                np.full(
+                    count, reader.getBlendShapeChannelIndex(mesh_index, target_index)
+                )
+            )
+            columns["vertex_index"].append(vertex_indices)
+            columns["x"].append(
+                np.asarray(reader.getBlendShapeTargetDeltaXs(mesh_index, target_index))
+            )
+            columns["y"].append(
+                np.asarray(reader.getBlendShapeTargetDeltaYs(mesh_index, target_index))
+            )
+            columns["z"].append(
+                np.asarray(reader.getBlendShapeTargetDeltaZs(mesh_index, target_index))
+            )
+    return {
+        name: concatenate(parts, np.float32 if name in ("x", "y", "z") else np.int32)
+        for name, parts in columns.items()
+    }
+
+
+def read_conditional_table(
+    inputs: List[int],
+    outputs: List[int],
+    from_values: List[float],
+    to_values: List[float],
+    slope_values: List[float],
+    cut_values: List[float],
+) -> Columns:
+    return {
+        "input_index": np.asarray(inputs, dtype=np.int32),
+        "output_index": np.asarray(outputs, dtype=np.int32),
+        "from_value": np.asarray(from_values, dtype=np.float32),
+        "to_value": np.asarray(to_values, dtype=np.float32),
+        "slope_value": np.asarray(slope_values, dtype=np.float32),
+        "cut_value": np.asarray(cut_values, dtype=np.float32),
+    }
+
+
+def read_gui_to_raw(dna: DNA) -> Columns:
+    """
+    Reads the conditional table mapping the gui controls to the raw controls.
+
+    @type dna: DNA
+    @param dna: The DNA
+
+    @rtype: Columns
+    @returns: The input, output, from, to, slope and cut value of every row
+    """
+
+    return read_conditional_table(
+        dna.get_gui_to_raw_input_indices(),
+        dna.get_gui_to_raw_output_indices(),
+        dna.get_gui_to_raw_from_values(),
+        dna.get_gui_to_raw_to_values(),
+        dna.gget_gui_to_raw_slope_values(),
+        dna.get_gui_to_raw_cut_values(),
+    )
+
+
+def read_animated_maps(dna: DNA) -> Columns:
+    """
+    Reads the conditional table driving the animated maps.
+
+    @type dna: DNA
+    @param dna: The DNA
+
+    @rtype: Columns
+    @returns: The input, output, from, to, slope and cut value of every row
+    """
+
+    return read_conditional_table(
+        dna.get_animated_map_input_indices(),
+        dna.get_animated_map_output_indices(),
+        dna.get_animated_map_from_values(),
+        dna.get_animated_map_to_values(),
+        dna.get_animated_map_slope_values(),
+        dna.get_animated_map_cut_values(),
+    )
+
+
+def read_psd(dna: DNA) -> Columns:
+    """
+    Reads the pose space deformation matrix.
+
+    @type dna: DNA
+    @param dna: The DNA
+
+    @rtype: Columns
+    @returns: The row index, column index and value of every nonzero element
+    """
+
+    return {
+        "row_index": np.asarray(dna.get_psd_row_indices(), dtype=np.int32),
+        "column_index": np.asarray(dna.get_psd_column_indices(), dtype=np.int32),
+        "value": np.asarray(dna.get_psd_values(), dtype=np.float32),
+    }
+
+
+def read_joint_groups(dna: DNA) -> Columns:
+    """
+    Reads the joint group matrices, every joint group maps its inputs to the joint attributes of its outputs.
+
+    @type dna: DNA
+    @param dna: The DNA
+
+    @rtype: Columns
+    @returns: The joint group index, output index, input index and value of every matrix element
+    """
+
+    columns: Dict[str, List[np.ndarray]] = {
+        "joint_group_index": [],
+        "output_index": [],
+        "input_index": [],
+        "value": [],
+    }
+    for joint_group_index in range(dna.get_joint_group_count()):
+        inputs = np.asarray(dna.get_joint_group_input_indices(joint_group_index))
+        outputs = np.asarray(dna.get_joint_group_output_indices(joint_group_index))
+        # the values are stored row major, a row per output
+        values = np.asarray(dna.get_joint_group_values(joint_group_index))
+        columns["joint_group_index"].append(np.full(len(values), joint_group_index))
+        columns["output_index"].append(np.repeat(outputs, len(inputs)))
+        columns["input_index"].append(np.tile(inputs, len(outputs)))
+        columns["value"].append(values)
+    return {
+        name: concatenate(parts, np.float32 if name == "value" else np.int32)
+        for name, parts in columns.items()
+    }
+
+
+def read_blend_shape_channels(dna: DNA) -> Columns:
+    """
+    Reads the mapping of the raw controls to the blend shape channels.
+
+    @type dna: DNA
+    @param dna: The DNA
+
+    @rtype: Columns
+    @returns: The input index and output index of every mapping
+    """
+
+    return {
+        "input_index": np.asarray(
+            dna.get_blend_shape_channel_input_indices(), dtype=np.int32
+        ),
+        "output_index": np.asarray(
+            dna.get_blend_shape_channel_output_indices(), dtype=np.int32
+        ),
+    }
+
+
+SECTION_READERS: Dict[str, Callable[[DNA], Columns]] = {
+    SECTION_NAMES: read_names,
+    SECTION_LODS: read_lods,
+    SECTION_JOINTS: read_joints,
+    SECTION_MESHES: read_meshes,
+    SECTION_VERTEX_POSITIONS: read_vertex_positions_section,
+    SECTION_TEXTURE_COORDINATES: read_texture_coordinates,
+    SECTION_TOPOLOGY: read_topology,
+    SECTION_SKIN_WEIGHTS: read_skin_weights,
+    SECTION_BLEND_SHAPE_DELTAS: read_blend_shape_deltas,
+    SECTION_GUI_TO_RAW: read_gui_to_raw,
+    SECTION_PSD: read_psd,
+    SECTION_JOINT_GROUPS: read_joint_groups,
+    SECTION_BLEND_SHAPE_CHANNELS: read_blend_shape_channels,
+    SECTION_ANIMATED_MAPS: read_animated_maps,
+}
+
+
+def iterate_sections(
+    dna: DNA, sections: Optional[List[str]] = None
+) -> Iterator[Tuple[str, Columns]]:
+    """
+    Reads the sections one at a time, so only a single section is held in memory.
+
+    @type dna: DNA
+    @param dna: The DNA
+
+    @type sections: Optional[List[str]]
+    @param sections: The names of the sections, all sections if nothing is passed
+
+    @rtype: Iterator[Tuple[str, Columns]]
+    @returns: The name and columns of every section
+    """
+
+    for section in sections or list(SECTION_READERS):
+        if section not in SECTION_READERS:
+            raise DNAViewerError(f"Unknown section {section}")
+        yield section, SECTION_READERS[section](dna)
+
+
+def import_pyarrow() -> Any:
+    try:
+        import pyarrow  # pylint: disable=import-outside-toplevel
+        import pyarrow.parquet  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
+        raise DNAViewerError(
+            "Parquet files need pyarrow, install it or use the npz format"
+        ) from e
+    return pyarrow
+
+
+def write_section(path: Path, columns: Columns, file_format: str) -> None:
+    if file_format == FORMAT_NPZ:
+        # stored uncompressed, so the columns can be memory mapped from the archive
+        np.savez(path, **columns)
+    elif file_format == FORMAT_PARQUET:
+        pyarrow = import_pyarrow()
+        table = pyarrow.table(
+            {
+                name: column.tolist() if column.dtype.kind == "U" else column
+                for name, column in columns.items()
+            }
+        )
+        pyarrow.parquet.write_table(table, str(path))
+    else:
+        raise DNAViewerError(f"Unknown format {file_format}")
+
+
+def export_columnar(
+    dna: DNA,
+    output_dir: str,
+    sections: Optional[List[str]] = None,
+    file_format: str = FORMAT_NPZ,
+) -> List[str]:
+    """
+    Writes every section of the DNA as a columnar file named after the section, e.g. joints.npz. The data is read with
+    the bulk getters of the DNA reader, the DNA file is loaded again with DataLayer_All if the reader doesn't hold it.
+
+    @type dna: DNA
+    @param dna: The DNA
+
+    @type output_dir: str
+    @param output_dir: The directory of the files
+
+    @type sections: Optional[List[str]]
+    @param sections: The names of the sections, all sections if nothing is passed
+
+    @type file_format: str
+    @param file_format: npz or parquet
+
+    @rtype: List[str]
+    @returns: The paths of the written files
+    """
+
+    dna.load_data_layer(DataLayer_All)
+    directory = Path(output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for section, columns in iterate_sections(dna, sections):
+        path = directory / f"{section}.{file_format}"
+        write_section(path, columns, file_format)
+        paths.append(str(path))
+    return paths
+
+
+def memory_map_npz_member(path: Path, info: zipfile.ZipInfo) -> np.ndarray:
+    """
+    Memory maps an array stored uncompressed in a npz file.
+
+    @type path: Path
+    @param path: The path of the npz file
+
+    @type info: zipfile.ZipInfo
+    @param info: The zip member holding the array
+
+    @rtype: np.ndarray
+    @returns: The read only memory mapped array
+    """
+
+    with open(path, "rb") as file:
+        file.seek(info.header_offset)
+        header = ZIP_LOCAL_HEADER.unpack(file.read(ZIP_LOCAL_HEADER.size))
+        if header[0] != ZIP_LOCAL_HEADER_SIGNATURE:
+            raise DNAViewerError(f"Corrupted zip member {info.filename} in {path}")
+        name_length, extra_length = header[-2:]
+        file.seek(name_length + extra_length, 1)
+        version = np.lib.format.read_magic(file)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+        offset = file.tell()
+
+    if not int(np.prod(shape)):
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(
+        path,
+        dtype=dtype,
+        mode="r",
+        offset=offset,
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
+
+
+class ColumnarDNA:
+    """
+    A read only view of the files written by export_columnar. Only the requested columns are read, npz columns are
+    memory mapped and parquet files are read with memory mapping.
+
+    Attributes
+    ----------
+    @type path: str
+    @param path: The directory of the files
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        if not Path(path).is_dir():
+            raise DNAViewerError(f"{path} is not a directory!")
+
+    def get_section_path(self, section: str) -> Path:
+        for file_format in (FORMAT_NPZ, FORMAT_PARQUET):
+            path = Path(self.path) / f"{section}.{file_format}"
+            if path.exists():
+                return path
+        raise DNAViewerError(f"Section {section} not found in {self.path}")
+
+    def get_sections(self) -> List[str]:
+        return sorted(
+            path.stem
+            for path in Path(self.path).iterdir()
+            if path.suffix[1:] in (FORMAT_NPZ, FORMAT_PARQUET)
+        )
+
+    def get_columns(self, section: str) -> List[str]:
+        """
+        Gets the names of the columns of the section without reading them.
+
+        @type section: str
+        @param section: The name of the section
+
+        @rtype: List[str]
+        @returns: The column names
+        """
+
+        path = self.get_section_path(section)
+        if path.suffix == f".{FORMAT_PARQUET}":
+            return list(import_pyarrow().parquet.read_schema(str(path)).names)
+        with zipfile.ZipFile(path) as archive:
+            return [Path(name).stem for name in archive.namelist()]
+
+    def read(self, section: str, columns: Optional[List[str]] = None) -> Columns:
+        """
+        Reads the columns of the section.
+
+        @type section: str
+        @param section: The name of the section
+
+        @type columns: Optional[List[str]]
+        @param columns: The names of the columns, all columns if nothing is passed
+
+        @rtype: Columns
+        @returns: The arrays of the columns by name
+        """
+
+        path = self.get_section_path(section)
+        if path.suffix == f".{FORMAT_PARQUET}":
+            pyarrow = import_pyarrow()
+            table = pyarrow.parquet.read_table(
+                str(path), columns=columns, memory_map=True
+            )
+            return {name: table.column(name).to_numpy() for name in table.column_names}
+
+        result: Columns = {}
+        with zipfile.ZipFile(path) as archive:
+            members = {Path(info.filename).stem: info for info in archive.infolist()}
+            for name in columns or list(members):
+                if name not in members:
+                    raise DNAViewerError(f"Column {name} not found in {path}")
+                info = members[name]
+                if info.compress_type == zipfile.ZIP_STORED:
+                    result[name] = memory_map_npz_member(path, info)
+                else:
+                    with archive.open(info) as file:
+                        result[name] = np.lib.format.read_array(file)
+        return result
@@ -0,0 +1,293 @@
+"""
+Converts DNA files between the binary and the JSON format.
+
+- usage in command line:
+    python -m dna_viewer.convert Ada.dna Taro.dna --output-dir output --layers behavior
+    python -m dna_viewer.convert output/Ada.json --output-dir output --format binary
+
+Only the selected layers are read from binary files. The writer copies them from the reader while the reader is still
+alive, so the peak memory of a conversion is two copies of the selected layers, one in the reader and one in the writer.
+The reader is freed before the output is written. Files are converted one at a time in every worker, so the peak memory
+is bounded by one reader and one writer copy per worker.
+"""
+
+import argparse
+import logging
+import os
+import time
+from functools import partial
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional
+
+from dna import (
+    BinaryStreamReader,
+    BinaryStreamWriter,
+    DataLayer_All,
+    DataLayer_AllWithoutBlendShapes,
+    DataLayer_Behavior,
+    DataLayer_Definition,
+    DataLayer_Descriptor,
+    DataLayer_Geometry,
+    DataLayer_GeometryWithoutBlendShapes,
+    FileStream,
+    JSONStreamReader,
+    JSONStreamWriter,
+    Status,
+)
+
+from .batch_runner import FileResult, get_worker_count, log_results, run_jobs
+from .common import DNAViewerError
+
+FORMAT_BINARY = "binary"
+FORMAT_JSON = "json"
+EXTENSIONS = {FORMAT_BINARY: ".dna", FORMAT_JSON: ".json"}
+
+LAYER_DESCRIPTOR = "descriptor"
+LAYER_DEFINITION = "definition"
+LAYER_BEHAVIOR = "behavior"
+LAYER_GEOMETRY = "geometry"
+LAYER_GEOMETRY_WITHOUT_BLEND_SHAPES = "geometry_without_blend_shapes"
+LAYER_ALL = "all"
+
+# Every selection of layers maps to the smallest DNA data layer containing all of them
+DATA_LAYERS: Dict[FrozenSet[str], int] = {
+    frozenset({LAYER_DESCRIPTOR}): DataLayer_Descriptor,
+    frozenset({LAYER_DEFINITION}): DataLayer_Definition,
+    frozenset({LAYER_BEHAVIOR}): DataLayer_Behavior,
+    frozenset({LAYER_GEOMETRY}): DataLayer_Geometry,
+    frozenset(
+        {LAYER_GEOMETRY_WITHOUT_BLEND_SHAPES}
+    ): DataLayer_GeometryWithoutBlendShapes,
+    frozenset(
+        {LAYER_BEHAVIOR, LAYER_GEOMETRY_WITHOUT_BLEND_SHAPES}
+    ): DataLayer_AllWithoutBlendShapes,
+    frozenset({LAYER_BEHAVIOR, LAYER_GEOMETRY}): DataLayer_All,
+    frozenset({LAYER_ALL}): DataLayer_All,
+}
+LAYER_NAMES = [
+    LAYER_DESCRIPTOR,
+    LAYER_DEFINITION,
+    LAYER_BEHAVIOR,
+    LAYER_GEOMETRY,
+    LAYER_GEOMETRY_WITHOUT_BLEND_SHAPES,
+    LAYER_ALL,
+]
+
+
+def get_data_layer(layers: Optional[List[str]] = None) -> int:
+    """
+    Gets the smallest DNA data layer that contains the selected layers. The descriptor is contained in every layer, the
+    definition in every layer except the descriptor.
+
+    @type layers: Optional[List[str]]
+    @param layers: The names of the selected layers, all layers if nothing is passed
+
+    @rtype: int
+    @returns: The DNA data layer
+    """
+
+    selected = set(layers or [LAYER_ALL])
+    if LAYER_ALL in selected:
+        selected = {LAYER_ALL}
+    if LAYER_GEOMETRY in selected:
+        selected.discard(LAYER_GEOMETRY_WITHOUT_BLEND_SHAPES)
+    for contained in (LAYER_DESCRIPTOR, LAYER_DEFINITION):
+        if len(selected) > 1:
+            selected.discard(contained)
+
+    data_layer = DATA_LAYERS.get(frozenset(selected))
+    if data_layer is None:
+        raise DNAViewerError(f"Unknown layer selection {sorted(selected)}")
+    return data_layer
+
+
+def get_format(path: str) -> str:
+    if Path(path).suffix.lower() == EXTENSIONS[FORMAT_JSON]:
+        return FORMAT_JSON
+    return FORMAT_BINARY
+
+
+def read_dna(path: str, data_layer: int = DataLayer_All) -> object:
+    """
+    Reads the DNA file, binary files are read only up to the data layer.
+
+    @type path: str
+    @param path: The path of the DNA file
+
+    @type data_layer: int
+    @param data_layer: The DNA data layer up to which the data is read
+
+    @rtype: object
+    @returns: The reader holding the data of the file
+    """
+
+    stream = FileStream(path, FileStream.AccessMode_Read, FileStream.OpenMode_Binary)
+    if get_format(path) == FORMAT_JSON:
+        reader = JSONStreamReader(stream)
+    else:
+        reader = BinaryStreamReader(stream, data_layer)
+    reader.read()
+    if not Status.isOk():
+        status = Status.get()
+        raise DNAViewerError(f"Error loading DNA {path}: {status.message}")
+    return reader
+
+
+def convert_dna(
+    input_path: str,
+    output_path: str,
+    layers: Optional[List[str]] = None,
+) -> None:
+    """
+    Converts the DNA file to the format given by the extension of the output path, .json for JSON and anything else
+    for binary.
+
+    @type input_path: str
+    @param input_path: The path of the DNA file to be converted
+
+    @type output_path: str
+    @param output_path: The path of the converted DNA file
+
+    @type layers: Optional[List[str]]
+    @param layers: The names of the layers that are written, all layers if nothing is passed
+    """
+
+    data_layer = get_data_layer(layers)
+    reader = read_dna(input_path, data_layer)
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    stream = FileStream(
+        output_path, FileStream.AccessMode_Write, FileStream.OpenMode_Binary
+    )
+    if get_format(output_path) == FORMAT_JSON:
+        writer = JSONStreamWriter(stream)
+    else:
+        writer = BinaryStreamWriter(stream)
+    writer.setFrom(reader, data_layer)
+    # setFrom copies the data while the reader is alive, freeing the reader drops that copy before writing
+    del reader
+    writer.write()
+    if not Status.isOk():
+        status = Status.get()
+        raise DNAViewerError(f"Error saving DNA {output_path}: {status.message}")
+
+
+def get_output_path(input_path: str, output_dir: str, output_format: str) -> str:
+    return str(Path(output_dir) / f"{Path(input_path).stem}{EXTENSIONS[output_format]}")
+
+
+def get_path_key(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def check_output_paths(input_paths: List[str], output_paths: List[str]) -> None:
+    """
+    Checks that every conversion writes a file of its own, outputs are named after the inputs, so inputs with the same
+    name would overwrite each other's output and an input could be overwritten by its own output.
+
+    @type input_paths: List[str]
+    @param input_paths: The paths of the DNA files to be converted
+
+    @type output_paths: List[str]
+    @param output_paths: The paths of the converted files, in the order of input paths
+    """
+
+    inputs = {get_path_key(path): path for path in input_paths}
+    outputs: Dict[str, str] = {}
+    for input_path, output_path in zip(input_paths, output_paths):
+        key = get_path_key(output_path)
+        if key in inputs:
+            raise DNAViewerError(
+                f"Converting {input_path} would overwrite the input {inputs[key]}"
+            )
+        if key in outputs:
+            raise DNAViewerError(
+                f"{outputs[key]} and {input_path} would both be converted to {output_path}"
+            )
+        outputs[key] = input_path
+
+
+def convert_dnas(
+    input_paths: List[str],
+    output_dir: str,
+    output_format: Optional[str] = None,
+    layers: Optional[List[str]] = None,
+    workers: int = 1,
+) -> List[FileResult]:
+    """
+    Converts the DNA files into the output directory, keeping their names. Nothing is converted if two inputs would be
+    written to the same output or an input would be overwritten.
+
+    @type input_paths: List[str]
+    @param input_paths: The paths of the DNA files to be converted
+
+    @type output_dir: str
+    @param output_dir: The directory of the converted files
+
+    @type output_format: Optional[str]
+    @param output_format: binary or json, if nothing is passed every file is converted to the other format
+
+    @type layers: Optional[List[str]]
+    @param layers: The names of the layers that are written, all layers if nothing is passed
+
+    @type workers: int
+    @param workers: The number of worker processes, every worker holds a single DNA in memory at a time
+
+    @rtype: List[FileResult]
+    @returns: The result of every file, in the order of input paths
+    """
+
+    get_data_layer(layers)
+    output_paths = []
+    for input_path in input_paths:
+        target_format = output_format or (
+            FORMAT_BINARY if get_format(input_path) == FORMAT_JSON else FORMAT_JSON
+        )
+        output_paths.append(get_output_path(input_path, output_dir, target_format))
+    check_output_paths(input_paths, output_paths)
+    return run_jobs(
+        partial(convert_dna, layers=layers), input_paths, output_paths, workers
+    )
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Converts DNA files between the binary and the JSON format."
+    )
+    parser.add_argument("inputs", nargs="+", help="paths of the DNA files")
+    parser.add_argument(
+        "--output-dir", required=True, help="directory of the converted files"
+    )
+    parser.add_argument(
+        "--format",
+        choices=[FORMAT_BINARY, FORMAT_JSON],
+        help="format of the converted files, defaults to the other format of every input",
+    )
+    parser.add_argument(
+        "--layers",
+        nargs="+",
+        choices=LAYER_NAMES,
+        help="layers that are written, defaults to all",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="number of worker processes"
+    )
+    args = parser.parse_args(arguments)
+
+    logging.basicConfig(level=logging.INFO)
+    start = time.perf_counter()
+    try:
+        results = convert_dnas(
+            args.inputs,
+            args.output_dir,
+            output_format=args.format,
+            layers=args.layers,
+            workers=get_worker_count(args.workers),
+        )
+    except DNAViewerError as e:
+        parser.error(str(e))
+    return log_results(results, "DNAs converted", time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,838 @@
+"""
+Compares two DNA files section by section, e.g. before and after a calibration.
+
+- usage in command line:
+    python -m dna_viewer.diff Ada.dna Ada_calibrated.dna
+    python -m dna_viewer.diff Ada.dna Ada_calibrated.dna --sections joints vertex_positions --tolerance 1e-4 --json diff.json
+
+The sections are read as columns with the readers of the columnar export, one section at a time. Sections whose
+columns are equal are reported as identical, the others are compared with vectorized array operations. Files with the
+same content hash are not read as DNAs, and the hashes are cached per path, size and modification time. Meshes, joints
+and blend shape targets are matched by name, so added, removed or reordered entities don't hide the changes of the
+others. The exit code of the command line is 1 if the DNAs differ, like diff.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from dna import DataLayer_All
+
+from .columnar import (
+    NAME_KIND_BLEND_SHAPE_CHANNEL,
+    NAME_KIND_JOINT,
+    NAME_KIND_MESH,
+    SECTION_BLEND_SHAPE_DELTAS,
+    SECTION_JOINT_GROUPS,
+    SECTION_JOINTS,
+    SECTION_LODS,
+    SECTION_MESHES,
+    SECTION_NAMES,
+    SECTION_READERS,
+    SECTION_SKIN_WEIGHTS,
+    SECTION_TEXTURE_COORDINATES,
+    SECTION_TOPOLOGY,
+    SECTION_VERTEX_POSITIONS,
+    Columns,
+    read_names,
+)
+from .common import DNAViewerError
+from .dnalib.dnalib import DNA
+from .dnalib.layer import Layer
+
+# The number of names listed in a change, the rest are counted
+LISTED_NAMES = 5
+FILE_HASH_BLOCK_SIZE = 1 << 20
+
+# The content hashes of the compared files by real path, size and modification time
+FILE_HASHES: Dict[Tuple[str, int, int], str] = {}
+FILE_HASHES_LOCK = threading.Lock()
+
+
+@dataclass
+class Delta:
+    """
+    A model class for holding the differences of a quantity of a single entity
+
+    Attributes
+    ----------
+    @type name: str
+    @param name: The name of the entity, e.g. a mesh or a joint
+
+    @type quantity: str
+    @param quantity: The compared quantity, e.g. position or weight
+
+    @type max: float
+    @param max: The largest difference
+
+    @type rms: float
+    @param rms: The root mean square of the differences of all compared elements
+
+    @type changed: int
+    @param changed: The number of elements that differ by more than the tolerance
+
+    @type count: int
+    @param count: The number of compared elements
+    """
+
+    name: str
+    quantity: str
+    max: float = field(default=0.0)
+    rms: float = field(default=0.0)
+    changed: int = field(default=0)
+    count: int = field(default=0)
+
+
+@dataclass
+class SectionDiff:
+    """
+    A model class for holding the differences of a section
+
+    Attributes
+    ----------
+    @type section: str
+    @param section: The name of the section
+
+    @type identical: bool
+    @param identical: True if the columns of the section are equal
+
+    @type changes: List[str]
+    @param changes: The structural changes, e.g. added joints or meshes whose vertex count changed
+
+    @type deltas: List[Delta]
+    @param deltas: The differences of the values, sorted by the largest difference
+    """
+
+    section: str
+    identical: bool = field(default=True)
+    changes: List[str] = field(default_factory=list)
+    deltas: List[Delta] = field(default_factory=list)
+
+    @property
+    def differs(self) -> bool:
+        return bool(self.changes or self.deltas)
+
+
+@dataclass
+class DNADiff:
+    """
+    A model class for holding the differences of two DNAs
+
+    Attributes
+    ----------
+    @type path_a: str
+    @param path_a: The path of the first DNA
+
+    @type path_b: str
+    @param path_b: The path of the second DNA
+
+    @type sections: List[SectionDiff]
+    @param sections: The differences of every compared section
+    """
+
+    path_a: str
+    path_b: str
+    sections: List[SectionDiff] = field(default_factory=list)
+
+    @property
+    def differs(self) -> bool:
+        return any(section.differs for section in self.sections)
+
+    def to_dict(self) -> Dict:
+        result = asdict(self)
+        result["differs"] = self.differs
+        return result
+
+    def format(self, top: int = 10) -> str:
+        """
+        Formats the differences as text.
+
+        @type top: int
+        @param top: The number of the largest deltas listed per section
+
+        @rtype: str
+        @returns: The report
+        """
+
+        lines = [f"--- {self.path_a}", f"+++ {self.path_b}"]
+        for section in self.sections:
+            if not section.differs:
+                lines.append(f"{section.section}: identical")
+                continue
+            lines.append(f"{section.section}:")
+            lines.extend(f"  {change}" for change in section.changes)
+            for delta in section.deltas[:top]:
+                lines.append(
+                    f"  {delta.name} {delta.quantity}: max {delta.max:.6g} rms {delta.rms:.6g}"
+                    f" ({delta.changed}/{delta.count} changed)"
+                )
+            if len(section.deltas) > top:
+                lines.append(f"  ... {len(section.deltas) - top} more")
+        return "\n".join(lines)
+
+
+def columns_equal(columns_a: Columns, columns_b: Columns) -> bool:
+    if columns_a.keys() != columns_b.keys():
+        return False
+    return all(
+        columns_a[name].dtype == columns_b[name].dtype
+        and np.array_equal(columns_a[name], columns_b[name])
+        for name in columns_a
+    )
+
+
+def hash_file(path: str) -> str:
+    """
+    Hashes the content of a file. The hash is cached per path, size and modification time, so comparing against the
+    same file again doesn't read it.
+
+    @type path: str
+    @param path: The path of the file
+
+    @rtype: str
+    @returns: The hex digest of the content
+    """
+
+    stat = os.stat(path)
+    key = (os.path.realpath(path), stat.st_size, stat.st_mtime_ns)
+    with FILE_HASHES_LOCK:
+        if key in FILE_HASHES:
+            return FILE_HASHES[key]
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(FILE_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    with FILE_HASHES_LOCK:
+        FILE_HASHES[key] = digest.hexdigest()
+    return FILE_HASHES[key]
+
+
+def describe_names(names: List[str]) -> str:
+    listed = ", ".join(names[:LISTED_NAMES])
+    if len(names) > LISTED_NAMES:
+        listed += f" and {len(names) - LISTED_NAMES} more"
+    return listed
+
+
+def get_delta(
+    name: str, quantity: str, differences: np.ndarray, tolerance: float
+) -> Optional[Delta]:
+    """
+    Summarizes the differences of an entity, vectors are compared by their length.
+
+    @type differences: np.ndarray
+    @param differences: The (N,) or (N, K) array of differences of the elements
+
+    @type tolerance: float
+    @param tolerance: Differences up to the tolerance are not counted as changes
+
+    @rtype: Optional[Delta]
+    @returns: The summary, None if no element differs by more than the tolerance
+    """
+
+    differences = np.asarray(differences, dtype=np.float64)
+    if not len(differences):
+        return None
+    magnitudes = np.linalg.norm(differences.reshape(len(differences), -1), axis=1)
+    changed = int(np.count_nonzero(magnitudes > tolerance))
+    if not changed:
+        return None
+    return Delta(
+        name=name,
+        quantity=quantity,
+        max=float(magnitudes.max()),
+        rms=float(np.sqrt(np.mean(magnitudes**2))),
+        changed=changed,
+        count=len(magnitudes),
+    )
+
+
+def get_sparse_differences(
+    keys_a: np.ndarray, values_a: np.ndarray, keys_b: np.ndarray, values_b: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Subtracts two sparse arrays given by their keys and values, keys missing from one of them are zero there.
+
+    @rtype: Tuple[np.ndarray, np.ndarray]
+    @returns: The sorted keys of both arrays and the differences, b - a, at those keys
+    """
+
+    keys, inverse = np.unique(np.concatenate((keys_a, keys_b)), return_inverse=True)
+    inverse = inverse.reshape(-1)
+    values = np.concatenate((-values_a, values_b))
+    if values.ndim == 1:
+        values = values[:, np.newaxis]
+    differences = np.stack(
+        [
+            np.bincount(inverse, weights=values[:, column], minlength=len(keys))
+            for column in range(values.shape[1])
+        ],
+        axis=1,
+    )
+    return keys, differences
+
+
+def get_offsets(group_column: np.ndarray, group_count: int) -> np.ndarray:
+    """Gets the first row of every group of a column sorted by group, followed by the row count"""
+
+    return np.searchsorted(group_column, np.arange(group_count + 1))
+
+
+def get_name_lookup(names_a: np.ndarray, names_b: np.ndarray) -> Dict[str, int]:
+    """Numbers the names of both DNAs, so indices of the same name get the same number"""
+
+    return {
+        name: index for index, name in enumerate(dict.fromkeys([*names_a, *names_b]))
+    }
+
+
+class DNADiffer:
+    """
+    A class used for comparing two DNAs section by section.
+
+    Attributes
+    ----------
+    @type dna_a: DNA
+    @param dna_a: The first DNA
+
+    @type dna_b: DNA
+    @param dna_b: The second DNA
+
+    @type tolerance: float
+    @param tolerance: Differences up to the tolerance are not reported
+
+    @type names: Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]
+    @param names: The names of every kind of entity, e.g. joint, of both DNAs
+    """
+
+    def __init__(self, dna_a: DNA, dna_b: DNA, tolerance: float = 0.0) -> None:
+        dna_a.load_data_layer(DataLayer_All)
+        dna_b.load_data_layer(DataLayer_All)
+        self.dna_a = dna_a
+        self.dna_b = dna_b
+        self.tolerance = tolerance
+        self.names = (self.get_names(dna_a), self.get_names(dna_b))
+        self.comparers: Dict[str, Callable[[SectionDiff, Columns, Columns], None]] = {
+            SECTION_NAMES: self.compare_names,
+            SECTION_LODS: self.compare_lods,
+            SECTION_JOINTS: self.compare_joints,
+            SECTION_MESHES: self.compare_meshes,
+            SECTION_VERTEX_POSITIONS: self.compare_vertex_positions,
+            SECTION_TEXTURE_COORDINATES: self.compare_texture_coordinates,
+            SECTION_TOPOLOGY: self.compare_topology,
+            SECTION_SKIN_WEIGHTS: self.compare_skin_weights,
+            SECTION_BLEND_SHAPE_DELTAS: self.compare_blend_shape_deltas,
+            SECTION_JOINT_GROUPS: self.compare_joint_groups,
+        }
+
+    @staticmethod
+    def get_names(dna: DNA) -> Dict[str, np.ndarray]:
+        names = read_names(dna)
+        return {
+            kind: names["name"][names["kind"] == kind]
+            for kind in np.unique(names["kind"]).tolist()
+        }
+
+    def get_kind_names(self, kind: str) -> Tuple[np.ndarray, np.ndarray]:
+        empty = np.empty(0, dtype=str)
+        return self.names[0].get(kind, empty), self.names[1].get(kind, empty)
+
+    def match(self, kind: str) -> List[Tuple[str, int, int]]:
+        """
+        Matches the entities of both DNAs by name.
+
+        @type kind: str
+        @param kind: The kind of the entities, e.g. joint
+
+        @rtype: List[Tuple[str, int, int]]
+        @returns: The name and the index in both DNAs of every entity in both of them
+        """
+
+        names_a, names_b = self.get_kind_names(kind)
+        indices_b: Dict[str, int] = {}
+        for index, name in enumerate(names_b.tolist()):
+            indices_b.setdefault(name, index)
+        return [
+            (name, index, indices_b[name])
+            for index, name in enumerate(names_a.tolist())
+            if name in indices_b
+        ]
+
+    def match_mesh_rows(
+        self, columns_a: Columns, columns_b: Columns
+    ) -> List[Tuple[str, slice, slice]]:
+        """
+        Matches the rows of the meshes of both DNAs by mesh name, in sections sorted by mesh index.
+
+        @rtype: List[Tuple[str, slice, slice]]
+        @returns: The name and the rows in both DNAs of every mesh in both of them
+        """
+
+        names_a, names_b = self.get_kind_names(NAME_KIND_MESH)
+        offsets_a = get_offsets(columns_a["mesh_index"], len(names_a))
+        offsets_b = get_offsets(columns_b["mesh_index"], len(names_b))
+        return [
+            (
+                name,
+                slice(offsets_a[index_a], offsets_a[index_a + 1]),
+                slice(offsets_b[index_b], offsets_b[index_b + 1]),
+            )
+            for name, index_a, index_b in self.match(NAME_KIND_MESH)
+        ]
+
+    def diff(self, sections: Optional[List[str]] = None) -> DNADiff:
+        """
+        Compares the sections, a single section of both DNAs is held in memory at a time.
+
+        @type sections: Optional[List[str]]
+        @param sections: The names of the sections, all sections if nothing is passed
+
+        @rtype: DNADiff
+        @returns: The differences
+        """
+
+        result = DNADiff(path_a=self.dna_a.path, path_b=self.dna_b.path)
+        for section in sections or list(SECTION_READERS):
+            if section not in SECTION_READERS:
+                raise DNAViewerError(f"Unknown section {section}")
+            columns_a = SECTION_READERS[section](self.dna_a)
+            columns_b = SECTION_READERS[section](self.dna_b)
+            section_diff = SectionDiff(section=section)
+            if not columns_equal(columns_a, columns_b):
+                section_diff.identical = False
+                self.comparers.get(section, self.compare_table)(
+                    section_diff, columns_a, columns_b
+                )
+                section_diff.deltas.sort(key=lambda delta: delta.max, reverse=True)
+            result.sections.append(section_diff)
+        return result
+
+    def add_delta(
+        self,
+        section_diff: SectionDiff,
+        name: str,
+        quantity: str,
+        differences: np.ndarray,
+    ) -> None:
+        delta = get_delta(name, quantity, differences, self.tolerance)
+        if delta:
+            section_diff.deltas.append(delta)
+
+    def compare_names(
+        self, section_diff: SectionDiff, columns_a: Columns, columns_b: Columns
+    ) -> None:
+        for kind in dict.fromkeys([*self.names[0], *self.names[1]]):
+            names_a, names_b = self.get_kind_names(kind)
+            set_a, set_b = set(names_a.tolist()), set(names_b.tolist())
+            removed = [name for name in names_a.tolist() if name not in set_b]
+            added = [name for name in names_b.tolist() if name not in set_a]
+            if removed:
+                section_diff.changes.append(
+                    f"{kind}: {len(removed)} removed: {describe_names(removed)}"
+                )
+            if added:
+                section_diff.changes.append(
+                    f"{kind}: {len(added)} added: {describe_names(added)}"
+                )
+            if not removed and not added and not np.array_equal(names_a, names_b):
+                section_diff.changes.append(f"{kind}: reordered")
+
+    def compare_lods(
+        self, section_diff: SectionDiff, columns_a: Columns, columns_b: Columns
+    ) -> None:
+        for kind in dict.fromkeys([*columns_a["kind"], *columns_b["kind"]]):
+            names = self.get_kind_names(kind)
+            members: List[Dict[int, set]] = []
+            for columns, kind_names in zip((columns_a, columns_b), names):
+                rows = columns["kind"] == kind
+                lods, indices = columns["lod"][rows], columns["index"][rows]
+                members.append(
+                    {
+                        lod: set(kind_names[indices[lods == lod]].tolist())
+                        for lod in np.unique(lods).tolist()
+                    }
+                )
+            for lod in sorted(set(members[0]) | set(members[1])):
+                removed = sorted(
+                    members[0].get(lod, set()) - members[1].get(lod, set())
+                )
+                added = sorted(members[1].get(lod, set()) - members[0].get(lod, set()))
+                if removed:
+                    section_diff.changes.append(
+                        f"lod{lod} {kind}: {len(removed)} removed: {describe_names(removed)}"
+                    )
+                if added:
+                    section_diff.changes.append(
+                        f"lod{lod} {kind}: {len(added)} added: {describe_names(added)}"
+                    )
+
+    def compare_joints(
+        self, section_diff: SectionDiff, columns_a: Columns, columns_b: Columns
+    ) -> None:
+        matches = self.match(NAME_KIND_JOINT)
+        if not matches:
+            return
+        names = [name for name, _, _ in matches]
+        rows_a = np.array([index for _, index, _ in matches])
+        rows_b = np.array([index for _, _, index in matches])
+
+        joint_names_a, joint_names_b = self.get_kind_names(NAME_KIND_JOINT)
+        parents_a = joint_names_a[columns_a["parent_index"][rows_a]]
+        parents_b = joint_names_b[columns_b["parent_index"][rows_b]]
+        # renamed parents are reported with the names
+        renamed = ~np.isin(parents_a, joint_names_b) | ~np.isin(
+            parents_b, joint_names_a
+        )
+        reparented = [
+            names[row] for row in np.flatnonzero((parents_a != parents_b) & ~renamed)
+        ]
+        if reparented:
+            section_diff.changes.append(
+                f"{len(reparented)} joints reparented: {describe_names(reparented)}"
+            )
+
+        for quantity, prefix, scale in (
+            ("translation", "translation", 1.0),
+            ("rotation (degrees)", "rotation", np.degrees(1.0)),
+        ):
+            differences = scale * np.stack(
+                [
+                    columns_b[f"{prefix}_{axis}"][rows_b]
+                    - columns_a[f"{prefix}_{axis}"][rows_a]
+                    for axis in "xyz"
+                ],
+                axis=1,
+            )
+            magnitudes = np.linalg.norm(differences, axis=1)
+            for row in np.flatnonzero(magnitudes > self.tolerance):
+                self.add_delta(section_diff, names[row], quantity, differences[[row]])
+
+    def compare_meshes(
+        self, section_diff: SectionDiff, columns_a: Columns, columns_b: Columns
+    ) -> None:
+        counts = [name for name in columns_a if name.endswith("_count")]
+        for name, index_a, index_b in self.match(NAME_KIND_MESH):
+            for count in counts:
+                count_a, count_b = columns_a[count][index_a], columns_b[count][index_b]
+                if count_a != count_b:
+                    section_diff.changes.append(
+                        f"{name}: {count} {count_a} -> {count_b}"
+                    )
+
+    def compare_mesh_rows(
+        self,
+        section_diff: SectionDiff,
+        columns_a: Columns,
+        columns_b: Columns,
+        value_columns: List[str],
+        quantity: str,
+    ) -> None:
+        """Compares the values of every mesh with the same number of rows in both DNAs, row by row"""
+
+        for name, rows_a, rows_b in self.match_mesh_rows(columns_a, columns_b):
+            count_a, count_b = rows_a.stop - rows_a.start, rows_b.stop - rows_b.start
+            if count_a != count_b:
+                section_diff.changes.append(
+                    f"{name}: {quantity} count {count_a} -> {count_b}, not compared"
+                )
+                continue
+            differences = np.stack(
+                [
+                    columns_b[column][rows_b].astype(np.float64)
+                    - columns_a[column][rows_a]
+                    for column in value_columns
+                ],
+                axis=1,
+            )
+            self.add_delta(section_diff, name, quantity, differences)
+
+    def compare_vertex_positions(
+        self, section_diff: SectionDiff, columns_a: Columns, columns_b: Columns
+    ) -> None:
+        self.compare_mesh_rows(
+            section_diff, columns_a, columns_b, ["x", "y", "z"], "position"
+        )
+
+    def compare_texture_coordinates(
+        self, section_diff: SectionDiff, columns_a: Columns, columns_b: Columns
+    ) -> None:
+        self.compare_mesh_rows(
+            section_diff, columns_a, columns_b, ["u", "v"], "texture coordinate"
+        )
+
+    def compare_topology(
+        self, section_diff: SectionDiff, columns_a: Columns, columns_b: Columns
+    ) -> None:
+        index_columns = ["face_index", "position_index", "texture_coordinate_index"]
+        for name, rows_a, rows_b in self.match_mesh_rows(columns_a, columns_b):
+            faces_a = np.stack([columns_a[column][rows_a] for column in index_columns])
+            faces_b = np.stack([columns_b[column][rows_b] for column in index_columns])
+            if faces_a.shape != faces_b.shape:
+                section_diff.changes.append(
+                    f"{name}: face vertex count {faces_a.shape[1]} -> {faces_b.shape[1]}"
+                )
+                continue
+            changed = np.flatnonzero((faces_a != faces_b).any(axis=0))
+            if len(changed):
+                face_count = len(np.unique(faces_a[0, changed]))
+                section_diff.changes.append(
+                    f"{name}: {len(changed)} face vertices of {face_count} faces changed"
+                )
+
+    def compare_skin_weights(
+        self, section_diff: SectionDiff, columns_a: Columns, columns_b: Columns
+    ) -> None:
+        """Compares the weights of every vertex and joint, joints are matched by name"""
+
+        joints = get_name_lookup(*self.get_kind_names(NAME_KIND_JOINT))
+        joint_numbers = [
+            np.array([joints[name] for name in kind_names.tolist()], dtype=np.int64)
+            for kind_names in self.get_kind_names(NAME_KIND_JOINT)
+        ]
+        for name, rows_a, rows_b in self.match_mesh_rows(columns_a, columns_b):
+            keys = []
+            for columns, rows, numbers in (
+                (columns_a, rows_a, joint_numbers[0]),
+                (columns_b, rows_b, joint_numbers[1]),
+            ):
+                keys.append(
+                    columns["vertex_index"][rows].astype(np.int64) * len(joints)
+                    + numbers[columns["joint_index"][rows]]
+                )
+            keys_both, differences = get_sparse_differences(
+                keys[0],
+                columns_a["weight"][rows_a].astype(np.float64),
+                keys[1],
+                columns_b["weight"][rows_b].astype(np.float64),
+            )
+            vertices = keys_both // len(joints)
+            vertex_count = int(vertices.max(initial=-1)) + 1
+            # the largest weight change of every vertex
+            vertex_differences = np.zeros(vertex_count)
+            np.maximum.at(vertex_differences, vertices, np.abs(differences[:, 0]))
+            self.add_delta(section_diff, name, "weight", vertex_differences)
+
+    def compare_blend_shape_deltas(
+        self, section_diff: SectionDiff, columns_a: Columns, columns_b: Columns
+    ) -> None:
+        """Compares the deltas of every target and vertex, targets are matched by the name of their channel"""
+
+        channel_names = self.get_kind_names(NAME_KIND_BLEND_SHAPE_CHANNEL)
+        channels = get_name_lookup(*channel_names)
+        channel_numbers = [
+            np.array([channels[name] for name in kind_names.tolist()], dtype=np.int64)
+            for kind_names in channel_names
+        ]
+        for name, rows_a, rows_b in self.match_mesh_rows(columns_a, columns_b):
+            mesh_channels = []
+            for columns, rows, numbers, kind_names in (
+                (columns_a, rows_a, channel_numbers[0], channel_names[0]),
+                (columns_b, rows_b, channel_numbers[1], channel_names[1]),
+            ):
+                mesh_channels.append(
+                    set(kind_names[np.unique(columns["channel_index"][rows])].tolist())
+                )
+            removed = sorted(mesh_channels[0] - mesh_channels[1])
+            added = sorted(mesh_channels[1] - mesh_channels[0])
+            if removed:
+                section_diff.changes.append(
+                    f"{name}: {len(removed)} targets removed: {describe_names(removed)}"
+                )
+            if added:
+                section_diff.changes.append(
+                    f"{name}: {len(added)} targets added: {describe_names(added)}"
+                )
+
+            vertex_count = (
+                max(
+                    int(columns_a["vertex_index"][rows_a].max(initial=-1)),
+                    int(columns_b["vertex_index"][rows_b].max(initial=-1)),
+                )
+                + 1
+            )
+            keys = [
+                numbers[columns["channel_index"][rows]] * vertex_count
+                + columns["vertex_index"][rows]
+                for columns, rows, numbers in (
+                    (columns_a, rows_a, channel_numbers[0]),
+                    (columns_b, rows_b, channel_numbers[1]),
+                )
+            ]
+            _, differences = get_sparse_differences(
+                keys[0],
+                np.stack([columns_a[axis][rows_a] for axis in "xyz"], axis=1),
+                keys[1],
+                np.stack([columns_b[axis][rows_b] for axis in "xyz"], axis=1),
+            )
+            self.add_delta(section_diff, name, "delta", differences)
+
+    def compare_joint_groups(
+        self, section_diff: SectionDiff, columns_a: Columns, columns_b: Columns
+    ) -> None:
+        group_count = (
+            max(
+                int(columns_a["joint_group_index"].max(initial=-1)),
+                int(columns_b["joint_group_index"].max(initial=-1)),
+            )
+            + 1
+        )
+        offsets_a = get_offsets(columns_a["joint_group_index"], group_count)
+        offsets_b = get_offsets(columns_b["joint_group_index"], group_count)
+        for group in range(group_count):
+            rows_a = slice(offsets_a[group], offsets_a[group + 1])
+            rows_b = slice(offsets_b[group], offsets_b[group + 1])
+            self.compare_table(
+                section_diff,
+                {name: column[rows_a] for name, column in columns_a.items()},
+                {name: column[rows_b] for name, column in columns_b.items()},
+                f"joint group {group}",
+            )
+
+    def compare_table(
+        self,
+        section_diff: SectionDiff,
+        columns_a: Columns,
+        columns_b: Columns,
+        name: Optional[str] = None,
+    ) -> None:
+        """
+        Compares the rows of a table with the same order in both DNAs, used for the behavior sections. Integer columns
+        are compared for equality and float columns by their differences.
+        """
+
+        name = name or section_diff.section
+        rows_a = len(next(iter(columns_a.values()), []))
+        rows_b = len(next(iter(columns_b.values()), []))
+        if rows_a != rows_b:
+            section_diff.changes.append(f"{name}: row count {rows_a} -> {rows_b}")
+            return
+        for column in columns_a:
+            if columns_a[column].dtype.kind == "f":
+                self.add_delta(
+                    section_diff,
+                    name,
+                    column,
+                    columns_b[column].astype(np.float64) - columns_a[column],
+                )
+                continue
+            changed = int(np.count_nonzero(columns_a[column] != columns_b[column]))
+            if changed:
+                section_diff.changes.append(
+                    f"{name}: {column} changed in {changed} rows"
+                )
+
+
+def diff_dna(
+    dna_a: DNA,
+    dna_b: DNA,
+    sections: Optional[List[str]] = None,
+    tolerance: float = 0.0,
+) -> DNADiff:
+    """
+    Compares two DNAs section by section. The sections are read through the DNA readers, which load DataLayer_All
+    first if they hold less, so sections outside of the loaded layers are compared too.
+
+    @type dna_a: DNA
+    @param dna_a: The first DNA
+
+    @type dna_b: DNA
+    @param dna_b: The second DNA
+
+    @type sections: Optional[List[str]]
+    @param sections: The names of the sections, the sections of the columnar export, all sections if nothing is passed
+
+    @type tolerance: float
+    @param tolerance: Differences up to the tolerance are not reported
+
+    @rtype: DNADiff
+    @returns: The differences
+    """
+
+    return DNADiffer(dna_a, dna_b, tolerance).diff(sections)
+
+
+def diff_dna_files(
+    path_a: str,
+    path_b: str,
+    sections: Optional[List[str]] = None,
+    tolerance: float = 0.0,
+) -> DNADiff:
+    """
+    Compares two DNA files section by section. Files with the same content are reported as identical without reading
+    them as DNAs.
+
+    @type path_a: str
+    @param path_a: The path of the first DNA
+
+    @type path_b: str
+    @param path_b: The path of the second DNA
+
+    @type sections: Optional[List[str]]
+    @param sections: The names of the sections, all sections if nothing is passed
+
+    @type tolerance: float
+    @param tolerance: Differences up to the tolerance are not reported
+
+    @rtype: DNADiff
+    @returns: The differences
+    """
+
+    if hash_file(path_a) == hash_file(path_b):
+        return DNADiff(
+            path_a=path_a,
+            path_b=path_b,
+            sections=[
+                SectionDiff(section=section)
+                for section in sections or list(SECTION_READERS)
+            ],
+        )
+    return diff_dna(
+        DNA(path_a, layers=[Layer.definition], data_layer=DataLayer_All),
+        DNA(path_b, layers=[Layer.definition], data_layer=DataLayer_All),
+        sections,
+        tolerance,
+    )
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compares two DNA files section by section."
+    )
+    parser.add_argument("path_a", help="path of the first DNA file")
+    parser.add_argument("path_b", help="path of the second DNA file")
+    parser.add_argument(
+        "--sections",
+        nargs="+",
+        choices=list(SECTION_READERS),
+        help="compared sections, all by default",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.0,
+        help="differences up to this value are not reported",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="number of largest deltas listed per section",
+    )
+    parser.add_argument("--json", help="path of the JSON report")
+    args = parser.parse_args(arguments)
+
+    result = diff_dna_files(args.path_a, args.path_b, args.sections, args.tolerance)
+    print(result.format(args.top))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(result.to_dict(), file, indent=2)
+    return 1 if result.differs else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,305 @@
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+import numpy as np
+from dnacalib import SetNeutralJointTranslationsCommand
+
+from ..common import DNAViewerError
+from .dnalib import DNA
+from .transform import (
+    get_local_translations_for_world_positions,
+    read_joint_parent_indices,
+    read_neutral_joint_local_matrices,
+    read_vertex_positions,
+)
+
+
+@dataclass
+class SurfaceJointBinding:
+    """
+    A model class for holding the binding of surface joints to the vertices of a mesh
+
+    Every joint is bound to a triangle with barycentric weights. Joints bound to a single vertex use the same vertex
+    three times with weights (1, 0, 0).
+
+    Attributes
+    ----------
+    @type mesh_index: int
+    @param mesh_index: The index of the mesh the joints are bound to
+
+    @type joint_names: List[str]
+    @param joint_names: The names of the bound joints
+
+    @type joint_indices: np.ndarray
+    @param joint_indices: The (N,) array of indices of the bound joints
+
+    @type vertex_indices: np.ndarray
+    @param vertex_indices: The (N, 3) array of vertex indices each joint is bound to
+
+    @type weights: np.ndarray
+    @param weights: The (N, 3) array of barycentric weights of the vertices
+    """
+
+    mesh_index: int = field(default=0)
+    joint_names: List[str] = field(default_factory=list)
+    joint_indices: np.ndarray = field(
+        default_factory=lambda: np.zeros(0, dtype=np.int64)
+    )
+    vertex_indices: np.ndarray = field(
+        default_factory=lambda: np.zeros((0, 3), dtype=np.int64)
+    )
+    weights: np.ndarray = field(
+        default_factory=lambda: np.zeros((0, 3), dtype=np.float64)
+    )
+
+    def get_positions(self, vertex_positions: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the positions of the bound joints on the given vertex positions.
+
+        @type vertex_positions: np.ndarray
+        @param vertex_positions: The (V, 3) array of vertex positions of the mesh
+
+        @rtype: np.ndarray
+        @returns: The (N, 3) array of joint world positions
+        """
+
+        vertex_positions = np.asarray(vertex_positions, dtype=np.float64)
+        return np.einsum(
+            "nk,nki->ni", self.weights, vertex_positions[self.vertex_indices]
+        )
+
+    def save(self, path: str) -> None:
+        """
+        Saves the binding, so it can be reused without the base DNA.
+
+        @type path: str
+        @param path: The path of the .npz file
+        """
+
+        with open(path, "wb") as file:
+            np.savez(
+                file,
+                mesh_index=self.mesh_index,
+                joint_names=np.array(self.joint_names),
+                joint_indices=self.joint_indices,
+                vertex_indices=self.vertex_indices,
+                weights=self.weights,
+            )
+
+    @staticmethod
+    def load(path: str) -> "SurfaceJointBinding":
+        """
+        Loads a binding saved with save.
+
+        @type path: str
+        @param path: The path of the .npz file
+
+        @rtype: SurfaceJointBinding
+        @returns: The loaded binding
+        """
+
+        with np.load(path) as data:
+            return SurfaceJointBinding(
+                mesh_index=int(data["mesh_index"]),
+                joint_names=data["joint_names"].tolist(),
+                joint_indices=data["joint_indices"],
+                vertex_indices=data["vertex_indices"],
+                weights=data["weights"],
+            )
+
+
+def get_triangles(dna: DNA, mesh_index: int) -> np.ndarray:
+    """
+    Triangulates the faces of the mesh as fans and maps their corners to vertex position indices.
+
+    @type dna: DNA
+    @param dna: Instance of DNA
+
+    @type mesh_index: int
+    @param mesh_index: The mesh index
+
+    @rtype: np.ndarray
+    @returns: The (T, 3) array of vertex position indices
+    """
+
+    layout_positions = np.array(
+        dna.get_vertex_layout_positions_for_mesh_index(mesh_index), dtype=np.int64
+    )
+    triangles = []
+    for face in dna.get_faces(mesh_index):
+        for corner in range(1, len(face) - 1):
+            triangles.append((face[0], face[corner], face[corner + 1]))
+    if not triangles:
+        return np.zeros((0, 3), dtype=np.int64)
+    return layout_positions[np.array(triangles, dtype=np.int64)]
+
+
+def get_barycentric_weights(
+    point: np.ndarray, triangle_positions: np.ndarray
+) -> np.ndarray:
+    """
+    Projects the point onto the planes of the triangles and gets its barycentric weights.
+
+    @type point: np.ndarray
+    @param point: The point being projected
+
+    @type triangle_positions: np.ndarray
+    @param triangle_positions: The (T, 3, 3) array of triangle corner positions
+
+    @rtype: np.ndarray
+    @returns: The (T, 3) array of barycentric weights, a weight is negative if the projection is outside of the triangle
+    """
+
+    a, b, c = (
+        triangle_positions[:, 0],
+        triangle_positions[:, 1],
+        triangle_positions[:, 2],
+    )
+    ab, ac, ap = b - a, c - a, point - a
+    d00 = np.sum(ab * ab, axis=1)
+    d01 = np.sum(ab * ac, axis=1)
+    d11 = np.sum(ac * ac, axis=1)
+    d20 = np.sum(ap * ab, axis=1)
+    d21 = np.sum(ap * ac, axis=1)
+    denominator = d00 * d11 - d01 * d01
+    denominator[denominator == 0.0] = np.nan
+    v = (d11 * d20 - d01 * d21) / denominator
+    w = (d00 * d21 - d01 * d20) / denominator
+    return np.stack([1.0 - v - w, v, w], axis=1)
+
+
+def bind_surface_joints(
+    dna: DNA, mesh_index: int, joint_names: List[str], barycentric: bool = True
+) -> SurfaceJointBinding:
+    """
+    Binds the joints to the nearest vertices of the mesh in its neutral state.
+
+    If barycentric is set and the projection of a joint falls inside one of the triangles around its nearest vertex,
+    the joint is bound to that triangle, otherwise it is bound to the vertex.
+
+    @type dna: DNA
+    @param dna: Instance of DNA holding the base geometry
+
+    @type mesh_index: int
+    @param mesh_index: The mesh index
+
+    @type joint_names: List[str]
+    @param joint_names: The names of the joints being bound
+
+    @type barycentric: bool
+    @param barycentric: A flag representing whether joints should be bound to triangles when possible
+
+    @rtype: SurfaceJointBinding
+    @returns: The binding of the joints
+    """
+
+    nearest_vertices = dna.find_nearest_vertices_to_joints(mesh_index, joint_names)
+    joint_indices = np.array(
+        [dna.get_joint_index_from_joint_name(name) for name in joint_names],
+        dtype=np.int64,
+    )
+    vertex_indices = np.repeat(
+        np.array([nearest_vertices[name] for name in joint_names], dtype=np.int64)[
+            :, np.newaxis
+        ],
+        3,
+        axis=1,
+    )
+    weights = np.zeros((len(joint_names), 3), dtype=np.float64)
+    weights[:, 0] = 1.0
+
+    if barycentric:
+        vertex_positions = dna.get_vertex_positions_array(mesh_index)
+        joint_positions = dna.get_neutral_joint_world_positions()[joint_indices]
+        triangles = get_triangles(dna, mesh_index)
+        for index, point in enumerate(joint_positions):
+            candidates = triangles[
+                np.any(triangles == vertex_indices[index, 0], axis=1)
+            ]
+            if not len(candidates):
+                continue
+            candidate_weights = get_barycentric_weights(
+                point, vertex_positions[candidates]
+            )
+            inside = np.nonzero(np.all(candidate_weights >= 0.0, axis=1))[0]
+            if not len(inside):
+                continue
+            projections = np.einsum(
+                "tk,tki->ti",
+                candidate_weights[inside],
+                vertex_positions[candidates[inside]],
+            )
+            best = inside[np.argmin(np.sum((projections - point) ** 2, axis=1))]
+            vertex_indices[index] = candidates[best]
+            weights[index] = candidate_weights[best]
+
+    return SurfaceJointBinding(
+        mesh_index=mesh_index,
+        joint_names=list(joint_names),
+        joint_indices=joint_indices,
+        vertex_indices=vertex_indices,
+        weights=weights,
+    )
+
+
+def get_rebound_joint_translations(
+    reader: Any,
+    binding: SurfaceJointBinding,
+    vertex_positions: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Calculates the neutral joint translations that put the bound joints back onto the surface of the mesh.
+
+    @type reader: Any
+    @param reader: The DNA reader holding the edited geometry, either a BinaryStreamReader or a DNACalibDNAReader
+
+    @type binding: SurfaceJointBinding
+    @param binding: The binding of the surface joints
+
+    @type vertex_positions: Optional[np.ndarray]
+    @param vertex_positions: The (V, 3) array of vertex positions, read from the reader if not passed
+
+    @rtype: np.ndarray
+    @returns: The (J, 3) array of neutral translations of all joints
+    """
+
+    if vertex_positions is None:
+        vertex_positions = read_vertex_positions(reader, binding.mesh_index)
+    if len(binding.joint_indices) and (
+        binding.vertex_indices.max() >= len(vertex_positions)
+    ):
+        raise DNAViewerError(
+            "Surface joint binding doesn't match the vertex count of the mesh!"
+        )
+
+    return get_local_translations_for_world_positions(
+        read_neutral_joint_local_matrices(reader),
+        read_joint_parent_indices(reader),
+        binding.joint_indices,
+        binding.get_positions(vertex_positions),
+    )
+
+
+def create_rebind_command(
+    reader: Any,
+    binding: SurfaceJointBinding,
+    vertex_positions: Optional[np.ndarray] = None,
+) -> SetNeutralJointTranslationsCommand:
+    """
+    Creates the command that puts the bound joints back onto the surface of the mesh.
+
+    @type reader: Any
+    @param reader: The DNA reader holding the edited geometry, either a BinaryStreamReader or a DNACalibDNAReader
+
+    @type binding: SurfaceJointBinding
+    @param binding: The binding of the surface joints
+
+    @type vertex_positions: Optional[np.ndarray]
+    @param vertex_positions: The (V, 3) array of vertex positions, read from the reader if not passed
+
+    @rtype: SetNeutralJointTranslationsCommand
+    @returns: The command setting the neutral translations of all joints
+    """
+
+    translations = get_rebound_joint_translations(reader, binding, vertex_positions)
+    return SetNeutralJointTranslationsCommand(translations.tolist())
@@ -0,0 +1,192 @@
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from ..model import Point3
+
+# The largest magnitude of a quantized delta component
+QUANTIZATION_LEVELS = np.iinfo(np.int16).max
+# A delta is stored in the DNA file as a vertex index and three floats
+FILE_BYTES_PER_DELTA = 16
+INDEX_STEP_DTYPES = (np.uint8, np.uint16, np.uint32)
+
+
+def encode_vertex_indices(vertex_indices: np.ndarray) -> Tuple[int, np.ndarray]:
+    """
+    Delta-encodes the vertex indices into the smallest unsigned type holding the steps between them. Indices that are
+    not increasing are kept as signed steps.
+
+    @type vertex_indices: np.ndarray
+    @param vertex_indices: The vertex indices
+
+    @rtype: Tuple[int, np.ndarray]
+    @returns: The first vertex index and the steps to the following ones
+    """
+
+    if not len(vertex_indices):
+        return 0, np.empty(0, dtype=np.uint8)
+    steps = np.diff(vertex_indices.astype(np.int64))
+    if len(steps) and steps.min() < 0:
+        return int(vertex_indices[0]), steps
+    largest = int(steps.max()) if len(steps) else 0
+    for dtype in INDEX_STEP_DTYPES:
+        if largest <= np.iinfo(dtype).max:
+            return int(vertex_indices[0]), steps.astype(dtype)
+    return int(vertex_indices[0]), steps
+
+
+def quantize_deltas(deltas: np.ndarray) -> Tuple[float, np.ndarray]:
+    """
+    Quantizes the deltas to 16-bit fixed point with a single scale.
+
+    @type deltas: np.ndarray
+    @param deltas: The (N, 3) array of deltas
+
+    @rtype: Tuple[float, np.ndarray]
+    @returns: The scale of a quantization step and the (N, 3) array of quantized deltas
+    """
+
+    largest = float(np.abs(deltas).max()) if deltas.size else 0.0
+    scale = largest / QUANTIZATION_LEVELS if largest else 1.0
+    quantized = np.rint(deltas / scale)
+    return scale, np.clip(quantized, -QUANTIZATION_LEVELS, QUANTIZATION_LEVELS).astype(
+        np.int16
+    )
+
+
+class CompressedDeltas(Mapping[int, Point3]):
+    """
+    A mapping of vertex indices to the deltas of a blend shape target, stored quantized and decoded on access. It is
+    used in place of the dictionary of the target, reading the keys, values or items decodes the whole target at once.
+    Looking up a delta by vertex index decodes the vertex indices once and keeps them, the lookups are binary searches.
+
+    Attributes
+    ----------
+    @type first_index: int
+    @param first_index: The first vertex index
+
+    @type index_steps: np.ndarray
+    @param index_steps: The steps between the following vertex indices
+
+    @type scale: float
+    @param scale: The size of a quantization step
+
+    @type quantized: np.ndarray
+    @param quantized: The (N, 3) array of quantized deltas
+
+    @type vertex_indices: Optional[np.ndarray]
+    @param vertex_indices: The decoded vertex indices, kept after the first lookup by vertex index
+    """
+
+    def __init__(self, vertex_indices: Any, deltas: Any) -> None:
+        self.first_index, self.index_steps = encode_vertex_indices(
+            np.asarray(vertex_indices, dtype=np.int64)
+        )
+        self.scale, self.quantized = quantize_deltas(
+            np.asarray(deltas, dtype=np.float64).reshape(-1, 3)
+        )
+        self.vertex_indices: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_dict(cls, deltas: Mapping[int, Point3]) -> "CompressedDeltas":
+        return cls(
+            list(deltas.keys()),
+            [(delta.x, delta.y, delta.z) for delta in deltas.values()],
+        )
+
+    @property
+    def error_bound(self) -> float:
+        """The largest distance between a delta and its decoded value, half a quantization step on every axis"""
+
+        if not len(self.quantized):
+            return 0.0
+        return float(np.sqrt(3.0) * self.scale / 2)
+
+    @property
+    def nbytes(self) -> int:
+        lookup = self.vertex_indices.nbytes if self.vertex_indices is not None else 0
+        return int(self.index_steps.nbytes + self.quantized.nbytes + lookup)
+
+    def get_vertex_indices(self) -> np.ndarray:
+        if self.vertex_indices is not None:
+            return self.vertex_indices
+        if not len(self.quantized):
+            return np.empty(0, dtype=np.int64)
+        indices = np.empty(len(self.quantized), dtype=np.int64)
+        indices[0] = self.first_index
+        np.cumsum(self.index_steps, dtype=np.int64, out=indices[1:])
+        indices[1:] += self.first_index
+        return indices
+
+    def get_deltas(self) -> np.ndarray:
+        """
+        Decodes the deltas.
+
+        @rtype: np.ndarray
+        @returns: The (N, 3) array of deltas in the order of the vertex indices
+        """
+
+        return self.quantized * self.scale
+
+    def __len__(self) -> int:
+        return len(self.quantized)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.get_vertex_indices().tolist())
+
+    def find_position(self, vertex_index: int) -> Optional[int]:
+        """
+        Finds the delta of the vertex, by binary search if the vertex indices are increasing.
+
+        @type vertex_index: int
+        @param vertex_index: The vertex index
+
+        @rtype: Optional[int]
+        @returns: The position of the delta, None if the vertex has no delta
+        """
+
+        if self.vertex_indices is None:
+            self.vertex_indices = self.get_vertex_indices()
+        indices = self.vertex_indices
+        if self.index_steps.dtype.kind == "u":
+            position = int(np.searchsorted(indices, vertex_index))
+            if position < len(indices) and indices[position] == vertex_index:
+                return position
+            return None
+        positions = np.flatnonzero(indices == vertex_index)
+        return int(positions[0]) if len(positions) else None
+
+    def __getitem__(self, vertex_index: int) -> Point3:
+        position = self.find_position(vertex_index)
+        if position is None:
+            raise KeyError(vertex_index)
+        return Point3(*(self.quantized[position] * self.scale).tolist())
+
+    def values(self) -> List[Point3]:  # type: ignore[override]
+        return [Point3(x, y, z) for x, y, z in self.get_deltas().tolist()]
+
+    def items(self) -> List[Tuple[int, Point3]]:  # type: ignore[override]
+        return list(zip(self.get_vertex_indices().tolist(), self.values()))
+
+
+@dataclass
+class DeltaCompressionReport:
+    """
+    A model class for holding the effect of compressing the blend shape deltas of a DNA
+
+    Attributes
+    ----------
+    @type delta_count: int
+    @param delta_count: The number of compressed deltas
+
+    @type size: int
+    @param size: The memory taken by the compressed deltas in bytes
+
+    @type error_bound: float
+    @param error_bound: The largest distance between a delta and its decoded value over all targets
+    """
+
+    delta_count: int = field(default=0)
+    size: int = field(default=0)
+    error_bound: float = field(default=0.0)
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, cast
+from typing import Callable, Dict, List, Optional, Tuple, cast
 
+import numpy as np
 from dna import BinaryStreamReader as DNAReader
 from dna import MeshBlendShapeChannelMapping
 
@@ -33,23 +34,32 @@ class Definition(Descriptor):
     @type meshes: GeometryEntity
     @param meshes: The names and indices of the meshes
 
+    @type meshes_mapping: Dict[str, int]
+    @param meshes_mapping: Mapping of mesh names to mesh indices, the same dictionary as meshes.name_indices
+
     @type gui_control_names: List[str]
     @param gui_control_names: The list of gui control names
 
+    @type gui_control_indices: Dict[str, int]
+    @param gui_control_indices: Mapping of gui control names to gui control indices
+
     @type raw_control_names: List[str]
     @param raw_control_names: The list of raw control names
 
+    @type raw_control_indices: Dict[str, int]
+    @param raw_control_indices: Mapping of raw control names to raw control indices
+
     @type mesh_blend_shape_channel_mapping: List[Tuple[int, int]]
     @param mesh_blend_shape_channel_mapping: Mapping of mesh index to the blend shape channel index
 
     @type mesh_blend_shape_channel_mapping_indices_for_lod: List[List[int]]
     @param mesh_blend_shape_channel_mapping_indices_for_lod: The list of blend shape channel mapping indices by lod
 
-    @type neutral_joint_translations: List[Point3]
-    @param neutral_joint_translations: The list of neutral joint translations
+    @type neutral_joint_translations: np.ndarray
+    @param neutral_joint_translations: The (N, 3) array of neutral joint translations
 
-    @type neutral_joint_rotations: List[Point3]
-    @param neutral_joint_rotations: The list of neutral joint rotations
+    @type neutral_joint_rotations: np.ndarray
+    @param neutral_joint_rotations: The (N, 3) array of neutral joint rotations, in the rotation unit of the DNA
     """
 
     def __init__(self, reader: DNAReader, layers: Optional[List[Layer]]) -> None:
@@ -58,16 +68,18 @@ class Definition(Descriptor):
         self.blend_shape_channels = GeometryEntity()
         self.animated_maps = GeometryEntity()
         self.meshes = GeometryEntity()
-        self.meshes_mapping: Dict[str, int] = {}
+        self.meshes_mapping: Dict[str, int] = self.meshes.name_indices
 
         self.gui_control_names: List[str] = []
+        self.gui_control_indices: Dict[str, int] = {}
         self.raw_control_names: List[str] = []
+        self.raw_control_indices: Dict[str, int] = {}
 
         self.mesh_blend_shape_channel_mapping: List[Tuple[int, int]] = []
         self.mesh_blend_shape_channel_mapping_indices_for_lod: List[List[int]] = []
 
-        self.neutral_joint_translations: List[Point3] = []
-        self.neutral_joint_rotations: List[Point3] = []
+        self.neutral_joint_translations = np.zeros((0, 3), dtype=np.float64)
+        self.neutral_joint_rotations = np.zeros((0, 3), dtype=np.float64)
         self.definition_read = False
 
     def start_read(self) -> None:
@@ -112,10 +124,12 @@ class Definition(Descriptor):
         return cast(str, self.reader.getRawControlName(index))
 
     def get_raw_control_names(self) -> List[str]:
-        names = []
-        for i in range(self.get_raw_control_count()):
-            names.append(self.get_raw_control_name(i))
-        return names
+        if self.definition_read:
+            return list(self.raw_control_names)
+        return [
+            self.get_raw_control_name(index)
+            for index in range(self.get_raw_control_count())
+        ]
 
     def get_neutral_joint_translation(self, index: int) -> Point3:
         translation = cast(List[float], self.reader.getNeutralJointTranslation(index))
@@ -168,6 +182,11 @@ class Definition(Descriptor):
     def get_joint_parent_index(self, index: int) -> int:
         return cast(int, self.reader.getJointParentIndex(index))
 
+    def get_joint_names(self) -> List[str]:
+        if self.definition_read:
+            return list(self.joints.names)
+        return [self.get_joint_name(index) for index in range(self.get_joint_count())]
+
     def get_joint_indices_for_lod(self, index: int) -> List[int]:
         return cast(List[int], self.reader.getJointIndicesForLOD(index))
 
@@ -196,10 +215,12 @@ class Definition(Descriptor):
         return cast(str, self.reader.getAnimatedMapName(index))
 
     def get_animated_map_names(self) -> List[str]:
-        names = []
-        for i in range(self.get_animated_map_count()):
-            names.append(self.get_animated_map_name(i))
-        return names
+        if self.definition_read:
+            return list(self.animated_maps.names)
+        return [
+            self.get_animated_map_name(index)
+            for index in range(self.get_animated_map_count())
+        ]
 
     def get_animated_map_indices_for_lod(self, index: int) -> List[int]:
         return cast(List[int], self.reader.getAnimatedMapIndicesForLOD(index))
@@ -211,94 +232,149 @@ class Definition(Descriptor):
         return cast(int, self.reader.getRotationUnit())
 
     def add_neutral_joints(self) -> None:
-        """Reads in the neutral joints part of the definition"""
-
-        neutral_joint_translation_xs = self.get_neutral_joint_translation_xs()
-        neutral_joint_translation_ys = self.get_neutral_joint_translation_ys()
-        neutral_joint_translation_zs = self.get_neutral_joint_translation_zs()
-        neutral_joint_translation_count_x = len(neutral_joint_translation_xs)
-        for index in range(neutral_joint_translation_count_x):
-            self.neutral_joint_translations.append(
-                Point3(
-                    x=neutral_joint_translation_xs[index],
-                    y=neutral_joint_translation_ys[index],
-                    z=neutral_joint_translation_zs[index],
+        """Reads in the neutral joints part of the definition with the bulk getters"""
+
+        self.neutral_joint_translations = (
+            np.column_stack(
+                (
+                    self.get_neutral_joint_translation_xs(),
+                    self.get_neutral_joint_translation_ys(),
+                    self.get_neutral_joint_translation_zs(),
                 )
             )
-        neutral_joint_rotation_xs = self.get_neutral_joint_rotation_xs()
-        neutral_joint_rotation_ys = self.get_neutral_joint_rotation_ys()
-        neutral_joint_rotation_zs = self.get_neutral_joint_rotation_zs()
-        neutral_joint_rotation_count_x = len(neutral_joint_rotation_xs)
-        for index in range(neutral_joint_rotation_count_x):
-            self.neutral_joint_rotations.append(
-                Point3(
-                    x=neutral_joint_rotation_xs[index],
-                    y=neutral_joint_rotation_ys[index],
-                    z=neutral_joint_rotation_zs[index],
+            .astype(np.float64)
+            .reshape(-1, 3)
+        )
+        self.neutral_joint_rotations = (
+            np.column_stack(
+                (
+                    self.get_neutral_joint_rotation_xs(),
+                    self.get_neutral_joint_rotation_ys(),
+                    self.get_neutral_joint_rotation_zs(),
                 )
             )
+            .astype(np.float64)
+            .reshape(-1, 3)
+        )
 
     def add_mesh_blend_shape_channel_mapping(self) -> None:
         """Reads in the mesh blend shape channel mapping"""
 
-        for index in range(self.get_mesh_blend_shape_channel_mapping_count()):
-            mapping = self.get_mesh_blend_shape_channel_mapping(index)
-            self.mesh_blend_shape_channel_mapping.append(
-                (mapping.meshIndex, mapping.blendShapeChannelIndex)
-            )
-        for lod in range(self.get_lod_count()):
-            self.mesh_blend_shape_channel_mapping_indices_for_lod.append(
-                self.get_mesh_blend_shape_channel_mapping_for_lod(lod)
-            )
+        mappings = [
+            self.get_mesh_blend_shape_channel_mapping(index)
+            for index in range(self.get_mesh_blend_shape_channel_mapping_count())
+        ]
+        self.mesh_blend_shape_channel_mapping = [
+            (mapping.meshIndex, mapping.blendShapeChannelIndex) for mapping in mappings
+        ]
+        self.mesh_blend_shape_channel_mapping_indices_for_lod = [
+            self.get_mesh_blend_shape_channel_mapping_for_lod(lod)
+            for lod in range(self.get_lod_count())
+        ]
+
+    def add_entity(
+        self,
+        entity: "GeometryEntity",
+        count: int,
+        get_name: Callable[[int], str],
+        get_lod_indices: Callable[[int], List[int]],
+    ) -> None:
+        """
+        Reads in the names once and the indices of every LOD with the bulk getter, then builds the lookups.
+
+        @type entity: GeometryEntity
+        @param entity: The populated entity
+
+        @type count: int
+        @param count: The number of entities
+
+        @type get_name: Callable[[int], str]
+        @param get_name: The getter of the name by index
+
+        @type get_lod_indices: Callable[[int], List[int]]
+        @param get_lod_indices: The getter of the indices by LOD
+        """
+
+        entity.names = [get_name(index) for index in range(count)]
+        entity.lod_indices = [
+            list(get_lod_indices(lod)) for lod in range(self.get_lod_count())
+        ]
+        entity.update_lookups()
 
     def add_meshes(self) -> None:
         """Reads in the meshes of the definition"""
 
-        for index in range(self.get_mesh_count()):
-            mesh_name = self.get_mesh_name(index)
-            self.meshes.names.append(mesh_name)
-            self.meshes_mapping[mesh_name] = index
-        for index in range(self.get_lod_count()):
-            self.meshes.lod_indices.append(self.get_mesh_indices_for_lod(index))
+        self.add_entity(
+            self.meshes,
+            self.get_mesh_count(),
+            self.get_mesh_name,
+            self.get_mesh_indices_for_lod,
+        )
 
     def add_animated_maps(self) -> None:
         """Reads in the animated maps of the definition"""
 
-        for index in range(self.get_animated_map_count()):
-            self.animated_maps.names.append(self.get_animated_map_name(index))
-        for index in range(self.get_lod_count()):
-            self.animated_maps.lod_indices.append(
-                self.get_animated_map_indices_for_lod(index)
-            )
+        self.add_entity(
+            self.animated_maps,
+            self.get_animated_map_count(),
+            self.get_animated_map_name,
+            self.get_animated_map_indices_for_lod,
+        )
 
     def add_blend_shape_channels(self) -> None:
-        """Reads in the neutral joints part of the definition"""
+        """Reads in the blend shape channels of the definition"""
 
-        for index in range(self.get_blend_shape_channel_count()):
-            self.blend_shape_channels.names.append(
-                self.get_blend_shape_channel_name(index)
-            )
-        for index in range(self.get_lod_count()):
-            self.blend_shape_channels.lod_indices.append(
-                self.get_blend_shape_channel_indices_for_lod(index)
-            )
+        self.add_entity(
+            self.blend_shape_channels,
+            self.get_blend_shape_channel_count(),
+            self.get_blend_shape_channel_name,
+            self.get_blend_shape_channel_indices_for_lod,
+        )
 
     def add_joints(self) -> None:
         """Reads in the joints of the definition"""
 
-        for index in range(self.get_joint_count()):
-            self.joints.names.append(self.get_joint_name(index))
-            self.joints.parent_index.append(self.get_joint_parent_index(index))
-        for index in range(self.get_lod_count()):
-            self.joints.lod_indices.append(self.get_joint_indices_for_lod(index))
+        joint_count = self.get_joint_count()
+        self.joints.parent_index = [
+            self.get_joint_parent_index(index) for index in range(joint_count)
+        ]
+        self.add_entity(
+            self.joints,
+            joint_count,
+            self.get_joint_name,
+            self.get_joint_indices_for_lod,
+        )
 
     def add_controls(self) -> None:
         """Reads in the gui and raw controls of the definition"""
 
-        for index in range(self.get_gui_control_count()):
-            self.gui_control_names.append(self.get_gui_control_name(index))
-        for index in range(self.get_raw_control_count()):
-            self.raw_control_names.append(self.get_raw_control_name(index))
+        self.gui_control_names = [
+            self.get_gui_control_name(index)
+            for index in range(self.get_gui_control_count())
+        ]
+        self.raw_control_names = [
+            self.get_raw_control_name(index)
+            for index in range(self.get_raw_control_count())
+        ]
+        self.gui_control_indices = get_name_indices(self.gui_control_names)
+        self.raw_control_indices = get_name_indices(self.raw_control_names)
+
+
+def get_name_indices(names: List[str]) -> Dict[str, int]:
+    """
+    Maps the names to their indices, the first index is kept for duplicate names.
+
+    @type names: List[str]
+    @param names: List of names
+
+    @rtype: Dict[str, int]
+    @returns: Mapping of names to indices
+    """
+
+    name_indices: Dict[str, int] = {}
+    for index, name in enumerate(names):
+        name_indices.setdefault(name, index)
+    return name_indices
 
 
 @dataclass
@@ -313,10 +389,75 @@ class GeometryEntity:
 
     @type lod_indices: List[List[int]]
     @param lod_indices: List of indices per lod
+
+    @type name_indices: Dict[str, int]
+    @param name_indices: Mapping of names to indices
+
+    @type lod_masks: np.ndarray
+    @param lod_masks: The (LOD count, entity count) array telling if an entity is in a LOD
     """
 
     names: List[str] = field(default_factory=list)
     lod_indices: List[List[int]] = field(default_factory=list)
+    name_indices: Dict[str, int] = field(default_factory=dict)
+    lod_masks: np.ndarray = field(default_factory=lambda: np.zeros((0, 0), dtype=bool))
+
+    def update_lookups(self) -> None:
+        """Builds the name indices and LOD masks from the names and the indices per lod"""
+
+        self.name_indices.clear()
+        self.name_indices.update(get_name_indices(self.names))
+        count = len(self.names)
+        self.lod_masks = np.zeros((len(self.lod_indices), count), dtype=bool)
+        for lod, indices in enumerate(self.lod_indices):
+            self.lod_masks[lod] = self.get_mask(indices)
+
+    def get_index(self, name: str) -> Optional[int]:
+        return self.name_indices.get(name)
+
+    def get_mask(self, indices: List[int]) -> np.ndarray:
+        """
+        Gets the mask of the given entities.
+
+        @type indices: List[int]
+        @param indices: The entity indices, indices outside of the entities are left to the validation and ignored
+
+        @rtype: np.ndarray
+        @returns: The array telling if an entity is selected, by entity index
+        """
+
+        index_array = np.asarray(indices, dtype=np.int64)
+        mask = np.zeros(len(self.names), dtype=bool)
+        mask[index_array[(index_array >= 0) & (index_array < len(mask))]] = True
+        return mask
+
+    def get_lowest_lod(self, indices: List[int]) -> Optional[int]:
+        """
+        Gets the lowest LOD containing any of the given entities.
+
+        @type indices: List[int]
+        @param indices: The entity indices
+
+        @rtype: Optional[int]
+        @returns: The LOD, None if no LOD contains the entities
+        """
+
+        lods = np.flatnonzero(self.lod_masks[:, self.get_mask(indices)].any(axis=1))
+        return int(lods[0]) if len(lods) else None
+
+    def get_indices_by_lods(self, indices: List[int]) -> List[List[int]]:
+        """
+        Groups the given entities by the LODs containing them.
+
+        @type indices: List[int]
+        @param indices: The entity indices
+
+        @rtype: List[List[int]]
+        @returns: The sorted entity indices of every LOD
+        """
+
+        selected = self.lod_masks & self.get_mask(indices)
+        return [np.flatnonzero(mask).tolist() for mask in selected]
 
 
 @dataclass
@@ -1,13 +1,59 @@
-from typing import List, Optional, Tuple
+import threading
+from itertools import chain
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 from dna import BinaryStreamReader as DNAReader
-from dna import DataLayer_All, FileStream, Status
+from dna import (
+    DataLayer_All,
+    DataLayer_Behavior,
+    DataLayer_Definition,
+    DataLayer_Descriptor,
+    DataLayer_Geometry,
+    FileStream,
+    Status,
+)
 
 from ..common import DNAViewerError
 from ..model import UV, BlendShape, Joint, Layout, Point3
 from .behavior import Behavior
+from .compression import CompressedDeltas, DeltaCompressionReport
 from .geometry import Geometry
 from .layer import Layer
+from .spatial import KDTree
+from .transform import (
+    get_world_matrices,
+    read_joint_parent_indices,
+    read_neutral_joint_local_matrices,
+    read_vertex_positions,
+)
+
+# The parts of the DNA held by the reader of every data layer, smallest data layer first
+DATA_LAYER_CONTENTS = {
+    DataLayer_Descriptor: {Layer.descriptor},
+    DataLayer_Definition: {Layer.descriptor, Layer.definition},
+    DataLayer_Behavior: {Layer.descriptor, Layer.definition, Layer.behavior},
+    DataLayer_Geometry: {Layer.descriptor, Layer.definition, Layer.geometry},
+    DataLayer_All: set(Layer),
+}
+
+
+def get_data_layer(layers: List[Layer]) -> int:
+    """
+    Gets the smallest data layer of the DNA file holding the parts of the DNA.
+
+    @type layers: List[Layer]
+    @param layers: List of parts of DNA
+
+    @rtype: int
+    @returns: The data layer the reader needs to load
+    """
+
+    required = set(Layer) if Layer.all in layers else set(layers)
+    for data_layer, contents in DATA_LAYER_CONTENTS.items():
+        if required <= contents:
+            return data_layer
+    return DataLayer_All
 
 
 class DNA(Behavior, Geometry):
@@ -20,23 +66,46 @@ class DNA(Behavior, Geometry):
     @type layers: Optional[List[Layer]]
     @param layers: List of parts of DNA to be loaded. If noting is passed, whole DNA is going to be loaded. Same as
         passing Layer.all.
+
+    @type compress_deltas: bool
+    @param compress_deltas: If the blend shape target deltas are kept quantized in memory, see compress_blend_shapes
+
+    @type data_layer: Optional[int]
+    @param data_layer: The data layer of the DNA file loaded by the reader, the smallest one holding the layers if None.
+        The reader is loaded again with a larger data layer if read_layers needs it.
     """
 
-    def __init__(self, dna_path: str, layers: Optional[List[Layer]] = None) -> None:
+    def __init__(
+        self,
+        dna_path: str,
+        layers: Optional[List[Layer]] = None,
+        compress_deltas: bool = False,
+        data_layer: Optional[int] = None,
+    ) -> None:
         self.path = dna_path
-        self.reader = self.create_reader(dna_path)
         layers = layers or [Layer.all]
+        self.data_layer = (
+            data_layer if data_layer is not None else get_data_layer(layers)
+        )
+        self.reader = self.create_reader(dna_path, self.data_layer)
         Behavior.__init__(self, self.reader, layers)
-        Geometry.__init__(self, self.reader, layers)
+        Geometry.__init__(self, self.reader, layers, compress_deltas)
+        self.vertex_kd_trees: Dict[int, KDTree] = {}
+        self.read_lock = threading.RLock()
         self.read()
 
-    def create_reader(self, dna_path: str) -> DNAReader:
+    def create_reader(
+        self, dna_path: str, data_layer: int = DataLayer_All
+    ) -> DNAReader:
         """
         Creates a stream reader needed for reading values from the DNA file.
 
         @type dna_path: str
         @param dna_path: The path of the DNA file
 
+        @type data_layer: int
+        @param data_layer: The data layer of the DNA file that is loaded
+
         @rtype: DNA
         @returns: The reader needed for reading values from the DNA file
         """
@@ -45,7 +114,7 @@ class DNA(Behavior, Geometry):
             dna_path, FileStream.AccessMode_Read, FileStream.OpenMode_Binary
         )
 
-        reader = DNAReader(stream, DataLayer_All)
+        reader = DNAReader(stream, data_layer)
         reader.read()
         if not Status.isOk():
             status = Status.get()
@@ -61,46 +130,254 @@ class DNA(Behavior, Geometry):
             Behavior.read(self)
             Geometry.read(self)
 
+    def read_layers(self, layers: List[Layer]) -> None:
+        """
+        Reads in additional parts of the DNA, the parts that are already read are not read again. The DNA file is
+        loaded again with a larger data layer if the reader doesn't hold the parts. Safe to call from multiple threads.
+
+        @type layers: List[Layer]
+        @param layers: List of parts of DNA to be loaded in addition to the already loaded ones
+        """
+
+        with self.read_lock:
+            self.layers = list(self.layers) + [
+                layer for layer in layers if layer not in self.layers
+            ]
+            self.load_data_layer(get_data_layer(self.layers))
+            Behavior.read(self)
+            Geometry.read(self)
+
+    def load_data_layer(self, data_layer: int = DataLayer_All) -> None:
+        """
+        Loads the DNA file again if the reader doesn't hold the data layer, without reading in any parts. The new reader
+        holds the parts of the old one too. Used by the tools reading the DNA through the bulk getters of its reader.
+        Safe to call from multiple threads.
+
+        @type data_layer: int
+        @param data_layer: The data layer the reader needs to hold
+        """
+
+        with self.read_lock:
+            required = DATA_LAYER_CONTENTS[data_layer]
+            held = DATA_LAYER_CONTENTS.get(self.data_layer, set(Layer))
+            if not required <= held:
+                self.data_layer = get_data_layer(list(required | held))
+                self.reader = self.create_reader(self.path, self.data_layer)
+
+    def adopt(self, other: "DNA") -> None:
+        """
+        Takes over the reader and the parts read by another DNA of the same file. A DNA shared with other threads can be
+        completed this way by reading the other DNA on a worker thread, without the worker touching the shared one.
+
+        @type other: DNA
+        @param other: A DNA of the same file, not shared with anyone
+        """
+
+        with self.read_lock:
+            state = {
+                key: value
+                for key, value in vars(other).items()
+                if key not in ("read_lock", "vertex_kd_trees")
+            }
+            vars(self).update(state)
+            self.vertex_kd_trees = {}
+
     def read_all_neutral_joints(self) -> List[Joint]:
-        joints = []
-        for i in range(self.get_joint_count()):
-            name = self.get_joint_name(i)
-            translation = self.get_neutral_joint_translation(i)
-            orientation = self.get_neutral_joint_rotation(i)
-            parent_name = self.get_joint_name(self.get_joint_parent_index(i))
-
-            joint = Joint(
+        self.read_definition()
+        names = self.joints.names
+        return [
+            Joint(
                 name=name,
-                translation=translation,
-                orientation=orientation,
-                parent_name=parent_name,
+                translation=Point3(*translation),
+                orientation=Point3(*orientation),
+                parent_name=names[parent_index],
+            )
+            for name, parent_index, translation, orientation in zip(
+                names,
+                self.joints.parent_index,
+                self.neutral_joint_translations.tolist(),
+                self.neutral_joint_rotations.tolist(),
+            )
+        ]
+
+    def get_joint_parent_indices(self) -> np.ndarray:
+        return read_joint_parent_indices(self.reader)
+
+    def get_neutral_joint_local_matrices(self) -> np.ndarray:
+        return read_neutral_joint_local_matrices(self.reader)
+
+    def get_neutral_joint_world_matrices(self) -> np.ndarray:
+        """
+        Composes the neutral joint translations and orientations through the joint hierarchy.
+
+        Matrices use Maya's row vector convention, so the world position of a joint is the last row of its matrix.
+
+        @rtype: np.ndarray
+        @returns: The (N, 4, 4) array of world matrices by joint index
+        """
+
+        return get_world_matrices(
+            self.get_neutral_joint_local_matrices(), self.get_joint_parent_indices()
+        )
+
+    def get_neutral_joint_world_positions(self) -> np.ndarray:
+        """
+        Gets the world space positions of the neutral joints.
+
+        @rtype: np.ndarray
+        @returns: The (N, 3) array of world positions by joint index
+        """
+
+        return self.get_neutral_joint_world_matrices()[:, 3, :3]
+
+    def get_vertex_positions_array(self, mesh_index: int) -> np.ndarray:
+        """
+        Gets the vertex positions of the mesh as an array, read with the bulk getters of the reader. The DNA file is
+        loaded again with the geometry if the reader doesn't hold it.
+
+        @type mesh_index: int
+        @param mesh_index: The mesh index
+
+        @rtype: np.ndarray
+        @returns: The (N, 3) array of vertex positions
+        """
+
+        self.load_data_layer(DataLayer_Geometry)
+        return read_vertex_positions(self.reader, mesh_index)
+
+    def get_texture_coordinates_array(self, mesh_index: int) -> np.ndarray:
+        """
+        Gets the texture coordinates of the mesh as an array.
+
+        @type mesh_index: int
+        @param mesh_index: The mesh index
+
+        @rtype: np.ndarray
+        @returns: The (N, 2) array of texture coordinates
+        """
+
+        texture_coordinates = self.get_vertex_texture_coordinates_for_mesh(mesh_index)
+        return np.array(
+            [(uv.u, uv.v) for uv in texture_coordinates], dtype=np.float64
+        ).reshape(-1, 2)
+
+    def get_layouts_array(self, mesh_index: int) -> np.ndarray:
+        """
+        Gets the vertex layouts of the mesh as an array.
+
+        @type mesh_index: int
+        @param mesh_index: The mesh index
+
+        @rtype: np.ndarray
+        @returns: The (N, 2) array of position and texture coordinate indices by vertex layout
+        """
+
+        layouts = self.get_layouts_for_mesh_index(mesh_index)
+        return np.fromiter(
+            chain.from_iterable(
+                (layout.position_index, layout.texture_coordinate_index)
+                for layout in layouts
+            ),
+            dtype=np.int64,
+            count=2 * len(layouts),
+        ).reshape(-1, 2)
+
+    def get_faces_array(self, mesh_index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the faces of the mesh as flat arrays.
+
+        @type mesh_index: int
+        @param mesh_index: The mesh index
+
+        @rtype: Tuple[np.ndarray, np.ndarray]
+        @returns: The number of vertices of every face and the vertex layout indices of all faces one after another
+        """
+
+        faces = self.get_faces(mesh_index)
+        face_counts = np.fromiter(map(len, faces), dtype=np.int64, count=len(faces))
+        face_layouts = np.fromiter(
+            chain.from_iterable(faces), dtype=np.int64, count=int(face_counts.sum())
+        )
+        return face_counts, face_layouts
+
+    def get_vertex_kd_tree(self, mesh_index: int) -> KDTree:
+        """
+        Gets the KD-tree built over the vertex positions of the mesh. The tree is built once and cached.
+
+        @type mesh_index: int
+        @param mesh_index: The mesh index
+
+        @rtype: KDTree
+        @returns: The KD-tree of vertex positions
+        """
+
+        if mesh_index not in self.vertex_kd_trees:
+            self.vertex_kd_trees[mesh_index] = KDTree(
+                self.get_vertex_positions_array(mesh_index)
             )
+        return self.vertex_kd_trees[mesh_index]
+
+    def find_nearest_vertices_to_joints(
+        self, mesh_index: int, joint_names: List[str]
+    ) -> Dict[str, int]:
+        """
+        Finds the nearest vertex of the mesh for each of the given joints in their neutral position.
+
+        @type mesh_index: int
+        @param mesh_index: The mesh index
+
+        @type joint_names: List[str]
+        @param joint_names: The names of the joints
+
+        @rtype: Dict[str, int]
+        @returns: Mapping of joint names to vertex indices
+        """
 
-            joints.append(joint)
+        joint_indices = []
+        for joint_name in joint_names:
+            joint_index = self.get_joint_index_from_joint_name(joint_name)
+            if joint_index is None:
+                raise DNAViewerError(f"Joint with name:{joint_name} not found!")
+            joint_indices.append(joint_index)
 
-        return joints
+        positions = self.get_neutral_joint_world_positions()[joint_indices]
+        vertex_indices, _ = self.get_vertex_kd_tree(mesh_index).query(positions)
+        return dict(zip(joint_names, vertex_indices.tolist()))
 
     def get_all_skin_weights_joint_indices_for_mesh(
         self, mesh_index: int
     ) -> List[List[int]]:
         return self.geometry_meshes[mesh_index].skin_weights.joint_indices
 
+    def get_skin_joint_indices_for_mesh(self, mesh_index: int) -> List[int]:
+        """
+        Gets the joints a skin cluster of the mesh is bound to. Meshes without skin weights are bound to the joints of
+        the lowest LOD containing them.
+
+        @type mesh_index: int
+        @param mesh_index: The mesh index
+
+        @rtype: List[int]
+        @returns: The sorted joint indices
+        """
+
+        joint_indices = self.get_all_skin_weights_joint_indices_for_mesh(mesh_index)
+        if any(joint_indices):
+            return np.unique(
+                np.fromiter(chain.from_iterable(joint_indices), dtype=np.int64)
+            ).tolist()
+        lod = self.get_lowest_lod_containing_meshes([mesh_index])
+        if lod:
+            return self.get_joint_indices_for_lod(lod)
+        return []
+
     def get_blend_shape_target_deltas_with_vertex_id(
         self, mesh_index: int, blend_shape_target_index: int
     ) -> List[Tuple[int, Point3]]:
         blend_shape = self.geometry_meshes[mesh_index].blend_shapes[
             blend_shape_target_index
         ]
-        indices = list(blend_shape.deltas.keys())
-
-        deltas: List[Point3] = []
-        for i in indices:
-            deltas.append(blend_shape.deltas[i])
-
-        if not deltas:
-            return []
-
-        return list(zip(indices, deltas))
+        return list(blend_shape.deltas.items())
 
     def get_all_skin_weights_values_for_mesh(
         self, mesh_index: int
@@ -206,21 +483,32 @@ class DNA(Behavior, Geometry):
             > 0
         )
 
+    def read_definition(self) -> None:
+        """Reads in the definition if it wasn't loaded, the name and LOD lookups are built from it"""
+
+        if not self.definition_read:
+            self.read_layers([Layer.definition])
+
     def get_lowest_lod_containing_meshes(
         self, mesh_indices: List[int]
     ) -> Optional[int]:
-        unique_mesh_indices = set(mesh_indices)
-        for lod in range(self.get_lod_count()):
-            if any(list(unique_mesh_indices & set(self.get_mesh_indices_for_lod(lod)))):
-                return lod
-        return None
+        self.read_definition()
+        return self.meshes.get_lowest_lod(mesh_indices)
 
     def get_meshes_by_lods(self, mesh_indices: List[int]) -> List[List[int]]:
-        result_list = []
-        for lod in range(self.get_lod_count()):
-            temp = list(set(mesh_indices) & set(self.get_mesh_indices_for_lod(lod)))
-            result_list.append(temp)
-        return result_list
+        self.read_definition()
+        return self.meshes.get_indices_by_lods(mesh_indices)
+
+    def get_mesh_lod_masks(self) -> np.ndarray:
+        """
+        Gets the LOD membership of the meshes.
+
+        @rtype: np.ndarray
+        @returns: The (LOD count, mesh count) array telling if a mesh is in a LOD
+        """
+
+        self.read_definition()
+        return self.meshes.lod_masks
 
     def get_all_meshes_grouped_by_lod(self) -> List[List[int]]:
         """
@@ -246,5 +534,50 @@ class DNA(Behavior, Geometry):
     def get_blend_shapes(self, mesh_index: int) -> List[BlendShape]:
         return self.geometry_meshes[mesh_index].blend_shapes
 
+    def compress_blend_shapes(self) -> DeltaCompressionReport:
+        """
+        Quantizes the loaded blend shape target deltas to 16 bits with a scale per target and delta-encodes their vertex
+        indices. The deltas are decoded on access, so the accessors of the blend shapes are unchanged. Deltas read in
+        later are compressed as well. Safe to call from multiple threads.
+
+        @rtype: DeltaCompressionReport
+        @returns: The memory taken by the compressed deltas and the largest error of a decoded delta
+        """
+
+        with self.read_lock:
+            self.compress_deltas = True
+            for mesh in self.geometry_meshes:
+                for blend_shape in mesh.blend_shapes:
+                    if not isinstance(blend_shape.deltas, CompressedDeltas):
+                        blend_shape.deltas = CompressedDeltas.from_dict(
+                            blend_shape.deltas
+                        )
+        return self.get_delta_compression_report()
+
+    def get_delta_compression_report(self) -> DeltaCompressionReport:
+        report = DeltaCompressionReport()
+        for mesh in self.geometry_meshes:
+            for blend_shape in mesh.blend_shapes:
+                if isinstance(blend_shape.deltas, CompressedDeltas):
+                    report.delta_count += len(blend_shape.deltas)
+                    report.size += blend_shape.deltas.nbytes
+                    report.error_bound = max(
+                        report.error_bound, blend_shape.deltas.error_bound
+                    )
+        return report
+
     def get_mesh_id_from_mesh_name(self, mesh_name: str) -> Optional[int]:
-        return self.meshes_mapping.get(mesh_name, None)
+        self.read_definition()
+        return self.meshes.get_index(mesh_name)
+
+    def get_joint_index_from_joint_name(self, joint_name: str) -> Optional[int]:
+        self.read_definition()
+        return self.joints.get_index(joint_name)
+
+    def get_blend_shape_channel_index_from_name(self, name: str) -> Optional[int]:
+        self.read_definition()
+        return self.blend_shape_channels.get_index(name)
+
+    def get_animated_map_index_from_name(self, name: str) -> Optional[int]:
+        self.read_definition()
+        return self.animated_maps.get_index(name)
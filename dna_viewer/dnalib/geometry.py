@@ -1,17 +1,37 @@
-from typing import Dict, List, Optional, Tuple, cast
+from typing import Dict, List, Mapping, Optional, Tuple, cast
 
+import numpy as np
 from dna import BinaryStreamReader as DNAReader
 
 from ..model import UV, BlendShape, Layout, Mesh, Point3, SkinWeightsData, Topology
+from .compression import CompressedDeltas
 from .definition import Definition
 from .layer import Layer
 
 
 class Geometry(Definition):
-    def __init__(self, reader: DNAReader, layers: Optional[List[Layer]]) -> None:
+    """
+    A class used for reading and accessing the geometry part of the DNA file
+
+    Attributes
+    ----------
+    @type geometry_meshes: List[Mesh]
+    @param geometry_meshes: The meshes read from the DNA file
+
+    @type compress_deltas: bool
+    @param compress_deltas: If the blend shape target deltas are read into CompressedDeltas instead of dictionaries
+    """
+
+    def __init__(
+        self,
+        reader: DNAReader,
+        layers: Optional[List[Layer]],
+        compress_deltas: bool = False,
+    ) -> None:
         super().__init__(reader, layers)
         self.geometry_meshes: List[Mesh] = []
         self.geometry_read = False
+        self.compress_deltas = compress_deltas
 
     def start_read(self) -> None:
         super().start_read()
@@ -235,19 +255,36 @@ class Geometry(Definition):
 
     def read_target_deltas(
         self, mesh_index: int, blend_shape_target_index: int
-    ) -> Dict[int, Point3]:
+    ) -> Mapping[int, Point3]:
         """
-        Reads in the target deltas
+        Reads in the target deltas, compressed with the bulk getters if compress_deltas is set
 
-        @rtype: Dict[int, Point3]
+        @rtype: Mapping[int, Point3]
         @returns: Mapping of vertex indices to positions
         """
 
-        result: Dict[int, Point3] = {}
-
         vertices = self.get_blend_shape_target_vertex_indices(
             mesh_index, blend_shape_target_index
         )
+        if self.compress_deltas:
+            return CompressedDeltas(
+                vertices,
+                np.column_stack(
+                    (
+                        self.reader.getBlendShapeTargetDeltaXs(
+                            mesh_index, blend_shape_target_index
+                        ),
+                        self.reader.getBlendShapeTargetDeltaYs(
+                            mesh_index, blend_shape_target_index
+                        ),
+                        self.reader.getBlendShapeTargetDeltaZs(
+                            mesh_index, blend_shape_target_index
+                        ),
+                    )
+                ),
+            )
+
+        result: Dict[int, Point3] = {}
 
         blend_shape_target_delta_count = self.get_blend_shape_target_delta_count(
             mesh_index, blend_shape_target_index
@@ -0,0 +1,210 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .compression import FILE_BYTES_PER_DELTA
+from .dnalib import DNA
+from .layer import Layer
+
+# The parsed DNA takes roughly this many bytes of memory per byte of the DNA file
+MEMORY_PER_FILE_BYTE = 4
+# The part of it taken by the reader, which keeps the raw deltas even when the parsed ones are compressed
+READER_MEMORY_PER_FILE_BYTE = 1
+DEFAULT_MEMORY_BUDGET = 2 * 1024 * 1024 * 1024
+
+
+@dataclass
+class RegistryEntry:
+    """
+    A model class for holding a DNA shared through the registry
+
+    Attributes
+    ----------
+    @type dna: DNA
+    @param dna: The shared DNA
+
+    @type ref_count: int
+    @param ref_count: The number of users currently holding the DNA
+
+    @type memory: int
+    @param memory: The estimated memory in bytes taken by the DNA
+    """
+
+    dna: DNA = field(default=None)
+    ref_count: int = field(default=0)
+    memory: int = field(default=0)
+
+
+class DNARegistry:
+    """
+    A class used for sharing loaded DNAs, so the same DNA file is parsed only once per session. DNAs are shared per path
+    and modification time, so a DNA file saved again is loaded again. Layers that are requested later are read into the
+    shared DNA. DNAs that are not held by anyone stay cached until they are evicted, least recently used first, to keep
+    the estimated memory of the cached DNAs within the memory budget. DNA files are parsed outside of the registry
+    lock, so loading a DNA doesn't block acquiring the others, and a file acquired by several threads at once is parsed
+    only once.
+
+    Attributes
+    ----------
+    @type memory_budget: int
+    @param memory_budget: The memory in bytes that the cached DNAs can take
+
+    @type compress_deltas: bool
+    @param compress_deltas: If the blend shape target deltas of the loaded DNAs are kept quantized in memory
+
+    @type entries: OrderedDict[Tuple[str, float], RegistryEntry]
+    @param entries: The shared DNAs by path and modification time, least recently used first
+
+    @type loading_locks: Dict[Tuple[str, float], threading.Lock]
+    @param loading_locks: The locks held while a DNA is loaded or layers are read into it, by path and modification time
+    """
+
+    def __init__(
+        self, memory_budget: int = DEFAULT_MEMORY_BUDGET, compress_deltas: bool = False
+    ) -> None:
+        self.memory_budget = memory_budget
+        self.compress_deltas = compress_deltas
+        self.entries: "OrderedDict[Tuple[str, float], RegistryEntry]" = OrderedDict()
+        self.loading_locks: Dict[Tuple[str, float], threading.Lock] = {}
+        self.lock = threading.RLock()
+
+    def get_key(self, dna_path: str) -> Tuple[str, float]:
+        path = os.path.normcase(os.path.abspath(dna_path))
+        return path, os.path.getmtime(path)
+
+    def acquire(self, dna_path: str, layers: Optional[List[Layer]] = None) -> DNA:
+        """
+        Gets the shared DNA of the file, loading it if needed. Every acquired DNA has to be released.
+
+        @type dna_path: str
+        @param dna_path: The path of the DNA file
+
+        @type layers: Optional[List[Layer]]
+        @param layers: List of parts of DNA that need to be loaded. If noting is passed, whole DNA is going to be loaded.
+
+        @rtype: DNA
+        @returns: The shared DNA
+        """
+
+        layers = layers or [Layer.all]
+        key = self.get_key(dna_path)
+        with self.lock:
+            loading_lock = self.loading_locks.setdefault(key, threading.Lock())
+        with loading_lock:
+            with self.lock:
+                entry = self.entries.get(key)
+                if entry is not None:
+                    # held while the layers are read, so it isn't evicted meanwhile
+                    entry.ref_count += 1
+                    self.entries.move_to_end(key)
+            if entry is None:
+                dna = DNA(dna_path, layers, self.compress_deltas)
+                entry = RegistryEntry(
+                    dna=dna, ref_count=1, memory=self.estimate_memory(dna, key[0])
+                )
+                with self.lock:
+                    self.remove_stale(key[0])
+                    self.entries[key] = entry
+            elif not all(entry.dna.layer_enabled(layer) for layer in layers):
+                try:
+                    entry.dna.read_layers(layers)
+                except Exception:
+                    self.release(entry.dna)
+                    raise
+                memory = self.estimate_memory(entry.dna, key[0])
+                with self.lock:
+                    entry.memory = memory
+        with self.lock:
+            self.evict()
+        return entry.dna
+
+    def estimate_memory(self, dna: DNA, path: str) -> int:
+        """
+        Estimates the memory of the DNA from the file size. Compressed deltas count with their actual size, in addition
+        to the raw deltas the reader still holds.
+        """
+
+        report = dna.get_delta_compression_report()
+        parsed_deltas = (
+            report.delta_count
+            * FILE_BYTES_PER_DELTA
+            * (MEMORY_PER_FILE_BYTE - READER_MEMORY_PER_FILE_BYTE)
+        )
+        return (
+            max(os.path.getsize(path) * MEMORY_PER_FILE_BYTE - parsed_deltas, 0)
+            + report.size
+        )
+
+    def release(self, dna: DNA) -> None:
+        """
+        Gives back a DNA got with acquire, the DNA stays cached until it is evicted.
+
+        @type dna: DNA
+        @param dna: The shared DNA
+        """
+
+        with self.lock:
+            for entry in self.entries.values():
+                if entry.dna is dna:
+                    entry.ref_count = max(entry.ref_count - 1, 0)
+                    break
+            self.evict()
+
+    def remove_stale(self, path: str) -> None:
+        """Removes the unused DNAs of a file that was modified since they were loaded"""
+
+        for key in [key for key in self.entries if key[0] == path]:
+            if not self.entries[key].ref_count:
+                del self.entries[key]
+                self.loading_locks.pop(key, None)
+
+    def evict(self) -> None:
+        """Removes the least recently used DNAs that are not held by anyone, until the memory budget is met"""
+
+        for key in list(self.entries):
+            if self.get_memory_usage() <= self.memory_budget:
+                break
+            if not self.entries[key].ref_count:
+                logging.info(f"evicting DNA {key[0]} from the registry")
+                del self.entries[key]
+
+    def get_memory_usage(self) -> int:
+        return sum(entry.memory for entry in self.entries.values())
+
+    def clear(self) -> None:
+        """Removes all DNAs that are not held by anyone"""
+
+        with self.lock:
+            for key in [
+                key for key, entry in self.entries.items() if not entry.ref_count
+            ]:
+                del self.entries[key]
+
+
+DNA_REGISTRY = DNARegistry()
+
+
+@contextmanager
+def shared_dna(dna_path: str, layers: Optional[List[Layer]] = None) -> Iterator[DNA]:
+    """
+    Holds the shared DNA of the file from the process-wide registry for the duration of the with block.
+
+    @type dna_path: str
+    @param dna_path: The path of the DNA file
+
+    @type layers: Optional[List[Layer]]
+    @param layers: List of parts of DNA that need to be loaded. If noting is passed, whole DNA is going to be loaded.
+
+    @rtype: Iterator[DNA]
+    @returns: The shared DNA
+    """
+
+    dna = DNA_REGISTRY.acquire(dna_path, layers)
+    try:
+        yield dna
+    finally:
+        DNA_REGISTRY.release(dna)
@@ -0,0 +1,147 @@
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+import numpy as np
+
+from ..common import DNAViewerError
+
+KD_TREE_LEAF_SIZE = 32
+
+
+@dataclass
+class KDTreeNode:
+    """
+    A model class for holding a single node of the KD-tree
+
+    Attributes
+    ----------
+    @type start: int
+    @param start: The first index into the permuted point indices covered by this node
+
+    @type end: int
+    @param end: The index after the last point index covered by this node
+
+    @type axis: int
+    @param axis: The axis the node is split on, -1 for leaves
+
+    @type split: float
+    @param split: The coordinate value the node is split on
+
+    @type left: int
+    @param left: The index of the child node holding points below the split
+
+    @type right: int
+    @param right: The index of the child node holding points above the split
+    """
+
+    start: int = field(default=0)
+    end: int = field(default=0)
+    axis: int = field(default=-1)
+    split: float = field(default=0.0)
+    left: int = field(default=-1)
+    right: int = field(default=-1)
+
+
+class KDTree:
+    """
+    A KD-tree built once over a set of 3D points, used for answering nearest point queries
+
+    Attributes
+    ----------
+    @type points: np.ndarray
+    @param points: The (N, 3) array of indexed points
+
+    @type indices: np.ndarray
+    @param indices: The point indices permuted so that every node covers a contiguous range
+
+    @type nodes: List[KDTreeNode]
+    @param nodes: The nodes of the tree, the first one being the root
+    """
+
+    def __init__(self, points: np.ndarray, leaf_size: int = KD_TREE_LEAF_SIZE) -> None:
+        self.points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        if not len(self.points):
+            raise DNAViewerError("Can't build KD-tree without points!")
+        self.leaf_size = max(1, leaf_size)
+        self.indices = np.arange(len(self.points))
+        self.nodes: List[KDTreeNode] = []
+        self.build()
+
+    def build(self) -> None:
+        """Builds the tree by splitting on the median of the widest axis until the leaf size is reached"""
+
+        self.nodes = [KDTreeNode(start=0, end=len(self.points))]
+        stack = [0]
+        while stack:
+            node = self.nodes[stack.pop()]
+            if node.end - node.start <= self.leaf_size:
+                continue
+
+            node_indices = self.indices[node.start : node.end]
+            node_points = self.points[node_indices]
+            axis = int(np.argmax(node_points.max(axis=0) - node_points.min(axis=0)))
+            middle = (node.end - node.start) // 2
+            order = np.argpartition(node_points[:, axis], middle)
+            self.indices[node.start : node.end] = node_indices[order]
+
+            node.axis = axis
+            node.split = float(self.points[self.indices[node.start + middle], axis])
+            node.left = len(self.nodes)
+            node.right = node.left + 1
+            self.nodes.append(KDTreeNode(start=node.start, end=node.start + middle))
+            self.nodes.append(KDTreeNode(start=node.start + middle, end=node.end))
+            stack.extend((node.left, node.right))
+
+    def query_point(self, point: np.ndarray) -> Tuple[int, float]:
+        """
+        Finds the indexed point nearest to the given one.
+
+        @type point: np.ndarray
+        @param point: The point being queried
+
+        @rtype: Tuple[int, float]
+        @returns: The index of the nearest point and the squared distance to it
+        """
+
+        best_index = -1
+        best_distance = np.inf
+        stack = [(0, 0.0)]
+        while stack:
+            node_index, bound = stack.pop()
+            if bound > best_distance:
+                continue
+            node = self.nodes[node_index]
+            if node.axis == -1:
+                node_indices = self.indices[node.start : node.end]
+                distances = np.sum((self.points[node_indices] - point) ** 2, axis=1)
+                nearest = int(np.argmin(distances))
+                if distances[nearest] < best_distance:
+                    best_distance = float(distances[nearest])
+                    best_index = int(node_indices[nearest])
+                continue
+
+            difference = float(point[node.axis]) - node.split
+            near, far = (
+                (node.left, node.right) if difference < 0 else (node.right, node.left)
+            )
+            stack.append((far, difference * difference))
+            stack.append((near, bound))
+        return best_index, best_distance
+
+    def query(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the nearest indexed point for every given point.
+
+        @type points: np.ndarray
+        @param points: The (M, 3) array of points being queried
+
+        @rtype: Tuple[np.ndarray, np.ndarray]
+        @returns: The indices of the nearest points and the distances to them
+        """
+
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        indices = np.empty(len(points), dtype=np.int64)
+        distances = np.empty(len(points), dtype=np.float64)
+        for i, point in enumerate(points):
+            indices[i], distances[i] = self.query_point(point)
+        return indices, np.sqrt(distances)
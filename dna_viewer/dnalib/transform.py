@@ -0,0 +1,251 @@
+from typing import Any
+
+import numpy as np
+
+
+def get_rotation_matrices(rotations: np.ndarray) -> np.ndarray:
+    """
+    Creates rotation matrices from XYZ ordered euler angles, using Maya's row vector convention.
+
+    @type rotations: np.ndarray
+    @param rotations: The (N, 3) array of euler angles in radians
+
+    @rtype: np.ndarray
+    @returns: The (N, 3, 3) array of rotation matrices
+    """
+
+    rotations = np.asarray(rotations, dtype=np.float64).reshape(-1, 3)
+    cos, sin = np.cos(rotations), np.sin(rotations)
+    one, zero = np.ones(len(rotations)), np.zeros(len(rotations))
+    rotate_x = np.stack(
+        [one, zero, zero, zero, cos[:, 0], sin[:, 0], zero, -sin[:, 0], cos[:, 0]],
+        axis=1,
+    ).reshape(-1, 3, 3)
+    rotate_y = np.stack(
+        [cos[:, 1], zero, -sin[:, 1], zero, one, zero, sin[:, 1], zero, cos[:, 1]],
+        axis=1,
+    ).reshape(-1, 3, 3)
+    rotate_z = np.stack(
+        [cos[:, 2], sin[:, 2], zero, -sin[:, 2], cos[:, 2], zero, zero, zero, one],
+        axis=1,
+    ).reshape(-1, 3, 3)
+    return rotate_x @ rotate_y @ rotate_z
+
+
+def get_local_matrices(translations: np.ndarray, rotations: np.ndarray) -> np.ndarray:
+    """
+    Creates local joint matrices from translations and joint orientations.
+
+    @type translations: np.ndarray
+    @param translations: The (N, 3) array of translations
+
+    @type rotations: np.ndarray
+    @param rotations: The (N, 3) array of euler angles in radians
+
+    @rtype: np.ndarray
+    @returns: The (N, 4, 4) array of local matrices
+    """
+
+    translations = np.asarray(translations, dtype=np.float64).reshape(-1, 3)
+    local = np.zeros((len(translations), 4, 4), dtype=np.float64)
+    local[:, :3, :3] = get_rotation_matrices(rotations)
+    local[:, 3, :3] = translations
+    local[:, 3, 3] = 1.0
+    return local
+
+
+def get_hierarchy_depths(parents: np.ndarray) -> np.ndarray:
+    """
+    Gets the depth of every joint in the hierarchy. Root joints are their own parents and have depth 0.
+
+    @type parents: np.ndarray
+    @param parents: The parent index of every joint
+
+    @rtype: np.ndarray
+    @returns: The depth of every joint
+    """
+
+    parents = np.asarray(parents, dtype=np.int64)
+    depths = np.zeros(len(parents), dtype=np.int64)
+    for index in range(len(parents)):
+        depth, current = 0, index
+        while parents[current] != current and depth <= len(parents):
+            current = parents[current]
+            depth += 1
+        depths[index] = depth
+    return depths
+
+
+def get_world_matrices(local: np.ndarray, parents: np.ndarray) -> np.ndarray:
+    """
+    Composes local matrices through the hierarchy, one depth level at a time.
+
+    @type local: np.ndarray
+    @param local: The (N, 4, 4) array of local matrices
+
+    @type parents: np.ndarray
+    @param parents: The parent index of every joint
+
+    @rtype: np.ndarray
+    @returns: The (N, 4, 4) array of world matrices
+    """
+
+    parents = np.asarray(parents, dtype=np.int64)
+    depths = get_hierarchy_depths(parents)
+    world = np.array(local, dtype=np.float64, copy=True)
+    for depth in range(1, int(depths.max(initial=0)) + 1):
+        level = np.nonzero(depths == depth)[0]
+        world[level] = local[level] @ world[parents[level]]
+    return world
+
+
+def get_local_translations_for_world_positions(
+    local: np.ndarray,
+    parents: np.ndarray,
+    joint_indices: np.ndarray,
+    positions: np.ndarray,
+) -> np.ndarray:
+    """
+    Calculates the local translations needed to move the given joints to the given world positions. Joints
+    that are not moved keep their local translations, so they follow their parents.
+
+    @type local: np.ndarray
+    @param local: The (N, 4, 4) array of local matrices
+
+    @type parents: np.ndarray
+    @param parents: The parent index of every joint
+
+    @type joint_indices: np.ndarray
+    @param joint_indices: The indices of the joints being moved
+
+    @type positions: np.ndarray
+    @param positions: The (M, 3) array of world positions of the joints being moved
+
+    @rtype: np.ndarray
+    @returns: The (N, 3) array of local translations of all joints
+    """
+
+    parents = np.asarray(parents, dtype=np.int64)
+    joint_indices = np.asarray(joint_indices, dtype=np.int64)
+    depths = get_hierarchy_depths(parents)
+    targets = np.full((len(parents), 3), np.nan)
+    targets[joint_indices] = positions
+
+    local = np.array(local, dtype=np.float64, copy=True)
+    world = local.copy()
+    for depth in range(int(depths.max(initial=0)) + 1):
+        level = np.nonzero(depths == depth)[0]
+        moved = level[~np.isnan(targets[level, 0])]
+        if depth:
+            parent_world = world[parents[moved]]
+            offsets = targets[moved] - parent_world[:, 3, :3]
+            local[moved, 3, :3] = np.einsum(
+                "ni,nij->nj", offsets, np.linalg.inv(parent_world[:, :3, :3])
+            )
+            world[level] = local[level] @ world[parents[level]]
+        else:
+            local[moved, 3, :3] = targets[moved]
+            world[level] = local[level]
+    return local[:, 3, :3].copy()
+
+
+def read_joint_parent_indices(reader: Any) -> np.ndarray:
+    """
+    Reads the parent index of every joint.
+
+    @type reader: Any
+    @param reader: The DNA reader, either a BinaryStreamReader or a DNACalibDNAReader
+
+    @rtype: np.ndarray
+    @returns: The parent index of every joint
+    """
+
+    return np.array(
+        [reader.getJointParentIndex(i) for i in range(reader.getJointCount())],
+        dtype=np.int64,
+    )
+
+
+def read_neutral_joint_translations(reader: Any) -> np.ndarray:
+    """
+    Reads the neutral joint translations with the bulk getters.
+
+    @type reader: Any
+    @param reader: The DNA reader, either a BinaryStreamReader or a DNACalibDNAReader
+
+    @rtype: np.ndarray
+    @returns: The (N, 3) array of translations
+    """
+
+    return np.array(
+        [
+            reader.getNeutralJointTranslationXs(),
+            reader.getNeutralJointTranslationYs(),
+            reader.getNeutralJointTranslationZs(),
+        ],
+        dtype=np.float64,
+    ).T.reshape(-1, 3)
+
+
+def read_neutral_joint_rotations(reader: Any) -> np.ndarray:
+    """
+    Reads the neutral joint orientations with the bulk getters, in radians regardless of the rotation unit of the DNA.
+
+    @type reader: Any
+    @param reader: The DNA reader, either a BinaryStreamReader or a DNACalibDNAReader
+
+    @rtype: np.ndarray
+    @returns: The (N, 3) array of joint orientations
+    """
+
+    rotations = np.array(
+        [
+            reader.getNeutralJointRotationXs(),
+            reader.getNeutralJointRotationYs(),
+            reader.getNeutralJointRotationZs(),
+        ],
+        dtype=np.float64,
+    ).T.reshape(-1, 3)
+    if reader.getRotationUnit() == 0:
+        return np.radians(rotations)
+    return rotations
+
+
+def read_neutral_joint_local_matrices(reader: Any) -> np.ndarray:
+    """
+    Reads the neutral joints as local matrices.
+
+    @type reader: Any
+    @param reader: The DNA reader, either a BinaryStreamReader or a DNACalibDNAReader
+
+    @rtype: np.ndarray
+    @returns: The (N, 4, 4) array of local matrices
+    """
+
+    return get_local_matrices(
+        read_neutral_joint_translations(reader), read_neutral_joint_rotations(reader)
+    )
+
+
+def read_vertex_positions(reader: Any, mesh_index: int) -> np.ndarray:
+    """
+    Reads the vertex positions of the mesh with the bulk getters.
+
+    @type reader: Any
+    @param reader: The DNA reader, either a BinaryStreamReader or a DNACalibDNAReader
+
+    @type mesh_index: int
+    @param mesh_index: The mesh index
+
+    @rtype: np.ndarray
+    @returns: The (N, 3) array of vertex positions
+    """
+
+    return np.array(
+        [
+            reader.getVertexPositionXs(mesh_index),
+            reader.getVertexPositionYs(mesh_index),
+            reader.getVertexPositionZs(mesh_index),
+        ],
+        dtype=np.float64,
+    ).T.reshape(-1, 3)
@@ -0,0 +1,711 @@
+"""
+Writes binary glTF (.glb) previews of the character without Maya, one file per LOD.
+
+- usage in command line:
+    python -m dna_viewer.gltf Ada.dna Taro.dna --output-dir output --max-influences 8 --workers 4
+
+Every file holds the meshes of the LOD with their texture coordinates, the joints as a skin with inverse bind matrices
+from the neutral joints, skin weights trimmed to the strongest 4 or 8 influences and the blend shape targets as sparse
+morph targets. Positions are converted to meters. The meshes are converted one at a time and their buffers are
+streamed to a temporary file, which becomes the binary chunk once the JSON chunk describing them is known.
+"""
+
+import argparse
+import json
+import logging
+import shutil
+import struct
+import tempfile
+import time
+from functools import partial
+from itertools import chain
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .batch_runner import get_worker_count, log_results, run_jobs
+from .builder.config import Config
+from .builder.mesh_filter import get_filtered_meshes
+from .common import DNAViewerError
+from .dnalib.dnalib import DNA
+from .dnalib.transform import get_world_matrices
+from .version import __version__
+
+GLB_MAGIC = 0x46546C67
+GLB_VERSION = 2
+CHUNK_JSON = 0x4E4F534A
+CHUNK_BIN = 0x004E4942
+
+ARRAY_BUFFER = 34962
+ELEMENT_ARRAY_BUFFER = 34963
+TRIANGLES = 4
+COMPONENT_TYPES = {
+    np.dtype(np.uint8): 5121,
+    np.dtype(np.uint16): 5123,
+    np.dtype(np.uint32): 5125,
+    np.dtype(np.float32): 5126,
+}
+ACCESSOR_TYPES = {1: "SCALAR", 2: "VEC2", 3: "VEC3", 4: "VEC4", 16: "MAT4"}
+
+METERS_PER_UNIT = {0: 0.01, 1: 1.0}
+INFLUENCE_COUNTS = (4, 8)
+INFLUENCES_PER_SET = 4
+
+
+class GlbBuffer:
+    """
+    A class used for collecting the buffer views and accessors of a glb file, their data is appended to a file as they
+    are added.
+
+    Attributes
+    ----------
+    @type file: BinaryIO
+    @param file: The file holding the binary chunk
+
+    @type length: int
+    @param length: The number of bytes written to the file
+
+    @type buffer_views: List[Dict[str, Any]]
+    @param buffer_views: The glTF buffer views
+
+    @type accessors: List[Dict[str, Any]]
+    @param accessors: The glTF accessors
+    """
+
+    def __init__(self, file: BinaryIO) -> None:
+        self.file = file
+        self.length = 0
+        self.buffer_views: List[Dict[str, Any]] = []
+        self.accessors: List[Dict[str, Any]] = []
+
+    def add_buffer_view(self, data: np.ndarray, target: Optional[int] = None) -> int:
+        data = np.ascontiguousarray(data)
+        buffer_view = {
+            "buffer": 0,
+            "byteOffset": self.length,
+            "byteLength": data.nbytes,
+        }
+        if target is not None:
+            buffer_view["target"] = target
+        # every buffer view starts at a multiple of 4 bytes, as required by the largest component type
+        padding = -data.nbytes % 4
+        self.file.write(data.tobytes() + b"\0" * padding)
+        self.length += data.nbytes + padding
+        self.buffer_views.append(buffer_view)
+        return len(self.buffer_views) - 1
+
+    def add_accessor(
+        self, data: np.ndarray, target: Optional[int] = None, bounds: bool = False
+    ) -> int:
+        """
+        Adds the data as an accessor with its own buffer view.
+
+        @type data: np.ndarray
+        @param data: The (N,), (N, K) or (N, 4, 4) array, with one of the glTF component types
+
+        @type target: Optional[int]
+        @param target: The buffer view target, ARRAY_BUFFER or ELEMENT_ARRAY_BUFFER
+
+        @type bounds: bool
+        @param bounds: Adds the min and max values of every component, required for positions
+
+        @rtype: int
+        @returns: The accessor index
+        """
+
+        data = data.reshape(len(data), -1)
+        accessor = {
+            "bufferView": self.add_buffer_view(data, target),
+            "componentType": COMPONENT_TYPES[data.dtype],
+            "count": len(data),
+            "type": ACCESSOR_TYPES[data.shape[1]],
+        }
+        if bounds and len(data):
+            accessor["min"] = data.min(axis=0).tolist()
+            accessor["max"] = data.max(axis=0).tolist()
+        self.accessors.append(accessor)
+        return len(self.accessors) - 1
+
+    def add_sparse_accessor(
+        self, count: int, indices: np.ndarray, values: np.ndarray
+    ) -> int:
+        """
+        Adds a VEC3 accessor that is zero everywhere except at the given indices.
+
+        @type count: int
+        @param count: The number of elements of the accessor
+
+        @type indices: np.ndarray
+        @param indices: The increasing indices of the elements that are not zero
+
+        @type values: np.ndarray
+        @param values: The (N, 3) array of values at the indices
+
+        @rtype: int
+        @returns: The accessor index
+        """
+
+        values = values.astype(np.float32).reshape(-1, 3)
+        bounds = np.zeros((2, 3), dtype=np.float32)
+        if len(values):
+            bounds = np.stack((values.min(axis=0), values.max(axis=0)))
+            if len(values) < count:
+                bounds = np.stack((np.minimum(bounds[0], 0), np.maximum(bounds[1], 0)))
+        accessor: Dict[str, Any] = {
+            "componentType": COMPONENT_TYPES[np.dtype(np.float32)],
+            "count": count,
+            "type": "VEC3",
+            "min": bounds[0].tolist(),
+            "max": bounds[1].tolist(),
+        }
+        if len(values):
+            accessor["sparse"] = {
+                "count": len(values),
+                "indices": {
+                    "bufferView": self.add_buffer_view(indices.astype(np.uint32)),
+                    "componentType": COMPONENT_TYPES[np.dtype(np.uint32)],
+                },
+                "values": {"bufferView": self.add_buffer_view(values)},
+            }
+        self.accessors.append(accessor)
+        return len(self.accessors) - 1
+
+
+def get_triangles(faces: List[List[int]]) -> np.ndarray:
+    """
+    Triangulates the faces as fans around their first vertex.
+
+    @type faces: List[List[int]]
+    @param faces: The vertex layout indices of every face
+
+    @rtype: np.ndarray
+    @returns: The (N, 3) array of vertex layout indices of the triangles
+    """
+
+    face_counts = np.fromiter(map(len, faces), dtype=np.int64, count=len(faces))
+    face_layouts = np.fromiter(
+        chain.from_iterable(faces), dtype=np.int64, count=int(face_counts.sum())
+    )
+    triangle_counts = np.maximum(face_counts - 2, 0)
+    face_starts = np.repeat(np.cumsum(face_counts) - face_counts, triangle_counts)
+    fan_indices = np.arange(int(triangle_counts.sum())) - np.repeat(
+        np.cumsum(triangle_counts) - triangle_counts, triangle_counts
+    )
+    return np.column_stack(
+        (
+            face_layouts[face_starts],
+            face_layouts[face_starts + fan_indices + 1],
+            face_layouts[face_starts + fan_indices + 2],
+        )
+    )
+
+
+def get_strongest_influences(
+    joint_indices: List[List[int]], weights: List[List[float]], count: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Keeps the strongest influences of every vertex and normalizes their weights. Vertices without weights are bound to
+    the first joint.
+
+    @type joint_indices: List[List[int]]
+    @param joint_indices: The joint indices of the influences of every vertex
+
+    @type weights: List[List[float]]
+    @param weights: The weights of the influences of every vertex
+
+    @type count: int
+    @param count: The number of influences kept per vertex
+
+    @rtype: Tuple[np.ndarray, np.ndarray]
+    @returns: The (N, count) arrays of joint indices and weights
+    """
+
+    influence_counts = np.fromiter(
+        map(len, joint_indices), dtype=np.int64, count=len(joint_indices)
+    )
+    if not np.array_equal(
+        influence_counts,
+        np.fromiter(map(len, weights), dtype=np.int64, count=len(weights)),
+    ):
+        raise DNAViewerError(
+            "Number of skin weight values and joint indices count don't match for vertex!"
+        )
+    total = int(influence_counts.sum())
+    flat_joints = np.fromiter(
+        chain.from_iterable(joint_indices), dtype=np.int64, count=total
+    )
+    flat_weights = np.fromiter(
+        chain.from_iterable(weights), dtype=np.float64, count=total
+    )
+    vertices = np.repeat(np.arange(len(influence_counts)), influence_counts)
+    # the influences stay grouped by vertex, so the position within the group is the rank of the weight
+    order = np.lexsort((-flat_weights, vertices))
+    ranks = np.arange(total) - np.repeat(
+        np.cumsum(influence_counts) - influence_counts, influence_counts
+    )
+    kept = ranks < count
+
+    result_joints = np.zeros((len(influence_counts), count), dtype=np.int64)
+    result_weights = np.zeros((len(influence_counts), count), dtype=np.float64)
+    result_joints[vertices[kept], ranks[kept]] = flat_joints[order][kept]
+    result_weights[vertices[kept], ranks[kept]] = flat_weights[order][kept]
+
+    sums = result_weights.sum(axis=1)
+    unweighted = sums <= 0
+    result_weights[unweighted, 0] = 1.0
+    sums[unweighted] = 1.0
+    return result_joints, result_weights / sums[:, np.newaxis]
+
+
+def write_glb(path: str, gltf: Dict[str, Any], binary: BinaryIO, length: int) -> None:
+    """
+    Writes the glb file from the glTF json and the file holding the binary chunk.
+
+    @type path: str
+    @param path: The path of the .glb file
+
+    @type gltf: Dict[str, Any]
+    @param gltf: The glTF json
+
+    @type binary: BinaryIO
+    @param binary: The file holding the binary chunk
+
+    @type length: int
+    @param length: The length of the binary chunk, a multiple of 4
+    """
+
+    json_chunk = json.dumps(gltf, separators=(",", ":")).encode("utf-8")
+    json_chunk += b" " * (-len(json_chunk) % 4)
+    total = 12 + 8 + len(json_chunk) + (8 + length if length else 0)
+    with open(path, "wb") as file:
+        file.write(struct.pack("<III", GLB_MAGIC, GLB_VERSION, total))
+        file.write(struct.pack("<II", len(json_chunk), CHUNK_JSON))
+        file.write(json_chunk)
+        if length:
+            file.write(struct.pack("<II", length, CHUNK_BIN))
+            binary.seek(0)
+            shutil.copyfileobj(binary, file)
+
+
+class GltfExporter:
+    """
+    A class used for exporting the LODs of the character as glb files.
+
+    Attributes
+    ----------
+    @type dna: DNA
+    @param dna: The DNA object read from the DNA file
+
+    @type config: Config
+    @param config: The configuration options, the meshes, joints, skin and blend shapes are selected like in the Builder
+
+    @type max_influences: int
+    @param max_influences: The number of influences kept per vertex, 4 or 8
+
+    @type unit_scale: float
+    @param unit_scale: The number of meters in the translation unit of the DNA
+    """
+
+    def __init__(
+        self, dna: DNA, config: Optional[Config] = None, max_influences: int = 4
+    ) -> None:
+        if max_influences not in INFLUENCE_COUNTS:
+            raise DNAViewerError(
+                f"Maximum influences must be one of {INFLUENCE_COUNTS}, got {max_influences}."
+            )
+        unit_scale = METERS_PER_UNIT.get(dna.get_translation_unit())
+        if unit_scale is None:
+            raise DNAViewerError("Unknown unit set in DNA file!")
+        self.dna = dna
+        self.config = config or Config()
+        self.max_influences = max_influences
+        self.unit_scale = unit_scale
+
+    def export(self, output_dir: str, name: Optional[str] = None) -> Dict[int, str]:
+        """
+        Exports every LOD containing selected meshes.
+
+        @type output_dir: str
+        @param output_dir: The directory of the glb files
+
+        @type name: Optional[str]
+        @param name: The prefix of the file names, the name of the DNA file by default
+
+        @rtype: Dict[int, str]
+        @returns: The path of the file of every exported LOD
+        """
+
+        mesh_indices = get_filtered_meshes(self.dna, self.config)
+        if not mesh_indices:
+            raise DNAViewerError("No meshes selected for export.")
+        name = name or Path(self.dna.path).stem
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+        paths = {}
+        for lod, meshes in enumerate(self.dna.get_meshes_by_lods(mesh_indices)):
+            if meshes:
+                paths[lod] = str(Path(output_dir) / f"{name}_lod{lod}.glb")
+                self.write_lod(paths[lod], lod, sorted(meshes))
+        return paths
+
+    def write_lod(self, path: str, lod: int, mesh_indices: List[int]) -> None:
+        """
+        Writes the glb file of the LOD.
+
+        @type path: str
+        @param path: The path of the .glb file
+
+        @type lod: int
+        @param lod: The LOD
+
+        @type mesh_indices: List[int]
+        @param mesh_indices: The meshes of the LOD being written
+        """
+
+        with tempfile.TemporaryFile(dir=Path(path).parent) as binary:
+            buffer = GlbBuffer(binary)
+            nodes: List[Dict[str, Any]] = []
+            root_nodes: List[int] = []
+            skins: List[Dict[str, Any]] = []
+            joint_lookup = None
+
+            if self.config.add_joints and self.dna.get_joint_count():
+                joint_indices = self.get_joint_indices(lod, mesh_indices)
+                root_nodes = self.add_joint_nodes(nodes, joint_indices)
+                if self.config.add_skin_cluster:
+                    joint_lookup = np.full(self.dna.get_joint_count(), -1, np.int64)
+                    joint_lookup[joint_indices] = np.arange(len(joint_indices))
+                    skins.append(
+                        {
+                            "inverseBindMatrices": buffer.add_accessor(
+                                self.get_inverse_bind_matrices(joint_indices)
+                            ),
+                            "joints": list(range(len(joint_indices))),
+                            "skeleton": root_nodes[0],
+                        }
+                    )
+
+            meshes = []
+            for mesh_index in mesh_indices:
+                meshes.append(self.add_mesh(buffer, mesh_index, joint_lookup))
+                node: Dict[str, Any] = {
+                    "name": self.dna.get_mesh_name(mesh_index),
+                    "mesh": len(meshes) - 1,
+                }
+                if joint_lookup is not None:
+                    node["skin"] = 0
+                root_nodes.append(len(nodes))
+                nodes.append(node)
+
+            gltf = {
+                "asset": {"version": "2.0", "generator": f"dna_viewer {__version__}"},
+                "scene": 0,
+                "scenes": [{"name": f"lod{lod}", "nodes": root_nodes}],
+                "nodes": nodes,
+                "meshes": meshes,
+                "skins": skins,
+                "accessors": buffer.accessors,
+                "bufferViews": buffer.buffer_views,
+                "buffers": [{"byteLength": buffer.length}] if buffer.length else [],
+            }
+            # glTF doesn't allow empty arrays
+            write_glb(
+                path,
+                {key: value for key, value in gltf.items() if value != []},
+                binary,
+                buffer.length,
+            )
+
+    def get_joint_indices(self, lod: int, mesh_indices: List[int]) -> np.ndarray:
+        """Gets the joints of the LOD and the joints skinning its meshes, together with all of their parents"""
+
+        joint_indices = set(self.dna.get_joint_indices_for_lod(lod))
+        for mesh_index in mesh_indices:
+            joint_indices.update(
+                chain.from_iterable(
+                    self.dna.get_all_skin_weights_joint_indices_for_mesh(mesh_index)
+                )
+            )
+        parents = self.dna.get_joint_parent_indices()
+        pending = list(joint_indices)
+        while pending:
+            parent = int(parents[pending.pop()])
+            if parent not in joint_indices:
+                joint_indices.add(parent)
+                pending.append(parent)
+        return np.array(sorted(joint_indices), dtype=np.int64)
+
+    def get_local_matrices(self) -> np.ndarray:
+        local = self.dna.get_neutral_joint_local_matrices()
+        local[:, 3, :3] *= self.unit_scale
+        return local
+
+    def add_joint_nodes(
+        self, nodes: List[Dict[str, Any]], joint_indices: np.ndarray
+    ) -> List[int]:
+        """
+        Adds a node per joint, in the order of the joint indices.
+
+        @rtype: List[int]
+        @returns: The nodes of the root joints
+        """
+
+        # Maya's row vector matrices, flattened by rows, are the column major glTF matrices
+        local = self.get_local_matrices()
+        parents = self.dna.get_joint_parent_indices()
+        node_indices = {
+            int(joint_index): len(nodes) + index
+            for index, joint_index in enumerate(joint_indices)
+        }
+        for joint_index in joint_indices:
+            nodes.append(
+                {
+                    "name": self.dna.get_joint_name(int(joint_index)),
+                    "matrix": local[joint_index].ravel().tolist(),
+                }
+            )
+
+        root_nodes = []
+        for joint_index, node_index in node_indices.items():
+            parent = int(parents[joint_index])
+            if parent == joint_index:
+                root_nodes.append(node_index)
+            else:
+                nodes[node_indices[parent]].setdefault("children", []).append(
+                    node_index
+                )
+        return root_nodes
+
+    def get_inverse_bind_matrices(self, joint_indices: np.ndarray) -> np.ndarray:
+        world = get_world_matrices(
+            self.get_local_matrices(), self.dna.get_joint_parent_indices()
+        )
+        return np.linalg.inv(world[joint_indices]).astype(np.float32)
+
+    def add_mesh(
+        self, buffer: GlbBuffer, mesh_index: int, joint_lookup: Optional[np.ndarray]
+    ) -> Dict[str, Any]:
+        """
+        Adds the mesh as a single primitive whose vertices are the vertex layouts of the DNA mesh, so vertices sharing
+        a position but not the texture coordinate are split.
+
+        @type buffer: GlbBuffer
+        @param buffer: The buffer the mesh data is added to
+
+        @type mesh_index: int
+        @param mesh_index: The mesh index
+
+        @type joint_lookup: Optional[np.ndarray]
+        @param joint_lookup: The skin joint of every DNA joint, None if the mesh is not skinned
+
+        @rtype: Dict[str, Any]
+        @returns: The glTF mesh
+        """
+
+        layouts = self.dna.get_layouts_for_mesh_index(mesh_index)
+        layout_positions = np.fromiter(
+            (layout.position_index for layout in layouts),
+            dtype=np.int64,
+            count=len(layouts),
+        )
+        layout_uvs = np.fromiter(
+            (layout.texture_coordinate_index for layout in layouts),
+            dtype=np.int64,
+            count=len(layouts),
+        )
+        positions = self.dna.get_vertex_positions_array(mesh_index) * self.unit_scale
+
+        attributes = {
+            "POSITION": buffer.add_accessor(
+                positions[layout_positions].astype(np.float32),
+                ARRAY_BUFFER,
+                bounds=True,
+            )
+        }
+        texture_coordinates = self.dna.get_vertex_texture_coordinates_for_mesh(
+            mesh_index
+        )
+        if texture_coordinates:
+            # glTF texture coordinates start at the top left corner
+            uvs = np.array(
+                [(uv.u, 1.0 - uv.v) for uv in texture_coordinates], dtype=np.float32
+            )
+            attributes["TEXCOORD_0"] = buffer.add_accessor(
+                uvs[layout_uvs], ARRAY_BUFFER
+            )
+        if joint_lookup is not None:
+            joints, weights = get_strongest_influences(
+                self.dna.get_all_skin_weights_joint_indices_for_mesh(mesh_index),
+                self.dna.get_all_skin_weights_values_for_mesh(mesh_index),
+                self.max_influences,
+            )
+            joints = joint_lookup[joints[layout_positions]].astype(np.uint16)
+            weights = weights[layout_positions].astype(np.float32)
+            for index, start in enumerate(
+                range(0, self.max_influences, INFLUENCES_PER_SET)
+            ):
+                end = start + INFLUENCES_PER_SET
+                attributes[f"JOINTS_{index}"] = buffer.add_accessor(
+                    joints[:, start:end], ARRAY_BUFFER
+                )
+                attributes[f"WEIGHTS_{index}"] = buffer.add_accessor(
+                    weights[:, start:end], ARRAY_BUFFER
+                )
+
+        # the largest value of the index type is reserved for primitive restart
+        index_type = np.uint16 if len(layouts) < np.iinfo(np.uint16).max else np.uint32
+        primitive: Dict[str, Any] = {
+            "attributes": attributes,
+            "indices": buffer.add_accessor(
+                get_triangles(self.dna.get_faces(mesh_index))
+                .astype(index_type)
+                .ravel(),
+                ELEMENT_ARRAY_BUFFER,
+            ),
+            "mode": TRIANGLES,
+        }
+        mesh: Dict[str, Any] = {
+            "name": self.dna.get_mesh_name(mesh_index),
+            "primitives": [primitive],
+        }
+        if self.config.add_blend_shapes and self.dna.has_blend_shapes(mesh_index):
+            targets, names = self.add_morph_targets(
+                buffer, mesh_index, layout_positions, len(positions)
+            )
+            primitive["targets"] = targets
+            mesh["weights"] = [0.0] * len(targets)
+            mesh["extras"] = {"targetNames": names}
+        return mesh
+
+    def add_morph_targets(
+        self,
+        buffer: GlbBuffer,
+        mesh_index: int,
+        layout_positions: np.ndarray,
+        position_count: int,
+    ) -> Tuple[List[Dict[str, int]], List[str]]:
+        """
+        Adds a sparse morph target per blend shape target of the mesh, holding the deltas of the vertex layouts whose
+        positions move.
+
+        @rtype: Tuple[List[Dict[str, int]], List[str]]
+        @returns: The glTF morph targets and their names
+        """
+
+        mesh_name = self.dna.get_mesh_name(mesh_index)
+        targets, names = [], []
+        for blend_shape in self.dna.get_blend_shapes(mesh_index):
+            vertex_indices = np.fromiter(
+                blend_shape.deltas.keys(), dtype=np.int64, count=len(blend_shape.deltas)
+            )
+            deltas = (
+                np.array(
+                    [
+                        (delta.x, delta.y, delta.z)
+                        for delta in blend_shape.deltas.values()
+                    ],
+                    dtype=np.float64,
+                ).reshape(-1, 3)
+                * self.unit_scale
+            )
+            delta_rows = np.full(position_count, -1, dtype=np.int64)
+            delta_rows[vertex_indices] = np.arange(len(vertex_indices))
+            layout_rows = delta_rows[layout_positions]
+            indices = np.flatnonzero(layout_rows >= 0)
+            targets.append(
+                {
+                    "POSITION": buffer.add_sparse_accessor(
+                        len(layout_positions), indices, deltas[layout_rows[indices]]
+                    )
+                }
+            )
+
+            channel_name = self.dna.get_blend_shape_channel_name(blend_shape.channel)
+            names.append(
+                f"{mesh_name}__{channel_name}"
+                if self.config.add_mesh_name_to_blend_shape_channel_name
+                else channel_name
+            )
+        return targets, names
+
+
+def export_gltf(
+    dna: DNA,
+    output_dir: str,
+    config: Optional[Config] = None,
+    max_influences: int = 4,
+    name: Optional[str] = None,
+) -> Dict[int, str]:
+    """
+    Exports a glb file per LOD of the character without Maya.
+
+    @type dna: DNA
+    @param dna: Instance of DNA
+
+    @type output_dir: str
+    @param output_dir: The directory of the glb files, named <name>_lod<lod>.glb
+
+    @type config: Optional[Config]
+    @param config: The configuration options, used like in build_meshes
+
+    @type max_influences: int
+    @param max_influences: The number of influences kept per vertex, 4 or 8
+
+    @type name: Optional[str]
+    @param name: The prefix of the file names, the name of the DNA file by default
+
+    @rtype: Dict[int, str]
+    @returns: The path of the file of every exported LOD
+    """
+
+    return GltfExporter(dna, config, max_influences).export(output_dir, name)
+
+
+def export_gltf_file(
+    dna_path: str, output_dir: str, max_influences: int, lods: List[int]
+) -> None:
+    export_gltf(
+        DNA(dna_path),
+        output_dir,
+        config=Config(lod_filter=lods),
+        max_influences=max_influences,
+    )
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Exports binary glTF files per LOD of DNA files without Maya."
+    )
+    parser.add_argument("inputs", nargs="+", help="paths of the DNA files")
+    parser.add_argument(
+        "--output-dir", required=True, help="directory of the exported files"
+    )
+    parser.add_argument(
+        "--max-influences",
+        type=int,
+        choices=INFLUENCE_COUNTS,
+        default=4,
+        help="number of skin influences kept per vertex",
+    )
+    parser.add_argument(
+        "--lods", type=int, nargs="+", default=[], help="exported LODs, all by default"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="number of worker processes"
+    )
+    args = parser.parse_args(arguments)
+
+    logging.basicConfig(level=logging.INFO)
+    start = time.perf_counter()
+    results = run_jobs(
+        partial(export_gltf_file, max_influences=args.max_influences, lods=args.lods),
+        args.inputs,
+        [args.output_dir] * len(args.inputs),
+        get_worker_count(args.workers),
+    )
+    return log_results(results, "DNA files exported", time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,614 @@
+"""
+Writes a Maya ASCII scene of the character without Maya, with the node names the Builder uses.
+
+- usage in command line:
+    python -m dna_viewer.maya_ascii Ada.dna Taro.dna --output-dir output --workers 4
+
+The static part of the scene, the groups, joints and meshes with UVs, is written as nodes, the way Maya saves scenes. The
+blend shape and skin cluster deformers are created with their commands when the scene is opened, so the deformer
+connections match the Maya version opening it, after which their targets and weights are set from the DNA. Meshes are
+written in LOD order, each followed by its deformers, and the file is written as a stream without building the scene.
+"""
+
+import argparse
+import logging
+import time
+from dataclasses import dataclass, field
+from itertools import chain
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
+
+import numpy as np
+
+from .batch_runner import get_worker_count, log_results, run_jobs
+from .builder.config import Config
+from .builder.mesh_filter import get_filtered_meshes
+from .common import DNAViewerError
+from .dnalib.dnalib import DNA
+
+DEFAULT_MAYA_VERSION = "2022"
+LINEAR_UNITS = {0: "centimeter", 1: "meter"}
+ANGLE_UNITS = {0: "degree", 1: "radian"}
+# The input target item of a blend shape target at full weight
+BLEND_SHAPE_TARGET_ITEM = 6000
+VALUES_PER_LINE = 12
+# The most zero weights written to set the weights of a vertex with a single setAttr
+MAX_WEIGHT_GAP = 16
+
+
+@dataclass
+class MayaMeshData:
+    """
+    A model class for holding a mesh in the layout of a Maya mesh node
+
+    Attributes
+    ----------
+    @type positions: np.ndarray
+    @param positions: The (N, 3) array of vertex positions
+
+    @type uvs: np.ndarray
+    @param uvs: The (N, 2) array of texture coordinates
+
+    @type face_counts: np.ndarray
+    @param face_counts: The number of vertices of every face
+
+    @type face_edges: np.ndarray
+    @param face_edges: The edge of every face vertex, reversed edges e are stored as -e - 1
+
+    @type face_uvs: np.ndarray
+    @param face_uvs: The texture coordinate index of every face vertex
+
+    @type edges: np.ndarray
+    @param edges: The (N, 2) array of vertex indices of the edges
+    """
+
+    positions: np.ndarray = field(default=None)
+    uvs: np.ndarray = field(default=None)
+    face_counts: np.ndarray = field(default=None)
+    face_edges: np.ndarray = field(default=None)
+    face_uvs: np.ndarray = field(default=None)
+    edges: np.ndarray = field(default=None)
+
+
+def format_values(values: Iterable[float], precision: str = ".8g") -> List[str]:
+    """Formats the values, VALUES_PER_LINE on every line"""
+
+    formatted = [format(value, precision) for value in values]
+    return [
+        " ".join(formatted[start : start + VALUES_PER_LINE])
+        for start in range(0, len(formatted), VALUES_PER_LINE)
+    ]
+
+
+def quote(value: str) -> str:
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def get_component_ranges(vertex_indices: np.ndarray) -> List[str]:
+    """
+    Gets the vertex components of the sorted vertex indices, runs of consecutive indices are joined into a range.
+
+    @type vertex_indices: np.ndarray
+    @param vertex_indices: The sorted vertex indices
+
+    @rtype: List[str]
+    @returns: The quoted components, e.g. "vtx[4:9]"
+    """
+
+    if not len(vertex_indices):
+        return []
+    breaks = np.flatnonzero(np.diff(vertex_indices) != 1) + 1
+    starts = vertex_indices[np.concatenate(([0], breaks))]
+    ends = vertex_indices[np.concatenate((breaks - 1, [len(vertex_indices) - 1]))]
+    return [
+        f'"vtx[{start}]"' if start == end else f'"vtx[{start}:{end}]"'
+        for start, end in zip(starts.tolist(), ends.tolist())
+    ]
+
+
+def get_maya_mesh_data(dna: DNA, mesh_index: int) -> MayaMeshData:
+    """
+    Converts the mesh to the layout of a Maya mesh node. The faces of DNA meshes point to vertex layouts, Maya faces
+    point to edges and texture coordinates.
+
+    @type dna: DNA
+    @param dna: Instance of DNA
+
+    @type mesh_index: int
+    @param mesh_index: The mesh index
+
+    @rtype: MayaMeshData
+    @returns: The mesh data
+    """
+
+    layouts = dna.get_layouts_for_mesh_index(mesh_index)
+    layout_positions = np.array(
+        [layout.position_index for layout in layouts], dtype=np.int64
+    )
+    layout_uvs = np.array(
+        [layout.texture_coordinate_index for layout in layouts], dtype=np.int64
+    )
+    faces = dna.get_faces(mesh_index)
+    face_counts = np.fromiter(map(len, faces), dtype=np.int64, count=len(faces))
+    face_layouts = np.fromiter(
+        chain.from_iterable(faces), dtype=np.int64, count=int(face_counts.sum())
+    )
+    face_vertices = layout_positions[face_layouts]
+
+    # every face vertex starts an edge ending in the next vertex of the face
+    face_starts = np.cumsum(face_counts) - face_counts
+    next_face_vertices = np.arange(1, len(face_vertices) + 1)
+    next_face_vertices[face_starts + face_counts - 1] = face_starts
+    edge_starts = face_vertices
+    edge_ends = face_vertices[next_face_vertices]
+
+    vertex_count = max(
+        len(dna.get_vertex_positions_for_mesh_index(mesh_index)),
+        int(face_vertices.max(initial=-1)) + 1,
+    )
+    keys = np.minimum(edge_starts, edge_ends) * vertex_count + np.maximum(
+        edge_starts, edge_ends
+    )
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    edges = np.column_stack((edge_starts[first], edge_ends[first]))
+    reversed_edges = edge_starts != edges[inverse, 0]
+
+    texture_coordinates = dna.get_vertex_texture_coordinates_for_mesh(mesh_index)
+    return MayaMeshData(
+        positions=dna.get_vertex_positions_array(mesh_index),
+        uvs=np.array(
+            [(uv.u, uv.v) for uv in texture_coordinates], dtype=np.float64
+        ).reshape(-1, 2),
+        face_counts=face_counts,
+        face_edges=np.where(reversed_edges, -inverse - 1, inverse),
+        face_uvs=layout_uvs[face_layouts],
+        edges=edges,
+    )
+
+
+class MayaAsciiWriter:
+    """
+    A class used for writing a Maya ASCII scene of the character. The scene has the groups, display layers, joints,
+    meshes, blend shapes, skin clusters, root joint attributes and key frame the Builder creates with the same config.
+
+    Attributes
+    ----------
+    @type dna: DNA
+    @param dna: The DNA object read from the DNA file
+
+    @type config: Config
+    @param config: The configuration options, used like in the Builder
+
+    @type maya_version: str
+    @param maya_version: The Maya version required by the scene
+
+    @type joint_paths: Dict[str, str]
+    @param joint_paths: The full path of every written joint by name
+    """
+
+    def __init__(
+        self,
+        dna: DNA,
+        config: Optional[Config] = None,
+        maya_version: str = DEFAULT_MAYA_VERSION,
+    ) -> None:
+        self.dna = dna
+        self.config = config or Config()
+        self.maya_version = maya_version
+        self.joint_paths: Dict[str, str] = {}
+
+    def write(self, path: str) -> Dict[int, List[str]]:
+        """
+        Writes the scene.
+
+        @type path: str
+        @param path: The path of the .ma file
+
+        @rtype: Dict[int, List[str]]
+        @returns: The names of the written meshes grouped by LOD
+        """
+
+        mesh_indices = get_filtered_meshes(self.dna, self.config)
+        if not mesh_indices:
+            raise DNAViewerError("No meshes selected for writing.")
+        meshes_by_lod = {
+            lod: sorted(meshes)
+            for lod, meshes in enumerate(self.dna.get_meshes_by_lods(mesh_indices))
+            if meshes
+        }
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.joint_paths = {}
+        with open(path, "w", encoding="utf-8", newline="\n") as file:
+            self.write_header(file, Path(path).name)
+            self.write_groups(file, list(meshes_by_lod))
+            self.write_joints(file)
+            for lod, meshes in meshes_by_lod.items():
+                for mesh_index in meshes:
+                    self.write_mesh(file, mesh_index, lod)
+            self.write_display_layers(file, meshes_by_lod)
+            self.write_key_frames(file)
+        return {
+            lod: [self.dna.get_mesh_name(mesh_index) for mesh_index in meshes]
+            for lod, meshes in meshes_by_lod.items()
+        }
+
+    def write_header(self, file: TextIO, name: str) -> None:
+        linear_unit = LINEAR_UNITS.get(self.dna.get_translation_unit())
+        angle_unit = ANGLE_UNITS.get(self.dna.get_rotation_unit())
+        if linear_unit is None or angle_unit is None:
+            raise DNAViewerError("Unknown unit set in DNA file!")
+        file.write(f"//Maya ASCII {self.maya_version} scene\n")
+        file.write(f"//Name: {name}\n")
+        file.write(f'requires maya "{self.maya_version}";\n')
+        file.write(f"currentUnit -l {linear_unit} -a {angle_unit} -t film;\n")
+        file.write('fileInfo "application" "maya";\n')
+
+    def get_lod_group_path(self, lod: int) -> str:
+        return (
+            f"|{self.config.get_top_level_group()}|{self.config.get_geometry_group()}"
+            f"|{self.config.top_level_group}_lod{lod}_grp"
+        )
+
+    def get_mesh_path(self, mesh_index: int, lod: int) -> str:
+        mesh_name = self.dna.get_mesh_name(mesh_index)
+        if self.config.group_by_lod:
+            return f"{self.get_lod_group_path(lod)}|{mesh_name}"
+        return f"|{mesh_name}"
+
+    def write_groups(self, file: TextIO, lods: List[int]) -> None:
+        if not self.config.group_by_lod:
+            return
+        top_level_group = self.config.get_top_level_group()
+        file.write(f"createNode transform -n {quote(top_level_group)};\n")
+        for group in (self.config.get_geometry_group(), self.config.get_rig_group()):
+            file.write(
+                f"createNode transform -n {quote(group)} -p {quote(top_level_group)};\n"
+            )
+        for lod in lods:
+            file.write(
+                f"createNode transform -n {quote(f'{self.config.top_level_group}_lod{lod}_grp')}"
+                f" -p {quote(f'|{top_level_group}|{self.config.get_geometry_group()}')};\n"
+            )
+
+    def write_joints(self, file: TextIO) -> None:
+        """Writes the neutral joints, parents first, with the root joint attributes"""
+
+        if not self.config.add_joints:
+            return
+        joints = self.dna.read_all_neutral_joints()
+        parent_indices = self.dna.get_joint_parent_indices().tolist()
+        children: List[List[int]] = [[] for _ in joints]
+        order: List[int] = []
+        for index, parent_index in enumerate(parent_indices):
+            if parent_index in (-1, index):
+                order.append(index)
+            else:
+                children[parent_index].append(index)
+        position = 0
+        while position < len(order):
+            order.extend(children[order[position]])
+            position += 1
+        if len(order) != len(joints):
+            raise DNAViewerError("Joint hierarchy contains a cycle!")
+
+        for index in order:
+            joint = joints[index]
+            parent_index = parent_indices[index]
+            if parent_index not in (-1, index):
+                parent = self.joint_paths[joints[parent_index].name]
+            elif index == 0 and self.config.group_by_lod:
+                parent = f"|{self.config.get_top_level_group()}"
+            else:
+                parent = ""
+            self.joint_paths[joint.name] = f"{parent}|{joint.name}"
+
+            file.write(f"createNode joint -n {quote(joint.name)}")
+            file.write(f" -p {quote(parent)};\n" if parent else ";\n")
+            translation, orientation = joint.translation, joint.orientation
+            file.write(
+                f'\tsetAttr ".t" -type "double3" {translation.x:.8g} {translation.y:.8g} {translation.z:.8g} ;\n'
+            )
+            file.write(
+                f'\tsetAttr ".jo" -type "double3" {orientation.x:.8g} {orientation.y:.8g} {orientation.z:.8g} ;\n'
+            )
+            file.write('\tsetAttr ".ssc" no;\n')
+            if joint.name == self.config.facial_root_joint_name:
+                self.write_root_joint_attributes(file)
+
+    def write_root_joint_attributes(self, file: TextIO) -> None:
+        names: List[str] = []
+        if self.config.add_ctrl_attributes_on_root_joint:
+            names.extend(
+                name.split(".")[1] for name in self.dna.get_raw_control_names()
+            )
+        if self.config.add_animated_map_attributes_on_root_joint:
+            names.extend(
+                name.replace(".", "_") for name in self.dna.get_animated_map_names()
+            )
+        for name in dict.fromkeys(names):
+            file.write(
+                f"\taddAttr -ci true -k true -sn {quote(name)} -ln {quote(name)}"
+                ' -min 0 -max 1 -at "float";\n'
+            )
+
+    def write_mesh(self, file: TextIO, mesh_index: int, lod: int) -> None:
+        """Writes the neutral mesh with its UVs, followed by its blend shapes and skin cluster"""
+
+        mesh_name = self.dna.get_mesh_name(mesh_index)
+        mesh_path = self.get_mesh_path(mesh_index, lod)
+        logging.info(f"writing mesh: {mesh_name}")
+        data = get_maya_mesh_data(self.dna, mesh_index)
+
+        parent = mesh_path.rsplit("|", 1)[0]
+        file.write(f"createNode transform -n {quote(mesh_name)}")
+        file.write(f" -p {quote(parent)};\n" if parent else ";\n")
+        file.write(
+            f"createNode mesh -n {quote(f'{mesh_name}Shape')} -p {quote(mesh_path)};\n"
+        )
+        file.write('\tsetAttr ".uvst[0].uvsn" -type "string" "map1";\n')
+        self.write_values(
+            file,
+            f'setAttr -s {len(data.uvs)} ".uvst[0].uvsp[0:{len(data.uvs) - 1}]" -type "float2"',
+            data.uvs.ravel(),
+        )
+        file.write('\tsetAttr ".cuvs" -type "string" "map1";\n')
+        self.write_values(
+            file,
+            f'setAttr -s {len(data.positions)} ".vt[0:{len(data.positions) - 1}]"',
+            data.positions.ravel(),
+        )
+        edges = np.column_stack((data.edges, np.ones(len(data.edges), np.int64)))
+        self.write_values(
+            file,
+            f'setAttr -s {len(data.edges)} ".ed[0:{len(data.edges) - 1}]"',
+            edges.ravel(),
+            "d",
+        )
+        self.write_faces(file, data)
+        file.write(
+            f'connectAttr {quote(f"{mesh_path}|{mesh_name}Shape.iog")} ":initialShadingGroup.dsm" -na;\n'
+        )
+
+        if self.config.add_blend_shapes and self.dna.has_blend_shapes(mesh_index):
+            self.write_blend_shapes(file, mesh_index, mesh_path)
+        if self.config.add_skin_cluster and self.config.add_joints:
+            self.write_skin_cluster(file, mesh_index, mesh_path)
+
+    def write_values(
+        self, file: TextIO, command: str, values: np.ndarray, precision: str = ".8g"
+    ) -> None:
+        if not len(values):
+            return
+        file.write(f"\t{command}\n\t\t")
+        file.write("\n\t\t".join(format_values(values.tolist(), precision)))
+        file.write(";\n")
+
+    def write_faces(self, file: TextIO, data: MayaMeshData) -> None:
+        face_count = len(data.face_counts)
+        if not face_count:
+            return
+        file.write(
+            f'\tsetAttr -s {face_count} -ch {len(data.face_edges)} ".fc[0:{face_count - 1}]" -type "polyFaces"'
+        )
+        face_edges = data.face_edges.tolist()
+        face_uvs = data.face_uvs.tolist()
+        start = 0
+        for count in data.face_counts.tolist():
+            end = start + count
+            file.write(f"\n\t\tf {count} {' '.join(map(str, face_edges[start:end]))}")
+            file.write(f"\n\t\tmu 0 {count} {' '.join(map(str, face_uvs[start:end]))}")
+            start = end
+        file.write(";\n")
+
+    def write_blend_shapes(self, file: TextIO, mesh_index: int, mesh_path: str) -> None:
+        """Writes the blend shape node with a sparse target per blend shape of the mesh"""
+
+        mesh_name = self.dna.get_mesh_name(mesh_index)
+        node = f"{mesh_name}{self.config.blend_shape_name_postfix}"
+        file.write(f"blendShape -n {quote(node)} {quote(mesh_path)};\n")
+        for target_index, blend_shape in enumerate(
+            self.dna.get_blend_shapes(mesh_index)
+        ):
+            channel_name = self.dna.get_blend_shape_channel_name(blend_shape.channel)
+            alias = (
+                f"{mesh_name}__{channel_name}"
+                if self.config.add_mesh_name_to_blend_shape_channel_name
+                else channel_name
+            )
+            file.write(f'setAttr "{node}.w[{target_index}]" 0;\n')
+            file.write(f'aliasAttr {quote(alias)} "{node}.w[{target_index}]";\n')
+
+            vertex_indices = np.fromiter(
+                blend_shape.deltas.keys(), dtype=np.int64, count=len(blend_shape.deltas)
+            )
+            if not len(vertex_indices):
+                continue
+            order = np.argsort(vertex_indices, kind="stable")
+            deltas = np.array(
+                [
+                    (delta.x, delta.y, delta.z, 1.0)
+                    for delta in blend_shape.deltas.values()
+                ],
+                dtype=np.float64,
+            )[order]
+            item = f"{node}.it[0].itg[{target_index}].iti[{BLEND_SHAPE_TARGET_ITEM}]"
+            self.write_values(
+                file,
+                f'setAttr "{item}.ipt" -type "pointArray" {len(deltas)}',
+                deltas.ravel(),
+            )
+            components = get_component_ranges(vertex_indices[order])
+            file.write(
+                f'\tsetAttr "{item}.ict" -type "componentList" {len(components)}\n\t\t'
+            )
+            file.write(
+                "\n\t\t".join(
+                    " ".join(components[start : start + VALUES_PER_LINE])
+                    for start in range(0, len(components), VALUES_PER_LINE)
+                )
+            )
+            file.write(";\n")
+
+    def write_skin_cluster(self, file: TextIO, mesh_index: int, mesh_path: str) -> None:
+        """Writes the skin cluster binding the mesh to its influences, followed by the weights of every vertex"""
+
+        joint_ids = self.dna.get_skin_joint_indices_for_mesh(mesh_index)
+        if not joint_ids:
+            return
+        joint_names = [self.dna.get_joint_name(joint_id) for joint_id in joint_ids]
+        mesh_name = self.dna.get_mesh_name(mesh_index)
+        node = f"{mesh_name}_{self.config.skin_cluster_suffix}"
+        maximum_influences = self.dna.get_maximum_influence_per_vertex(mesh_index)
+
+        file.write(
+            f"skinCluster -tsb -n {quote(node)} -mi {maximum_influences} -sm 0 -omi true"
+            f" {quote(self.joint_paths[joint_names[0]])} {quote(mesh_path)};\n"
+        )
+        if len(joint_names) > 1:
+            influences = " ".join(
+                f"-ai {quote(self.joint_paths[name])}" for name in joint_names[1:]
+            )
+            file.write(f"skinCluster -e -wt 0 {influences} {quote(node)};\n")
+
+        # the mesh is bound to the first influence, its weight is cleared where other influences take over
+        influence_indices = {
+            joint_id: index for index, joint_id in enumerate(joint_ids)
+        }
+        for vertex_id, vertex_weights in enumerate(
+            self.dna.get_skin_weight_matrix_for_mesh(mesh_index)
+        ):
+            weights: List[Tuple[int, float]] = [
+                (influence_indices[joint_index], weight)
+                for joint_index, weight in vertex_weights
+            ]
+            if all(index for index, _ in weights):
+                weights.insert(0, (0, 0.0))
+            file.write(
+                "".join(
+                    f'setAttr "{node}.wl[{vertex_id}].w[{indices}]" {values};\n'
+                    for indices, values in get_weight_runs(weights)
+                )
+            )
+
+    def write_key_frames(self, file: TextIO) -> None:
+        """Keys the facial root joint at the first frame with linear tangents, like the Builder does"""
+
+        if not (self.config.add_key_frames and self.config.add_joints):
+            return
+        root_joint_path = self.joint_paths.get(self.config.facial_root_joint_name)
+        if root_joint_path is None:
+            return
+        file.write("currentTime 0;\n")
+        file.write(
+            f'setKeyframe -itt "linear" -ott "linear" {quote(root_joint_path)};\n'
+        )
+
+    def write_display_layers(
+        self, file: TextIO, meshes_by_lod: Dict[int, List[int]]
+    ) -> None:
+        if not self.config.create_display_layers:
+            return
+        for layer_id, (lod, meshes) in enumerate(meshes_by_lod.items(), start=1):
+            layer = f"{self.config.top_level_group}_lod{lod}_layer"
+            file.write(f"createNode displayLayer -n {quote(layer)};\n")
+            file.write(f'\tsetAttr ".do" {layer_id};\n')
+            file.write(f'connectAttr "layerManager.dli[{layer_id}]" "{layer}.id";\n')
+            for mesh_index in meshes:
+                file.write(
+                    f'connectAttr "{layer}.di" {quote(f"{self.get_mesh_path(mesh_index, lod)}.do")};\n'
+                )
+
+
+def get_weight_runs(weights: List[Tuple[int, float]]) -> List[Tuple[str, str]]:
+    """
+    Groups the weights of a vertex into runs of influence indices, each run is set with a single multi-value setAttr.
+    Gaps of up to MAX_WEIGHT_GAP influences are filled with zero weights, so most vertices are set at once, while
+    influences far apart don't write the zero weights of every influence in between.
+
+    @type weights: List[Tuple[int, float]]
+    @param weights: The influence indices and weights of a vertex
+
+    @rtype: List[Tuple[str, str]]
+    @returns: The index range and the values of every run, e.g. ("0:2", "0.5 0.25 0.25")
+    """
+
+    runs: List[List[Tuple[int, float]]] = []
+    for index, weight in sorted(weights):
+        if runs and index - runs[-1][-1][0] - 1 <= MAX_WEIGHT_GAP:
+            runs[-1].extend((gap, 0.0) for gap in range(runs[-1][-1][0] + 1, index))
+            runs[-1].append((index, weight))
+        else:
+            runs.append([(index, weight)])
+    return [
+        (
+            f"{run[0][0]}:{run[-1][0]}" if len(run) > 1 else f"{run[0][0]}",
+            " ".join(format_values(weight for _, weight in run)),
+        )
+        for run in runs
+    ]
+
+
+def write_maya_ascii(
+    dna: DNA,
+    path: str,
+    config: Optional[Config] = None,
+    maya_version: str = DEFAULT_MAYA_VERSION,
+) -> Dict[int, List[str]]:
+    """
+    Writes a Maya ASCII scene of the character without Maya.
+
+    @type dna: DNA
+    @param dna: Instance of DNA
+
+    @type path: str
+    @param path: The path of the .ma file
+
+    @type config: Optional[Config]
+    @param config: The configuration options, used like in build_meshes
+
+    @type maya_version: str
+    @param maya_version: The Maya version required by the scene
+
+    @rtype: Dict[int, List[str]]
+    @returns: The names of the written meshes grouped by LOD
+    """
+
+    return MayaAsciiWriter(dna, config, maya_version).write(path)
+
+
+def write_maya_ascii_file(dna_path: str, output_path: str) -> None:
+    write_maya_ascii(DNA(dna_path), output_path)
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Writes Maya ASCII scenes of DNA files without Maya."
+    )
+    parser.add_argument("inputs", nargs="+", help="paths of the DNA files")
+    parser.add_argument(
+        "--output-dir", required=True, help="directory of the written scenes"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="number of worker processes"
+    )
+    args = parser.parse_args(arguments)
+
+    logging.basicConfig(level=logging.INFO)
+    output_paths = [
+        str(Path(args.output_dir) / f"{Path(input_path).stem}.ma")
+        for input_path in args.inputs
+    ]
+    start = time.perf_counter()
+    results = run_jobs(
+        write_maya_ascii_file,
+        args.inputs,
+        output_paths,
+        get_worker_count(args.workers),
+    )
+    return log_results(results, "scenes written", time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,366 @@
+"""
+Writes the neutral meshes of a DNA as Wavefront OBJ or binary PLY files without Maya, one file per mesh, for comparing
+meshes before and after calibration with external tools.
+
+- usage in command line:
+    python -m dna_viewer.mesh_export Ada.dna --output-dir output --format ply --lods 0 1 --meshes head teeth
+    python -m dna_viewer.mesh_export Ada.dna --output-dir output --blend-shape jaw_open
+
+Vertices are written in the order of the DNA, so vertex indices match between the files and the DNA. Texture coordinates
+are written per face vertex, like the vertex layouts of the DNA. Faces are written as they are, without triangulation.
+"""
+
+import argparse
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, TextIO, Tuple
+
+import numpy as np
+
+from .batch_runner import log_results, run_jobs
+from .builder.config import Config
+from .builder.mesh_filter import get_filtered_meshes
+from .common import DNAViewerError
+from .dnalib.dnalib import DNA
+
+FILE_FORMATS = ("obj", "ply")
+PLY_MAX_FACE_VERTICES = np.iinfo(np.uint8).max
+
+
+def get_face_runs(face_counts: np.ndarray) -> List[Tuple[int, int, int]]:
+    """
+    Splits the faces into runs of consecutive faces with the same number of vertices, so every run can be written as a
+    single array.
+
+    @type face_counts: np.ndarray
+    @param face_counts: The number of vertices of every face
+
+    @rtype: List[Tuple[int, int, int]]
+    @returns: The first and the end face vertex of every run, with the number of vertices of its faces
+    """
+
+    if not len(face_counts):
+        return []
+    breaks = np.flatnonzero(np.diff(face_counts)) + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks, [len(face_counts)]))
+    offsets = np.concatenate(([0], np.cumsum(face_counts)))
+    return list(
+        zip(
+            offsets[starts].tolist(),
+            offsets[ends].tolist(),
+            face_counts[starts].tolist(),
+        )
+    )
+
+
+def get_mesh_positions(
+    dna: DNA, mesh_index: int, blend_shape: Optional[str] = None
+) -> np.ndarray:
+    """
+    Gets the vertex positions of the mesh, with the deltas of the blend shape target added.
+
+    @type dna: DNA
+    @param dna: Instance of DNA
+
+    @type mesh_index: int
+    @param mesh_index: The mesh index
+
+    @type blend_shape: Optional[str]
+    @param blend_shape: The name of the blend shape channel whose target is applied, the neutral positions if None or
+        if the mesh has no target for it
+
+    @rtype: np.ndarray
+    @returns: The (N, 3) array of vertex positions
+    """
+
+    positions = dna.get_vertex_positions_array(mesh_index)
+    if blend_shape is None:
+        return positions
+    for target in dna.get_blend_shapes(mesh_index):
+        if dna.get_blend_shape_channel_name(target.channel) != blend_shape:
+            continue
+        vertex_indices = np.fromiter(
+            target.deltas.keys(), dtype=np.int64, count=len(target.deltas)
+        )
+        positions[vertex_indices] += np.array(
+            [(delta.x, delta.y, delta.z) for delta in target.deltas.values()],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+    return positions
+
+
+def write_obj(
+    file: TextIO,
+    name: str,
+    positions: np.ndarray,
+    uvs: np.ndarray,
+    layouts: np.ndarray,
+    faces: Tuple[np.ndarray, np.ndarray],
+) -> None:
+    """
+    Writes the mesh in the Wavefront OBJ format.
+
+    @type file: TextIO
+    @param file: The opened file
+
+    @type name: str
+    @param name: The name of the mesh
+
+    @type positions: np.ndarray
+    @param positions: The (N, 3) array of vertex positions
+
+    @type uvs: np.ndarray
+    @param uvs: The (N, 2) array of texture coordinates
+
+    @type layouts: np.ndarray
+    @param layouts: The (N, 2) array of position and texture coordinate indices by vertex layout
+
+    @type faces: Tuple[np.ndarray, np.ndarray]
+    @param faces: The number of vertices of every face and their vertex layout indices
+    """
+
+    face_counts, face_layouts = faces
+    file.write(f"o {name}\n")
+    np.savetxt(file, positions, fmt="v %.8g %.8g %.8g")
+    # OBJ indices start at 1
+    corners = layouts[face_layouts] + 1
+    if len(uvs):
+        np.savetxt(file, uvs, fmt="vt %.8g %.8g")
+        corner_format = " %d/%d"
+    else:
+        corners = corners[:, :1]
+        corner_format = " %d"
+    for start, end, count in get_face_runs(face_counts):
+        np.savetxt(
+            file,
+            corners[start:end].reshape(-1, count * corners.shape[1]),
+            fmt="f" + corner_format * count,
+        )
+
+
+def write_ply(
+    file: BinaryIO,
+    name: str,
+    positions: np.ndarray,
+    uvs: np.ndarray,
+    layouts: np.ndarray,
+    faces: Tuple[np.ndarray, np.ndarray],
+) -> None:
+    """
+    Writes the mesh in the binary little endian PLY format. The texture coordinates are written as the texcoord list of
+    every face.
+
+    @type file: BinaryIO
+    @param file: The opened file
+
+    @type name: str
+    @param name: The name of the mesh
+
+    @type positions: np.ndarray
+    @param positions: The (N, 3) array of vertex positions
+
+    @type uvs: np.ndarray
+    @param uvs: The (N, 2) array of texture coordinates
+
+    @type layouts: np.ndarray
+    @param layouts: The (N, 2) array of position and texture coordinate indices by vertex layout
+
+    @type faces: Tuple[np.ndarray, np.ndarray]
+    @param faces: The number of vertices of every face and their vertex layout indices
+    """
+
+    face_counts, face_layouts = faces
+    if face_counts.max(initial=0) > PLY_MAX_FACE_VERTICES:
+        raise DNAViewerError(
+            f"Mesh {name} has faces with more than {PLY_MAX_FACE_VERTICES} vertices."
+        )
+    header = [
+        "ply",
+        "format binary_little_endian 1.0",
+        f"comment {name}",
+        f"element vertex {len(positions)}",
+        "property float x",
+        "property float y",
+        "property float z",
+        f"element face {len(face_counts)}",
+        "property list uchar int vertex_indices",
+    ]
+    if len(uvs):
+        header.append("property list uchar float texcoord")
+    header.append("end_header\n")
+    file.write("\n".join(header).encode("ascii"))
+    file.write(positions.astype("<f4").tobytes())
+
+    corners = layouts[face_layouts]
+    for start, end, count in get_face_runs(face_counts):
+        fields = [("count", "u1"), ("vertex_indices", "<i4", (count,))]
+        if len(uvs):
+            fields += [("uv_count", "u1"), ("texcoord", "<f4", (count, 2))]
+        run = np.zeros((end - start) // count, dtype=np.dtype(fields))
+        run["count"] = count
+        run["vertex_indices"] = corners[start:end, 0].reshape(-1, count)
+        if len(uvs):
+            run["uv_count"] = 2 * count
+            run["texcoord"] = uvs[corners[start:end, 1]].reshape(-1, count, 2)
+        file.write(run.tobytes())
+
+
+def export_mesh(
+    dna: DNA,
+    mesh_index: int,
+    path: str,
+    file_format: str = "obj",
+    blend_shape: Optional[str] = None,
+) -> None:
+    """
+    Writes a single mesh of the DNA.
+
+    @type dna: DNA
+    @param dna: Instance of DNA
+
+    @type mesh_index: int
+    @param mesh_index: The mesh index
+
+    @type path: str
+    @param path: The path of the written file
+
+    @type file_format: str
+    @param file_format: obj or ply
+
+    @type blend_shape: Optional[str]
+    @param blend_shape: The name of the blend shape channel whose target is applied to the positions
+    """
+
+    name = dna.get_mesh_name(mesh_index)
+    mesh_data = (
+        name,
+        get_mesh_positions(dna, mesh_index, blend_shape),
+        dna.get_texture_coordinates_array(mesh_index),
+        dna.get_layouts_array(mesh_index),
+        dna.get_faces_array(mesh_index),
+    )
+    if file_format == "obj":
+        with open(path, "w", encoding="utf-8", newline="\n") as text_file:
+            write_obj(text_file, *mesh_data)
+    elif file_format == "ply":
+        with open(path, "wb") as binary_file:
+            write_ply(binary_file, *mesh_data)
+    else:
+        raise DNAViewerError(
+            f"Unknown file format {file_format}, expected one of {FILE_FORMATS}."
+        )
+
+
+def export_meshes(
+    dna: DNA,
+    output_dir: str,
+    file_format: str = "obj",
+    config: Optional[Config] = None,
+    blend_shape: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> Dict[str, str]:
+    """
+    Writes the meshes of the DNA, a file per mesh named after it, using a thread pool.
+
+    @type dna: DNA
+    @param dna: Instance of DNA
+
+    @type output_dir: str
+    @param output_dir: The directory of the written files
+
+    @type file_format: str
+    @param file_format: obj or ply
+
+    @type config: Optional[Config]
+    @param config: The meshes, mesh_filter and lod_filter options select the meshes like in build_meshes
+
+    @type blend_shape: Optional[str]
+    @param blend_shape: The name of the blend shape channel whose target is applied to the positions
+
+    @type workers: Optional[int]
+    @param workers: The number of threads, chosen by ThreadPoolExecutor if None
+
+    @rtype: Dict[str, str]
+    @returns: The path of the file of every written mesh by mesh name
+    """
+
+    if file_format not in FILE_FORMATS:
+        raise DNAViewerError(
+            f"Unknown file format {file_format}, expected one of {FILE_FORMATS}."
+        )
+    mesh_indices = sorted(get_filtered_meshes(dna, config or Config()))
+    if not mesh_indices:
+        raise DNAViewerError("No meshes selected for export.")
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    paths = {
+        dna.get_mesh_name(mesh_index): str(
+            Path(output_dir) / f"{dna.get_mesh_name(mesh_index)}.{file_format}"
+        )
+        for mesh_index in mesh_indices
+    }
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                export_mesh,
+                dna,
+                mesh_index,
+                paths[dna.get_mesh_name(mesh_index)],
+                file_format,
+                blend_shape,
+            )
+            for mesh_index in mesh_indices
+        ]
+        for future in futures:
+            future.result()
+    return paths
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Writes the meshes of a DNA file as OBJ or PLY files without Maya."
+    )
+    parser.add_argument("input", help="path of the DNA file")
+    parser.add_argument(
+        "--output-dir", required=True, help="directory of the written files"
+    )
+    parser.add_argument(
+        "--format", choices=FILE_FORMATS, default="obj", help="format of the files"
+    )
+    parser.add_argument(
+        "--lods", type=int, nargs="+", default=[], help="written LODs, all by default"
+    )
+    parser.add_argument(
+        "--meshes",
+        nargs="+",
+        default=[],
+        help="written meshes, every mesh whose name contains one of these",
+    )
+    parser.add_argument(
+        "--blend-shape", help="name of the blend shape channel applied to the meshes"
+    )
+    parser.add_argument("--workers", type=int, help="number of threads")
+    args = parser.parse_args(arguments)
+
+    def export(input_path: str, output_dir: str) -> None:
+        paths = export_meshes(
+            DNA(input_path),
+            output_dir,
+            file_format=args.format,
+            config=Config(mesh_filter=args.meshes, lod_filter=args.lods),
+            blend_shape=args.blend_shape,
+            workers=args.workers,
+        )
+        logging.info(f"{len(paths)} meshes written to {output_dir}")
+
+    logging.basicConfig(level=logging.INFO)
+    start = time.perf_counter()
+    results = run_jobs(export, [args.input], [args.output_dir])
+    return log_results(results, "DNA files exported", time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import List, Mapping
 
 
 @dataclass
@@ -96,12 +96,13 @@ class BlendShape:
     @type channel: int
     @param channel: The index pointing to the blend shape name
 
-    @type deltas: Dict[int, Point3]
-    @param deltas: A mapping of blend shape indices to the coordinate differences that are made by the blend shape
+    @type deltas: Mapping[int, Point3]
+    @param deltas: A mapping of blend shape indices to the coordinate differences that are made by the blend shape,
+        either a dictionary or CompressedDeltas
     """
 
     channel: int = field(default=None)
-    deltas: Dict[int, Point3] = field(default_factory=dict)
+    deltas: Mapping[int, Point3] = field(default_factory=dict)
 
 
 @dataclass
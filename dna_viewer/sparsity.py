@@ -0,0 +1,520 @@
+"""
+Analyzes the sparsity of the blend shape target deltas of a DNA and prunes small deltas per blend shape channel.
+
+- usage in command line:
+    python -m dna_viewer.sparsity Ada.dna --thresholds 0.0001 0.001 0.01 --json sparsity.json
+    python -m dna_viewer.sparsity Ada.dna --output Ada_pruned.dna --threshold 0.001 --channel-thresholds thresholds.json
+
+The analysis reports histograms of the delta magnitudes per target and LOD, and projects the number of deltas, the size
+of the DNA and the deformation error of pruning every delta whose magnitude is at most a threshold, for a range of
+thresholds, in total, per mesh and per blend shape channel. The number of deltas is also the cost of evaluating the
+blend shapes. Pruning runs SetBlendShapeTargetDeltasCommand through a CommandSequence of dnacalib, so every channel can
+have its own threshold, unlike PruneBlendShapeTargetsCommand.
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from dna import BinaryStreamWriter, DataLayer_All, FileStream, Status
+from dnacalib import (
+    CommandSequence,
+    DNACalibDNAReader,
+    SetBlendShapeTargetDeltasCommand,
+    VectorOperation_Multiply,
+)
+
+from .batch_runner import log_results, run_jobs
+from .columnar import Columns, read_blend_shape_deltas
+from .common import DNAViewerError
+from .dnalib.compression import FILE_BYTES_PER_DELTA
+from .dnalib.dnalib import DNA
+
+DEFAULT_THRESHOLDS = [0.0001, 0.0003, 0.001, 0.003, 0.01, 0.03, 0.1]
+# The magnitudes are binned by powers of ten, with the zero deltas in the first bin
+HISTOGRAM_BIN_EDGES = [0.0] + [10.0**exponent for exponent in range(-6, 2)] + [np.inf]
+
+
+@dataclass
+class ThresholdProjection:
+    """
+    A model class for holding the projected effect of pruning with a threshold
+
+    Attributes
+    ----------
+    @type threshold: float
+    @param threshold: Deltas whose magnitude is at most the threshold are pruned
+
+    @type delta_count: int
+    @param delta_count: The number of deltas left after pruning
+
+    @type pruned_count: int
+    @param pruned_count: The number of pruned deltas
+
+    @type size: int
+    @param size: The size of the deltas left after pruning in bytes
+
+    @type max_error: float
+    @param max_error: The largest displacement of a vertex by a pruned delta, with the channel fully activated
+
+    @type rms_error: float
+    @param rms_error: The RMS of the displacements by pruned deltas over all deltas
+    """
+
+    threshold: float
+    delta_count: int
+    pruned_count: int
+    size: int
+    max_error: float
+    rms_error: float
+
+
+@dataclass
+class SparsityReport:
+    """
+    A model class for holding the sparsity analysis of the blend shape deltas of a DNA
+
+    Attributes
+    ----------
+    @type path: str
+    @param path: The path of the DNA
+
+    @type file_size: Optional[int]
+    @param file_size: The size of the DNA file in bytes, None if the file doesn't exist
+
+    @type bin_edges: List[float]
+    @param bin_edges: The edges of the magnitude histograms, bins include their lower edge
+
+    @type targets: List[Dict[str, Any]]
+    @param targets: The mesh, target index, channel and magnitude histogram of every target
+
+    @type lods: List[List[int]]
+    @param lods: The magnitude histogram of every LOD
+
+    @type total: List[ThresholdProjection]
+    @param total: The projection of every threshold over all deltas
+
+    @type meshes: Dict[str, List[ThresholdProjection]]
+    @param meshes: The projections by mesh name
+
+    @type channels: Dict[str, List[ThresholdProjection]]
+    @param channels: The projections by blend shape channel name
+    """
+
+    path: str
+    file_size: Optional[int] = field(default=None)
+    bin_edges: List[float] = field(default_factory=list)
+    targets: List[Dict[str, Any]] = field(default_factory=list)
+    lods: List[List[int]] = field(default_factory=list)
+    total: List[ThresholdProjection] = field(default_factory=list)
+    meshes: Dict[str, List[ThresholdProjection]] = field(default_factory=dict)
+    channels: Dict[str, List[ThresholdProjection]] = field(default_factory=dict)
+
+    def get_projected_file_size(self, projection: ThresholdProjection) -> Optional[int]:
+        if self.file_size is None:
+            return None
+        return self.file_size - projection.pruned_count * FILE_BYTES_PER_DELTA
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = asdict(self)
+        # JSON has no infinity
+        result["bin_edges"] = [
+            edge if np.isfinite(edge) else None for edge in self.bin_edges
+        ]
+        return result
+
+    def format(self) -> str:
+        lines = [f"{self.path}:"]
+        bins = [
+            f"<{edge:g}" if np.isfinite(edge) else "rest" for edge in self.bin_edges[1:]
+        ]
+        lines.append("  magnitudes  " + " ".join(f"{name:>9}" for name in bins))
+        for lod, histogram in enumerate(self.lods):
+            lines.append(
+                f"  lod{lod:<8} " + " ".join(f"{count:>9}" for count in histogram)
+            )
+        lines.append(
+            "  threshold   deltas     pruned  file size   max error   rms error"
+        )
+        for projection in self.total:
+            file_size = self.get_projected_file_size(projection)
+            lines.append(
+                f"  {projection.threshold:<9g} {projection.delta_count:>9} {projection.pruned_count:>9}"
+                f" {file_size if file_size is not None else '-':>11} {projection.max_error:>11.3g}"
+                f" {projection.rms_error:>11.3g}"
+            )
+        for mesh, projections in self.meshes.items():
+            lines.append(
+                f"  {mesh}: "
+                + ", ".join(
+                    f"{projection.threshold:g} -> {projection.delta_count}"
+                    for projection in projections
+                )
+            )
+        return "\n".join(lines)
+
+
+def get_magnitudes(columns: Columns) -> np.ndarray:
+    return np.sqrt(
+        columns["x"].astype(np.float64) ** 2
+        + columns["y"].astype(np.float64) ** 2
+        + columns["z"].astype(np.float64) ** 2
+    )
+
+
+def get_projections(
+    magnitudes: np.ndarray, thresholds: List[float]
+) -> List[ThresholdProjection]:
+    """
+    Projects the effect of pruning the deltas with every threshold.
+
+    @type magnitudes: np.ndarray
+    @param magnitudes: The magnitudes of the deltas
+
+    @type thresholds: List[float]
+    @param thresholds: The thresholds
+
+    @rtype: List[ThresholdProjection]
+    @returns: The projection of every threshold
+    """
+
+    ordered = np.sort(magnitudes)
+    squares = np.concatenate(([0.0], np.cumsum(ordered**2)))
+    pruned_counts = np.searchsorted(ordered, thresholds, side="right")
+    count = len(ordered)
+    projections = []
+    for threshold, pruned_count in zip(thresholds, pruned_counts.tolist()):
+        projections.append(
+            ThresholdProjection(
+                threshold=float(threshold),
+                delta_count=count - pruned_count,
+                pruned_count=pruned_count,
+                size=(count - pruned_count) * FILE_BYTES_PER_DELTA,
+                max_error=float(ordered[pruned_count - 1]) if pruned_count else 0.0,
+                rms_error=(
+                    float(np.sqrt(squares[pruned_count] / count)) if count else 0.0
+                ),
+            )
+        )
+    return projections
+
+
+def get_group_projections(
+    magnitudes: np.ndarray,
+    groups: np.ndarray,
+    names: List[str],
+    thresholds: List[float],
+) -> Dict[str, List[ThresholdProjection]]:
+    """Projects the thresholds separately for the deltas of every group, only groups with deltas are included"""
+
+    order = np.argsort(groups, kind="stable")
+    group_indices, starts = np.unique(groups[order], return_index=True)
+    ends = np.append(starts[1:], len(order))
+    return {
+        names[group_index]: get_projections(magnitudes[order[start:end]], thresholds)
+        for group_index, start, end in zip(
+            group_indices.tolist(), starts.tolist(), ends.tolist()
+        )
+    }
+
+
+def get_target_indices(dna: DNA, columns: Columns) -> np.ndarray:
+    """
+    Numbers the targets of all meshes consecutively, in mesh and target order.
+
+    @type dna: DNA
+    @param dna: The DNA the columns were read from
+
+    @type columns: Columns
+    @param columns: The blend shape deltas
+
+    @rtype: np.ndarray
+    @returns: The consecutive target index of every delta
+    """
+
+    target_counts = [
+        dna.reader.getBlendShapeTargetCount(mesh_index)
+        for mesh_index in range(dna.get_mesh_count())
+    ]
+    offsets = np.concatenate(([0], np.cumsum(target_counts, dtype=np.int64)))
+    return offsets[columns["mesh_index"]] + columns["target_index"]
+
+
+def analyze_sparsity(
+    dna: DNA,
+    thresholds: Optional[List[float]] = None,
+    bin_edges: Optional[List[float]] = None,
+) -> SparsityReport:
+    """
+    Analyzes the blend shape deltas of the DNA.
+
+    @type dna: DNA
+    @param dna: Instance of DNA, its reader loads the blend shape deltas if it was opened without them
+
+    @type thresholds: Optional[List[float]]
+    @param thresholds: The projected thresholds, DEFAULT_THRESHOLDS if None
+
+    @type bin_edges: Optional[List[float]]
+    @param bin_edges: The increasing edges of the magnitude histograms, HISTOGRAM_BIN_EDGES if None
+
+    @rtype: SparsityReport
+    @returns: The histograms and projections
+    """
+
+    dna.load_data_layer(DataLayer_All)
+    thresholds = sorted(thresholds or DEFAULT_THRESHOLDS)
+    bin_edges = list(bin_edges or HISTOGRAM_BIN_EDGES)
+    columns = read_blend_shape_deltas(dna)
+    magnitudes = get_magnitudes(columns)
+    bins = np.clip(
+        np.searchsorted(bin_edges, magnitudes, side="right") - 1,
+        0,
+        len(bin_edges) - 2,
+    )
+    bin_count = len(bin_edges) - 1
+
+    targets = [
+        (mesh_index, target_index)
+        for mesh_index in range(dna.get_mesh_count())
+        for target_index in range(dna.reader.getBlendShapeTargetCount(mesh_index))
+    ]
+    histograms = np.bincount(
+        get_target_indices(dna, columns) * bin_count + bins,
+        minlength=len(targets) * bin_count,
+    ).reshape(len(targets), bin_count)
+    mesh_histograms = np.zeros((dna.get_mesh_count(), bin_count), dtype=np.int64)
+    np.add.at(
+        mesh_histograms,
+        np.asarray([mesh_index for mesh_index, _ in targets], dtype=np.int64),
+        histograms,
+    )
+
+    mesh_names = [
+        dna.get_mesh_name(mesh_index) for mesh_index in range(dna.get_mesh_count())
+    ]
+    channel_names = [
+        dna.get_blend_shape_channel_name(index)
+        for index in range(dna.get_blend_shape_channel_count())
+    ]
+    file_size = os.path.getsize(dna.path) if os.path.isfile(dna.path) else None
+    return SparsityReport(
+        path=dna.path,
+        file_size=file_size,
+        bin_edges=[float(edge) for edge in bin_edges],
+        targets=[
+            {
+                "mesh": mesh_names[mesh_index],
+                "target_index": target_index,
+                "channel": channel_names[
+                    dna.reader.getBlendShapeChannelIndex(mesh_index, target_index)
+                ],
+                "histogram": histogram,
+            }
+            for (mesh_index, target_index), histogram in zip(
+                targets, histograms.tolist()
+            )
+        ],
+        lods=(dna.get_mesh_lod_masks().astype(np.int64) @ mesh_histograms).tolist(),
+        total=get_projections(magnitudes, thresholds),
+        meshes=get_group_projections(
+            magnitudes, columns["mesh_index"], mesh_names, thresholds
+        ),
+        channels=get_group_projections(
+            magnitudes, columns["channel_index"], channel_names, thresholds
+        ),
+    )
+
+
+def get_channel_thresholds(
+    dna: DNA,
+    channel_thresholds: Optional[Dict[str, float]] = None,
+    default_threshold: Optional[float] = None,
+) -> np.ndarray:
+    """
+    Gets the pruning threshold of every blend shape channel.
+
+    @type dna: DNA
+    @param dna: Instance of DNA
+
+    @type channel_thresholds: Optional[Dict[str, float]]
+    @param channel_thresholds: The thresholds by blend shape channel name
+
+    @type default_threshold: Optional[float]
+    @param default_threshold: The threshold of the other channels, they aren't pruned if None
+
+    @rtype: np.ndarray
+    @returns: The threshold by blend shape channel index, -1 for channels that aren't pruned
+    """
+
+    thresholds = np.full(
+        dna.get_blend_shape_channel_count(),
+        -1.0 if default_threshold is None else default_threshold,
+    )
+    for name, threshold in (channel_thresholds or {}).items():
+        channel_index = dna.get_blend_shape_channel_index_from_name(name)
+        if channel_index is None:
+            raise DNAViewerError(f"Blend shape channel with name:{name} not found!")
+        thresholds[channel_index] = threshold
+    return thresholds
+
+
+def get_pruned_mask(columns: Columns, thresholds: np.ndarray) -> np.ndarray:
+    """Tells which deltas have a magnitude of at most the threshold of their channel"""
+
+    return get_magnitudes(columns) <= thresholds[columns["channel_index"]]
+
+
+def create_prune_commands(
+    columns: Columns, pruned_mask: np.ndarray
+) -> List[SetBlendShapeTargetDeltasCommand]:
+    """
+    Creates the commands zeroing the pruned deltas, the commands drop the zeroed deltas from the targets.
+
+    @type columns: Columns
+    @param columns: The blend shape deltas, in mesh and target order
+
+    @type pruned_mask: np.ndarray
+    @param pruned_mask: Tells which deltas are pruned
+
+    @rtype: List[SetBlendShapeTargetDeltasCommand]
+    @returns: A command for every target with pruned deltas
+    """
+
+    pruned = np.flatnonzero(pruned_mask)
+    keys = np.stack(
+        (columns["mesh_index"][pruned], columns["target_index"][pruned]), axis=1
+    )
+    _, starts = np.unique(keys, axis=0, return_index=True)
+    ends = np.append(starts[1:], len(pruned))
+
+    commands = []
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        rows = pruned[start:end]
+        zeros = [0.0] * len(rows)
+        commands.append(
+            SetBlendShapeTargetDeltasCommand(
+                int(columns["mesh_index"][rows[0]]),
+                int(columns["target_index"][rows[0]]),
+                zeros,
+                zeros,
+                zeros,
+                columns["vertex_index"][rows].tolist(),
+                VectorOperation_Multiply,
+            )
+        )
+    return commands
+
+
+def prune_blend_shapes(
+    dna: DNA,
+    output_path: str,
+    channel_thresholds: Optional[Dict[str, float]] = None,
+    default_threshold: Optional[float] = None,
+) -> int:
+    """
+    Prunes the blend shape deltas with a threshold per channel and saves the pruned DNA.
+
+    @type dna: DNA
+    @param dna: Instance of DNA
+
+    @type output_path: str
+    @param output_path: The path of the pruned DNA
+
+    @type channel_thresholds: Optional[Dict[str, float]]
+    @param channel_thresholds: The thresholds by blend shape channel name
+
+    @type default_threshold: Optional[float]
+    @param default_threshold: The threshold of the other channels, they aren't pruned if None
+
+    @rtype: int
+    @returns: The number of pruned deltas
+    """
+
+    dna.load_data_layer(DataLayer_All)
+    thresholds = get_channel_thresholds(dna, channel_thresholds, default_threshold)
+    columns = read_blend_shape_deltas(dna)
+    pruned_mask = get_pruned_mask(columns, thresholds)
+    commands = create_prune_commands(columns, pruned_mask)
+
+    calibrated = DNACalibDNAReader(dna.reader)
+    # the sequence doesn't own the commands, the list keeps them alive while it runs
+    sequence = CommandSequence()
+    for command in commands:
+        sequence.add(command)
+    sequence.run(calibrated)
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    stream = FileStream(
+        output_path, FileStream.AccessMode_Write, FileStream.OpenMode_Binary
+    )
+    writer = BinaryStreamWriter(stream)
+    writer.setFrom(calibrated)
+    writer.write()
+    if not Status.isOk():
+        status = Status.get()
+        raise DNAViewerError(f"Error saving DNA {output_path}: {status.message}")
+    return int(np.count_nonzero(pruned_mask))
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Analyzes and prunes the blend shape deltas of a DNA file."
+    )
+    parser.add_argument("input", help="path of the DNA file")
+    parser.add_argument(
+        "--thresholds",
+        type=float,
+        nargs="+",
+        default=DEFAULT_THRESHOLDS,
+        help="projected thresholds",
+    )
+    parser.add_argument("--json", help="path of the JSON report")
+    parser.add_argument(
+        "--output", help="path of the pruned DNA, no pruning if not set"
+    )
+    parser.add_argument(
+        "--threshold", type=float, help="pruning threshold of the channels"
+    )
+    parser.add_argument(
+        "--channel-thresholds",
+        help="path of a JSON file mapping blend shape channel names to pruning thresholds",
+    )
+    args = parser.parse_args(arguments)
+
+    logging.basicConfig(level=logging.INFO)
+    start = time.perf_counter()
+    dna = DNA(args.input)
+    report = analyze_sparsity(dna, args.thresholds)
+    print(report.format())
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(report.to_dict(), file, indent=2)
+    if args.output:
+        channel_thresholds = None
+        if args.channel_thresholds:
+            with open(args.channel_thresholds, encoding="utf-8") as file:
+                channel_thresholds = json.load(file)
+        if channel_thresholds is None and args.threshold is None:
+            logging.error("Pruning needs --threshold or --channel-thresholds.")
+            return 1
+
+        def prune(input_path: str, output_path: str) -> None:
+            pruned_count = prune_blend_shapes(
+                dna, output_path, channel_thresholds, args.threshold
+            )
+            logging.info(f"{pruned_count} deltas of {input_path} pruned")
+
+        results = run_jobs(prune, [args.input], [args.output])
+        return log_results(results, "DNA files pruned", time.perf_counter() - start)
+    logging.info(f"Done in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
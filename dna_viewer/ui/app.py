@@ -1,11 +1,20 @@
 import logging
 import os
+import threading
 import webbrowser
-from typing import Callable, List
+from typing import Callable, Iterator, List
 
 from maya import cmds
 from maya.cmds import confirmDialog
-from PySide2.QtCore import QCoreApplication, Qt
+from PySide2.QtCore import (
+    QCoreApplication,
+    QObject,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from PySide2.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -24,9 +33,13 @@ from PySide2.QtWidgets import (
     QWidget,
 )
 
-from .. import DNA, build_rig
+from .. import DNA
+from ..builder.builder import BuildStep
 from ..builder.config import RigConfig
+from ..builder.plan import BuildPlan
+from ..builder.rig_builder import RigBuilder
 from ..dnalib.layer import Layer
+from ..dnalib.registry import DNA_REGISTRY
 from ..version import __version__
 from .widgets import FileChooser, QHLine
 
@@ -38,6 +51,7 @@ def show() -> None:
 WINDOW_OBJECT = "dnaviewer"
 WINDOW_TITLE = "DNA Viewer"
 HELP_URL = "https://epicgames.github.io/MetaHuman-DNA-Calibration/"
+BUILD_COSTS_FILE_NAME = "dna_viewer_build_costs.json"
 SPACING = 6
 WINDOW_SIZE_WIDTH_MIN = 800
 WINDOW_SIZE_WIDTH_MAX = 1200
@@ -56,6 +70,68 @@ MARGIN_BODY_TOP = 0
 MARGIN_BODY_RIGHT = 0
 
 
+class DnaLoaderSignals(QObject):
+    """
+    The signals emitted by the DNA loader, they are delivered on the thread of the window. The DNA emitted with
+    definition_loaded is acquired from the DNA registry for the window.
+
+    @type progress: Signal
+    @param progress: Emits the progress text and value
+
+    @type definition_loaded: Signal
+    @param definition_loaded: Emits the DNA once its definition is read
+
+    @type geometry_loaded: Signal
+    @param geometry_loaded: Emits a separate DNA of the same file with all of its parts read, it is not shared with
+        anyone, so the window adopts it into the shared DNA on its own thread
+
+    @type failed: Signal
+    @param failed: Emits the error message if loading fails
+    """
+
+    progress = Signal(str, int)
+    definition_loaded = Signal(object)
+    geometry_loaded = Signal(object)
+    failed = Signal(str)
+
+
+class DnaLoader(QRunnable):
+    """
+    A worker used for loading the DNA in the background. Only the definition data layer of the DNA file is parsed first,
+    so the meshes can be listed while the rest of the DNA is being read.
+
+    @type dna_path: str
+    @param dna_path: The path of the DNA file
+
+    @type signals: DnaLoaderSignals
+    @param signals: The signals used for reporting the loading progress
+
+    @type finished: threading.Event
+    @param finished: Set once the worker stops, whether loading succeeded or not
+    """
+
+    def __init__(self, dna_path: str) -> None:
+        super().__init__()
+        self.dna_path = dna_path
+        self.signals = DnaLoaderSignals()
+        self.finished = threading.Event()
+
+    def run(self) -> None:
+        try:
+            self.signals.progress.emit("Loading DNA definition...", 10)
+            dna = DNA_REGISTRY.acquire(self.dna_path, [Layer.definition])
+            self.signals.definition_loaded.emit(dna)
+            self.signals.progress.emit("Loading DNA behavior and geometry...", 40)
+            # the shared DNA is read on the thread of the window, so the rest is read into a DNA of the worker
+            self.signals.geometry_loaded.emit(
+                DNA(dna.path, [Layer.all], dna.compress_deltas)
+            )
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        finally:
+            self.finished.set()
+
+
 class MeshTreeList(QWidget):
     """
     A custom widget that lists out meshes with checkboxes next to them, so these meshes can be selected to be processed. The meshes are grouped by LOD
@@ -224,6 +300,7 @@ class MeshTreeList(QWidget):
             self.main_window.process_btn.setEnabled(
                 self.main_window.joints_cb.checkState()
             )
+        self.main_window.schedule_build_estimate()
 
 
 class DnaViewerWindow(QMainWindow):
@@ -278,8 +355,26 @@ class DnaViewerWindow(QMainWindow):
     @type process_btn: QPushButton
     @param process_btn: The button that starts creating the scene and character
 
+    @type build_estimate_label: QLabel
+    @param build_estimate_label: The label next to the process button showing the estimated cost of the build
+
     @type progress_bar: QProgressBar
     @param progress_bar: The progress bar that shows the building progress
+
+    @type cancel_btn: QPushButton
+    @param cancel_btn: The button that stops the build in progress
+
+    @type dna_loader: DnaLoader
+    @param dna_loader: The worker loading the currently selected DNA
+
+    @type dna_loaded: bool
+    @param dna_loaded: Represents if all parts of the DNA are loaded
+
+    @type builder: RigBuilder
+    @param builder: The builder of the build in progress
+
+    @type build_steps: Iterator[BuildStep]
+    @param build_steps: The remaining units of work of the build in progress, run one at a time when Maya is idle
     """
 
     _instance: "DnaViewerWindow" = None
@@ -299,8 +394,14 @@ class DnaViewerWindow(QMainWindow):
     select_analog_gui_path: FileChooser = None
     select_aas_path: FileChooser = None
     process_btn: QPushButton = None
+    build_estimate_label: QLabel = None
     progress_bar: QProgressBar = None
+    cancel_btn: QPushButton = None
     dna: DNA = None
+    dna_loader: DnaLoader = None
+    dna_loaded: bool = False
+    builder: RigBuilder = None
+    build_steps: Iterator[BuildStep] = None
 
     def __init__(self, parent: QWidget = None) -> None:
         super().__init__(parent)
@@ -308,6 +409,10 @@ class DnaViewerWindow(QMainWindow):
         self.header: QHBoxLayout = None
         self.build_options: QWidget = None
         self.extra_build_options: QWidget = None
+        self.build_step_count = 0
+        self.build_step_index = 0
+        self.build_estimate_pending = False
+        self.disabled_widgets: List[QWidget] = []
 
         self.setup_window()
         self.create_ui()
@@ -397,35 +502,162 @@ class DnaViewerWindow(QMainWindow):
 
         if process:
             self.set_progress(text="Processing in progress...", value=0)
-            config = RigConfig(
-                meshes=self.mesh_tree_list.get_selected_meshes(),
-                gui_path=self.select_gui_path.get_file_path(),
-                analog_gui_path=self.select_analog_gui_path.get_file_path(),
-                aas_path=self.select_aas_path.get_file_path(),
-                add_rig_logic=self.add_rig_logic(),
-                add_joints=self.add_joints(),
-                add_blend_shapes=self.add_blend_shapes(),
-                add_skin_cluster=self.add_skin_cluster(),
-                add_ctrl_attributes_on_root_joint=self.add_ctrl_attributes_on_root_joint(),
-                add_animated_map_attributes_on_root_joint=self.add_animated_map_attributes_on_root_joint(),
-                add_mesh_name_to_blend_shape_channel_name=self.add_mesh_name_to_blend_shape_channel_name(),
-                add_key_frames=self.add_key_frames(),
-            )
+            config = self.get_config()
 
-            self.main_widget.setEnabled(False)
+            self.set_build_controls_enabled(False)
 
             try:
-                self.set_progress(value=33)
-                self.dna = DNA(self.select_dna_path.get_file_path())
-                self.set_progress(value=66)
-                build_rig(dna=self.dna, config=config)
-                self.set_progress(text="Processing completed", value=100)
+                self.wait_for_dna()
+                self.builder = RigBuilder(dna=self.dna, config=config)
+                plan = self.builder.plan()
+                plan.log()
+                self.set_build_estimate(plan)
+                self.build_step_count = self.builder.get_step_count()
+                self.build_step_index = 0
+                self.build_steps = self.builder.build_steps()
+                self.cancel_btn.setEnabled(True)
+                cmds.evalDeferred(self.run_next_build_step, lowestPriority=True)
             except Exception as e:
-                self.set_progress(text="Processing failed", value=100)
-                logging.error(e)
-                confirmDialog(message=e, button=["ok"], icon="critical")
+                self.on_build_failed(e)
+
+    def get_config(self) -> RigConfig:
+        """
+        Creates the build configuration from the UI
+
+        @rtype: RigConfig
+        @returns: The configuration of the selected meshes and build options
+        """
+
+        return RigConfig(
+            meshes=self.mesh_tree_list.get_selected_meshes(),
+            gui_path=self.select_gui_path.get_file_path(),
+            analog_gui_path=self.select_analog_gui_path.get_file_path(),
+            aas_path=self.select_aas_path.get_file_path(),
+            add_rig_logic=self.add_rig_logic(),
+            add_joints=self.add_joints(),
+            add_blend_shapes=self.add_blend_shapes(),
+            add_skin_cluster=self.add_skin_cluster(),
+            add_ctrl_attributes_on_root_joint=self.add_ctrl_attributes_on_root_joint(),
+            add_animated_map_attributes_on_root_joint=self.add_animated_map_attributes_on_root_joint(),
+            add_mesh_name_to_blend_shape_channel_name=self.add_mesh_name_to_blend_shape_channel_name(),
+            add_key_frames=self.add_key_frames(),
+            cost_calibration_path=os.path.join(
+                cmds.internalVar(userAppDir=True), BUILD_COSTS_FILE_NAME
+            ),
+        )
+
+    def schedule_build_estimate(self) -> None:
+        """
+        Updates the build estimate once the pending UI events are handled, so a change touching many widgets (e.g.
+        selecting all meshes) estimates the build only once, with the final enabled states of the options.
+        """
 
-            self.main_widget.setEnabled(True)
+        if not self.build_estimate_pending:
+            self.build_estimate_pending = True
+            QTimer.singleShot(0, self.update_build_estimate)
+
+    def update_build_estimate(self) -> None:
+        """Estimates the cost of building the selected meshes with the selected options, without touching the scene"""
+
+        self.build_estimate_pending = False
+        if self.dna is None or self.builder is not None:
+            return
+        try:
+            self.set_build_estimate(
+                RigBuilder(dna=self.dna, config=self.get_config()).plan()
+            )
+        except Exception as e:
+            logging.warning(f"Can't estimate the build. Reason: {e}")
+            self.build_estimate_label.setText("")
+
+    def set_build_estimate(self, plan: BuildPlan) -> None:
+        """
+        Shows the estimated cost of the build next to the process button
+
+        @type plan: BuildPlan
+        @param plan: The plan of the build
+        """
+
+        text = f"Estimated: {plan.get_summary()}"
+        if not self.dna_loaded:
+            text += " (meshes are counted once the DNA geometry is loaded)"
+        self.build_estimate_label.setText(text)
+
+    def run_next_build_step(self) -> None:
+        """
+        Runs the next unit of work of the build in progress and schedules the one after it, so Maya stays responsive
+        between the units of work.
+        """
+
+        if self.build_steps is None:
+            return
+
+        try:
+            step = next(self.build_steps)
+        except StopIteration:
+            self.finish_build()
+            self.set_progress(text="Processing completed", value=100)
+            return
+        except Exception as e:
+            self.on_build_failed(e)
+            return
+
+        self.build_step_index += 1
+        self.set_progress(
+            text=f"Processing in progress, {step.description}...",
+            value=int(100 * self.build_step_index / max(self.build_step_count, 1)),
+        )
+        cmds.evalDeferred(self.run_next_build_step, lowestPriority=True)
+
+    def on_cancel_clicked(self) -> None:
+        """The method that gets called when the cancel button is clicked, it stops the build in progress"""
+
+        if self.build_steps is None:
+            return
+
+        self.build_steps.close()
+        try:
+            self.builder.cancel()
+        finally:
+            self.finish_build()
+        self.set_progress(text="Processing canceled", value=0)
+
+    def on_build_failed(self, error: Exception) -> None:
+        self.finish_build()
+        self.set_progress(text="Processing failed", value=100)
+        logging.error(error)
+        confirmDialog(message=error, button=["ok"], icon="critical")
+
+    def finish_build(self) -> None:
+        self.build_steps = None
+        self.builder = None
+        self.cancel_btn.setEnabled(False)
+        self.set_build_controls_enabled(True)
+
+    def set_build_controls_enabled(self, enabled: bool) -> None:
+        """
+        Enables or disables the controls that can't be used while building, the controls that were already disabled
+        stay disabled.
+
+        @type enabled: bool
+        @param enabled: Represents if the controls should be enabled
+        """
+
+        if enabled:
+            for widget in self.disabled_widgets:
+                widget.setEnabled(True)
+            self.disabled_widgets = []
+            return
+
+        for widget in self.main_widget.findChildren(
+            QWidget, "", Qt.FindDirectChildrenOnly
+        ):
+            if widget.isEnabled() and widget not in (
+                self.cancel_btn,
+                self.progress_bar,
+            ):
+                widget.setEnabled(False)
+                self.disabled_widgets.append(widget)
 
     def set_progress(self, text: str = None, value: int = None) -> None:
         """Setting text and/or value to progress bar"""
@@ -553,6 +785,7 @@ class DnaViewerWindow(QMainWindow):
         self.select_aas_path = self.create_aas_selector()
         self.process_btn = self.create_process_btn()
         self.progress_bar = self.create_progress_bar()
+        self.cancel_btn = self.create_cancel_btn()
 
         return self.body
 
@@ -699,37 +932,121 @@ class DnaViewerWindow(QMainWindow):
 
     def on_load_dna_clicked(self, input: FileChooser) -> None:
         """
-        The method that gets called when a DNA file gets selected
+        The method that gets called when a DNA file gets selected, the DNA is loaded in the background
 
         @type input: FileChooser
         @param input: The file chooser object corresponding to the DNA selector widget
         """
 
+        dna_file_path = input.get_file_path()
+        if not dna_file_path:
+            return
+
         self.main_widget.setEnabled(False)
-        QCoreApplication.processEvents()
-        try:
-            dna_file_path = input.get_file_path()
-
-            if dna_file_path:
-                self.dna = DNA(dna_file_path, [Layer.definition])
-                lod_count = self.dna.get_lod_count()
-                names = self.get_mesh_names()
-                indices_names = self.get_lod_indices_names()
-                self.mesh_tree_list.fill_mesh_list(lod_count, names, indices_names)
-                self.joints_cb.setEnabled(True)
-                self.enable_additional_build_options(True)
-                self.process_btn.setEnabled(False)
-                self.mesh_tree_list.btn_select_all.setEnabled(True)
-                self.mesh_tree_list.btn_deselect_all.setEnabled(True)
-        except Exception as e:
-            dlg = QMessageBox()
-            dlg.setIcon(QMessageBox.Warning)
-            dlg.setWindowTitle("Error")
-            dlg.setText(str(e))
-            dlg.setStandardButtons(QMessageBox.Ok)
-            dlg.exec_()
+        self.dna_loaded = False
+        loader = DnaLoader(dna_file_path)
+        loader.signals.progress.connect(
+            lambda text, value: self.on_dna_progress(loader, text, value)
+        )
+        loader.signals.definition_loaded.connect(
+            lambda dna: self.on_dna_definition_loaded(loader, dna)
+        )
+        loader.signals.geometry_loaded.connect(
+            lambda dna: self.on_dna_geometry_loaded(loader, dna)
+        )
+        loader.signals.failed.connect(
+            lambda message: self.on_dna_load_failed(loader, message)
+        )
+        self.dna_loader = loader
+        QThreadPool.globalInstance().start(loader)
+
+    def on_dna_progress(self, loader: DnaLoader, text: str, value: int) -> None:
+        if loader is self.dna_loader:
+            self.set_progress(text=text, value=value)
 
+    def on_dna_definition_loaded(self, loader: DnaLoader, dna: DNA) -> None:
+        """
+        The method that gets called when the definition of the DNA is read, it fills the mesh list
+
+        @type loader: DnaLoader
+        @param loader: The worker that loaded the DNA
+
+        @type dna: DNA
+        @param dna: The DNA with the definition read
+        """
+
+        if loader is not self.dna_loader:
+            DNA_REGISTRY.release(dna)
+            return
+
+        self.set_dna(dna)
+        lod_count = self.dna.get_lod_count()
+        names = self.get_mesh_names()
+        indices_names = self.get_lod_indices_names()
+        self.mesh_tree_list.fill_mesh_list(lod_count, names, indices_names)
+        self.joints_cb.setEnabled(True)
+        self.enable_additional_build_options(True)
+        self.process_btn.setEnabled(False)
+        self.mesh_tree_list.btn_select_all.setEnabled(True)
+        self.mesh_tree_list.btn_deselect_all.setEnabled(True)
         self.main_widget.setEnabled(True)
+        self.update_build_estimate()
+
+    def on_dna_geometry_loaded(self, loader: DnaLoader, dna: DNA) -> None:
+        """
+        The method that gets called when all parts of the DNA are read, the shared DNA takes them over
+
+        @type loader: DnaLoader
+        @param loader: The worker that loaded the DNA
+
+        @type dna: DNA
+        @param dna: The DNA of the same file read by the worker
+        """
+
+        if loader is self.dna_loader and self.dna is not None:
+            self.dna.adopt(dna)
+            self.dna_loaded = True
+            self.set_progress(text=f"Loaded {dna.path}", value=100)
+            self.update_build_estimate()
+
+    def on_dna_load_failed(self, loader: DnaLoader, message: str) -> None:
+        if loader is not self.dna_loader:
+            return
+
+        self.set_progress(text="Loading DNA failed", value=100)
+        self.main_widget.setEnabled(True)
+        dlg = QMessageBox()
+        dlg.setIcon(QMessageBox.Warning)
+        dlg.setWindowTitle("Error")
+        dlg.setText(message)
+        dlg.setStandardButtons(QMessageBox.Ok)
+        dlg.exec_()
+
+    def wait_for_dna(self) -> None:
+        """
+        Waits for the background loading of the selected DNA to finish, then gets the fully loaded DNA from the DNA
+        registry. The DNA is loaded here only if the background loading did not load it or the file changed since.
+        """
+
+        dna_file_path = self.select_dna_path.get_file_path()
+        if self.dna and self.dna.path == dna_file_path and not self.dna_loaded:
+            self.set_progress(text="Waiting for the DNA to load...")
+            self.dna_loader.finished.wait()
+            QCoreApplication.processEvents()
+        self.set_dna(DNA_REGISTRY.acquire(dna_file_path))
+        self.dna_loaded = True
+
+    def set_dna(self, dna: DNA) -> None:
+        """
+        Sets the DNA used by the window, the previously used DNA is released to the DNA registry
+
+        @type dna: DNA
+        @param dna: The DNA acquired from the DNA registry
+        """
+
+        if self.dna is not None:
+            DNA_REGISTRY.release(self.dna)
+        self.dna = dna
 
     def get_mesh_names(self) -> List[str]:
         """Reads in the meshes of the definition"""
@@ -873,6 +1190,7 @@ class DnaViewerWindow(QMainWindow):
             "rig logic",
             "Add RigLogic to rig. Requires: DNA to be loaded, all meshes to be checked, joints, skin, blend shapes to be checked, also gui, analog gui and additional assemble script must be set",
             layout,
+            lambda _: self.schedule_build_estimate(),
         )
         layout.addStretch()
 
@@ -893,6 +1211,7 @@ class DnaViewerWindow(QMainWindow):
             "ctrl attributes on root joint",
             "ctrl attributes on root joint",
             layout,
+            lambda _: self.schedule_build_estimate(),
             enabled=True,
             checked=True,
         )
@@ -900,6 +1219,7 @@ class DnaViewerWindow(QMainWindow):
             "animated map attributes on root joint",
             "animated map attributes on root joint",
             layout,
+            lambda _: self.schedule_build_estimate(),
             enabled=True,
             checked=True,
         )
@@ -907,6 +1227,7 @@ class DnaViewerWindow(QMainWindow):
             "mesh name to blend shape channel name",
             "mesh name to blend shape channel name",
             layout,
+            lambda _: self.schedule_build_estimate(),
             enabled=True,
             checked=True,
         )
@@ -914,6 +1235,7 @@ class DnaViewerWindow(QMainWindow):
             "key frames",
             "Add keyframes to rig",
             layout,
+            lambda _: self.schedule_build_estimate(),
             enabled=True,
             checked=True,
         )
@@ -999,6 +1321,35 @@ class DnaViewerWindow(QMainWindow):
         btn = QPushButton("Process")
         btn.setEnabled(False)
         btn.clicked.connect(self.process)
+        self.build_estimate_label = QLabel("")
+        self.build_estimate_label.setToolTip(
+            "Estimated duration and memory of building the selected meshes with the selected options"
+        )
+
+        widget = QWidget()
+        layout = QHBoxLayout(widget)
+        layout.addWidget(btn, 1)
+        layout.addWidget(self.build_estimate_label)
+        layout.setContentsMargins(
+            MARGIN_HEADER_LEFT,
+            MARGIN_HEADER_TOP,
+            MARGIN_HEADER_RIGHT,
+            MARGIN_HEADER_BOTTOM,
+        )
+        self.body.addWidget(widget)
+        return btn
+
+    def create_cancel_btn(self) -> QPushButton:
+        """
+        Creates and adds a cancel button, it is enabled only while building
+
+        @rtype: QPushButton
+        @returns: The created cancel button
+        """
+
+        btn = QPushButton("Cancel")
+        btn.setEnabled(False)
+        btn.clicked.connect(self.on_cancel_clicked)
 
         self.body.addWidget(btn)
         return btn
@@ -1031,6 +1382,7 @@ class DnaViewerWindow(QMainWindow):
         """
 
         self.set_riglogic_cb_enabled()
+        self.schedule_build_estimate()
 
     def is_enabled_and_checked(self, check_box: QCheckBox) -> bool:
         """
@@ -0,0 +1,820 @@
+"""
+Validates the consistency of DNA files and reports all findings at once.
+
+- usage in command line:
+    python -m dna_viewer.validation Ada.dna Taro.dna --workers 8 --json report.json
+
+The meshes are validated in parallel by a thread pool, every check runs on whole arrays read with the bulk getters of
+the DNA reader. The validator loads the DNA file again with DataLayer_All if the reader was opened with less, so the
+geometry and behavior are checked whatever layers were read. The exit code of the command line is 1 if any DNA has
+errors.
+"""
+
+import argparse
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+from dna import DataLayer_All
+
+from .dnalib.dnalib import DNA
+from .dnalib.layer import Layer
+
+SEVERITY_ERROR = "error"
+SEVERITY_WARNING = "warning"
+
+CHECK_LAYOUT_INDICES = "layout_indices"
+CHECK_FACE_INDICES = "face_indices"
+CHECK_FACE_SIZES = "face_sizes"
+CHECK_FINITE_VALUES = "finite_values"
+CHECK_SKIN_WEIGHT_COUNT = "skin_weight_count"
+CHECK_SKIN_WEIGHT_INDICES = "skin_weight_indices"
+CHECK_SKIN_WEIGHT_SUMS = "skin_weight_sums"
+CHECK_MAXIMUM_INFLUENCES = "maximum_influences"
+CHECK_BLEND_SHAPE_INDICES = "blend_shape_indices"
+CHECK_JOINT_HIERARCHY = "joint_hierarchy"
+CHECK_LOD_MAPPING = "lod_mapping"
+CHECK_BEHAVIOR_INDICES = "behavior_indices"
+
+DEFAULT_WEIGHT_TOLERANCE = 1e-3
+# The number of offending indices kept in a finding
+EXAMPLE_COUNT = 5
+
+
+@dataclass
+class Finding:
+    """
+    A model class for holding a single finding of a check
+
+    Attributes
+    ----------
+    @type check: str
+    @param check: The name of the check
+
+    @type severity: str
+    @param severity: error or warning
+
+    @type message: str
+    @param message: The description of the finding
+
+    @type mesh: Optional[str]
+    @param mesh: The name of the mesh, None for findings outside of the geometry
+
+    @type count: int
+    @param count: The number of offending elements
+
+    @type examples: List[int]
+    @param examples: The indices of the first offending elements
+    """
+
+    check: str
+    severity: str
+    message: str
+    mesh: Optional[str] = field(default=None)
+    count: int = field(default=1)
+    examples: List[int] = field(default_factory=list)
+
+
+@dataclass
+class ValidationReport:
+    """
+    A model class for holding the findings of validating a DNA
+
+    Attributes
+    ----------
+    @type path: str
+    @param path: The path of the DNA
+
+    @type findings: List[Finding]
+    @param findings: The findings of all checks
+
+    @type duration: float
+    @param duration: The time spent validating in seconds
+    """
+
+    path: str
+    findings: List[Finding] = field(default_factory=list)
+    duration: float = field(default=0.0)
+
+    @property
+    def errors(self) -> List[Finding]:
+        return [
+            finding for finding in self.findings if finding.severity == SEVERITY_ERROR
+        ]
+
+    @property
+    def warnings(self) -> List[Finding]:
+        return [
+            finding for finding in self.findings if finding.severity == SEVERITY_WARNING
+        ]
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = asdict(self)
+        result["is_valid"] = self.is_valid
+        return result
+
+    def format(self) -> str:
+        lines = [
+            f"{self.path}: {len(self.errors)} errors, {len(self.warnings)} warnings"
+            f" ({self.duration:.2f}s)"
+        ]
+        for finding in self.findings:
+            location = f"{finding.mesh}: " if finding.mesh else ""
+            examples = f" e.g. {finding.examples}" if finding.examples else ""
+            lines.append(
+                f"  {finding.severity} [{finding.check}] {location}{finding.message}"
+                f" ({finding.count}){examples}"
+            )
+        return "\n".join(lines)
+
+
+def find_invalid(
+    findings: List[Finding],
+    check: str,
+    invalid: np.ndarray,
+    message: str,
+    mesh: Optional[str] = None,
+    severity: str = SEVERITY_ERROR,
+    owners: Optional[np.ndarray] = None,
+) -> None:
+    """
+    Adds a finding if any element is invalid.
+
+    @type findings: List[Finding]
+    @param findings: The findings the finding is added to
+
+    @type check: str
+    @param check: The name of the check
+
+    @type invalid: np.ndarray
+    @param invalid: The mask of invalid elements
+
+    @type message: str
+    @param message: The description of the finding
+
+    @type mesh: Optional[str]
+    @param mesh: The name of the checked mesh
+
+    @type severity: str
+    @param severity: error or warning
+
+    @type owners: Optional[np.ndarray]
+    @param owners: The index of the face or vertex every element of a flattened array belongs to, the finding counts
+        and lists the owners of invalid elements if given
+    """
+
+    indices = np.flatnonzero(invalid)
+    if owners is not None:
+        indices = np.unique(owners[indices])
+    if len(indices):
+        findings.append(
+            Finding(
+                check=check,
+                severity=severity,
+                message=message,
+                mesh=mesh,
+                count=len(indices),
+                examples=indices[:EXAMPLE_COUNT].tolist(),
+            )
+        )
+
+
+def find_out_of_range(
+    findings: List[Finding],
+    check: str,
+    indices: Any,
+    count: int,
+    message: str,
+    mesh: Optional[str] = None,
+    owners: Optional[np.ndarray] = None,
+) -> None:
+    """Adds a finding if any index is outside of [0, count), see find_invalid for the owners"""
+
+    indices = np.asarray(indices, dtype=np.int64)
+    find_invalid(
+        findings,
+        check,
+        (indices < 0) | (indices >= count),
+        f"{message} outside of [0, {count})",
+        mesh,
+        owners=owners,
+    )
+
+
+def find_non_finite(
+    findings: List[Finding],
+    values: Any,
+    message: str,
+    mesh: Optional[str] = None,
+    owners: Optional[np.ndarray] = None,
+) -> None:
+    """Adds a finding if any value or row of values is NaN or infinite, see find_invalid for the owners"""
+
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim > 1:
+        values = values.reshape(len(values), -1)
+        invalid = ~np.isfinite(values).all(axis=1)
+    else:
+        invalid = ~np.isfinite(values)
+    find_invalid(
+        findings,
+        CHECK_FINITE_VALUES,
+        invalid,
+        f"{message} not finite",
+        mesh,
+        owners=owners,
+    )
+
+
+class DNAValidator:
+    """
+    A class used for validating a DNA.
+
+    Attributes
+    ----------
+    @type dna: DNA
+    @param dna: The validated DNA
+
+    @type weight_tolerance: float
+    @param weight_tolerance: The allowed difference of the skin weight sum of a vertex from 1
+
+    @type workers: Optional[int]
+    @param workers: The number of threads validating the meshes, chosen by ThreadPoolExecutor if None
+    """
+
+    def __init__(
+        self,
+        dna: DNA,
+        weight_tolerance: float = DEFAULT_WEIGHT_TOLERANCE,
+        workers: Optional[int] = None,
+    ) -> None:
+        dna.load_data_layer(DataLayer_All)
+        self.dna = dna
+        self.reader = dna.reader
+        self.weight_tolerance = weight_tolerance
+        self.workers = workers
+
+    def validate(self) -> ValidationReport:
+        start = time.perf_counter()
+        report = ValidationReport(path=self.dna.path)
+        checks: List[Callable[[List[Finding]], None]] = [
+            self.validate_joint_hierarchy,
+            self.validate_lod_mapping,
+            self.validate_behavior,
+        ]
+        for check in checks:
+            check(report.findings)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            report.findings.extend(
+                chain.from_iterable(
+                    executor.map(self.validate_mesh, range(self.dna.get_mesh_count()))
+                )
+            )
+        report.duration = time.perf_counter() - start
+        return report
+
+    def get_control_count(self) -> int:
+        """Gets the number of inputs of the behavior, the raw controls followed by the PSD controls"""
+
+        return self.dna.get_raw_control_count() + self.dna.get_psd_count()
+
+    def validate_joint_hierarchy(self, findings: List[Finding]) -> None:
+        """Checks that the parent indices form a tree, roots are their own parents"""
+
+        joint_count = self.dna.get_joint_count()
+        parents = np.array(
+            [self.reader.getJointParentIndex(index) for index in range(joint_count)],
+            dtype=np.int64,
+        )
+        if not joint_count:
+            return
+        find_out_of_range(
+            findings, CHECK_JOINT_HIERARCHY, parents, joint_count, "Joint parents"
+        )
+        parents = np.where((parents < 0) | (parents >= joint_count), 0, parents)
+        roots = np.flatnonzero(parents == np.arange(joint_count))
+        if not len(roots):
+            findings.append(
+                Finding(CHECK_JOINT_HIERARCHY, SEVERITY_ERROR, "No root joint")
+            )
+        elif len(roots) > 1:
+            findings.append(
+                Finding(
+                    CHECK_JOINT_HIERARCHY,
+                    SEVERITY_WARNING,
+                    "Multiple root joints",
+                    count=len(roots),
+                    examples=roots[:EXAMPLE_COUNT].tolist(),
+                )
+            )
+
+        # every joint reaches its root in at most joint count steps, doubling the steps on every jump
+        ancestors = parents.copy()
+        for _ in range(int(np.ceil(np.log2(joint_count))) + 1):
+            ancestors = ancestors[ancestors]
+        find_invalid(
+            findings,
+            CHECK_JOINT_HIERARCHY,
+            parents[ancestors] != ancestors,
+            "Joints in or under a parent cycle",
+        )
+
+    def validate_lod_mapping(self, findings: List[Finding]) -> None:
+        """Checks that the members of every LOD are in range and the LOD counts of the behavior match"""
+
+        lod_count = self.dna.get_lod_count()
+        sources = [
+            ("Joint", self.dna.get_joint_count(), self.dna.get_joint_indices_for_lod),
+            ("Mesh", self.dna.get_mesh_count(), self.dna.get_mesh_indices_for_lod),
+            (
+                "Blend shape channel",
+                self.dna.get_blend_shape_channel_count(),
+                self.dna.get_blend_shape_channel_indices_for_lod,
+            ),
+            (
+                "Animated map",
+                self.dna.get_animated_map_count(),
+                self.dna.get_animated_map_indices_for_lod,
+            ),
+        ]
+        for kind, count, get_indices in sources:
+            members = np.zeros(count, dtype=bool)
+            for lod in range(lod_count):
+                indices = np.asarray(get_indices(lod), dtype=np.int64)
+                find_out_of_range(
+                    findings,
+                    CHECK_LOD_MAPPING,
+                    indices,
+                    count,
+                    f"{kind} indices of lod{lod}",
+                )
+                members[indices[(indices >= 0) & (indices < count)]] = True
+            find_invalid(
+                findings,
+                CHECK_LOD_MAPPING,
+                ~members,
+                f"{kind}s not in any LOD",
+                severity=SEVERITY_WARNING,
+            )
+
+        for name, lods, output_count in (
+            (
+                "Blend shape channel",
+                self.dna.get_blend_shape_channel_lods(),
+                len(self.dna.get_blend_shape_channel_output_indices()),
+            ),
+            (
+                "Animated map",
+                self.dna.get_animated_map_lods(),
+                len(self.dna.get_animated_map_output_indices()),
+            ),
+        ):
+            if len(lods) != lod_count:
+                findings.append(
+                    Finding(
+                        CHECK_LOD_MAPPING,
+                        SEVERITY_ERROR,
+                        f"{name} LOD count {len(lods)} doesn't match LOD count {lod_count}",
+                    )
+                )
+            find_out_of_range(
+                findings,
+                CHECK_LOD_MAPPING,
+                lods,
+                output_count + 1,
+                f"{name} output counts of LODs",
+            )
+
+        mapping_count = self.dna.get_mesh_blend_shape_channel_mapping_count()
+        mappings = [
+            self.dna.get_mesh_blend_shape_channel_mapping(index)
+            for index in range(mapping_count)
+        ]
+        find_out_of_range(
+            findings,
+            CHECK_LOD_MAPPING,
+            [mapping.meshIndex for mapping in mappings],
+            self.dna.get_mesh_count(),
+            "Mesh indices of blend shape channel mappings",
+        )
+        find_out_of_range(
+            findings,
+            CHECK_LOD_MAPPING,
+            [mapping.blendShapeChannelIndex for mapping in mappings],
+            self.dna.get_blend_shape_channel_count(),
+            "Blend shape channel indices of blend shape channel mappings",
+        )
+        for lod in range(lod_count):
+            find_out_of_range(
+                findings,
+                CHECK_LOD_MAPPING,
+                self.dna.get_mesh_blend_shape_channel_mapping_for_lod(lod),
+                mapping_count,
+                f"Blend shape channel mappings of lod{lod}",
+            )
+
+    def validate_behavior(self, findings: List[Finding]) -> None:
+        """Checks that the inputs and outputs of the behavior point to existing controls, joints, channels and maps"""
+
+        control_count = self.get_control_count()
+        for name, inputs, input_count, outputs, output_count in (
+            (
+                "GUI to raw",
+                self.dna.get_gui_to_raw_input_indices(),
+                self.dna.get_gui_control_count(),
+                self.dna.get_gui_to_raw_output_indices(),
+                self.dna.get_raw_control_count(),
+            ),
+            (
+                "PSD",
+                self.dna.get_psd_column_indices(),
+                control_count,
+                self.dna.get_psd_row_indices(),
+                control_count,
+            ),
+            (
+                "Blend shape channel",
+                self.dna.get_blend_shape_channel_input_indices(),
+                control_count,
+                self.dna.get_blend_shape_channel_output_indices(),
+                self.dna.get_blend_shape_channel_count(),
+            ),
+            (
+                "Animated map",
+                self.dna.get_animated_map_input_indices(),
+                control_count,
+                self.dna.get_animated_map_output_indices(),
+                self.dna.get_animated_map_count(),
+            ),
+        ):
+            if len(inputs) != len(outputs):
+                findings.append(
+                    Finding(
+                        CHECK_BEHAVIOR_INDICES,
+                        SEVERITY_ERROR,
+                        f"{name} has {len(inputs)} inputs and {len(outputs)} outputs",
+                    )
+                )
+            find_out_of_range(
+                findings,
+                CHECK_BEHAVIOR_INDICES,
+                inputs,
+                input_count,
+                f"{name} input indices",
+            )
+            find_out_of_range(
+                findings,
+                CHECK_BEHAVIOR_INDICES,
+                outputs,
+                output_count,
+                f"{name} output indices",
+            )
+        find_non_finite(findings, self.dna.get_psd_values(), "PSD values")
+
+        joint_row_count = self.dna.get_joint_row_count()
+        for joint_group_index in range(self.dna.get_joint_group_count()):
+            name = f"Joint group {joint_group_index}"
+            inputs = self.dna.get_joint_group_input_indices(joint_group_index)
+            outputs = self.dna.get_joint_group_output_indices(joint_group_index)
+            values = self.dna.get_joint_group_values(joint_group_index)
+            if len(values) != len(inputs) * len(outputs):
+                findings.append(
+                    Finding(
+                        CHECK_BEHAVIOR_INDICES,
+                        SEVERITY_ERROR,
+                        f"{name} has {len(values)} values for {len(inputs)} inputs and {len(outputs)} outputs",
+                    )
+                )
+            find_out_of_range(
+                findings,
+                CHECK_BEHAVIOR_INDICES,
+                inputs,
+                control_count,
+                f"{name} input indices",
+            )
+            find_out_of_range(
+                findings,
+                CHECK_BEHAVIOR_INDICES,
+                outputs,
+                joint_row_count,
+                f"{name} output indices",
+            )
+            find_out_of_range(
+                findings,
+                CHECK_BEHAVIOR_INDICES,
+                self.dna.get_joint_group_joint_indices(joint_group_index),
+                self.dna.get_joint_count(),
+                f"{name} joint indices",
+            )
+            find_non_finite(findings, values, f"{name} values")
+
+    def validate_mesh(self, mesh_index: int) -> List[Finding]:
+        """
+        Runs the checks of a single mesh.
+
+        @type mesh_index: int
+        @param mesh_index: The mesh index
+
+        @rtype: List[Finding]
+        @returns: The findings of the mesh
+        """
+
+        findings: List[Finding] = []
+        mesh = self.dna.get_mesh_name(mesh_index)
+        reader = self.reader
+        position_count = reader.getVertexPositionCount(mesh_index)
+        texture_coordinate_count = reader.getVertexTextureCoordinateCount(mesh_index)
+        layout_count = reader.getVertexLayoutCount(mesh_index)
+
+        find_non_finite(
+            findings,
+            np.column_stack(
+                (
+                    reader.getVertexPositionXs(mesh_index),
+                    reader.getVertexPositionYs(mesh_index),
+                    reader.getVertexPositionZs(mesh_index),
+                )
+            ).reshape(-1, 3),
+            "Vertex positions",
+            mesh,
+        )
+        find_non_finite(
+            findings,
+            np.column_stack(
+                (
+                    reader.getVertexTextureCoordinateUs(mesh_index),
+                    reader.getVertexTextureCoordinateVs(mesh_index),
+                )
+            ).reshape(-1, 2),
+            "Texture coordinates",
+            mesh,
+        )
+
+        find_out_of_range(
+            findings,
+            CHECK_LAYOUT_INDICES,
+            reader.getVertexLayoutPositionIndices(mesh_index),
+            position_count,
+            "Position indices of vertex layouts",
+            mesh,
+        )
+        find_out_of_range(
+            findings,
+            CHECK_LAYOUT_INDICES,
+            reader.getVertexLayoutTextureCoordinateIndices(mesh_index),
+            texture_coordinate_count,
+            "Texture coordinate indices of vertex layouts",
+            mesh,
+        )
+
+        faces = [
+            reader.getFaceVertexLayoutIndices(mesh_index, face_index)
+            for face_index in range(reader.getFaceCount(mesh_index))
+        ]
+        face_counts = np.fromiter(map(len, faces), dtype=np.int64, count=len(faces))
+        find_invalid(
+            findings,
+            CHECK_FACE_SIZES,
+            face_counts < 3,
+            "Faces with less than 3 vertices",
+            mesh,
+        )
+        face_layouts = np.fromiter(
+            chain.from_iterable(faces), dtype=np.int64, count=int(face_counts.sum())
+        )
+        find_out_of_range(
+            findings,
+            CHECK_FACE_INDICES,
+            face_layouts,
+            layout_count,
+            "Faces with vertex layout indices",
+            mesh,
+            owners=np.repeat(np.arange(len(faces)), face_counts),
+        )
+
+        self.validate_skin_weights(findings, mesh_index, mesh, position_count)
+        self.validate_blend_shapes(findings, mesh_index, mesh, position_count)
+        return findings
+
+    def validate_skin_weights(
+        self, findings: List[Finding], mesh_index: int, mesh: str, position_count: int
+    ) -> None:
+        reader = self.reader
+        vertex_count = reader.getSkinWeightsCount(mesh_index)
+        if vertex_count != position_count:
+            findings.append(
+                Finding(
+                    CHECK_SKIN_WEIGHT_COUNT,
+                    SEVERITY_ERROR,
+                    f"Skin weights of {vertex_count} vertices for {position_count} vertex positions",
+                    mesh,
+                )
+            )
+        if not vertex_count:
+            return
+
+        joint_indices = [
+            reader.getSkinWeightsJointIndices(mesh_index, vertex_index)
+            for vertex_index in range(vertex_count)
+        ]
+        weights = [
+            reader.getSkinWeightsValues(mesh_index, vertex_index)
+            for vertex_index in range(vertex_count)
+        ]
+        influence_counts = np.fromiter(
+            map(len, joint_indices), dtype=np.int64, count=vertex_count
+        )
+        weight_counts = np.fromiter(
+            map(len, weights), dtype=np.int64, count=vertex_count
+        )
+        find_invalid(
+            findings,
+            CHECK_SKIN_WEIGHT_COUNT,
+            influence_counts != weight_counts,
+            "Vertices with different joint index and weight counts",
+            mesh,
+        )
+        find_invalid(
+            findings,
+            CHECK_SKIN_WEIGHT_COUNT,
+            influence_counts == 0,
+            "Vertices without influences",
+            mesh,
+        )
+        maximum_influences = reader.getMaximumInfluencePerVertex(mesh_index)
+        find_invalid(
+            findings,
+            CHECK_MAXIMUM_INFLUENCES,
+            influence_counts > maximum_influences,
+            f"Vertices with more than {maximum_influences} influences",
+            mesh,
+        )
+
+        joint_owners = np.repeat(np.arange(vertex_count), influence_counts)
+        weight_owners = np.repeat(np.arange(vertex_count), weight_counts)
+        flat_joints = np.fromiter(
+            chain.from_iterable(joint_indices),
+            dtype=np.int64,
+            count=int(influence_counts.sum()),
+        )
+        find_out_of_range(
+            findings,
+            CHECK_SKIN_WEIGHT_INDICES,
+            flat_joints,
+            self.dna.get_joint_count(),
+            "Vertices with skin weight joint indices",
+            mesh,
+            owners=joint_owners,
+        )
+        flat_weights = np.fromiter(
+            chain.from_iterable(weights),
+            dtype=np.float64,
+            count=int(weight_counts.sum()),
+        )
+        find_non_finite(
+            findings, flat_weights, "Skin weights of vertices", mesh, weight_owners
+        )
+        find_invalid(
+            findings,
+            CHECK_SKIN_WEIGHT_SUMS,
+            flat_weights < 0,
+            "Vertices with negative skin weights",
+            mesh,
+            owners=weight_owners,
+        )
+        sums = np.bincount(
+            weight_owners,
+            weights=flat_weights,
+            minlength=vertex_count,
+        )
+        find_invalid(
+            findings,
+            CHECK_SKIN_WEIGHT_SUMS,
+            np.abs(sums - 1.0) > self.weight_tolerance,
+            "Vertices whose skin weights don't sum to 1",
+            mesh,
+        )
+
+    def validate_blend_shapes(
+        self, findings: List[Finding], mesh_index: int, mesh: str, position_count: int
+    ) -> None:
+        reader = self.reader
+        target_count = reader.getBlendShapeTargetCount(mesh_index)
+        channels = [
+            reader.getBlendShapeChannelIndex(mesh_index, target_index)
+            for target_index in range(target_count)
+        ]
+        find_out_of_range(
+            findings,
+            CHECK_BLEND_SHAPE_INDICES,
+            channels,
+            self.dna.get_blend_shape_channel_count(),
+            "Blend shape channel indices of targets",
+            mesh,
+        )
+        for target_index in range(target_count):
+            vertex_indices = np.asarray(
+                reader.getBlendShapeTargetVertexIndices(mesh_index, target_index),
+                dtype=np.int64,
+            )
+            find_out_of_range(
+                findings,
+                CHECK_BLEND_SHAPE_INDICES,
+                vertex_indices,
+                position_count,
+                f"Vertex indices of target {target_index}",
+                mesh,
+            )
+            find_invalid(
+                findings,
+                CHECK_BLEND_SHAPE_INDICES,
+                np.diff(vertex_indices) <= 0,
+                f"Vertex indices of target {target_index} not increasing",
+                mesh,
+                SEVERITY_WARNING,
+            )
+            deltas = np.column_stack(
+                (
+                    reader.getBlendShapeTargetDeltaXs(mesh_index, target_index),
+                    reader.getBlendShapeTargetDeltaYs(mesh_index, target_index),
+                    reader.getBlendShapeTargetDeltaZs(mesh_index, target_index),
+                )
+            ).reshape(-1, 3)
+            if len(deltas) != len(vertex_indices):
+                findings.append(
+                    Finding(
+                        CHECK_BLEND_SHAPE_INDICES,
+                        SEVERITY_ERROR,
+                        f"Target {target_index} has {len(deltas)} deltas for {len(vertex_indices)} vertex indices",
+                        mesh,
+                    )
+                )
+            find_non_finite(findings, deltas, f"Deltas of target {target_index}", mesh)
+
+
+def validate_dna(
+    dna: DNA,
+    weight_tolerance: float = DEFAULT_WEIGHT_TOLERANCE,
+    workers: Optional[int] = None,
+) -> ValidationReport:
+    """
+    Validates the DNA, all checks run and their findings are collected in a single report.
+
+    @type dna: DNA
+    @param dna: Instance of DNA, the checks read all data layers through its reader
+
+    @type weight_tolerance: float
+    @param weight_tolerance: The allowed difference of the skin weight sum of a vertex from 1
+
+    @type workers: Optional[int]
+    @param workers: The number of threads validating the meshes
+
+    @rtype: ValidationReport
+    @returns: The findings
+    """
+
+    return DNAValidator(dna, weight_tolerance, workers).validate()
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Validates DNA files.")
+    parser.add_argument("inputs", nargs="+", help="paths of the DNA files")
+    parser.add_argument(
+        "--weight-tolerance",
+        type=float,
+        default=DEFAULT_WEIGHT_TOLERANCE,
+        help="allowed difference of the skin weight sum of a vertex from 1",
+    )
+    parser.add_argument("--workers", type=int, help="number of threads")
+    parser.add_argument("--json", help="path of the JSON report")
+    args = parser.parse_args(arguments)
+
+    logging.basicConfig(level=logging.INFO)
+    reports = []
+    for input_path in args.inputs:
+        report = validate_dna(
+            DNA(input_path, layers=[Layer.definition], data_layer=DataLayer_All),
+            args.weight_tolerance,
+            args.workers,
+        )
+        print(report.format())
+        reports.append(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump([report.to_dict() for report in reports], file, indent=2)
+    invalid = len([report for report in reports if not report.is_valid])
+    logging.info(f"{len(reports) - invalid}/{len(reports)} DNA files are valid")
+    return 1 if invalid else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
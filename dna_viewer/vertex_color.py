@@ -0,0 +1,159 @@
+import json
+import struct
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .common import DNAViewerError
+
+VERTEX_COLOR_MAGIC = b"DNAVTXC\0"
+VERTEX_COLOR_VERSION = 1
+VERTEX_COLOR_HEADER = struct.Struct("<8sII")
+VERTEX_COLOR_ALIGNMENT = 16
+
+
+class VertexColors:
+    """
+    A read only view of a vertex color file. The colors of all meshes are stored as one contiguous block of float32
+    RGBA values, which is memory mapped, so only the colors of the meshes actually used are read from disk.
+
+    Attributes
+    ----------
+    @type path: str
+    @param path: The path of the vertex color file
+
+    @type shader_mapping: Dict[str, List[str]]
+    @param shader_mapping: The names of the meshes using each shader
+
+    @type mesh_ranges: Dict[str, slice]
+    @param mesh_ranges: The range of the color block holding the colors of each mesh
+
+    @type colors: np.memmap
+    @param colors: The (N, 4) memory mapped array of the colors of all meshes
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as file:
+            magic, version, header_size = VERTEX_COLOR_HEADER.unpack(
+                file.read(VERTEX_COLOR_HEADER.size)
+            )
+            if magic != VERTEX_COLOR_MAGIC:
+                raise DNAViewerError(f"{path} is not a vertex color file!")
+            if version != VERTEX_COLOR_VERSION:
+                raise DNAViewerError(
+                    f"Unsupported vertex color file version {version} in {path}!"
+                )
+            header = json.loads(file.read(header_size).decode("utf-8"))
+
+        self.shader_mapping: Dict[str, List[str]] = header["shaders"]
+        self.mesh_ranges: Dict[str, slice] = {}
+        for mesh in header["meshes"]:
+            self.mesh_ranges[mesh["name"]] = slice(
+                mesh["start"], mesh["start"] + mesh["count"]
+            )
+        self.colors = np.memmap(
+            path,
+            dtype="<f4",
+            mode="r",
+            offset=header["data_offset"],
+            shape=(header["color_count"], 4),
+        )
+
+    def get_mesh_names(self) -> List[str]:
+        """
+        Gets the names of the meshes that have vertex colors, in the order they were written.
+
+        @rtype: List[str]
+        @returns: The mesh names
+        """
+
+        return list(self.mesh_ranges.keys())
+
+    def get_colors(self, mesh_name: str) -> Optional[np.ndarray]:
+        """
+        Gets the vertex colors of the mesh without copying them.
+
+        @type mesh_name: str
+        @param mesh_name: The mesh name
+
+        @rtype: Optional[np.ndarray]
+        @returns: The (V, 4) array of RGBA colors indexed by vertex id, None if the mesh has no vertex colors
+        """
+
+        mesh_range = self.mesh_ranges.get(mesh_name)
+        if mesh_range is None:
+            return None
+        return self.colors[mesh_range]
+
+    def get_mesh_names_for_lod(self, lod: int) -> List[str]:
+        """
+        Gets the names of the meshes of the given LOD that have vertex colors.
+
+        @type lod: int
+        @param lod: The LOD
+
+        @rtype: List[str]
+        @returns: The mesh names
+        """
+
+        return [name for name in self.mesh_ranges if f"lod{lod}" in name]
+
+
+def write_vertex_colors(
+    path: str,
+    mesh_colors: Dict[str, np.ndarray],
+    shader_mapping: Optional[Dict[str, List[str]]] = None,
+) -> None:
+    """
+    Writes a vertex color file readable by VertexColors.
+
+    @type path: str
+    @param path: The path of the vertex color file
+
+    @type mesh_colors: Dict[str, np.ndarray]
+    @param mesh_colors: The (V, 3) RGB or (V, 4) RGBA colors of each mesh, indexed by vertex id. Alpha defaults to 1.
+
+    @type shader_mapping: Optional[Dict[str, List[str]]]
+    @param shader_mapping: The names of the meshes using each shader
+    """
+
+    blocks = []
+    meshes = []
+    start = 0
+    for name, colors in mesh_colors.items():
+        colors = np.asarray(colors, dtype=np.float32).reshape(len(colors), -1)
+        if colors.shape[1] not in (3, 4):
+            raise DNAViewerError(
+                f"Vertex colors of mesh {name} must have 3 or 4 components!"
+            )
+        if colors.shape[1] == 3:
+            colors = np.hstack([colors, np.ones((len(colors), 1), dtype=np.float32)])
+        blocks.append(colors)
+        meshes.append({"name": name, "start": start, "count": len(colors)})
+        start += len(colors)
+
+    header = {
+        "shaders": shader_mapping or {},
+        "meshes": meshes,
+        "color_count": start,
+        "data_offset": 0,
+    }
+    # The data offset is part of the header, so the header is sized with a placeholder of the final width first
+    header["data_offset"] = 10**12
+    header_size = len(json.dumps(header).encode("utf-8"))
+    data_offset = VERTEX_COLOR_HEADER.size + header_size
+    data_offset += -data_offset % VERTEX_COLOR_ALIGNMENT
+    header["data_offset"] = data_offset
+    encoded_header = json.dumps(header).encode("utf-8").ljust(header_size)
+
+    with open(path, "wb") as file:
+        file.write(
+            VERTEX_COLOR_HEADER.pack(
+                VERTEX_COLOR_MAGIC, VERTEX_COLOR_VERSION, header_size
+            )
+        )
+        file.write(encoded_header)
+        file.write(b"\0" * (data_offset - file.tell()))
+        for block in blocks:
+            file.write(block.astype("<f4").tobytes())
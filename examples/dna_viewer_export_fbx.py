@@ -7,6 +7,13 @@ IMPORTANT: You have to setup the environment before running this example. Please
     mayapy dna_viewer_export_fbx.py
     NOTE: Script cannot be called with Python, it must be called with mayapy.
 
+- parallel usage in command line:
+    mayapy dna_viewer_export_fbx.py --workers 4
+    Every LOD is exported in its own mayapy batch process, running at most the given number of processes at once.
+    Pass `--workers 0` to use one process per CPU core. Timings and failures are reported per LOD at the end.
+    The path of mayapy is taken from the MAYAPY environment variable, or next to the running mayapy.
+    NOTE: Workers are started as `mayapy dna_viewer_export_fbx.py --lod X --dna <path>`, which exports a single LOD.
+
 - usage in Maya:
     1. copy whole content of this file to Maya Script Editor
     2. change value of ROOT_DIR to absolute path of dna_calibration, e.g. `c:/dna_calibration` in Windows or `/home/user/dna_calibration`. Important:
@@ -28,6 +35,7 @@ NOTE: If OUTPUT_DIR does not exist, it will be created.
 """
 
 
+from argparse import ArgumentParser
 from os import makedirs
 from os import path as ospath
 from pathlib import Path
@@ -71,7 +79,6 @@ from dna import (
 )
 from dnacalib import DNACalibDNAReader, RotateCommand
 from maya import cmds, mel
-from vtx_color import MESH_SHADER_MAPPING, VTX_COLOR_MESHES, VTX_COLOR_VALUES
 
 from dna_viewer import (
     DNA,
@@ -80,6 +87,11 @@ from dna_viewer import (
     get_skin_weights_from_scene,
     set_skin_weights_to_scene,
 )
+from dna_viewer.batch import export_lods_in_parallel
+from dna_viewer.builder.maya.vertex_color import set_all_vertex_colors_to_scene
+from dna_viewer.vertex_color import VertexColors
+
+VERTEX_COLORS = VertexColors(f"{DATA_DIR}/vtx_color.bin")
 
 
 def load_dna_reader():
@@ -233,7 +245,7 @@ def create_shader(name):
 
 
 def add_shader():
-    for shader_name, meshes in MESH_SHADER_MAPPING.items():
+    for shader_name, meshes in VERTEX_COLORS.shader_mapping.items():
         shading_group = create_shader(shader_name)
         for mesh in meshes:
             try:
@@ -244,14 +256,7 @@ def add_shader():
 
 
 def set_vertex_color():
-    for m, meshName in enumerate(VTX_COLOR_MESHES):
-        try:
-            cmds.select(meshName)
-        except Exception as e:
-            print(f"Skipped adding vtx color for mesh {meshName}. Reason {e}")
-            continue
-        for v, rgb in enumerate(VTX_COLOR_VALUES[m]):
-            cmds.polyColorPerVertex(f"{meshName}.vtx[{v}]", g=rgb[1], b=rgb[2])
+    set_all_vertex_colors_to_scene(VERTEX_COLORS)
 
 
 def export_fbx(lod, meshes):
@@ -280,9 +285,7 @@ def export_fbx_for_lod(dna, lod):
     export_fbx(lod, meshes)
 
 
-if __name__ == "__main__":
-    makedirs(OUTPUT_DIR, exist_ok=True)
-
+def prepare_scene():
     # Loads the builtin plugin needed for FBX
     cmds.loadPlugin("fbxmaya.mll")
 
@@ -292,9 +295,74 @@ if __name__ == "__main__":
     # Generate workspace.mel
     mel.eval(f'setProject "{OUTPUT_DIR}";')
 
-    # Export FBX for each lod
     cmds.upAxis(ax=UP_AXIS)
+
+
+def get_dna_path():
+    if UP_AXIS == "z":
+        return f"{CHARACTER_DNA}.rotate.dna"
+    return CHARACTER_DNA
+
+
+def export_in_worker(dna_path, lod):
+    # Batch processes have to initialize Maya themselves
+    import maya.standalone
+
+    maya.standalone.initialize()
+    prepare_scene()
+    export_fbx_for_lod(DNA(dna_path), lod)
+
+
+def export_with_workers(workers):
+    # Prepares the rotated DNA once, so the workers don't write it at the same time
     dna = get_dna()
-    for lod in range(dna.get_lod_count()):
-        export_fbx_for_lod(dna, lod)
-    cleanup()
+    try:
+        report = export_lods_in_parallel(
+            script_path=ospath.abspath(__file__),
+            lods=list(range(dna.get_lod_count())),
+            arguments=["--dna", get_dna_path()],
+            pool_size=workers or None,
+        )
+    finally:
+        cleanup()
+
+    for result in report.results:
+        status = "exported" if result.succeeded else f"failed ({result.error})"
+        print(f"lod{result.lod} {status} in {result.duration:.1f}s")
+    for result in report.get_failed():
+        print(f"----- lod{result.lod} output -----\n{result.output}")
+    print(f"Exported {len(report.results)} LODs in {report.duration:.1f}s")
+    return 1 if report.get_failed() else 0
+
+
+def parse_arguments():
+    parser = ArgumentParser(description="Exports fbx per lod")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="export every lod in its own mayapy process, using at most this many processes (0 means one per CPU core)",
+    )
+    parser.add_argument("--lod", type=int, default=None, help=ArgumentParser.SUPPRESS)
+    parser.add_argument("--dna", default=None, help=ArgumentParser.SUPPRESS)
+    # Maya Script Editor doesn't pass command line arguments
+    return parser.parse_known_args()[0]
+
+
+if __name__ == "__main__":
+    makedirs(OUTPUT_DIR, exist_ok=True)
+    arguments = parse_arguments()
+
+    if arguments.lod is not None:
+        # Exports a single lod, called by export_with_workers
+        export_in_worker(arguments.dna or CHARACTER_DNA, arguments.lod)
+    elif arguments.workers is not None:
+        raise SystemExit(export_with_workers(arguments.workers))
+    else:
+        prepare_scene()
+
+        # Export FBX for each lod
+        dna = get_dna()
+        for lod in range(dna.get_lod_count()):
+            export_fbx_for_lod(dna, lod)
+        cleanup()
@@ -79,7 +79,13 @@ from dnacalib import (
     VectorOperation_Add,
 )
 
-from dna_viewer import DNA, RigConfig, build_rig, build_meshes
+from dna_viewer import (
+    DNA,
+    RigConfig,
+    build_meshes,
+    build_rig,
+    get_joint_transforms_from_scene,
+)
 
 
 def load_dna_reader(path):
@@ -129,23 +135,16 @@ def get_mesh_vertex_positions_from_scene(meshName):
 
 
 def run_joints_command(reader, calibrated):
-    # Making arrays for joints' transformations and their corresponding mapping arrays
-    joint_translations = []
-    joint_rotations = []
-
-    for i in range(reader.getJointCount()):
-        joint_name = reader.getJointName(i)
-
-        translation = cmds.xform(joint_name, query=True, translation=True)
-        joint_translations.append(translation)
-
-        rotation = cmds.joint(joint_name, query=True, orientation=True)
-        joint_rotations.append(rotation)
+    # Reading all joints' transformations from the scene in one pass
+    joint_names = [reader.getJointName(i) for i in range(reader.getJointCount())]
+    joint_translations, joint_rotations = get_joint_transforms_from_scene(joint_names)
 
     # This is step 5 sub-step a
-    set_new_joints_translations = SetNeutralJointTranslationsCommand(joint_translations)
+    set_new_joints_translations = SetNeutralJointTranslationsCommand(
+        joint_translations.tolist()
+    )
     # This is step 5 sub-step b
-    set_new_joints_rotations = SetNeutralJointRotationsCommand(joint_rotations)
+    set_new_joints_rotations = SetNeutralJointRotationsCommand(joint_rotations.tolist())
 
     # Abstraction to collect all commands into a sequence, and run them with only one invocation
     commands = CommandSequence()
@@ -0,0 +1,46 @@
+import sys
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import pytest
+
+# the tests import the dna_viewer package and the synthetic DNAs of the benchmarks from the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+@pytest.fixture
+def dnacalib() -> object:
+    module = pytest.importorskip("dnacalib")
+    # the dnacalib sources in the repository root are imported as an empty namespace package without the bindings
+    if not hasattr(module, "DNACalibDNAReader"):
+        pytest.skip("the dnacalib bindings aren't installed")
+    return module
+
+
+@pytest.fixture
+def synthetic_dna() -> Callable[..., object]:
+    """Creates DNAs served by the synthetic reader of the benchmarks, the dna bindings are needed for importing DNA"""
+
+    pytest.importorskip("dna")
+    from benchmarks.synthetic import Scale, SyntheticDNA, SyntheticReader
+
+    def create(
+        vertex_count: int = 300,
+        lod_count: int = 2,
+        blend_shape_target_count: int = 5,
+        joint_count: int = 10,
+        influence_count: int = 4,
+        seed: int = 0,
+        layers: Optional[List[object]] = None,
+    ) -> SyntheticDNA:
+        scale = Scale(
+            "test",
+            vertex_count,
+            lod_count,
+            blend_shape_target_count,
+            joint_count,
+            influence_count,
+        )
+        return SyntheticDNA(SyntheticReader(scale, seed), layers)
+
+    return create
@@ -0,0 +1,51 @@
+import logging
+import os
+from pathlib import Path
+
+import pytest
+
+from dna_viewer.batch_runner import get_worker_count, log_results, run_jobs
+
+
+def copy_file(input_path: str, output_path: str) -> None:
+    if Path(input_path).stem == "broken":
+        raise ValueError(f"{input_path} is broken")
+    Path(output_path).write_bytes(Path(input_path).read_bytes())
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_jobs_keeps_going_after_a_failure(tmp_path, workers: int) -> None:
+    input_paths = []
+    for name in ("a", "broken", "b"):
+        path = tmp_path / f"{name}.dna"
+        path.write_bytes(name.encode())
+        input_paths.append(str(path))
+    output_paths = [f"{path}.copy" for path in input_paths]
+
+    results = run_jobs(copy_file, input_paths, output_paths, workers)
+
+    assert [result.input_path for result in results] == input_paths
+    assert [result.succeeded for result in results] == [True, False, True]
+    assert "broken" in results[1].error
+    assert Path(output_paths[2]).read_bytes() == b"b"
+    assert all(result.duration >= 0.0 for result in results)
+
+
+def test_log_results_exit_code(caplog) -> None:
+    results = run_jobs(copy_file, ["missing.dna"], ["missing.copy"])
+
+    with caplog.at_level(logging.INFO):
+        assert log_results(results, "DNAs copied", 1.0) == 1
+        assert log_results([], "DNAs copied", 1.0) == 0
+
+    assert "0/1 DNAs copied" in caplog.text
+    assert "missing.dna failed" in caplog.text
+
+
+@pytest.mark.parametrize("workers", [None, 0, -2, 1])
+def test_worker_count_is_at_least_one(workers) -> None:
+    assert get_worker_count(workers) == 1
+
+
+def test_worker_count_is_capped_by_cpus() -> None:
+    assert get_worker_count(10_000) == (os.cpu_count() or 1)
@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from dna_viewer.dnalib.compression import (
+    QUANTIZATION_LEVELS,
+    CompressedDeltas,
+    encode_vertex_indices,
+    quantize_deltas,
+)
+from dna_viewer.model import Point3
+
+
+@pytest.mark.parametrize(
+    "vertex_indices, dtype",
+    [
+        ([3, 10, 200], np.uint8),
+        ([0, 300], np.uint16),
+        ([0, 70000], np.uint32),
+        ([5, 2, 9], np.int64),
+    ],
+)
+def test_encode_vertex_indices(vertex_indices, dtype) -> None:
+    first_index, steps = encode_vertex_indices(np.array(vertex_indices))
+
+    assert first_index == vertex_indices[0]
+    assert steps.dtype == dtype
+    np.testing.assert_array_equal(steps, np.diff(vertex_indices))
+
+
+def test_encode_no_vertex_indices() -> None:
+    first_index, steps = encode_vertex_indices(np.empty(0, dtype=np.int64))
+
+    assert (first_index, len(steps)) == (0, 0)
+
+
+def test_quantize_deltas() -> None:
+    deltas = np.array([[1.0, -2.0, 0.5], [0.0, 0.25, 0.0]])
+
+    scale, quantized = quantize_deltas(deltas)
+
+    assert quantized.dtype == np.int16
+    assert scale == pytest.approx(2.0 / QUANTIZATION_LEVELS)
+    assert quantized[0, 1] == -QUANTIZATION_LEVELS
+    assert np.abs(quantized * scale - deltas).max() <= scale / 2
+    assert quantize_deltas(np.zeros((2, 3)))[0] == 1.0
+
+
+@pytest.mark.parametrize(
+    "vertex_indices",
+    [[2, 3, 7, 400, 90000], [40, 3, 17, 9], [8], []],
+    ids=["increasing", "unordered", "single", "empty"],
+)
+def test_round_trip(vertex_indices) -> None:
+    rng = np.random.default_rng(0)
+    deltas = rng.normal(size=(len(vertex_indices), 3))
+
+    compressed = CompressedDeltas(vertex_indices, deltas)
+
+    assert len(compressed) == len(vertex_indices)
+    assert list(compressed) == vertex_indices
+    decoded = compressed.get_deltas()
+    assert decoded.shape == (len(vertex_indices), 3)
+    if len(vertex_indices):
+        assert np.linalg.norm(decoded - deltas, axis=1).max() <= compressed.error_bound
+    else:
+        assert compressed.error_bound == 0.0
+    assert [key for key, _ in compressed.items()] == vertex_indices
+
+
+@pytest.mark.parametrize(
+    "vertex_indices",
+    [[2, 3, 7, 400, 90000], [40, 3, 17, 9]],
+    ids=["increasing", "unordered"],
+)
+def test_lookups(vertex_indices) -> None:
+    compressed = CompressedDeltas(
+        vertex_indices, np.arange(len(vertex_indices) * 3).reshape(-1, 3)
+    )
+
+    for position, vertex_index in enumerate(vertex_indices):
+        assert compressed.find_position(vertex_index) == position
+    assert compressed.find_position(5) is None
+    assert compressed.find_position(10**6) is None
+    assert vertex_indices[1] in compressed and 5 not in compressed
+    assert compressed.get(5) is None
+    with pytest.raises(KeyError):
+        compressed[5]
+
+    last = compressed[vertex_indices[-1]]
+    expected = np.arange(len(vertex_indices) * 3).reshape(-1, 3)[-1]
+    np.testing.assert_allclose(
+        (last.x, last.y, last.z), expected, atol=compressed.error_bound
+    )
+
+
+def test_lookups_keep_the_vertex_indices() -> None:
+    compressed = CompressedDeltas([1, 5, 9], np.ones((3, 3)))
+    size = compressed.nbytes
+
+    compressed.find_position(5)
+
+    assert compressed.vertex_indices is not None
+    assert compressed.nbytes == size + compressed.vertex_indices.nbytes
+
+
+def test_from_dict() -> None:
+    deltas = {4: Point3(0.5, 0.0, -0.5), 9: Point3(1.0, 1.0, 1.0)}
+
+    compressed = CompressedDeltas.from_dict(deltas)
+
+    assert list(compressed.keys()) == [4, 9]
+    assert compressed[4].x == pytest.approx(0.5, abs=compressed.error_bound)
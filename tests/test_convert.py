@@ -0,0 +1,58 @@
+import pytest
+
+dna = pytest.importorskip("dna")
+
+from dna_viewer.common import DNAViewerError
+from dna_viewer.convert import (
+    check_output_paths,
+    get_data_layer,
+    get_format,
+    get_output_path,
+)
+
+
+@pytest.mark.parametrize(
+    "layers, data_layer",
+    [
+        (None, "DataLayer_All"),
+        (["all", "behavior"], "DataLayer_All"),
+        (["descriptor"], "DataLayer_Descriptor"),
+        (["descriptor", "definition"], "DataLayer_Definition"),
+        (["definition", "behavior"], "DataLayer_Behavior"),
+        (["geometry"], "DataLayer_Geometry"),
+        (["geometry", "geometry_without_blend_shapes"], "DataLayer_Geometry"),
+        (
+            ["geometry_without_blend_shapes"],
+            "DataLayer_GeometryWithoutBlendShapes",
+        ),
+        (
+            ["behavior", "geometry_without_blend_shapes"],
+            "DataLayer_AllWithoutBlendShapes",
+        ),
+        (["behavior", "geometry", "descriptor"], "DataLayer_All"),
+    ],
+)
+def test_get_data_layer(layers, data_layer: str) -> None:
+    assert get_data_layer(layers) == getattr(dna, data_layer)
+
+
+def test_get_data_layer_rejects_unknown_layers() -> None:
+    with pytest.raises(DNAViewerError):
+        get_data_layer(["hair"])
+
+
+def test_output_path_follows_the_format() -> None:
+    assert get_format("Ada.JSON") == "json"
+    assert get_format("Ada.dna") == "binary"
+    assert get_output_path("in/Ada.dna", "out", "json").replace("\\", "/") == (
+        "out/Ada.json"
+    )
+
+
+def test_check_output_paths() -> None:
+    check_output_paths(["a/Ada.dna", "b/Taro.dna"], ["out/Ada.json", "out/Taro.json"])
+
+    with pytest.raises(DNAViewerError, match="would both be converted"):
+        check_output_paths(["a/Ada.dna", "b/Ada.dna"], ["out/Ada.json"] * 2)
+    with pytest.raises(DNAViewerError, match="would overwrite the input"):
+        check_output_paths(["out/Ada.json"], ["out/../out/Ada.json"])
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("dna")
+
+from dna_viewer.dnalib.layer import Layer
+
+
+def test_neutral_joints_are_read_into_arrays(synthetic_dna) -> None:
+    dna = synthetic_dna(joint_count=8, layers=[Layer.definition])
+
+    assert dna.neutral_joint_translations.dtype == np.float64
+    np.testing.assert_allclose(
+        dna.neutral_joint_translations, dna.reader.joint_translations
+    )
+    np.testing.assert_allclose(dna.neutral_joint_rotations, dna.reader.joint_rotations)
+
+
+def test_read_all_neutral_joints(synthetic_dna) -> None:
+    dna = synthetic_dna(joint_count=8, layers=[Layer.definition])
+    reader = dna.reader
+
+    joints = dna.read_all_neutral_joints()
+
+    assert [joint.name for joint in joints] == reader.joint_names
+    assert [joint.parent_name for joint in joints] == [
+        reader.joint_names[parent] for parent in reader.joint_parents
+    ]
+    translation = joints[3].translation
+    np.testing.assert_allclose(
+        (translation.x, translation.y, translation.z), reader.joint_translations[3]
+    )
+
+
+def test_names_are_read_once(synthetic_dna, monkeypatch) -> None:
+    dna = synthetic_dna(joint_count=8, layers=[Layer.definition])
+
+    def fail(index: int) -> str:
+        raise AssertionError("the name was read again")
+
+    monkeypatch.setattr(dna.reader, "getJointName", fail)
+    monkeypatch.setattr(dna.reader, "getRawControlName", fail)
+
+    assert dna.get_joint_names() == dna.joints.names
+    assert len(dna.get_raw_control_names()) == dna.get_raw_control_count()
+
+
+def test_names_without_the_definition(synthetic_dna) -> None:
+    dna = synthetic_dna(joint_count=8, layers=[Layer.descriptor])
+
+    assert not dna.definition_read
+    assert dna.get_joint_names() == dna.reader.joint_names
+    assert not dna.definition_read
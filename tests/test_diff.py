@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("dna")
+
+from dna_viewer import diff
+from dna_viewer.columnar import SECTION_JOINTS, SECTION_READERS
+from dna_viewer.diff import (
+    columns_equal,
+    diff_dna,
+    diff_dna_files,
+    get_delta,
+    get_name_lookup,
+    get_offsets,
+    get_sparse_differences,
+    hash_file,
+)
+
+
+def test_columns_equal() -> None:
+    columns = {"index": np.arange(3), "value": np.array([0.5, 1.0, 1.5])}
+
+    assert columns_equal(
+        columns, {name: column.copy() for name, column in columns.items()}
+    )
+    assert not columns_equal(columns, {"index": columns["index"]})
+    assert not columns_equal(columns, {**columns, "value": np.array([0.5, 1.0, 2.0])})
+    # equal values of a different type are a change of the file
+    assert not columns_equal(
+        columns, {**columns, "value": columns["value"].astype(np.float32)}
+    )
+
+
+def test_hash_file_is_cached_per_modification(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(diff, "FILE_HASHES", {})
+    path = tmp_path / "a.dna"
+    path.write_bytes(b"first")
+
+    first = hash_file(str(path))
+    assert hash_file(str(path)) == first
+    assert len(diff.FILE_HASHES) == 1
+
+    path.write_bytes(b"second")
+
+    assert hash_file(str(path)) != first
+
+
+def test_get_delta() -> None:
+    delta = get_delta(
+        "jaw", "translation", np.array([[3.0, 4.0, 0.0], [0.0, 0.0, 0.0]]), 0.1
+    )
+
+    assert (delta.max, delta.changed, delta.count) == (5.0, 1, 2)
+    assert delta.rms == pytest.approx(np.sqrt(12.5))
+    assert get_delta("jaw", "translation", np.array([0.05, -0.05]), 0.1) is None
+    assert get_delta("jaw", "translation", np.empty(0), 0.0) is None
+
+
+def test_get_sparse_differences() -> None:
+    keys, differences = get_sparse_differences(
+        np.array([1, 4]),
+        np.array([[1.0, 1.0], [2.0, 2.0]]),
+        np.array([4, 7]),
+        np.array([[3.0, 2.0], [1.0, 0.0]]),
+    )
+
+    np.testing.assert_array_equal(keys, [1, 4, 7])
+    np.testing.assert_array_equal(differences, [[-1, -1], [1, 0], [1, 0]])
+
+
+def test_get_offsets() -> None:
+    np.testing.assert_array_equal(
+        get_offsets(np.array([0, 0, 2, 2, 2]), 3), [0, 2, 2, 5]
+    )
+
+
+def test_get_name_lookup() -> None:
+    assert get_name_lookup(np.array(["a", "b"]), np.array(["c", "a"])) == {
+        "a": 0,
+        "b": 1,
+        "c": 2,
+    }
+
+
+def test_identical_files_are_not_read(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(diff, "DNA", None)
+    path_a, path_b = tmp_path / "a.dna", tmp_path / "b.dna"
+    path_a.write_bytes(b"dna")
+    path_b.write_bytes(b"dna")
+
+    result = diff_dna_files(str(path_a), str(path_b))
+
+    assert not result.differs
+    assert [section.section for section in result.sections] == list(SECTION_READERS)
+
+
+def test_diff_dna(synthetic_dna) -> None:
+    dna_a = synthetic_dna(vertex_count=60, joint_count=6)
+    dna_b = synthetic_dna(vertex_count=60, joint_count=6)
+
+    assert not diff_dna(dna_a, dna_b).differs
+
+    dna_b.reader.joint_translations[2] += [0.0, 3.0, 4.0]
+    result = diff_dna(dna_a, dna_b, [SECTION_JOINTS], tolerance=1e-6)
+
+    (section,) = result.sections
+    assert not section.identical
+    assert [(delta.name, delta.quantity, delta.max) for delta in section.deltas] == [
+        (dna_a.get_joint_name(2), "translation", pytest.approx(5.0))
+    ]
+    assert "joints:" in result.format()
@@ -0,0 +1,111 @@
+import io
+import json
+import struct
+
+import numpy as np
+import pytest
+
+pytest.importorskip("dna")
+
+from dna_viewer.common import DNAViewerError
+from dna_viewer.gltf import (
+    ARRAY_BUFFER,
+    CHUNK_BIN,
+    CHUNK_JSON,
+    GLB_MAGIC,
+    GLB_VERSION,
+    GlbBuffer,
+    export_gltf,
+    get_strongest_influences,
+    get_triangles,
+)
+
+
+def read_glb(path: str) -> tuple:
+    with open(path, "rb") as file:
+        data = file.read()
+    magic, version, length = struct.unpack_from("<III", data)
+    assert (magic, version, length) == (GLB_MAGIC, GLB_VERSION, len(data))
+    json_length, json_type = struct.unpack_from("<II", data, 12)
+    assert json_type == CHUNK_JSON and json_length % 4 == 0
+    gltf = json.loads(data[20 : 20 + json_length])
+    binary_length, binary_type = struct.unpack_from("<II", data, 20 + json_length)
+    assert binary_type == CHUNK_BIN
+    return gltf, data[28 + json_length : 28 + json_length + binary_length]
+
+
+def test_get_triangles_fans_faces() -> None:
+    triangles = get_triangles([[0, 1, 2], [3, 4, 5, 6], [7, 8]])
+
+    np.testing.assert_array_equal(triangles, [[0, 1, 2], [3, 4, 5], [3, 5, 6]])
+    assert get_triangles([]).shape == (0, 3)
+
+
+def test_strongest_influences_are_kept_and_normalized() -> None:
+    joints, weights = get_strongest_influences(
+        [[1, 2, 3], [4], []], [[0.1, 0.6, 0.3], [0.5], []], 2
+    )
+
+    np.testing.assert_array_equal(joints, [[2, 3], [4, 0], [0, 0]])
+    np.testing.assert_allclose(weights, [[2 / 3, 1 / 3], [1.0, 0.0], [1.0, 0.0]])
+
+
+def test_strongest_influences_reject_mismatched_weights() -> None:
+    with pytest.raises(DNAViewerError):
+        get_strongest_influences([[1, 2]], [[1.0]], 4)
+
+
+def test_buffer_views_are_aligned() -> None:
+    file = io.BytesIO()
+    buffer = GlbBuffer(file)
+
+    buffer.add_accessor(np.arange(3, dtype=np.uint8))
+    positions = buffer.add_accessor(
+        np.array([[0, 1, 2], [-1, 5, 0]], dtype=np.float32), ARRAY_BUFFER, bounds=True
+    )
+
+    assert buffer.length == len(file.getvalue()) == 4 + 24
+    assert buffer.buffer_views[1] == {
+        "buffer": 0,
+        "byteOffset": 4,
+        "byteLength": 24,
+        "target": ARRAY_BUFFER,
+    }
+    accessor = buffer.accessors[positions]
+    assert (accessor["type"], accessor["count"]) == ("VEC3", 2)
+    assert (accessor["min"], accessor["max"]) == ([-1, 1, 0], [0, 5, 2])
+
+
+def test_sparse_accessor_bounds_include_zero() -> None:
+    buffer = GlbBuffer(io.BytesIO())
+
+    accessor = buffer.accessors[
+        buffer.add_sparse_accessor(
+            10, np.array([2, 7]), np.array([[1.0, 2.0, 3.0], [2.0, 3.0, 4.0]])
+        )
+    ]
+    empty = buffer.accessors[buffer.add_sparse_accessor(10, np.array([]), np.array([]))]
+
+    assert accessor["sparse"]["count"] == 2
+    assert (accessor["min"], accessor["max"]) == ([0, 0, 0], [2, 3, 4])
+    assert "sparse" not in empty and empty["count"] == 10
+
+
+def test_export_gltf(tmp_path, synthetic_dna) -> None:
+    dna = synthetic_dna(vertex_count=60, joint_count=6, blend_shape_target_count=2)
+
+    paths = export_gltf(dna, str(tmp_path), name="head")
+
+    assert sorted(paths) == [0, 1]
+    gltf, binary = read_glb(paths[0])
+    assert len(binary) == gltf["buffers"][0]["byteLength"]
+    assert [mesh["name"] for mesh in gltf["meshes"]] == [dna.get_mesh_name(0)]
+    primitive = gltf["meshes"][0]["primitives"][0]
+    assert len(primitive["targets"]) == 2
+    assert {"POSITION", "JOINTS_0", "WEIGHTS_0"} <= set(primitive["attributes"])
+    assert gltf["skins"][0]["joints"]
+
+
+def test_export_gltf_rejects_influence_counts(tmp_path, synthetic_dna) -> None:
+    with pytest.raises(DNAViewerError):
+        export_gltf(synthetic_dna(vertex_count=60), str(tmp_path), max_influences=6)
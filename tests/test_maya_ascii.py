@@ -0,0 +1,96 @@
+import re
+
+import numpy as np
+import pytest
+
+pytest.importorskip("dna")
+
+from dna_viewer.builder.config import Config
+from dna_viewer.maya_ascii import (
+    MAX_WEIGHT_GAP,
+    VALUES_PER_LINE,
+    format_values,
+    get_component_ranges,
+    get_weight_runs,
+    quote,
+    write_maya_ascii,
+)
+
+
+@pytest.mark.parametrize(
+    "vertex_indices, components",
+    [
+        ([], []),
+        ([7], ['"vtx[7]"']),
+        ([0, 1, 2, 5, 7, 8], ['"vtx[0:2]"', '"vtx[5]"', '"vtx[7:8]"']),
+    ],
+)
+def test_get_component_ranges(vertex_indices, components) -> None:
+    assert get_component_ranges(np.array(vertex_indices, dtype=np.int64)) == (
+        components
+    )
+
+
+def test_weight_runs_fill_small_gaps() -> None:
+    assert get_weight_runs([(3, 0.25), (0, 0.5), (1, 0.25)]) == [
+        ("0:3", "0.5 0.25 0 0.25")
+    ]
+    assert get_weight_runs([(2, 1.0)]) == [("2", "1")]
+
+
+def test_weight_runs_split_large_gaps() -> None:
+    far = MAX_WEIGHT_GAP + 2
+
+    assert get_weight_runs([(0, 0.5), (far, 0.5)]) == [("0", "0.5"), (str(far), "0.5")]
+    # a gap of exactly MAX_WEIGHT_GAP influences is still filled
+    runs = get_weight_runs([(0, 0.5), (far - 1, 0.5)])
+    assert runs[0][0] == f"0:{far - 1}"
+    assert len(runs[0][1].split()) == far
+
+
+def test_format_values_wraps_lines() -> None:
+    lines = format_values(range(VALUES_PER_LINE + 1))
+
+    assert len(lines) == 2
+    assert lines[1] == str(VALUES_PER_LINE)
+    assert format_values([0.1 + 0.2], ".3g") == ["0.3"]
+
+
+def test_quote_escapes() -> None:
+    assert quote('a"b\\c') == '"a\\"b\\\\c"'
+
+
+def test_write_maya_ascii(tmp_path, synthetic_dna) -> None:
+    dna = synthetic_dna(vertex_count=60, joint_count=6, blend_shape_target_count=2)
+    root_joint = dna.get_joint_name(0)
+    path = tmp_path / "scene.ma"
+
+    meshes = write_maya_ascii(dna, str(path), Config(facial_root_joint_name=root_joint))
+    scene = path.read_text()
+
+    assert meshes == {lod: [dna.get_mesh_name(lod)] for lod in range(2)}
+    assert scene.startswith("//Maya ASCII 2022 scene\n")
+    assert scene.endswith(
+        f'currentTime 0;\nsetKeyframe -itt "linear" -ott "linear" "|head_grp|{root_joint}";\n'
+    )
+    assert scene.count("createNode joint") == 6
+    assert 'blendShape -n "head_lod0_mesh_blendShapes"' in scene
+    assert 'skinCluster -tsb -n "head_lod1_mesh_skinCluster"' in scene
+
+    # every vertex is weighted with multi-value setAttrs of its influences
+    weighted = set(
+        int(vertex)
+        for vertex in re.findall(
+            r'setAttr "head_lod0_mesh_skinCluster\.wl\[(\d+)\]\.w\[\d+(?::\d+)?\]"',
+            scene,
+        )
+    )
+    assert weighted == set(range(len(dna.get_vertex_positions_for_mesh_index(0))))
+
+
+def test_key_frames_need_the_root_joint(tmp_path, synthetic_dna) -> None:
+    path = tmp_path / "scene.ma"
+
+    write_maya_ascii(synthetic_dna(vertex_count=60, joint_count=6), str(path))
+
+    assert "setKeyframe" not in path.read_text()
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("dna")
+
+from dna_viewer.builder.config import Config
+from dna_viewer.builder.mesh_filter import get_filtered_meshes, get_mesh_indices_filter
+from dna_viewer.dnalib.definition import GeometryEntity, get_name_indices
+from dna_viewer.dnalib.layer import Layer
+
+
+@pytest.fixture
+def entity() -> GeometryEntity:
+    entity = GeometryEntity(
+        names=["head", "teeth", "eyes", "head"], lod_indices=[[0, 1, 2], [1, 2], [3]]
+    )
+    entity.update_lookups()
+    return entity
+
+
+def test_name_indices_keep_the_first_duplicate(entity) -> None:
+    assert get_name_indices(entity.names) == {"head": 0, "teeth": 1, "eyes": 2}
+    assert entity.get_index("eyes") == 2
+    assert entity.get_index("hair") is None
+
+
+def test_lod_masks(entity) -> None:
+    np.testing.assert_array_equal(
+        entity.lod_masks,
+        [[True, True, True, False], [False, True, True, False], [False] * 3 + [True]],
+    )
+    # indices outside of the entities are ignored
+    np.testing.assert_array_equal(
+        entity.get_mask([1, -1, 9]), [False, True, False, False]
+    )
+
+
+def test_lod_lookups(entity) -> None:
+    assert entity.get_lowest_lod([2, 3]) == 0
+    assert entity.get_lowest_lod([3]) == 2
+    assert entity.get_lowest_lod([]) is None
+    assert entity.get_indices_by_lods([2, 3]) == [[2], [2], [3]]
+
+
+@pytest.mark.parametrize(
+    "config, meshes",
+    [
+        (Config(), [0, 1, 2]),
+        (Config(meshes=[1]), [1]),
+        (Config(lod_filter=[1, 2]), [1, 2]),
+        (Config(lod_filter=[5]), []),
+        (Config(mesh_filter=["lod2"]), [2]),
+        (Config(mesh_filter=["lod2", "lod0"], lod_filter=[0, 1]), [0]),
+        (Config(mesh_filter=["hair"]), []),
+        # a mesh filter matching no meshes doesn't empty a LOD selection
+        (Config(mesh_filter=["hair"], lod_filter=[1]), [1]),
+    ],
+)
+def test_get_filtered_meshes(synthetic_dna, config: Config, meshes) -> None:
+    dna = synthetic_dna(vertex_count=60, lod_count=3, layers=[Layer.descriptor])
+
+    assert get_filtered_meshes(dna, config) == meshes
+
+
+def test_lookups_read_the_definition_on_demand(synthetic_dna) -> None:
+    dna = synthetic_dna(vertex_count=60, lod_count=3, layers=[Layer.descriptor])
+    assert not dna.definition_read
+
+    assert get_mesh_indices_filter(dna, ["lod1", "lod2"]) == [1, 2]
+    assert dna.definition_read
+    assert dna.get_mesh_id_from_mesh_name("head_lod2_mesh") == 2
+    assert dna.get_lowest_lod_containing_meshes([2, 1]) == 1
+    assert dna.get_meshes_by_lods([0, 2]) == [[0], [], [2]]
@@ -0,0 +1,142 @@
+import pytest
+
+from dna_viewer.builder.plan import (
+    CALIBRATION_WEIGHT,
+    DEFAULT_STAGE_COSTS,
+    STAGE_GUI,
+    STAGE_JOINTS,
+    STAGE_NEUTRAL_MESHES,
+    BuildPlan,
+    BuildTimings,
+    StageCost,
+    calibrate_stage_costs,
+    estimate_stage,
+    format_bytes,
+    load_stage_costs,
+    save_stage_costs,
+)
+
+
+class MemoryProbe:
+    def __init__(self) -> None:
+        self.used = 0.0
+
+    def __call__(self) -> float:
+        return self.used
+
+
+def test_estimate_stage() -> None:
+    costs = {STAGE_JOINTS: StageCost(seconds_per_unit=0.5, bytes_per_unit=10)}
+
+    estimate = estimate_stage(STAGE_JOINTS, 4, costs)
+
+    assert (estimate.seconds, estimate.memory) == (2.0, 40)
+    # stages missing from the costs use the defaults
+    default = DEFAULT_STAGE_COSTS[STAGE_GUI]
+    assert estimate_stage(STAGE_GUI, 1, {}).seconds == default.seconds_per_unit
+    assert estimate_stage("unknown", 5, {}).seconds == 0.0
+
+
+def test_plan_totals() -> None:
+    costs = {
+        STAGE_JOINTS: StageCost(seconds_per_unit=1.0, bytes_per_unit=1024),
+        STAGE_NEUTRAL_MESHES: StageCost(seconds_per_unit=2.0, bytes_per_unit=1024),
+    }
+    plan = BuildPlan(
+        stages=[
+            estimate_stage(STAGE_JOINTS, 10, costs),
+            estimate_stage(STAGE_NEUTRAL_MESHES, 1014, costs),
+        ]
+    )
+
+    assert plan.get_total_seconds() == 2038.0
+    assert plan.get_total_memory() == 1024 * 1024
+    assert plan.get_summary() == "~2038 s, ~1 MB"
+
+
+@pytest.mark.parametrize(
+    "value, formatted",
+    [(512, "512 B"), (2048, "2 KB"), (3 * 1024**2, "3 MB"), (1.5 * 1024**3, "1.5 GB")],
+)
+def test_format_bytes(value: float, formatted: str) -> None:
+    assert format_bytes(value) == formatted
+
+
+def test_timings_accumulate_duration_and_memory() -> None:
+    probe = MemoryProbe()
+    timings = BuildTimings(probe)
+
+    for growth in (100.0, 50.0):
+        with timings.measure(STAGE_JOINTS):
+            probe.used += growth
+    with timings.measure(STAGE_GUI):
+        probe.used -= 500.0
+
+    assert timings.memory == {STAGE_JOINTS: 150.0, STAGE_GUI: 0.0}
+    assert set(timings.durations) == {STAGE_JOINTS, STAGE_GUI}
+    assert all(duration >= 0.0 for duration in timings.durations.values())
+
+
+def test_timings_without_probe_record_no_memory() -> None:
+    timings = BuildTimings()
+
+    with timings.measure(STAGE_JOINTS):
+        pass
+
+    assert timings.memory == {}
+    assert STAGE_JOINTS in timings.durations
+
+
+def test_calibration_blends_measured_costs() -> None:
+    costs = {STAGE_JOINTS: StageCost(seconds_per_unit=1.0, bytes_per_unit=100.0)}
+    plan = BuildPlan(stages=[estimate_stage(STAGE_JOINTS, 10, costs)])
+    timings = BuildTimings()
+    timings.durations[STAGE_JOINTS] = 30.0
+    timings.memory[STAGE_JOINTS] = 3000.0
+
+    calibrated = calibrate_stage_costs(plan, timings, costs)[STAGE_JOINTS]
+
+    assert calibrated.seconds_per_unit == pytest.approx(
+        CALIBRATION_WEIGHT * 3.0 + (1 - CALIBRATION_WEIGHT) * 1.0
+    )
+    assert calibrated.bytes_per_unit == pytest.approx(
+        CALIBRATION_WEIGHT * 300.0 + (1 - CALIBRATION_WEIGHT) * 100.0
+    )
+
+
+def test_calibration_keeps_unmeasured_costs() -> None:
+    costs = {STAGE_JOINTS: StageCost(seconds_per_unit=1.0, bytes_per_unit=100.0)}
+    plan = BuildPlan(
+        stages=[
+            estimate_stage(STAGE_JOINTS, 10, costs),
+            estimate_stage(STAGE_GUI, 0, costs),
+        ]
+    )
+    timings = BuildTimings()
+    timings.durations[STAGE_JOINTS] = 10.0
+    timings.durations[STAGE_GUI] = 1.0
+
+    calibrated = calibrate_stage_costs(plan, timings, costs)
+
+    # memory wasn't recorded and stages without units can't be calibrated
+    assert calibrated[STAGE_JOINTS].bytes_per_unit == 100.0
+    assert STAGE_GUI not in calibrated
+
+
+def test_stage_costs_round_trip(tmp_path) -> None:
+    path = str(tmp_path / "calibration" / "costs.json")
+    costs = {STAGE_JOINTS: StageCost(seconds_per_unit=0.25, bytes_per_unit=8.0)}
+
+    save_stage_costs(path, costs)
+    loaded = load_stage_costs(path)
+
+    assert loaded[STAGE_JOINTS] == costs[STAGE_JOINTS]
+    assert loaded[STAGE_GUI] == DEFAULT_STAGE_COSTS[STAGE_GUI]
+
+
+def test_unreadable_stage_costs_give_defaults(tmp_path) -> None:
+    path = tmp_path / "costs.json"
+    path.write_text("not json")
+
+    assert load_stage_costs(str(path)) == DEFAULT_STAGE_COSTS
+    assert load_stage_costs(None) == DEFAULT_STAGE_COSTS
@@ -0,0 +1,141 @@
+import os
+from typing import Callable, List
+
+import pytest
+
+pytest.importorskip("dna")
+
+from dna_viewer.dnalib import registry
+from dna_viewer.dnalib.layer import Layer
+from dna_viewer.dnalib.registry import MEMORY_PER_FILE_BYTE, DNARegistry, shared_dna
+
+FILE_SIZE = 1024
+DNA_MEMORY = FILE_SIZE * MEMORY_PER_FILE_BYTE
+
+
+@pytest.fixture
+def loads(monkeypatch, synthetic_dna) -> List[str]:
+    """Serves the DNAs of the registry from the synthetic reader, returns the paths of the loaded DNAs"""
+
+    loaded = []
+
+    def create(dna_path: str, layers: List[Layer], compress_deltas: bool) -> object:
+        loaded.append(dna_path)
+        return synthetic_dna(layers=layers)
+
+    monkeypatch.setattr(registry, "DNA", create)
+    return loaded
+
+
+@pytest.fixture
+def dna_file(tmp_path) -> Callable[[str], str]:
+    def create(name: str) -> str:
+        path = tmp_path / f"{name}.dna"
+        path.write_bytes(bytes(FILE_SIZE))
+        return str(path)
+
+    return create
+
+
+def get_ref_counts(dna_registry: DNARegistry) -> List[int]:
+    return [entry.ref_count for entry in dna_registry.entries.values()]
+
+
+def test_acquire_shares_the_dna(loads, dna_file) -> None:
+    dna_registry = DNARegistry()
+    path = dna_file("a")
+
+    first = dna_registry.acquire(path)
+    second = dna_registry.acquire(path)
+
+    assert first is second
+    assert loads == [path]
+    assert get_ref_counts(dna_registry) == [2]
+    assert dna_registry.get_memory_usage() == DNA_MEMORY
+
+    dna_registry.release(first)
+    dna_registry.release(second)
+    dna_registry.release(second)
+
+    # released DNAs stay cached
+    assert get_ref_counts(dna_registry) == [0]
+    assert dna_registry.acquire(path) is first
+    assert len(loads) == 1
+
+
+def test_acquire_reads_the_missing_layers(loads, dna_file) -> None:
+    dna_registry = DNARegistry()
+    path = dna_file("a")
+
+    dna = dna_registry.acquire(path, [Layer.definition])
+    assert not dna.layer_enabled(Layer.geometry)
+
+    assert dna_registry.acquire(path, [Layer.geometry]) is dna
+    assert dna.layer_enabled(Layer.geometry)
+    assert loads == [path]
+    assert get_ref_counts(dna_registry) == [2]
+
+
+def test_unused_dnas_are_evicted_least_recently_used_first(loads, dna_file) -> None:
+    dna_registry = DNARegistry(memory_budget=2 * DNA_MEMORY)
+    paths = [dna_file(name) for name in "abc"]
+
+    for path in (paths[0], paths[1], paths[0], paths[2]):
+        dna_registry.release(dna_registry.acquire(path))
+
+    remaining = [key[0] for key in dna_registry.entries]
+    assert remaining == [os.path.normcase(paths[i]) for i in (0, 2)]
+    assert dna_registry.get_memory_usage() == 2 * DNA_MEMORY
+
+
+def test_held_dnas_are_not_evicted(loads, dna_file) -> None:
+    dna_registry = DNARegistry(memory_budget=DNA_MEMORY)
+    first = dna_registry.acquire(dna_file("a"))
+    second = dna_registry.acquire(dna_file("b"))
+
+    # over the budget, but both DNAs are held
+    assert len(dna_registry.entries) == 2
+
+    dna_registry.release(second)
+
+    assert [entry.dna for entry in dna_registry.entries.values()] == [first]
+
+
+def test_modified_file_is_loaded_again(loads, dna_file) -> None:
+    dna_registry = DNARegistry()
+    path = dna_file("a")
+    dna = dna_registry.acquire(path)
+    dna_registry.release(dna)
+
+    modified = os.path.getmtime(path) + 10
+    os.utime(path, (modified, modified))
+
+    assert dna_registry.acquire(path) is not dna
+    assert len(loads) == 2
+    # the DNA of the old version isn't used by anyone
+    assert len(dna_registry.entries) == 1
+
+
+def test_clear_keeps_held_dnas(loads, dna_file) -> None:
+    dna_registry = DNARegistry()
+    held = dna_registry.acquire(dna_file("a"))
+    dna_registry.release(dna_registry.acquire(dna_file("b")))
+
+    dna_registry.clear()
+
+    assert [entry.dna for entry in dna_registry.entries.values()] == [held]
+
+
+def test_shared_dna_releases_on_exit(monkeypatch, loads, dna_file) -> None:
+    dna_registry = DNARegistry()
+    monkeypatch.setattr(registry, "DNA_REGISTRY", dna_registry)
+    path = dna_file("a")
+
+    with pytest.raises(ValueError):
+        with shared_dna(path) as dna:
+            assert get_ref_counts(dna_registry) == [1]
+            raise ValueError()
+
+    assert get_ref_counts(dna_registry) == [0]
+    with shared_dna(path) as shared:
+        assert shared is dna
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("dna")
+# the dnacalib sources in the repository root are imported as an empty namespace package without the bindings
+if not hasattr(pytest.importorskip("dnacalib"), "DNACalibDNAReader"):
+    pytest.skip("the dnacalib bindings aren't installed", allow_module_level=True)
+
+from dna_viewer.columnar import read_blend_shape_deltas
+from dna_viewer.common import DNAViewerError
+from dna_viewer.dnalib.compression import FILE_BYTES_PER_DELTA
+from dna_viewer.dnalib.layer import Layer
+from dna_viewer.sparsity import (
+    analyze_sparsity,
+    get_channel_thresholds,
+    get_group_projections,
+    get_magnitudes,
+    get_projections,
+    get_pruned_mask,
+)
+
+
+def test_get_magnitudes() -> None:
+    columns = {
+        "x": np.array([3.0, 0.0], dtype=np.float32),
+        "y": np.array([4.0, 0.0], dtype=np.float32),
+        "z": np.array([0.0, 2.0], dtype=np.float32),
+    }
+
+    np.testing.assert_allclose(get_magnitudes(columns), [5.0, 2.0])
+
+
+def test_get_projections() -> None:
+    projections = get_projections(np.array([0.4, 0.1, 0.3, 0.2]), [0.0, 0.25, 1.0])
+
+    assert [projection.pruned_count for projection in projections] == [0, 2, 4]
+    assert [projection.delta_count for projection in projections] == [4, 2, 0]
+    assert projections[1].size == 2 * FILE_BYTES_PER_DELTA
+    assert [projection.max_error for projection in projections] == [0.0, 0.2, 0.4]
+    assert projections[1].rms_error == pytest.approx(np.sqrt((0.01 + 0.04) / 4))
+
+
+def test_projections_of_no_deltas() -> None:
+    (projection,) = get_projections(np.empty(0), [0.1])
+
+    assert (projection.delta_count, projection.max_error, projection.rms_error) == (
+        0,
+        0.0,
+        0.0,
+    )
+
+
+def test_group_projections_include_groups_with_deltas() -> None:
+    projections = get_group_projections(
+        np.array([0.5, 0.1, 0.2]), np.array([2, 0, 2]), ["a", "b", "c"], [0.3]
+    )
+
+    assert list(projections) == ["a", "c"]
+    assert projections["c"][0].pruned_count == 1
+
+
+def test_get_pruned_mask() -> None:
+    columns = {
+        "x": np.array([0.1, 0.1, 0.0]),
+        "y": np.zeros(3),
+        "z": np.zeros(3),
+        "channel_index": np.array([0, 1, 1]),
+    }
+
+    # channels with a negative threshold aren't pruned, not even their zero deltas
+    np.testing.assert_array_equal(
+        get_pruned_mask(columns, np.array([0.2, -1.0])), [True, False, False]
+    )
+
+
+def test_get_channel_thresholds(synthetic_dna) -> None:
+    dna = synthetic_dna(vertex_count=60, blend_shape_target_count=3)
+    channel = dna.get_blend_shape_channel_name(1)
+
+    np.testing.assert_array_equal(
+        get_channel_thresholds(dna, {channel: 0.5}), [-1.0, 0.5, -1.0]
+    )
+    np.testing.assert_array_equal(
+        get_channel_thresholds(dna, {channel: 0.5}, 0.1), [0.1, 0.5, 0.1]
+    )
+    with pytest.raises(DNAViewerError):
+        get_channel_thresholds(dna, {"missing": 0.5})
+
+
+def test_analyze_sparsity(synthetic_dna) -> None:
+    dna = synthetic_dna(
+        vertex_count=200, blend_shape_target_count=3, layers=[Layer.definition]
+    )
+    delta_count = len(read_blend_shape_deltas(dna)["x"])
+
+    report = analyze_sparsity(dna, thresholds=[1e9, 0.0])
+
+    assert delta_count
+    assert [projection.threshold for projection in report.total] == [0.0, 1e9]
+    assert [projection.pruned_count for projection in report.total] == [
+        0,
+        delta_count,
+    ]
+    assert len(report.targets) == 3
+    assert sum(sum(target["histogram"]) for target in report.targets) == delta_count
+    # the blend shapes are on the LOD 0 mesh only
+    assert [sum(histogram) for histogram in report.lods] == [delta_count, 0]
+    assert list(report.meshes) == [dna.get_mesh_name(0)]
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from dna_viewer.common import DNAViewerError
+from dna_viewer.dnalib.spatial import KDTree
+
+
+def brute_force_nearest(points: np.ndarray, queries: np.ndarray) -> np.ndarray:
+    distances = np.sum((queries[:, np.newaxis, :] - points[np.newaxis, :, :]) ** 2, -1)
+    return np.argmin(distances, axis=1)
+
+
+@pytest.mark.parametrize("leaf_size", [1, 4, 16, 1000])
+def test_query_matches_brute_force(leaf_size: int) -> None:
+    rng = np.random.default_rng(7)
+    points = rng.normal(size=(500, 3))
+    queries = rng.normal(size=(200, 3)) * 1.5
+
+    indices, distances = KDTree(points, leaf_size).query(queries)
+
+    expected = brute_force_nearest(points, queries)
+    np.testing.assert_allclose(
+        distances, np.linalg.norm(points[expected] - queries, axis=1)
+    )
+    np.testing.assert_array_equal(indices, expected)
+
+
+def test_query_finds_indexed_points_exactly() -> None:
+    points = np.random.default_rng(3).uniform(-1.0, 1.0, (100, 3))
+
+    indices, distances = KDTree(points, leaf_size=2).query(points)
+
+    np.testing.assert_array_equal(indices, np.arange(len(points)))
+    np.testing.assert_array_equal(distances, np.zeros(len(points)))
+
+
+def test_duplicate_points() -> None:
+    points = np.zeros((20, 3))
+    points[10:] = 1.0
+
+    indices, _ = KDTree(points, leaf_size=1).query([[0.9, 0.9, 0.9]])
+
+    assert 10 <= indices[0] < 20
+
+
+def test_empty_points_raise() -> None:
+    with pytest.raises(DNAViewerError):
+        KDTree(np.empty((0, 3)))
+
+
+def test_nearest_vertices_to_joints(synthetic_dna) -> None:
+    dna = synthetic_dna()
+    joint_names = dna.get_joint_names()[:5]
+    positions = dna.get_vertex_positions_array(0)
+
+    nearest = dna.find_nearest_vertices_to_joints(0, joint_names)
+
+    joint_positions = dna.get_neutral_joint_world_positions()[:5]
+    expected = brute_force_nearest(positions, joint_positions)
+    assert [nearest[name] for name in joint_names] == expected.tolist()
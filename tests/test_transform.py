@@ -0,0 +1,192 @@
+from typing import List
+
+import numpy as np
+import pytest
+
+from dna_viewer.dnalib.transform import (
+    get_local_matrices,
+    get_local_translations_for_world_positions,
+    get_world_matrices,
+    read_joint_parent_indices,
+    read_neutral_joint_local_matrices,
+    read_neutral_joint_rotations,
+    read_neutral_joint_translations,
+    read_vertex_positions,
+)
+
+
+class Reader:
+    """Serves the bulk getters used by the transform readers from arrays"""
+
+    def __init__(
+        self,
+        parents: List[int],
+        translations: np.ndarray,
+        rotations: np.ndarray,
+        rotation_unit: int = 0,
+        vertex_positions: np.ndarray = np.zeros((0, 3)),
+    ) -> None:
+        self.parents = parents
+        self.translations = translations
+        self.rotations = rotations
+        self.rotation_unit = rotation_unit
+        self.vertex_positions = vertex_positions
+
+    def getJointCount(self) -> int:
+        return len(self.parents)
+
+    def getJointParentIndex(self, index: int) -> int:
+        return self.parents[index]
+
+    def getNeutralJointTranslationXs(self) -> List[float]:
+        return self.translations[:, 0].tolist()
+
+    def getNeutralJointTranslationYs(self) -> List[float]:
+        return self.translations[:, 1].tolist()
+
+    def getNeutralJointTranslationZs(self) -> List[float]:
+        return self.translations[:, 2].tolist()
+
+    def getNeutralJointRotationXs(self) -> List[float]:
+        return self.rotations[:, 0].tolist()
+
+    def getNeutralJointRotationYs(self) -> List[float]:
+        return self.rotations[:, 1].tolist()
+
+    def getNeutralJointRotationZs(self) -> List[float]:
+        return self.rotations[:, 2].tolist()
+
+    def getRotationUnit(self) -> int:
+        return self.rotation_unit
+
+    def getVertexPositionXs(self, mesh_index: int) -> List[float]:
+        return self.vertex_positions[:, 0].tolist()
+
+    def getVertexPositionYs(self, mesh_index: int) -> List[float]:
+        return self.vertex_positions[:, 1].tolist()
+
+    def getVertexPositionZs(self, mesh_index: int) -> List[float]:
+        return self.vertex_positions[:, 2].tolist()
+
+
+def create_reader(rotation_unit: int = 0) -> Reader:
+    rng = np.random.default_rng(11)
+    return Reader(
+        parents=[0, 0, 1, 1, 3],
+        translations=rng.normal(size=(5, 3)),
+        rotations=rng.uniform(-90.0, 90.0, (5, 3)),
+        rotation_unit=rotation_unit,
+        vertex_positions=rng.normal(size=(7, 3)),
+    )
+
+
+def get_world_matrices_sequentially(
+    local: np.ndarray, parents: np.ndarray
+) -> np.ndarray:
+    world = local.copy()
+    for index, parent in enumerate(parents):
+        if parent != index:
+            world[index] = local[index] @ world[parent]
+    return world
+
+
+def test_read_joints() -> None:
+    reader = create_reader()
+
+    np.testing.assert_array_equal(read_joint_parent_indices(reader), reader.parents)
+    np.testing.assert_array_equal(
+        read_neutral_joint_translations(reader), reader.translations
+    )
+
+
+@pytest.mark.parametrize("rotation_unit", [0, 1])
+def test_read_rotations_in_radians(rotation_unit: int) -> None:
+    reader = create_reader(rotation_unit)
+
+    rotations = read_neutral_joint_rotations(reader)
+
+    expected = np.radians(reader.rotations) if rotation_unit == 0 else reader.rotations
+    np.testing.assert_allclose(rotations, expected)
+
+
+def test_read_vertex_positions() -> None:
+    reader = create_reader()
+
+    positions = read_vertex_positions(reader, 0)
+
+    assert positions.shape == (7, 3)
+    np.testing.assert_array_equal(positions, reader.vertex_positions)
+
+
+def test_local_matrices() -> None:
+    translations = np.array([[1.0, 2.0, 3.0]])
+
+    local = get_local_matrices(translations, np.array([[0.0, 0.0, np.pi / 2]]))
+
+    np.testing.assert_allclose(local[0, 3], [1.0, 2.0, 3.0, 1.0])
+    # rows are the rotated axes, a quarter turn around Z maps X to Y
+    np.testing.assert_allclose(local[0, 0, :3], [0.0, 1.0, 0.0], atol=1e-12)
+
+
+def test_world_matrices_follow_the_hierarchy() -> None:
+    reader = create_reader()
+    local = read_neutral_joint_local_matrices(reader)
+    parents = read_joint_parent_indices(reader)
+
+    world = get_world_matrices(local, parents)
+
+    np.testing.assert_allclose(world, get_world_matrices_sequentially(local, parents))
+
+
+def test_local_translations_for_world_positions() -> None:
+    reader = create_reader()
+    local = read_neutral_joint_local_matrices(reader)
+    parents = read_joint_parent_indices(reader)
+    joint_indices = np.array([1, 4])
+    positions = np.array([[1.0, 0.0, 0.0], [0.0, 2.0, 0.5]])
+
+    translations = get_local_translations_for_world_positions(
+        local, parents, joint_indices, positions
+    )
+
+    moved = local.copy()
+    moved[:, 3, :3] = translations
+    world = get_world_matrices(moved, parents)
+    np.testing.assert_allclose(world[joint_indices, 3, :3], positions, atol=1e-9)
+    unmoved = [0, 2, 3]
+    np.testing.assert_allclose(translations[unmoved], reader.translations[unmoved])
+
+
+def test_surface_joint_binding_round_trip(tmp_path, dnacalib) -> None:
+    from dna_viewer.dnalib.binding import (
+        SurfaceJointBinding,
+        get_barycentric_weights,
+        get_rebound_joint_translations,
+    )
+
+    reader = create_reader()
+    triangle = reader.vertex_positions[[0, 1, 2]]
+    point = triangle.T @ np.array([0.2, 0.3, 0.5])
+    weights = get_barycentric_weights(point, triangle[np.newaxis])
+    np.testing.assert_allclose(weights, [[0.2, 0.3, 0.5]])
+
+    binding = SurfaceJointBinding(
+        mesh_index=0,
+        joint_names=["joint_4"],
+        joint_indices=np.array([4]),
+        vertex_indices=np.array([[0, 1, 2]]),
+        weights=weights,
+    )
+    path = str(tmp_path / "binding.npz")
+    binding.save(path)
+    loaded = SurfaceJointBinding.load(path)
+    assert loaded.joint_names == ["joint_4"]
+    np.testing.assert_allclose(loaded.get_positions(reader.vertex_positions), [point])
+
+    # the rebound joint lands on the bound point of the edited mesh
+    reader.vertex_positions = reader.vertex_positions + [0.0, 0.0, 1.0]
+    translations = get_rebound_joint_translations(reader, loaded)
+    moved = read_neutral_joint_local_matrices(reader)
+    moved[:, 3, :3] = translations
+    world = get_world_matrices(moved, read_joint_parent_indices(reader))
+    np.testing.assert_allclose(world[4, 3, :3], point + [0.0, 0.0, 1.0], atol=1e-9)
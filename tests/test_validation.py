@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("dna")
+
+from dna_viewer.validation import (
+    CHECK_FACE_INDICES,
+    CHECK_FINITE_VALUES,
+    CHECK_JOINT_HIERARCHY,
+    EXAMPLE_COUNT,
+    SEVERITY_ERROR,
+    SEVERITY_WARNING,
+    Finding,
+    ValidationReport,
+    find_invalid,
+    find_non_finite,
+    find_out_of_range,
+    validate_dna,
+)
+
+
+def test_find_invalid_lists_the_first_examples() -> None:
+    findings = []
+    invalid = np.zeros(20, dtype=bool)
+    invalid[3:13] = True
+
+    find_invalid(findings, CHECK_FACE_INDICES, invalid, "Bad faces", mesh="head")
+    find_invalid(findings, CHECK_FACE_INDICES, ~invalid[3:13], "Nothing")
+
+    (finding,) = findings
+    assert (finding.count, finding.mesh, finding.severity) == (10, "head", "error")
+    assert finding.examples == list(range(3, 3 + EXAMPLE_COUNT))
+
+
+def test_find_invalid_counts_owners() -> None:
+    findings = []
+
+    find_invalid(
+        findings,
+        CHECK_FACE_INDICES,
+        np.array([True, True, False, True]),
+        "Bad face vertices",
+        owners=np.array([0, 0, 1, 2]),
+    )
+
+    assert (findings[0].count, findings[0].examples) == (2, [0, 2])
+
+
+def test_find_out_of_range() -> None:
+    findings = []
+
+    find_out_of_range(findings, CHECK_FACE_INDICES, [0, -1, 4, 3], 4, "Layouts")
+
+    assert findings[0].examples == [1, 2]
+    assert findings[0].message == "Layouts outside of [0, 4)"
+
+
+def test_find_non_finite_checks_rows() -> None:
+    findings = []
+
+    find_non_finite(findings, [[0.0, 1.0], [np.inf, 0.0], [0.0, np.nan]], "Values")
+    find_non_finite(findings, [0.0, 1.0], "Finite values")
+
+    (finding,) = findings
+    assert (finding.check, finding.examples) == (CHECK_FINITE_VALUES, [1, 2])
+
+
+def test_report_severities() -> None:
+    report = ValidationReport(
+        path="a.dna",
+        findings=[
+            Finding(
+                check=CHECK_JOINT_HIERARCHY, severity=SEVERITY_WARNING, message="w"
+            ),
+        ],
+    )
+    assert report.is_valid and len(report.warnings) == 1
+
+    report.findings.append(
+        Finding(check=CHECK_FACE_INDICES, severity=SEVERITY_ERROR, message="e")
+    )
+
+    assert not report.is_valid
+    assert report.to_dict()["is_valid"] is False
+
+
+def test_validate_dna(synthetic_dna) -> None:
+    dna = synthetic_dna(vertex_count=60, joint_count=6)
+
+    assert validate_dna(dna).findings == []
+
+    dna.reader.meshes[0].positions[5] = np.nan
+    dna.reader.joint_parents[3] = 3
+    report = validate_dna(dna, workers=2)
+
+    assert {(finding.check, finding.severity) for finding in report.findings} == {
+        (CHECK_FINITE_VALUES, SEVERITY_ERROR),
+        (CHECK_JOINT_HIERARCHY, SEVERITY_WARNING),
+    }
+    (error,) = report.errors
+    assert (error.mesh, error.examples) == (dna.get_mesh_name(0), [5])
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from dna_viewer.common import DNAViewerError
+from dna_viewer.vertex_color import (
+    VERTEX_COLOR_ALIGNMENT,
+    VERTEX_COLOR_HEADER,
+    VERTEX_COLOR_MAGIC,
+    VertexColors,
+    write_vertex_colors,
+)
+
+DATA_VERTEX_COLORS = Path(__file__).resolve().parents[1] / "data" / "vtx_color.bin"
+
+
+def test_round_trip(tmp_path) -> None:
+    path = str(tmp_path / "colors.bin")
+    head = np.random.default_rng(5).uniform(size=(6, 4)).astype(np.float32)
+    teeth = np.array([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]])
+    shaders = {"head_shader": ["head_lod0_mesh"]}
+
+    write_vertex_colors(
+        path, {"head_lod0_mesh": head, "teeth_lod1_mesh": teeth}, shaders
+    )
+    colors = VertexColors(path)
+
+    assert colors.get_mesh_names() == ["head_lod0_mesh", "teeth_lod1_mesh"]
+    assert colors.shader_mapping == shaders
+    np.testing.assert_array_equal(colors.get_colors("head_lod0_mesh"), head)
+    # RGB colors are stored with an opaque alpha
+    np.testing.assert_allclose(
+        colors.get_colors("teeth_lod1_mesh"),
+        np.hstack([teeth, np.ones((2, 1))]),
+        rtol=1e-6,
+    )
+    assert colors.get_colors("eyes_lod0_mesh") is None
+    assert colors.get_mesh_names_for_lod(1) == ["teeth_lod1_mesh"]
+
+
+def test_color_block_is_aligned(tmp_path) -> None:
+    path = str(tmp_path / "colors.bin")
+
+    write_vertex_colors(path, {"mesh": np.zeros((3, 4))})
+
+    assert VertexColors(path).colors.offset % VERTEX_COLOR_ALIGNMENT == 0
+    with open(path, "rb") as file:
+        magic, _, _ = VERTEX_COLOR_HEADER.unpack(file.read(VERTEX_COLOR_HEADER.size))
+    assert magic == VERTEX_COLOR_MAGIC
+
+
+def test_invalid_component_count_raises(tmp_path) -> None:
+    with pytest.raises(DNAViewerError):
+        write_vertex_colors(str(tmp_path / "colors.bin"), {"mesh": np.zeros((3, 2))})
+
+
+def test_not_a_vertex_color_file_raises(tmp_path) -> None:
+    path = tmp_path / "colors.bin"
+    path.write_bytes(b"\0" * 64)
+
+    with pytest.raises(DNAViewerError):
+        VertexColors(str(path))
+
+
+def test_shipped_vertex_colors() -> None:
+    colors = VertexColors(str(DATA_VERTEX_COLORS))
+
+    mesh_names = colors.get_mesh_names()
+    assert mesh_names
+    for mesh_name in mesh_names:
+        mesh_colors = colors.get_colors(mesh_name)
+        assert mesh_colors.shape[1] == 4
+        assert np.all(np.isfinite(mesh_colors))